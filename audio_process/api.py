@@ -187,12 +187,14 @@ def update_speaker_labels(request, session_id: str, payload: SpeakerUpdateSchema
             continue
         new_label = 'counselor' if item.is_counselor else 'client'
 
-        if seg.text != item.text or seg.speaker_label != new_label:
+        if seg.text != item.text or seg.speaker_label != new_label or seg.is_counselor != item.is_counselor:
             seg.text = item.text
             seg.speaker_label = new_label
+            seg.is_counselor = item.is_counselor
             update_list.append(seg)
 
+    # 분석 결과는 입력 해시로 무효화 판단 (다음 analyze 호출 시 바뀐 세그먼트/Turn만 재분석)
     if update_list:
-        SpeakerSegment.objects.bulk_update(update_list, ['text','speaker_label'])
+        SpeakerSegment.objects.bulk_update(update_list, ['text', 'speaker_label', 'is_counselor'])
 
     return {"status": "success", "updated_segments": len(update_list)}
\ No newline at end of file
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_process', '0003_speakersegment_emotion_confidence_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='speakersegment',
+            name='audio_emotion_confidence',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='speakersegment',
+            name='audio_emotion_label',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='speakersegment',
+            name='text_emotion_confidence',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='speakersegment',
+            name='text_emotion_label',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+    ]
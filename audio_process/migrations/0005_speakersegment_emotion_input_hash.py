@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_process', '0004_speakersegment_branch_emotion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='speakersegment',
+            name='emotion_input_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -53,7 +53,14 @@ class SpeakerSegment(models.Model):
     text = models.TextField()
     emotion_label = models.CharField(max_length=50, null=True, blank=True)
     emotion_confidence = models.FloatField(null=True, blank=True)
-    
+    # 분기별 감정 분석 결과 (emotion_label/emotion_confidence는 융합 결과)
+    text_emotion_label = models.CharField(max_length=50, null=True, blank=True)
+    text_emotion_confidence = models.FloatField(null=True, blank=True)
+    audio_emotion_label = models.CharField(max_length=50, null=True, blank=True)
+    audio_emotion_confidence = models.FloatField(null=True, blank=True)
+    # 감정 분석 입력 해시 (텍스트, 화자 역할, 모델 버전/융합 설정) - 변경된 세그먼트만 재분석
+    emotion_input_hash = models.CharField(max_length=64, null=True, blank=True)
+
     
     class Meta:
         db_table = 'speaker_segments'
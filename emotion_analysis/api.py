@@ -1,14 +1,47 @@
+import hashlib
+import json
+
 from ninja import Router
 from django.shortcuts import get_object_or_404
 from ninja_jwt.authentication import JWTAuth
 from audio_process.models import CallRecording, SpeakerSegment
 
-from .emotion_system.emotion.text_emotion import classify_text_emotion
+from audio_process.audio_system.utils.audio_utils import download_and_convert_to_wav, cleanup_temp_file
+
+from .emotion_system.emotion.fusion import (
+    fuse_session_emotions, FusionResult, TEXT_WEIGHT, AUDIO_WEIGHT, EMOTION_MODEL_VERSION
+)
+from .emotion_system.emotion.label_map import sentiment_map
+from .emotion_system.response.generate_response import generate_responses
+from .emotion_system.emotion.timeline import merge_segment_states, build_timeline_summary
+from .models import EmotionTimeline
 
 router = Router()
 
+EMOTION_RESULT_FIELDS = [
+    'emotion_label', 'emotion_confidence',
+    'text_emotion_label', 'text_emotion_confidence',
+    'audio_emotion_label', 'audio_emotion_confidence'
+]
+
+
+def emotion_input_hash(seg, use_audio, text_weight, audio_weight):
+    """감정 분석 입력 해시 (텍스트, 화자 역할, 모델 버전, 융합 설정, 음향 사용 시 구간)"""
+    parts = [EMOTION_MODEL_VERSION, "client", seg.text, use_audio, text_weight, audio_weight]
+    if use_audio:
+        parts += [seg.start_time, seg.end_time]
+    payload = json.dumps(parts, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
 @router.post("/{session_id}/analyze", auth=JWTAuth())
-def analyze_session_emotion(request, session_id: str):
+def analyze_session_emotion(
+    request,
+    session_id: str,
+    use_audio: bool = False,
+    text_weight: float = TEXT_WEIGHT,
+    audio_weight: float = AUDIO_WEIGHT
+):
     recording = get_object_or_404(CallRecording, session_id=session_id, uploader=request.user)
     client_segments = recording.segments.filter(
         recording=recording,
@@ -21,35 +54,172 @@ def analyze_session_emotion(request, session_id: str):
     if not client_segments.exists():
         return {"status": "error", "message": "고객 발화 데이터가 없습니다."}
     
-    updated_count = 0
-    update_list = []
-
     print("고객 발화문 감정분석 시작 - 세션ID:", session_id)
 
+    # 화자가 상담원으로 바뀐 세그먼트의 이전 감정 결과 제거
+    recording.segments.filter(emotion_input_hash__isnull=False).exclude(
+        speaker_label='client', is_counselor=False
+    ).update(emotion_input_hash=None, **{field_name: None for field_name in EMOTION_RESULT_FIELDS})
+
+    # 입력 해시가 같은 세그먼트는 기존 결과 재사용 (텍스트/설정이 바뀐 세그먼트만 재분석)
+    target_segments = []
+    target_hashes = []
+    cleared_segments = []
+    analyzable_ids = set()
     for seg in client_segments:
         if not seg.text or len(seg.text.strip()) == 0:
             print("빈 문장 건너뜀 - Segment ID:", seg.id)
+            # 텍스트가 지워진 세그먼트의 이전 감정 결과 제거 (타임라인에서도 제외)
+            if seg.emotion_input_hash is not None or seg.emotion_label is not None:
+                seg.emotion_input_hash = None
+                for field_name in EMOTION_RESULT_FIELDS:
+                    setattr(seg, field_name, None)
+                cleared_segments.append(seg)
             continue
-        try:
-            print("분석 중 - Segment ID:", seg.id, "텍스트:", seg.text[:20])
-            label, confidence = classify_text_emotion(seg.text)
-            seg.emotion_label = label
-            seg.emotion_confidence = confidence
-            update_list.append(seg)
-            updated_count += 1
-
-        except Exception as e:
-            print(f"분석 실패: {e}")
+        analyzable_ids.add(str(seg.id))
+        input_hash = emotion_input_hash(seg, use_audio, text_weight, audio_weight)
+        if seg.emotion_input_hash == input_hash:
             continue
+        target_segments.append(seg)
+        target_hashes.append(input_hash)
+
+    # 텍스트 분기(스레드)와 음향 분기(프로세스)를 동시에 실행
+    local_wav_path = None
+    fusion = FusionResult()
+    try:
+        if use_audio and target_segments:
+            local_wav_path = download_and_convert_to_wav(recording.audio_file)
+        if target_segments:
+            fusion = fuse_session_emotions(
+                [seg.text for seg in target_segments],
+                wav_path=local_wav_path,
+                spans=[(seg.start_time, seg.end_time) for seg in target_segments],
+                text_weight=text_weight,
+                audio_weight=audio_weight
+            )
+    except Exception as e:
+        print(f"분석 실패: {e}")
+        return {"status": "error", "message": str(e)}
+    finally:
+        cleanup_temp_file(local_wav_path)
+
+    update_list = []
+    for seg, input_hash, result in zip(target_segments, target_hashes, fusion.segments):
+        # 두 분기 모두 실패한 대체 결과는 해시를 저장하지 않아 다음 요청에서 다시 분석
+        seg.emotion_input_hash = input_hash if result.has_prediction else None
+        seg.emotion_label = result.label
+        seg.emotion_confidence = result.confidence
+        seg.text_emotion_label = result.text_label
+        seg.text_emotion_confidence = result.text_confidence
+        seg.audio_emotion_label = result.audio_label
+        seg.audio_emotion_confidence = result.audio_confidence
+        update_list.append(seg)
+    updated_count = len(update_list)
+
+    if update_list or cleared_segments:
+        SpeakerSegment.objects.bulk_update(
+            update_list + cleared_segments, EMOTION_RESULT_FIELDS + ['emotion_input_hash']
+        )
     
-    if update_list:
-        SpeakerSegment.objects.bulk_update(update_list, ['emotion_label', 'emotion_confidence'])
-    
+    # 세션 감정 타임라인 증분 갱신 (재분석된 세그먼트만 병합, 빈 문장 세그먼트는 제외)
+    update_emotion_timeline(
+        recording,
+        {str(seg.id): [seg.start_time, seg.emotion_label, seg.emotion_confidence] for seg in update_list},
+        keep_ids=analyzable_ids
+    )
+
     print("감정분석 완료 - 분석된 문장 수:", updated_count)
 
     return {
         "status": "success",
         "session_id": session_id,
         "analyzed_segments": updated_count,
+        "latency_ms": {
+            "text": round(fusion.text_ms, 1),
+            "audio": round(fusion.audio_ms, 1),
+            "total": round(fusion.total_ms, 1)
+        },
         "message": f"총 {total_count}개 문장 중 {updated_count}개 문장 감정분석 완료."  
-    }
\ No newline at end of file
+    }
+
+
+def update_emotion_timeline(recording, updates, keep_ids=None):
+    """세션 감정 타임라인 행을 세그먼트 상태 병합 후 다시 요약"""
+    timeline, _ = EmotionTimeline.objects.get_or_create(recording=recording)
+    timeline.segment_states = merge_segment_states(timeline.segment_states, updates, keep_ids)
+    for field_name, value in build_timeline_summary(timeline.segment_states, timeline.bucket_seconds).items():
+        setattr(timeline, field_name, value)
+    timeline.save()
+    return timeline
+
+
+def _timeline_summary(timeline):
+    return {
+        "session_id": timeline.recording.session_id,
+        "segment_count": timeline.segment_count,
+        "positive_count": timeline.positive_count,
+        "negative_count": timeline.negative_count,
+        "neutral_count": timeline.neutral_count,
+        "dominant_emotion": timeline.dominant_emotion,
+        "max_negative_streak": timeline.max_negative_streak,
+        "negative_streaks": timeline.negative_streaks,
+        "peak_anger_time": timeline.peak_anger_time,
+        "sentiment_buckets": timeline.sentiment_buckets,
+        "updated_at": timeline.updated_at,
+    }
+
+
+@router.get("/timelines", auth=JWTAuth())
+def list_emotion_timelines(request, limit: int = 100):
+    """여러 세션의 감정 요약을 한 번의 쿼리로 조회"""
+    timelines = (
+        EmotionTimeline.objects
+        .filter(recording__uploader=request.user)
+        .select_related('recording')
+        .defer('segment_states')
+        .order_by('-updated_at')[:limit]
+    )
+    return {"status": "success", "timelines": [_timeline_summary(t) for t in timelines]}
+
+
+@router.get("/{session_id}/timeline", auth=JWTAuth())
+def get_emotion_timeline(request, session_id: str):
+    timeline = get_object_or_404(
+        EmotionTimeline.objects.select_related('recording').defer('segment_states'),
+        recording__session_id=session_id,
+        recording__uploader=request.user
+    )
+    return {"status": "success", **_timeline_summary(timeline)}
+
+
+@router.post("/{session_id}/responses", auth=JWTAuth())
+def generate_session_responses(request, session_id: str, counselor: str = "default"):
+    """부정 감정으로 분석된 고객 발화들에 대한 상담사 응답 일괄 생성"""
+    recording = get_object_or_404(CallRecording, session_id=session_id, uploader=request.user)
+    flagged_segments = list(recording.segments.filter(
+        speaker_label='client',
+        is_counselor=False,
+        emotion_label__in=sentiment_map["부정"]
+    ))
+
+    if not flagged_segments:
+        return {"status": "success", "session_id": session_id, "responses": []}
+
+    results = generate_responses(
+        [(seg.emotion_label, seg.text) for seg in flagged_segments],
+        counselor=counselor
+    )
+
+    return {
+        "status": "success",
+        "session_id": session_id,
+        "responses": [
+            {
+                "segment_id": seg.id,
+                "emotion_label": seg.emotion_label,
+                "response": result["response"],
+                "source": result["source"],
+                "latency_ms": round(result["latency_ms"], 1)
+            } for seg, result in zip(flagged_segments, results)
+        ]
+    }
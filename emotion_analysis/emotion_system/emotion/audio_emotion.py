@@ -1,9 +1,15 @@
 '''
 LSTM 기반 음향 감정 분석
-음향 특징 벡터 (MFCC, pitch, energy 등)를 입력받아 
+음향 특징 벡터 (MFCC, pitch, energy 등)를 입력받아
 감정라벨을 출력합니다.
+
+AudioEmotionModel 가중치는 프로세스당 한 번만 로드하고,
+세그먼트별 가변 길이 특징 시퀀스를 길이순으로 묶어
+배치당 한 번의 forward로 추론합니다.
 '''
 
+import os
+
 try:
     import torch
     import torch.nn as nn
@@ -16,6 +22,13 @@ except ImportError:
     nn = _DummyModule()
 from .label_map import label_map
 
+AUDIO_WEIGHTS_PATH = "./emotion_analysis/emotion_system/emotion/audio_emotion_model.pth"
+AUDIO_BATCH_SIZE = 32
+
+_audio_model = None
+_device = "cuda" if (torch is not None and torch.cuda.is_available()) else "cpu"
+
+
 class SimpleLSTM(nn.Module):
     def __init__(self, input_dim, num_classes):
         super().__init__()
@@ -26,11 +39,120 @@ class SimpleLSTM(nn.Module):
         _, (hn, _) = self.lstm(x)
         return self.fc(hn.squeeze(0))
 
-def classify_audio_emotion(features):
-    model = SimpleLSTM(input_dim=features.shape[2], num_classes=len(label_map))
-    model.eval()
+
+def load_audio_model(weights_path=AUDIO_WEIGHTS_PATH):
+    """
+    음향 감정 모델(AudioEmotionModel) 로드 (최초 1회)
+
+    Returns:
+        로드된 AudioEmotionModel
+    """
+    global _audio_model
+
+    if torch is None:
+        raise ImportError("PyTorch is not installed. Cannot load audio emotion model.")
+
+    if _audio_model is None:
+        from ..models.model import AudioEmotionModel
+        from ..features.extract_features import AUDIO_FEATURE_DIM
+
+        if not os.path.exists(weights_path):
+            raise FileNotFoundError(f"모델 가중치 파일을 찾을 수 없습니다: {weights_path}")
+
+        print("⏳ [AI] 음향 감정 모델 로딩 중...")
+        model = AudioEmotionModel(input_dim=AUDIO_FEATURE_DIM, num_classes=len(label_map))
+        state_dict = torch.load(weights_path, map_location=_device)
+        model.load_state_dict(state_dict)
+        model.to(_device)
+        model.eval()
+        _audio_model = model
+        print("✅ 음향 감정 모델 로딩 완료!")
+
+    return _audio_model
+
+
+def predict_audio_batch(model, sequences, batch_size=AUDIO_BATCH_SIZE, device=None,
+                        return_probabilities=False):
+    """
+    가변 길이 특징 시퀀스 배치 추론
+
+    길이순으로 정렬해 비슷한 길이끼리 묶어 패딩을 줄이고,
+    패딩된 배치는 lengths와 함께 한 번의 forward로 처리합니다.
+
+    Args:
+        model: AudioEmotionModel (forward(x, lengths) 지원)
+        sequences: [(프레임 수, 특징 차원) 배열, ...]
+        batch_size: 배치 크기
+        device: 추론 장치 (None이면 모델 파라미터 장치 사용)
+        return_probabilities: True이면 라벨 대신 label_map 인덱스 순서의 확률 리스트 반환
+
+    Returns:
+        입력 순서대로 [(label, confidence), ...] 또는 [확률 리스트, ...]
+    """
+    if not sequences:
+        return []
+    if device is None:
+        device = next(model.parameters()).device
+
+    # 1. 길이 내림차순 정렬 (원래 순서는 order로 복원)
+    order = sorted(range(len(sequences)), key=lambda i: len(sequences[i]), reverse=True)
+    results = [None] * len(sequences)
+
     with torch.no_grad():
-        x = torch.tensor(features, dtype=torch.float32)
-        logits = model(x)
-        label = torch.argmax(logits, dim=1).item()
-        return label_map[label]
\ No newline at end of file
+        for start in range(0, len(order), batch_size):
+            batch_idx = order[start:start + batch_size]
+            tensors = [torch.as_tensor(sequences[i], dtype=torch.float32) for i in batch_idx]
+            lengths = torch.tensor([len(t) for t in tensors], dtype=torch.long)
+
+            # 2. 배치 내 최대 길이에 맞춰 패딩 후 한 번의 forward
+            x = nn.utils.rnn.pad_sequence(tensors, batch_first=True).to(device)
+            logits = model(x, lengths=lengths)
+            probs = torch.softmax(logits, dim=1)
+            if return_probabilities:
+                for i, row in zip(batch_idx, probs.cpu().tolist()):
+                    results[i] = row
+                continue
+            top_prob, top_label_idx = torch.max(probs, dim=1)
+
+            for i, label_idx, prob in zip(batch_idx, top_label_idx.tolist(), top_prob.tolist()):
+                results[i] = (label_map.get(label_idx, "unknown"), prob)
+
+    return results
+
+
+def classify_audio_emotion_batch(sequences, batch_size=AUDIO_BATCH_SIZE):
+    """
+    여러 세그먼트의 음향 감정 분석
+    모델을 사용할 수 없으면 기본 중립 감정 반환
+
+    Args:
+        sequences: 세그먼트별 (프레임 수, 특징 차원) 배열 리스트
+
+    Returns:
+        입력 순서대로 [(label, confidence), ...]
+    """
+    try:
+        model = load_audio_model()
+    except (ImportError, FileNotFoundError) as e:
+        print(f"⚠️ [Audio Emotion] Model loading failed: {e}")
+        return [("neutral", 0.0)] * len(sequences)
+
+    try:
+        return predict_audio_batch(model, sequences, batch_size=batch_size, device=_device)
+    except Exception as e:
+        print(f"음향 감정 분류 실패: {e}")
+        return [("neutral", 0.0)] * len(sequences)
+
+
+def classify_audio_emotion(features):
+    """
+    단일/소수 세그먼트 음향 감정 분석 (기존 인터페이스 호환)
+
+    Args:
+        features: (batch, 프레임 수, 특징 차원) 배열
+
+    Returns:
+        첫 번째 세그먼트의 감정 라벨
+    """
+    label, _ = classify_audio_emotion_batch(list(features))[0]
+    return label
@@ -0,0 +1,194 @@
+'''
+텍스트 + 음향 감정 융합
+세션의 발화 구간들에 대해 텍스트(KoBERT) 분기는 스레드 풀에서,
+음향(LSTM) 분기는 프로세스 풀에서 동시에 실행한 뒤
+가중합으로 최종 감정 라벨을 결정합니다.
+
+두 분기가 동시에 돌기 때문에 전체 지연 시간은
+두 분기 지연 시간의 합이 아니라 최대값에 가깝습니다.
+'''
+
+import time
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from .label_map import label_map
+from .text_emotion import predict_text_emotion_probs
+
+# 기본 융합 가중치 (텍스트, 음향)
+TEXT_WEIGHT = 0.6
+AUDIO_WEIGHT = 0.4
+
+# 감정 모델 버전 (모델/라벨 체계 변경 시 올려서 저장된 결과를 무효화)
+EMOTION_MODEL_VERSION = "kobert-text+lstm-audio-v1"
+
+_text_executor = None
+_audio_executor = None
+
+
+@dataclass
+class SegmentEmotion:
+    """세그먼트별 감정 분석 결과 (분기별 + 융합)"""
+    label: str
+    confidence: float
+    text_label: Optional[str] = None
+    text_confidence: Optional[float] = None
+    audio_label: Optional[str] = None
+    audio_confidence: Optional[float] = None
+
+    @property
+    def has_prediction(self) -> bool:
+        """분기 중 하나라도 확률 분포를 냈는지 (False면 두 분기 모두 실패한 중립 대체 결과)"""
+        return self.text_label is not None or self.audio_label is not None
+
+
+@dataclass
+class FusionResult:
+    """세션 단위 융합 결과"""
+    segments: List[SegmentEmotion] = field(default_factory=list)
+    text_ms: float = 0.0
+    audio_ms: float = 0.0
+    total_ms: float = 0.0
+
+
+def _init_audio_worker():
+    """음향 분기 워커 초기화 (프로세스당 모델 1회 로드)"""
+    from .audio_emotion import load_audio_model
+    try:
+        load_audio_model()
+    except (ImportError, FileNotFoundError) as e:
+        print(f"⚠️ [Audio Emotion] Model loading failed: {e}")
+
+
+def _run_audio_branch(wav_path: str, spans: List[Tuple[float, float]]):
+    """음향 분기: 특징 시퀀스 추출 + 배치 추론 (워커 프로세스에서 실행)"""
+    from .audio_emotion import load_audio_model, predict_audio_batch
+    from ..features.extract_features import extract_segment_feature_sequences
+
+    start = time.perf_counter()
+    try:
+        model = load_audio_model()
+    except (ImportError, FileNotFoundError):
+        return None, (time.perf_counter() - start) * 1000
+
+    sequences = extract_segment_feature_sequences(wav_path, spans)
+    probs = predict_audio_batch(model, sequences, return_probabilities=True)
+    return probs, (time.perf_counter() - start) * 1000
+
+
+def _run_text_branch(texts: List[str]):
+    """텍스트 분기: KoBERT 배치 추론 (스레드에서 실행, torch 연산 중에는 GIL 해제)"""
+    start = time.perf_counter()
+    probs = predict_text_emotion_probs(texts)
+    return probs, (time.perf_counter() - start) * 1000
+
+
+def _get_text_executor():
+    global _text_executor
+    if _text_executor is None:
+        _text_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="text-emotion")
+    return _text_executor
+
+
+def _get_audio_executor():
+    global _audio_executor
+    if _audio_executor is None:
+        # fork 후 torch 스레드 풀 교착을 피하기 위해 spawn 사용
+        _audio_executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_audio_worker
+        )
+    return _audio_executor
+
+
+def _top(probs) -> Tuple[str, float]:
+    idx = max(range(len(probs)), key=probs.__getitem__)
+    return label_map.get(idx, "unknown"), float(probs[idx])
+
+
+def fuse_probabilities(text_probs, audio_probs, text_weight=TEXT_WEIGHT, audio_weight=AUDIO_WEIGHT):
+    """
+    분기별 확률 분포 가중합
+
+    한쪽 분기 결과가 없으면 나머지 분기만으로 정규화합니다.
+
+    Returns:
+        (label, confidence)
+    """
+    weighted = []
+    if text_probs is not None:
+        weighted.append((text_probs, text_weight))
+    if audio_probs is not None:
+        weighted.append((audio_probs, audio_weight))
+    total_weight = sum(weight for _, weight in weighted)
+    if not weighted or total_weight <= 0:
+        return "neutral", 0.0
+
+    fused = [
+        sum(probs[i] * weight for probs, weight in weighted) / total_weight
+        for i in range(len(label_map))
+    ]
+    return _top(fused)
+
+
+def fuse_session_emotions(
+    texts: List[str],
+    wav_path: Optional[str] = None,
+    spans: Optional[List[Tuple[float, float]]] = None,
+    text_weight: float = TEXT_WEIGHT,
+    audio_weight: float = AUDIO_WEIGHT
+) -> FusionResult:
+    """
+    세션 발화 구간들의 텍스트/음향 감정을 동시에 분석하여 융합
+
+    Args:
+        texts: 세그먼트별 텍스트
+        wav_path: 세션 음성(wav) 로컬 경로 (None이면 텍스트 분기만 실행)
+        spans: 세그먼트별 (start_time, end_time)
+        text_weight: 텍스트 분기 가중치
+        audio_weight: 음향 분기 가중치
+
+    Returns:
+        FusionResult (입력 순서대로 세그먼트 결과 + 분기별 지연 시간)
+    """
+    start = time.perf_counter()
+
+    # 1. 두 분기를 동시에 제출
+    audio_future = None
+    if wav_path and spans:
+        audio_future = _get_audio_executor().submit(_run_audio_branch, wav_path, spans)
+    text_future = _get_text_executor().submit(_run_text_branch, texts)
+
+    # 2. 결과 수집 (한 분기 실패 시 나머지 분기만 사용)
+    try:
+        text_probs, text_ms = text_future.result()
+    except Exception as e:
+        print(f"텍스트 감정 분기 실패: {e}")
+        text_probs, text_ms = None, 0.0
+
+    audio_probs, audio_ms = None, 0.0
+    if audio_future is not None:
+        try:
+            audio_probs, audio_ms = audio_future.result()
+        except Exception as e:
+            print(f"음향 감정 분기 실패: {e}")
+
+    # 3. 세그먼트별 융합
+    result = FusionResult(text_ms=text_ms, audio_ms=audio_ms)
+    for i in range(len(texts)):
+        t_probs = text_probs[i] if text_probs is not None else None
+        a_probs = audio_probs[i] if audio_probs is not None else None
+        label, confidence = fuse_probabilities(t_probs, a_probs, text_weight, audio_weight)
+
+        segment = SegmentEmotion(label=label, confidence=confidence)
+        if t_probs is not None:
+            segment.text_label, segment.text_confidence = _top(t_probs)
+        if a_probs is not None:
+            segment.audio_label, segment.audio_confidence = _top(a_probs)
+        result.segments.append(segment)
+
+    result.total_ms = (time.perf_counter() - start) * 1000
+    return result
@@ -109,3 +109,41 @@ def classify_text_emotion(text):
     except Exception as e:
         print(f"감정 분류 실패: {e}")
         return "neutral", 0.0
+
+
+def predict_text_emotion_probs(texts, batch_size=16):
+    """
+    여러 발화의 감정 확률 분포를 배치로 계산
+
+    Args:
+        texts: 발화 텍스트 리스트
+        batch_size: 배치 크기
+
+    Returns:
+        입력 순서대로 label_map 인덱스 순서의 확률 리스트,
+        모델을 사용할 수 없으면 None
+    """
+    if not TRANSFORMERS_AVAILABLE:
+        print("⚠️ [Text Emotion] transformers not available. Skipping text emotion branch.")
+        return None
+
+    if _model is None or _tokenizer is None:
+        try:
+            load_text_model()
+        except (ImportError, FileNotFoundError) as e:
+            print(f"⚠️ [Text Emotion] Model loading failed: {e}")
+            return None
+
+    probs_list = []
+    with torch.no_grad():
+        for start in range(0, len(texts), batch_size):
+            inputs = _tokenizer(
+                texts[start:start + batch_size],
+                return_tensors="pt",
+                truncation=True,
+                padding=True,
+                max_length=128
+            ).to(_device)
+            outputs = _model(**inputs)
+            probs_list.extend(torch.softmax(outputs.logits, dim=1).cpu().tolist())
+    return probs_list
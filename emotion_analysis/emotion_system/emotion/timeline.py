@@ -0,0 +1,106 @@
+'''
+세션 단위 감정 타임라인 요약
+세그먼트별 감정 상태(시작 시각, 라벨, 신뢰도)로부터
+구간별 긍/부정/중립 개수, 대표 감정, 부정 연속 구간, 분노 최고점 시각을 계산합니다.
+
+재분석된 세그먼트만 상태에 병합한 뒤 요약을 다시 계산하므로
+세션의 전체 세그먼트를 다시 조회하지 않아도 됩니다.
+'''
+
+from collections import Counter
+
+from .label_map import sentiment_map
+
+# 감정 라벨 -> 긍정/부정/중립
+SENTIMENT_OF = {
+    label: sentiment
+    for sentiment, labels in sentiment_map.items()
+    for label in labels
+}
+SENTIMENTS = ("긍정", "부정", "중립")
+ANGER_LABELS = ("분노", "격분")
+BUCKET_SECONDS = 30.0
+
+
+def sentiment_of(label):
+    """감정 라벨의 긍/부정/중립 분류 (알 수 없는 라벨은 중립)"""
+    return SENTIMENT_OF.get(label, "중립")
+
+
+def merge_segment_states(states, updates, keep_ids=None):
+    """
+    세그먼트 상태 병합
+
+    Args:
+        states: {segment_id(str): [start_time, label, confidence], ...} 기존 상태
+        updates: 재분석된 세그먼트 상태 (같은 형식)
+        keep_ids: 남겨둘 세그먼트 ID 집합 (None이면 삭제하지 않음)
+
+    Returns:
+        병합된 상태 딕셔너리
+    """
+    merged = dict(states or {})
+    merged.update(updates)
+    if keep_ids is not None:
+        merged = {seg_id: state for seg_id, state in merged.items() if seg_id in keep_ids}
+    return merged
+
+
+def build_timeline_summary(states, bucket_seconds=BUCKET_SECONDS):
+    """
+    세그먼트 상태로부터 타임라인 요약 계산
+
+    Args:
+        states: {segment_id: [start_time, label, confidence], ...}
+        bucket_seconds: 구간 길이(초)
+
+    Returns:
+        EmotionTimeline 요약 필드 딕셔너리
+    """
+    ordered = sorted(states.values(), key=lambda state: state[0])
+
+    buckets = {}
+    sentiment_counts = Counter()
+    label_counts = Counter()
+    negative_streaks = []
+    streak = 0
+    peak_anger_time = None
+    peak_anger_confidence = None
+
+    for start_time, label, confidence in ordered:
+        sentiment = sentiment_of(label)
+        sentiment_counts[sentiment] += 1
+        label_counts[label] += 1
+
+        # 1. 구간별 긍/부정/중립 개수
+        bucket_index = int(start_time // bucket_seconds)
+        bucket = buckets.setdefault(bucket_index, {"start": bucket_index * bucket_seconds, **{s: 0 for s in SENTIMENTS}})
+        bucket[sentiment] += 1
+
+        # 2. 부정 연속 구간 길이
+        if sentiment == "부정":
+            streak += 1
+        elif streak:
+            negative_streaks.append(streak)
+            streak = 0
+
+        # 3. 분노 최고점 (신뢰도가 가장 높은 분노 발화 시각)
+        if label in ANGER_LABELS and (peak_anger_confidence is None or (confidence or 0.0) > peak_anger_confidence):
+            peak_anger_time = start_time
+            peak_anger_confidence = confidence or 0.0
+
+    if streak:
+        negative_streaks.append(streak)
+
+    return {
+        "segment_count": len(ordered),
+        "sentiment_buckets": [buckets[index] for index in sorted(buckets)],
+        "positive_count": sentiment_counts["긍정"],
+        "negative_count": sentiment_counts["부정"],
+        "neutral_count": sentiment_counts["중립"],
+        "dominant_emotion": label_counts.most_common(1)[0][0] if label_counts else None,
+        "negative_streaks": negative_streaks,
+        "max_negative_streak": max(negative_streaks, default=0),
+        "peak_anger_time": peak_anger_time,
+        "peak_anger_confidence": peak_anger_confidence,
+    }
@@ -2,11 +2,18 @@
 음성 파일에서 음향 특징 추출
 pitch, energy, spectral centroid, ZCR, speech rate, MFCC 평균값
 딕셔너리 형태로 모델에 입력됩니다.
+
+세그먼트 단위 음향 감정 분석용으로 프레임 단위 특징 시퀀스
+(MFCC 13 + pitch + energy + spectral centroid + ZCR)도 추출합니다.
 '''
 
-import librosa
 import numpy as np
 
+try:
+    import librosa
+except ImportError:
+    librosa = None
+
 def extract_features(file_path):
     y, sr = librosa.load(file_path, sr=16000)
     pitches, magnitudes = librosa.piptrack(y=y, sr=sr)
@@ -28,4 +35,67 @@ def extract_features(file_path):
     }
     for i, val in enumerate(mfccs_mean):
         features[f'mfcc_{i+1}'] = val
-    return features
\ No newline at end of file
+    return features
+
+
+# 프레임 단위 특징 시퀀스 차원 (MFCC 13 + pitch + energy + spec_centroid + zcr)
+AUDIO_FEATURE_DIM = 17
+_N_FFT = 2048
+_HOP_LENGTH = 512
+
+
+def extract_feature_sequence(y, sr=16000):
+    """
+    파형에서 프레임 단위 특징 시퀀스 추출
+
+    Args:
+        y: 모노 파형 (numpy 배열)
+        sr: 샘플링 레이트
+
+    Returns:
+        (프레임 수, AUDIO_FEATURE_DIM) float32 배열
+    """
+    # 너무 짧은 세그먼트는 최소 1프레임이 나오도록 0으로 채움
+    if len(y) < _N_FFT:
+        y = np.pad(y, (0, _N_FFT - len(y)))
+
+    mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13, n_fft=_N_FFT, hop_length=_HOP_LENGTH)
+    pitches, magnitudes = librosa.piptrack(y=y, sr=sr, n_fft=_N_FFT, hop_length=_HOP_LENGTH)
+    # 프레임별로 magnitude가 가장 큰 bin의 pitch 사용
+    pitch = pitches[np.argmax(magnitudes, axis=0), np.arange(pitches.shape[1])]
+    energy = librosa.feature.rms(y=y, frame_length=_N_FFT, hop_length=_HOP_LENGTH)[0]
+    spec_centroid = librosa.feature.spectral_centroid(y=y, sr=sr, n_fft=_N_FFT, hop_length=_HOP_LENGTH)[0]
+    zcr = librosa.feature.zero_crossing_rate(y, frame_length=_N_FFT, hop_length=_HOP_LENGTH)[0]
+
+    n_frames = min(mfccs.shape[1], len(pitch), len(energy), len(spec_centroid), len(zcr))
+    sequence = np.vstack([
+        mfccs[:, :n_frames],
+        pitch[None, :n_frames],
+        energy[None, :n_frames],
+        spec_centroid[None, :n_frames],
+        zcr[None, :n_frames],
+    ]).T
+    return sequence.astype(np.float32)
+
+
+def extract_segment_feature_sequences(file_path, segments, sr=16000):
+    """
+    하나의 음성 파일에서 여러 발화 구간의 특징 시퀀스를 추출
+
+    파일은 한 번만 로드하고 구간별로 잘라서 사용합니다.
+
+    Args:
+        file_path: 음성 파일 경로
+        segments: [(start_time, end_time), ...] 초 단위 구간 리스트
+        sr: 샘플링 레이트
+
+    Returns:
+        구간 순서대로 (프레임 수, AUDIO_FEATURE_DIM) 배열 리스트
+    """
+    y, sr = librosa.load(file_path, sr=sr)
+    sequences = []
+    for start_time, end_time in segments:
+        start = max(int(start_time * sr), 0)
+        end = min(int(end_time * sr), len(y))
+        sequences.append(extract_feature_sequence(y[start:max(end, start)], sr))
+    return sequences
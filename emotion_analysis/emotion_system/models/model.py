@@ -10,8 +10,12 @@ except ImportError:
             raise RuntimeError("PyTorch is not available in this deployment.")
 
     nn = _DummyModule()
-from transformers import BertTokenizer, BertForSequenceClassification
-from emotion_system.emotion.label_map import label_map
+try:
+    from transformers import BertTokenizer, BertForSequenceClassification
+except ImportError:
+    BertTokenizer = None
+    BertForSequenceClassification = None
+from ..emotion.label_map import label_map
 
 # 텍스트 감정 분석 모델 (KoBERT 기반)
 class TextEmotionModel:
@@ -41,11 +45,30 @@ class AudioEmotionModel(nn.Module):
         self.pool = nn.AdaptiveMaxPool1d(1)
         self.fc_cnn = nn.Linear(64, num_classes)
 
-    def forward(self, x):
-        _, (hn, _) = self.lstm(x)
-        lstm_out = self.fc_lstm(hn.squeeze(0))
+    def forward(self, x, lengths=None):
+        """
+        Args:
+            x: (batch, time, input_dim) 패딩된 특징 시퀀스
+            lengths: 각 시퀀스의 실제 길이 (batch,). None이면 패딩 없음으로 간주
+
+        Returns:
+            logits (batch, num_classes)
+        """
+        # 1. LSTM: 패킹해서 패딩 프레임이 마지막 hidden state에 섞이지 않도록 함
+        if lengths is not None:
+            packed = nn.utils.rnn.pack_padded_sequence(
+                x, lengths.cpu(), batch_first=True, enforce_sorted=False
+            )
+            _, (hn, _) = self.lstm(packed)
+        else:
+            _, (hn, _) = self.lstm(x)
+        lstm_out = self.fc_lstm(hn[-1])
 
+        # 2. CNN: 패딩 구간은 max pooling 전에 -inf로 마스킹
         cnn_out = self.conv(x.transpose(1, 2))
+        if lengths is not None:
+            mask = torch.arange(x.size(1), device=x.device)[None, :] < lengths.to(x.device)[:, None]
+            cnn_out = cnn_out.masked_fill(~mask[:, None, :], float("-inf"))
         cnn_out = self.pool(cnn_out).squeeze(-1)
         cnn_out = self.fc_cnn(cnn_out)
 
@@ -1,9 +1,22 @@
 '''
 권장 조치 vs 실제 조치 비교
 difflib.SequenceMatcher로 유사도를 계산합니다.
+
+대량 비교 시에는 양쪽 문장을 문자 n-gram 해시 벡터로 한 번만 변환하고
+NumPy 행렬곱(코사인 유사도)으로 모든 쌍의 유사도를 한꺼번에 계산합니다.
 '''
 
 from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import chain
+import zlib
+
+import numpy as np
+
+# 문자 n-gram 크기 및 해시 차원
+NGRAM_SIZES = (2, 3)
+HASH_DIM = 2 ** 12
+
 
 def compare_actions(user_text, recommended_action, actual_action):
     similarity = SequenceMatcher(None, recommended_action, actual_action).ratio()
@@ -12,4 +25,112 @@ def compare_actions(user_text, recommended_action, actual_action):
         "recommended": recommended_action,
         "actual": actual_action,
         "similarity": round(similarity * 100, 2)
-    }
\ No newline at end of file
+    }
+
+
+@lru_cache(maxsize=65536)
+def _ngram_buckets(text):
+    """
+    문장의 문자 n-gram 해시 버킷 목록 (같은 스크립트 반복 시 캐시 사용)
+    crc32는 프로세스 간에도 결정적이며, 캐시는 문장 단위 LRU 하나만 유지
+    """
+    padded = f" {text.strip()} "
+    return [
+        zlib.crc32(padded[i:i + n].encode("utf-8")) % HASH_DIM
+        for n in NGRAM_SIZES for i in range(len(padded) - n + 1)
+    ]
+
+
+def _sparse_ngram_counts(texts):
+    """
+    문장들의 n-gram 해시 버킷 개수를 희소 형태로 계산
+
+    Returns:
+        (keys, counts) - keys = 행 번호 * HASH_DIM + 버킷 (정렬, 중복 없음)
+    """
+    bucket_lists = [_ngram_buckets(text or "") for text in texts]
+    lengths = [len(buckets) for buckets in bucket_lists]
+    buckets = np.fromiter(chain.from_iterable(bucket_lists), dtype=np.int64, count=sum(lengths))
+    offsets = np.repeat(np.arange(len(texts), dtype=np.int64) * HASH_DIM, lengths)
+    return np.unique(buckets + offsets, return_counts=True)
+
+
+def _row_norms(keys, counts, num_rows):
+    squared = np.bincount(keys // HASH_DIM, weights=counts.astype(np.float64) ** 2, minlength=num_rows)
+    return np.sqrt(squared)
+
+
+def vectorize_actions(texts):
+    """
+    문장들을 L2 정규화된 문자 n-gram 해시 벡터로 변환
+
+    Args:
+        texts: 문장 리스트
+
+    Returns:
+        (len(texts), HASH_DIM) float32 행렬
+    """
+    keys, counts = _sparse_ngram_counts(texts)
+    norms = _row_norms(keys, counts, len(texts))
+    matrix = np.zeros((len(texts), HASH_DIM), dtype=np.float32)
+    if len(keys):
+        matrix.flat[keys] = counts / norms[keys // HASH_DIM]
+    return matrix
+
+
+def compare_actions_matrix(recommended_actions, actual_actions, chunk_size=4096):
+    """
+    권장 조치 x 실제 조치 전체 쌍의 유사도 행렬 계산
+
+    Args:
+        recommended_actions: 권장 조치(스크립트) 리스트
+        actual_actions: 실제 조치(상담원 발화) 리스트
+        chunk_size: 실제 조치 측을 나눠 벡터화할 크기 (메모리 상한)
+
+    Returns:
+        (len(recommended_actions), len(actual_actions)) 유사도 행렬 (0-100)
+    """
+    recommended_vectors = vectorize_actions(recommended_actions)
+    similarity = np.empty((len(recommended_actions), len(actual_actions)), dtype=np.float32)
+    for start in range(0, len(actual_actions), chunk_size):
+        actual_vectors = vectorize_actions(actual_actions[start:start + chunk_size])
+        similarity[:, start:start + chunk_size] = recommended_vectors @ actual_vectors.T
+    return np.round(np.clip(similarity, 0.0, 1.0) * 100, 2)
+
+
+def compare_actions_bulk(user_texts, recommended_actions, actual_actions):
+    """
+    여러 (권장 조치, 실제 조치) 쌍을 한 번에 비교
+
+    Args:
+        user_texts, recommended_actions, actual_actions: 같은 길이의 리스트
+
+    Returns:
+        compare_actions와 같은 형식의 결과 딕셔너리 리스트
+    """
+    num_pairs = len(recommended_actions)
+    recommended_keys, recommended_counts = _sparse_ngram_counts(recommended_actions)
+    actual_keys, actual_counts = _sparse_ngram_counts(actual_actions)
+
+    # 같은 쌍(행)의 같은 버킷끼리만 곱하면 되므로 희소 키 교집합으로 내적 계산
+    _, r_idx, a_idx = np.intersect1d(recommended_keys, actual_keys, assume_unique=True, return_indices=True)
+    dots = np.bincount(
+        recommended_keys[r_idx] // HASH_DIM,
+        weights=recommended_counts[r_idx].astype(np.float64) * actual_counts[a_idx],
+        minlength=num_pairs
+    )
+    norms = (_row_norms(recommended_keys, recommended_counts, num_pairs)
+             * _row_norms(actual_keys, actual_counts, num_pairs))
+    similarities = np.divide(dots, norms, out=np.zeros(num_pairs), where=norms > 0)
+    similarities = np.round(np.clip(similarities, 0.0, 1.0) * 100, 2)
+
+    return [
+        {
+            "user_text": user_text,
+            "recommended": recommended,
+            "actual": actual,
+            "similarity": float(similarity)
+        }
+        for user_text, recommended, actual, similarity
+        in zip(user_texts, recommended_actions, actual_actions, similarities)
+    ]
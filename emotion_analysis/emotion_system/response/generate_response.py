@@ -1,35 +1,187 @@
 '''
 KoGPT 기반 상담사 응답 생성
 styles.py에 입력해 상담사별 스타일을 적용 가능합니다(counselor_A, counselor_B 등)
+
+모델은 프로세스당 한 번만 로드하고, 여러 발화를 배치로 생성합니다.
+상담사 스타일에 해당 감정의 예시 응답이 있으면 LM을 돌리지 않고 바로 반환합니다.
 '''
 
-from transformers import GPT2LMHeadModel, PreTrainedTokenizerFast
-
-def generate_response(emotion_label, user_text):
-    style_map = {
-        "불만": "공감하며 사과하고 해결 방안을 안내하는 말투로",
-        "분노": "책임감 있게 사과하고 신속한 조치를 약속하는 말투로",
-        "짜증": "불편을 인정하고 빠른 해결을 약속하는 말투로",
-        "실망": "기대에 못 미친 점을 사과하고 개선을 약속하는 말투로",
-        "불안": "안심시키고 절차를 명확히 설명하는 말투로",
-        "혼란": "상황을 정리하고 명확하게 설명하는 말투로",
-        "중립": "정중하고 간결하게 안내하는 말투로",
-        "요청": "요청 사항을 확인하고 처리 절차를 안내하는 말투로",
-        "호기심": "정보를 친절하게 설명하고 추가 안내를 제공하는 말투로",
-        "감사": "감사 인사를 공손하게 전달하는 말투로",
-        "기쁨": "긍정적인 분위기를 유지하며 감사 인사를 전하는 말투로",
-        "감동": "진심 어린 감사와 응원의 말을 전하는 말투로",
-        "슬픔": "공감하며 위로하고 필요한 도움을 안내하는 말투로",
-        "피로": "간결하고 배려 있는 말투로 핵심만 안내하는 말투로"
-    }
-    style = style_map.get(emotion_label, "정중하고 간결한 말투로")
-    prompt = f"""민원 상담 응답 생성기
+import time
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    from transformers import GPT2LMHeadModel, PreTrainedTokenizerFast
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    GPT2LMHeadModel = None
+    PreTrainedTokenizerFast = None
+    TRANSFORMERS_AVAILABLE = False
+
+from .styles import counselor_styles
+
+MODEL_NAME = "skt/kogpt2-base-v2"
+
+# 생성 예산 (토큰 수 / 배치당 시간 / 호출 전체 시간)
+MAX_NEW_TOKENS = 40
+MAX_TIME_SECONDS = 2.0
+MAX_TOTAL_TIME_SECONDS = 6.0
+BATCH_SIZE = 8
+
+# 모델을 사용할 수 없을 때의 기본 응답
+FALLBACK_RESPONSE = "말씀 주셔서 감사합니다. 확인 후 안내드리겠습니다."
+
+STYLE_MAP = {
+    "불만": "공감하며 사과하고 해결 방안을 안내하는 말투로",
+    "분노": "책임감 있게 사과하고 신속한 조치를 약속하는 말투로",
+    "짜증": "불편을 인정하고 빠른 해결을 약속하는 말투로",
+    "실망": "기대에 못 미친 점을 사과하고 개선을 약속하는 말투로",
+    "불안": "안심시키고 절차를 명확히 설명하는 말투로",
+    "혼란": "상황을 정리하고 명확하게 설명하는 말투로",
+    "중립": "정중하고 간결하게 안내하는 말투로",
+    "요청": "요청 사항을 확인하고 처리 절차를 안내하는 말투로",
+    "호기심": "정보를 친절하게 설명하고 추가 안내를 제공하는 말투로",
+    "감사": "감사 인사를 공손하게 전달하는 말투로",
+    "기쁨": "긍정적인 분위기를 유지하며 감사 인사를 전하는 말투로",
+    "감동": "진심 어린 감사와 응원의 말을 전하는 말투로",
+    "슬픔": "공감하며 위로하고 필요한 도움을 안내하는 말투로",
+    "피로": "간결하고 배려 있는 말투로 핵심만 안내하는 말투로"
+}
+
+_tokenizer = None
+_model = None
+_device = "cuda" if (torch is not None and torch.cuda.is_available()) else "cpu"
+
+
+def load_response_model():
+    global _tokenizer, _model
+
+    # 이미 로드된 모델은 그대로 재사용
+    if _model is not None:
+        return
+
+    if not TRANSFORMERS_AVAILABLE:
+        raise ImportError("transformers library is not installed. Cannot load response model.")
+
+    print("⏳ [AI] KoGPT2 응답 생성 모델 로딩 중...")
+    _tokenizer = PreTrainedTokenizerFast.from_pretrained(
+        MODEL_NAME,
+        bos_token='</s>', eos_token='</s>', unk_token='<unk>',
+        pad_token='<pad>', mask_token='<mask>'
+    )
+    # 배치 생성 시 프롬프트 끝이 맞도록 왼쪽 패딩
+    _tokenizer.padding_side = "left"
+    model = GPT2LMHeadModel.from_pretrained(MODEL_NAME)
+    model.to(_device)
+    model.eval()
+    _model = model
+    print("✅ KoGPT2 로딩 완료!")
+
+
+def build_prompt(emotion_label, user_text):
+    style = STYLE_MAP.get(emotion_label, "정중하고 간결한 말투로")
+    return f"""민원 상담 응답 생성기
 사용자 감정: {emotion_label}
 사용자 발화: {user_text}
 상담사 응답 스타일: {style}
 상담사 응답:"""
-    tokenizer = PreTrainedTokenizerFast.from_pretrained("skt/kogpt2-base-v2")
-    model = GPT2LMHeadModel.from_pretrained("skt/kogpt2-base-v2")
-    input_ids = tokenizer.encode(prompt, return_tensors="pt")
-    output = model.generate(input_ids, max_new_tokens=100, do_sample=True)
-    return tokenizer.decode(output[0], skip_special_tokens=True)
\ No newline at end of file
+
+
+def _generate_batch(prompts, max_new_tokens, max_time):
+    inputs = _tokenizer(prompts, return_tensors="pt", padding=True).to(_device)
+    with torch.no_grad():
+        output = _model.generate(
+            **inputs,
+            max_new_tokens=max_new_tokens,
+            max_time=max_time,
+            do_sample=True,
+            pad_token_id=_tokenizer.pad_token_id
+        )
+    # 프롬프트 부분을 제외한 생성 토큰만 디코딩
+    new_tokens = output[:, inputs["input_ids"].shape[1]:]
+    return [text.strip() for text in _tokenizer.batch_decode(new_tokens, skip_special_tokens=True)]
+
+
+def generate_responses(items, counselor="default", max_new_tokens=MAX_NEW_TOKENS,
+                       max_time=MAX_TIME_SECONDS, batch_size=BATCH_SIZE,
+                       max_total_time=MAX_TOTAL_TIME_SECONDS):
+    """
+    여러 발화에 대한 상담사 응답 생성
+
+    Args:
+        items: [(emotion_label, user_text), ...]
+        counselor: styles.counselor_styles의 상담사 키
+        max_new_tokens: 응답당 최대 생성 토큰 수
+        max_time: 배치당 최대 생성 시간(초)
+        batch_size: LM 배치 크기
+        max_total_time: 호출 전체 LM 생성 시간 상한(초)
+            (배치마다 남은 시간으로 max_time을 줄이고, 시간이 다 되면 남은 요청은 기본 응답)
+
+    Returns:
+        입력 순서대로 [{"response", "source", "latency_ms"}, ...]
+        - source: "template" (스타일 예시 응답) / "model" (LM 생성) / "fallback"
+        - latency_ms: 요청별 지연 시간 (LM 생성/생성 실패는 요청이 속한 배치의 생성 시간)
+    """
+    results = [None] * len(items)
+    styles = counselor_styles.get(counselor, {})
+
+    # 1. 템플릿 fast path: 감정/스타일이 정확히 일치하면 LM 생략
+    pending = []
+    for i, (emotion_label, user_text) in enumerate(items):
+        start = time.perf_counter()
+        if emotion_label in styles:
+            _, template = styles[emotion_label]
+            results[i] = {
+                "response": template,
+                "source": "template",
+                "latency_ms": (time.perf_counter() - start) * 1000
+            }
+        else:
+            pending.append(i)
+
+    if not pending:
+        return results
+
+    # 2. 나머지는 배치로 LM 생성 (모델을 쓸 수 없으면 기본 응답)
+    try:
+        load_response_model()
+    except Exception as e:
+        print(f"⚠️ [Response] Model loading failed: {e}")
+        for i in pending:
+            results[i] = {"response": FALLBACK_RESPONSE, "source": "fallback", "latency_ms": 0.0}
+        return results
+
+    deadline = time.perf_counter() + max_total_time
+    for offset in range(0, len(pending), batch_size):
+        batch_idx = pending[offset:offset + batch_size]
+        start = time.perf_counter()
+        remaining = deadline - start
+        if remaining <= 0:
+            # 호출 전체 시간 상한 초과: 남은 요청은 생성하지 않고 기본 응답
+            for i in batch_idx:
+                results[i] = {"response": FALLBACK_RESPONSE, "source": "fallback", "latency_ms": 0.0}
+            continue
+        try:
+            responses = _generate_batch(
+                [build_prompt(*items[i]) for i in batch_idx],
+                max_new_tokens,
+                min(max_time, remaining)
+            )
+            source = "model"
+        except Exception as e:
+            # 배치 생성 실패(CUDA OOM, 토크나이저 오류 등)는 해당 배치만 기본 응답
+            print(f"⚠️ [Response] Batch generation failed: {e}")
+            responses = [FALLBACK_RESPONSE] * len(batch_idx)
+            source = "fallback"
+        batch_latency_ms = (time.perf_counter() - start) * 1000
+        for i, response in zip(batch_idx, responses):
+            results[i] = {"response": response, "source": source, "latency_ms": batch_latency_ms}
+
+    return results
+
+
+def generate_response(emotion_label, user_text, counselor="default"):
+    return generate_responses([(emotion_label, user_text)], counselor=counselor)[0]["response"]
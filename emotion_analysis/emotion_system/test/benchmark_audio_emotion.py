@@ -0,0 +1,155 @@
+"""
+음향 감정 추론 처리량 벤치마크
+
+세그먼트마다 모델을 새로 만들어 한 건씩 추론하던 기존 방식과
+모델 1회 로드 + 길이 버킷 배치 추론 방식의 처리량을 비교
+"""
+
+import sys
+import json
+import time
+from pathlib import Path
+from typing import Dict, Any, List
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+
+def make_synthetic_sequences(num_segments: int, feature_dim: int, seed: int = 42) -> List[np.ndarray]:
+    """
+    실제 상담 발화 길이 분포를 흉내 낸 가변 길이 특징 시퀀스 생성
+    (16kHz, hop 512 기준 1~15초 ≈ 30~470 프레임)
+    """
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(30, 470, size=num_segments)
+    return [rng.standard_normal((int(n), feature_dim)).astype(np.float32) for n in lengths]
+
+
+def run_legacy(sequences: List[np.ndarray], num_classes: int) -> float:
+    """기존 방식: 세그먼트마다 SimpleLSTM 생성 후 단건 추론"""
+    from emotion_analysis.emotion_system.emotion.audio_emotion import SimpleLSTM
+
+    start = time.perf_counter()
+    for seq in sequences:
+        model = SimpleLSTM(input_dim=seq.shape[1], num_classes=num_classes)
+        model.eval()
+        with torch.no_grad():
+            logits = model(torch.tensor(seq[None, :, :], dtype=torch.float32))
+            torch.argmax(logits, dim=1).item()
+    return time.perf_counter() - start
+
+
+def run_single(model, sequences: List[np.ndarray]) -> tuple[float, List[int]]:
+    """모델 1회 로드 + 세그먼트별 단건 추론"""
+    labels = []
+    start = time.perf_counter()
+    with torch.no_grad():
+        for seq in sequences:
+            logits = model(torch.tensor(seq[None, :, :], dtype=torch.float32))
+            labels.append(torch.argmax(logits, dim=1).item())
+    return time.perf_counter() - start, labels
+
+
+def run_batched(model, sequences: List[np.ndarray], batch_size: int) -> tuple[float, List[str]]:
+    """모델 1회 로드 + 길이 버킷 배치 추론"""
+    from emotion_analysis.emotion_system.emotion.audio_emotion import predict_audio_batch
+
+    start = time.perf_counter()
+    results = predict_audio_batch(model, sequences, batch_size=batch_size)
+    return time.perf_counter() - start, [label for label, _ in results]
+
+
+def benchmark_audio_emotion(num_segments: int = 512, batch_sizes=(8, 32, 64)) -> Dict[str, Any]:
+    """
+    음향 감정 추론 처리량 측정
+
+    Args:
+        num_segments: 측정에 사용할 세그먼트 수
+        batch_sizes: 비교할 배치 크기 목록
+
+    Returns:
+        방식별 처리량(segments/sec) 딕셔너리
+    """
+    from emotion_analysis.emotion_system.models.model import AudioEmotionModel
+    from emotion_analysis.emotion_system.emotion.label_map import label_map
+    from emotion_analysis.emotion_system.features.extract_features import AUDIO_FEATURE_DIM
+
+    torch.manual_seed(0)
+    sequences = make_synthetic_sequences(num_segments, AUDIO_FEATURE_DIM)
+    model = AudioEmotionModel(input_dim=AUDIO_FEATURE_DIM, num_classes=len(label_map))
+    model.eval()
+
+    results: Dict[str, Any] = {
+        "num_segments": num_segments,
+        "torch_threads": torch.get_num_threads(),
+    }
+
+    # 1. 기존 방식
+    legacy_time = run_legacy(sequences, len(label_map))
+    results["legacy_per_call_model"] = {
+        "seconds": legacy_time,
+        "segments_per_sec": num_segments / legacy_time,
+    }
+
+    # 2. 단건 추론 (모델 재사용)
+    single_time, single_labels = run_single(model, sequences)
+    results["single_loaded_model"] = {
+        "seconds": single_time,
+        "segments_per_sec": num_segments / single_time,
+    }
+
+    # 3. 배치 추론 (배치 크기별)
+    idx_to_label = {idx: label for idx, label in label_map.items()}
+    expected = [idx_to_label[idx] for idx in single_labels]
+    for batch_size in batch_sizes:
+        batch_time, batch_labels = run_batched(model, sequences, batch_size)
+        results[f"batched_{batch_size}"] = {
+            "seconds": batch_time,
+            "segments_per_sec": num_segments / batch_time,
+            "speedup_vs_legacy": legacy_time / batch_time,
+            # 패킹/마스킹이 올바르면 단건 추론과 라벨이 일치해야 함
+            "label_agreement_with_single": float(np.mean([a == b for a, b in zip(batch_labels, expected)])),
+        }
+
+    return results
+
+
+def main():
+    """메인 함수"""
+    if torch is None:
+        print("[건너뜀] PyTorch가 설치되어 있지 않습니다.")
+        return
+
+    print("=" * 80)
+    print("음향 감정 추론 처리량 벤치마크")
+    print("=" * 80)
+
+    results = benchmark_audio_emotion()
+
+    for name, value in results.items():
+        if isinstance(value, dict):
+            line = f"{name:<24} {value['segments_per_sec']:>10.1f} seg/s"
+            if "speedup_vs_legacy" in value:
+                line += f"  (x{value['speedup_vs_legacy']:.1f}, 일치율 {value['label_agreement_with_single']:.3f})"
+            print(line)
+        else:
+            print(f"{name:<24} {value}")
+
+    output_dir = Path(__file__).parent / 'test_results'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / 'audio_emotion_benchmark.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
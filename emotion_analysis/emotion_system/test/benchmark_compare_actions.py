@@ -0,0 +1,119 @@
+"""
+권장 조치 vs 실제 조치 비교 벤치마크
+
+쌍마다 SequenceMatcher를 돌리는 기존 compare_actions와
+n-gram 해시 벡터 + 행렬곱 기반 compare_actions_bulk / compare_actions_matrix의
+처리량을 비교
+"""
+
+import sys
+import json
+import time
+import random
+from pathlib import Path
+from typing import Dict, Any, List
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from emotion_analysis.emotion_system.response.compare_actions import (
+    compare_actions,
+    compare_actions_bulk,
+    compare_actions_matrix
+)
+
+# 합성 상담원 발화/권장 스크립트 구성 요소
+_PHRASES = [
+    "불편을 드려 죄송합니다", "확인 후 안내드리겠습니다", "환불 접수 후 3일 내 처리",
+    "담당 부서로 연결해 드리겠습니다", "처리 지연 중입니다", "고객님 정보 확인 부탁드립니다",
+    "바로 조치하겠습니다", "추가 문의 사항 있으시면 연락 주세요", "교환 절차를 안내드리겠습니다",
+    "배송 일정을 다시 확인하겠습니다", "보상 규정에 따라 처리됩니다", "잠시만 기다려 주세요"
+]
+
+
+def make_synthetic_actions(count: int, seed: int) -> List[str]:
+    """권장/실제 조치 문장 합성 (2~4개 구문 조합)"""
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(_PHRASES, rng.randint(2, 4))) for _ in range(count)]
+
+
+def benchmark_compare_actions(num_pairs: int = 20000, num_scripts: int = 200) -> Dict[str, Any]:
+    """
+    비교 방식별 처리량 측정
+
+    Args:
+        num_pairs: 쌍 단위 비교에 사용할 (권장, 실제) 쌍 수
+        num_scripts: 행렬 비교에 사용할 권장 스크립트 수
+
+    Returns:
+        방식별 처리량 딕셔너리
+    """
+    recommended = make_synthetic_actions(num_pairs, seed=1)
+    actual = make_synthetic_actions(num_pairs, seed=2)
+    user_texts = [""] * num_pairs
+    results: Dict[str, Any] = {"num_pairs": num_pairs, "num_scripts": num_scripts}
+
+    # 1. 기존 방식: 쌍마다 SequenceMatcher
+    start = time.perf_counter()
+    legacy = [compare_actions(u, r, a) for u, r, a in zip(user_texts, recommended, actual)]
+    legacy_time = time.perf_counter() - start
+    results["legacy_sequence_matcher"] = {
+        "seconds": legacy_time,
+        "pairs_per_sec": num_pairs / legacy_time,
+    }
+
+    # 2. 벡터화 쌍 비교
+    start = time.perf_counter()
+    bulk = compare_actions_bulk(user_texts, recommended, actual)
+    bulk_time = time.perf_counter() - start
+    legacy_scores = np.array([item["similarity"] for item in legacy])
+    bulk_scores = np.array([item["similarity"] for item in bulk])
+    results["bulk_ngram_hash"] = {
+        "seconds": bulk_time,
+        "pairs_per_sec": num_pairs / bulk_time,
+        "speedup_vs_legacy": legacy_time / bulk_time,
+        # 유사도 척도가 달라 값은 다르지만 순위 경향은 비슷해야 함
+        "pearson_with_legacy": float(np.corrcoef(legacy_scores, bulk_scores)[0, 1]),
+    }
+
+    # 3. 전체 쌍 행렬 (스크립트 x 상담원 발화)
+    scripts = recommended[:num_scripts]
+    start = time.perf_counter()
+    matrix = compare_actions_matrix(scripts, actual)
+    matrix_time = time.perf_counter() - start
+    results["matrix_ngram_hash"] = {
+        "seconds": matrix_time,
+        "shape": list(matrix.shape),
+        "pairs_per_sec": matrix.size / matrix_time,
+    }
+
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("권장 조치 vs 실제 조치 비교 벤치마크")
+    print("=" * 80)
+
+    results = benchmark_compare_actions()
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print(f"{name:<26} {value['pairs_per_sec']:>14,.0f} pairs/s  ({value['seconds']:.3f}s)")
+        else:
+            print(f"{name:<26} {value}")
+    print(f"SequenceMatcher와의 상관계수: {results['bulk_ngram_hash']['pearson_with_legacy']:.3f}")
+
+    output_dir = Path(__file__).parent / 'test_results'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / 'compare_actions_benchmark.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+음향 감정 배치 추론 테스트
+
+길이순 버킷 배치 추론(predict_audio_batch) 결과가 세그먼트마다 패딩 없이 한 건씩 추론한 결과와
+같은지(pack_padded_sequence + CNN 마스킹으로 패딩 프레임이 섞이지 않는지) 검증
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import torch
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from emotion_analysis.emotion_system.emotion.audio_emotion import predict_audio_batch
+from emotion_analysis.emotion_system.emotion.label_map import label_map
+from emotion_analysis.emotion_system.features.extract_features import AUDIO_FEATURE_DIM
+from emotion_analysis.emotion_system.models.model import AudioEmotionModel
+
+
+def make_model():
+    torch.manual_seed(0)
+    return AudioEmotionModel(input_dim=AUDIO_FEATURE_DIM, num_classes=len(label_map)).eval()
+
+
+def make_sequences(lengths, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.standard_normal((n, AUDIO_FEATURE_DIM)).astype(np.float32) for n in lengths]
+
+
+def single_probs(model, sequence):
+    """기존 방식: 세그먼트 한 건을 패딩 없이 추론"""
+    with torch.no_grad():
+        logits = model(torch.as_tensor(sequence[None, :, :]))
+    return torch.softmax(logits, dim=1)[0].tolist()
+
+
+def test_batch_matches_single():
+    """길이가 다른 세그먼트를 배치로 묶어도 단건 추론과 같은 확률 분포 (입력 순서 유지)"""
+    model = make_model()
+    # 1프레임, 같은 길이, 배치 경계를 넘는 길이 섞기
+    sequences = make_sequences([1, 40, 7, 300, 40, 3, 120, 2, 55])
+    batched = predict_audio_batch(model, sequences, batch_size=4, return_probabilities=True)
+    assert len(batched) == len(sequences)
+    assert predict_audio_batch(model, []) == []
+    for sequence, probs in zip(sequences, batched):
+        assert np.allclose(probs, single_probs(model, sequence), atol=1e-5)
+
+    labels = predict_audio_batch(model, sequences, batch_size=4)
+    for (label, confidence), probs in zip(labels, batched):
+        assert label == label_map[int(np.argmax(probs))]
+        assert abs(confidence - max(probs)) < 1e-6
+
+
+def test_padding_is_masked():
+    """짧은 세그먼트 결과는 같은 배치의 긴 세그먼트(패딩 길이)와 무관"""
+    model = make_model()
+    short = make_sequences([5], seed=1)[0]
+    expected = single_probs(model, short)
+    for other_length in (6, 50, 400):
+        other = make_sequences([other_length], seed=2)[0] * 100
+        probs = predict_audio_batch(model, [short, other], return_probabilities=True)[0]
+        assert np.allclose(probs, expected, atol=1e-5), other_length
+
+
+if __name__ == "__main__":
+    test_batch_matches_single()
+    test_padding_is_masked()
+    print("[완료] 음향 감정 배치 추론 테스트 통과")
@@ -0,0 +1,98 @@
+"""
+권장/실제 조치 대량 비교 테스트
+
+- compare_actions_bulk 쌍별 결과와 compare_actions_matrix 대각 성분이 같은지
+- 출력 형식과 양 끝 값(동일 문장 100, 공통 문자 없음 0)이 기존 compare_actions와 같은지
+- 스크립트별로 가장 비슷한 상담원 발화와 유사도 경향이 기존 SequenceMatcher 방식과 같은지 검증
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from emotion_analysis.emotion_system.response.compare_actions import (
+    compare_actions,
+    compare_actions_bulk,
+    compare_actions_matrix
+)
+from emotion_analysis.emotion_system.test.benchmark_compare_actions import make_synthetic_actions
+
+SCRIPTS = [
+    "불편을 드려 죄송합니다 환불 접수 후 3일 내 처리됩니다",
+    "담당 부서로 연결해 드리겠습니다 잠시만 기다려 주세요",
+    "교환 절차를 안내드리겠습니다 택배 회수 후 새 상품을 보내드립니다",
+    "고객님 정보 확인 부탁드립니다 본인 확인 후 진행하겠습니다",
+]
+# 스크립트를 조금씩 바꾼 상담원 발화 (같은 순서)
+SPOKEN = [
+    "고객님 불편 드려서 죄송해요 환불 접수하고 3일 안에 처리돼요",
+    "담당 부서 연결해 드릴게요 잠시만요",
+    "교환 절차 안내해 드릴게요 택배 회수되면 새 상품 보내드려요",
+    "정보 확인 부탁드려요 본인 확인하고 진행할게요",
+]
+# 다른 주제의 상담원 발화
+UNRELATED = [
+    "오늘 날씨가 많이 춥네요", "요금제 변경은 다음 달부터 적용됩니다", "포인트는 매월 말일에 소멸돼요",
+    "앱을 최신 버전으로 업데이트해 보시겠어요", "영업시간은 오전 9시부터입니다", "이벤트 당첨을 축하드립니다",
+]
+
+
+def test_bulk_matches_matrix():
+    """쌍별 비교 결과 = 전체 쌍 행렬의 대각 성분 (청크 크기와 무관)"""
+    recommended = make_synthetic_actions(300, seed=1)
+    actual = make_synthetic_actions(300, seed=2)
+    bulk = compare_actions_bulk([""] * 300, recommended, actual)
+    for chunk_size in (7, 4096):
+        matrix = compare_actions_matrix(recommended, actual, chunk_size=chunk_size)
+        assert matrix.shape == (300, 300)
+        assert np.allclose([item["similarity"] for item in bulk], np.diag(matrix), atol=0.011)
+
+
+def test_bulk_format_and_bounds():
+    """기존 compare_actions와 같은 키/순서, 동일 문장 100, 공통 문자가 없으면 0"""
+    user_texts = ["환불해 주세요", "연결해 주세요", "감사합니다"]
+    recommended = [SCRIPTS[0], SCRIPTS[1], "abc"]
+    actual = [SCRIPTS[0], SPOKEN[1], "가나다"]
+    bulk = compare_actions_bulk(user_texts, recommended, actual)
+    legacy = [compare_actions(*args) for args in zip(user_texts, recommended, actual)]
+
+    for new, old in zip(bulk, legacy):
+        assert list(new) == list(old)
+        assert (new["user_text"], new["recommended"], new["actual"]) == (old["user_text"], old["recommended"], old["actual"])
+        assert isinstance(new["similarity"], float) and 0.0 <= new["similarity"] <= 100.0
+    assert bulk[0]["similarity"] == legacy[0]["similarity"] == 100.0
+    assert bulk[2]["similarity"] == legacy[2]["similarity"] == 0.0
+    assert 0.0 < bulk[1]["similarity"] < 100.0
+    assert compare_actions_bulk([], [], []) == []
+
+
+def test_agrees_with_legacy():
+    """
+    기존 SequenceMatcher 방식과 같은 경향
+    - 스크립트별 가장 비슷한 발화(바꿔 말한 발화)가 같음
+    - 합성 쌍의 유사도 상관계수가 높음
+    """
+    spoken = SPOKEN + UNRELATED
+    random.Random(0).shuffle(spoken)
+    matrix = compare_actions_matrix(SCRIPTS, spoken)
+    for row, script, expected in zip(matrix, SCRIPTS, SPOKEN):
+        legacy_scores = [compare_actions("", script, text)["similarity"] for text in spoken]
+        assert spoken[int(np.argmax(row))] == spoken[int(np.argmax(legacy_scores))] == expected
+
+    recommended = make_synthetic_actions(500, seed=1)
+    actual = make_synthetic_actions(500, seed=2)
+    bulk = [item["similarity"] for item in compare_actions_bulk([""] * 500, recommended, actual)]
+    legacy = [compare_actions("", r, a)["similarity"] for r, a in zip(recommended, actual)]
+    assert np.corrcoef(bulk, legacy)[0, 1] > 0.6
+
+if __name__ == "__main__":
+    test_bulk_matches_matrix()
+    test_bulk_format_and_bounds()
+    test_agrees_with_legacy()
+    print("[완료] 권장/실제 조치 대량 비교 테스트 통과")
@@ -0,0 +1,107 @@
+"""
+텍스트/음향 감정 융합 테스트
+
+- 분기별 확률 분포 가중합과 한쪽 분기가 없을 때의 정규화
+- 세션 융합에서 한 분기가 실패(예외)해도 나머지 분기 결과로 세그먼트 감정을 결정하는지 검증
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from emotion_analysis.emotion_system.emotion import fusion
+from emotion_analysis.emotion_system.emotion.label_map import label_map
+
+NUM_LABELS = len(label_map)
+
+
+def peaked(index, peak=0.6):
+    """index 라벨에 peak, 나머지에 균등 분포"""
+    rest = (1.0 - peak) / (NUM_LABELS - 1)
+    return [peak if i == index else rest for i in range(NUM_LABELS)]
+
+
+@contextmanager
+def branches(text_branch, audio_branch):
+    """분기 함수를 바꿔 실행 (음향 분기는 프로세스 대신 스레드 풀에서 실행)"""
+    saved = (fusion._run_text_branch, fusion._run_audio_branch, fusion._audio_executor)
+    fusion._run_text_branch = text_branch
+    fusion._run_audio_branch = audio_branch
+    fusion._audio_executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        yield
+    finally:
+        fusion._audio_executor.shutdown()
+        fusion._run_text_branch, fusion._run_audio_branch, fusion._audio_executor = saved
+
+
+def same(result, expected):
+    """(label, confidence) 비교 (신뢰도는 부동소수 오차 허용)"""
+    return result[0] == expected[0] and abs(result[1] - expected[1]) < 1e-9
+
+
+def fail(*args):
+    raise RuntimeError("branch failed")
+
+
+def test_fuse_probabilities_weighting():
+    """가중치가 큰 분기의 라벨이 우세, 신뢰도는 가중 평균"""
+    text, audio = peaked(1, 0.6), peaked(18, 0.9)
+    label, confidence = fusion.fuse_probabilities(text, audio, text_weight=0.6, audio_weight=0.4)
+    assert label == label_map[18]
+    assert abs(confidence - (audio[18] * 0.4 + text[18] * 0.6)) < 1e-9
+
+    text_heavy, _ = fusion.fuse_probabilities(text, audio, text_weight=0.9, audio_weight=0.1)
+    assert text_heavy == label_map[1]
+
+    # 가중치 합으로 정규화하므로 가중치 배율은 결과에 영향 없음
+    assert same(fusion.fuse_probabilities(text, audio, 3.0, 2.0), (label, confidence))
+
+
+def test_fuse_probabilities_single_branch():
+    """한쪽 분기가 없으면 나머지 분기만으로 정규화, 둘 다 없으면 중립"""
+    text = peaked(3, 0.7)
+    assert same(fusion.fuse_probabilities(text, None), (label_map[3], 0.7))
+    assert same(fusion.fuse_probabilities(None, text, text_weight=0.6, audio_weight=0.4), (label_map[3], 0.7))
+    assert fusion.fuse_probabilities(None, None) == ("neutral", 0.0)
+    assert fusion.fuse_probabilities(text, None, text_weight=0.0) == ("neutral", 0.0)
+
+
+def test_session_fusion_branch_failure():
+    """한 분기가 예외로 실패하면 세그먼트 결과는 나머지 분기만 사용"""
+    texts = ["환불해 주세요", "감사합니다"]
+    spans = [(0.0, 1.0), (1.0, 2.0)]
+    text_probs = [peaked(0), peaked(15)]
+    audio_probs = [peaked(1), peaked(18)]
+
+    with branches(lambda t: (text_probs, 5.0), lambda wav, s: (audio_probs, 7.0)):
+        both = fusion.fuse_session_emotions(texts, wav_path="session.wav", spans=spans)
+    assert [seg.text_label for seg in both.segments] == [label_map[0], label_map[15]]
+    assert [seg.audio_label for seg in both.segments] == [label_map[1], label_map[18]]
+    assert (both.text_ms, both.audio_ms) == (5.0, 7.0)
+
+    with branches(lambda t: (text_probs, 5.0), fail):
+        text_only = fusion.fuse_session_emotions(texts, wav_path="session.wav", spans=spans)
+    assert [(seg.label, seg.audio_label) for seg in text_only.segments] == [(label_map[0], None), (label_map[15], None)]
+    assert text_only.audio_ms == 0.0
+
+    with branches(fail, lambda wav, s: (audio_probs, 7.0)):
+        audio_only = fusion.fuse_session_emotions(texts, wav_path="session.wav", spans=spans)
+    assert [(seg.label, seg.text_label) for seg in audio_only.segments] == [(label_map[1], None), (label_map[18], None)]
+
+    # 음성 파일이 없으면 음향 분기를 실행하지 않음
+    with branches(lambda t: (text_probs, 5.0), fail):
+        no_audio = fusion.fuse_session_emotions(texts)
+    assert [seg.label for seg in no_audio.segments] == [label_map[0], label_map[15]]
+
+
+if __name__ == "__main__":
+    test_fuse_probabilities_weighting()
+    test_fuse_probabilities_single_branch()
+    test_session_fusion_branch_failure()
+    print("[완료] 텍스트/음향 감정 융합 테스트 통과")
@@ -0,0 +1,227 @@
+"""
+세션 감정 타임라인 테스트
+
+- 세그먼트 상태로 계산한 구간별 개수, 대표 감정, 부정 연속 구간, 분노 최고점
+- 재분석된 세그먼트만 병합한 증분 요약이 전체 재계산과 같은지
+- analyze API: 입력 해시(emotion_input_hash)가 같은 세그먼트는 감정 분석을 다시 하지 않는지
+- analyze API: 텍스트/음향 분기가 모두 실패한 대체 결과는 해시를 저장하지 않아 다음 요청에서 다시 분석하는지
+- analyze API: 텍스트가 비워진 세그먼트의 이전 감정 결과/해시를 지우고 타임라인에서 제외하는지 검증
+  (감정 모델 대신 텍스트로 라벨이 정해지는 융합 함수 사용, 테스트 DB 필요)
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from emotion_analysis.emotion_system.emotion.fusion import FusionResult, SegmentEmotion
+from emotion_analysis.emotion_system.emotion.timeline import build_timeline_summary, merge_segment_states
+
+STATES = {
+    "1": [0.0, "분노", 0.7],
+    "2": [10.0, "짜증", 0.5],
+    "3": [35.0, "감사", 0.9],
+    "4": [40.0, "격분", 0.95],
+    "5": [70.0, "중립", 0.8],
+}
+
+# 텍스트 키워드 → 감정 라벨 (없으면 중립)
+TEXT_EMOTIONS = {"화나": "분노", "짜증": "짜증", "감사": "감사"}
+
+
+@contextmanager
+def text_keyword_fusion(calls):
+    """analyze API의 융합 함수를 키워드 기반 라벨로 교체 (분석한 텍스트 목록을 calls에 기록)"""
+    from emotion_analysis import api as emotion_api
+
+    def fuse(texts, wav_path=None, spans=None, text_weight=None, audio_weight=None):
+        calls.append(list(texts))
+        segments = []
+        for text in texts:
+            label = next((label for keyword, label in TEXT_EMOTIONS.items() if keyword in text), "중립")
+            segments.append(SegmentEmotion(label=label, confidence=0.9, text_label=label, text_confidence=0.9))
+        return FusionResult(segments=segments)
+
+    saved = emotion_api.fuse_session_emotions
+    emotion_api.fuse_session_emotions = fuse
+    try:
+        yield
+    finally:
+        emotion_api.fuse_session_emotions = saved
+
+
+def test_timeline_summary():
+    """구간별 긍/부정/중립, 부정 연속 구간, 분노 최고점 (시작 시각 순)"""
+    summary = build_timeline_summary(dict(reversed(list(STATES.items()))), bucket_seconds=30.0)
+    assert summary["segment_count"] == 5
+    assert (summary["positive_count"], summary["negative_count"], summary["neutral_count"]) == (1, 3, 1)
+    assert summary["sentiment_buckets"] == [
+        {"start": 0.0, "긍정": 0, "부정": 2, "중립": 0},
+        {"start": 30.0, "긍정": 1, "부정": 1, "중립": 0},
+        {"start": 60.0, "긍정": 0, "부정": 0, "중립": 1},
+    ]
+    assert summary["negative_streaks"] == [2, 1] and summary["max_negative_streak"] == 2
+    assert (summary["peak_anger_time"], summary["peak_anger_confidence"]) == (40.0, 0.95)
+    assert summary["dominant_emotion"] in {"분노", "짜증", "감사", "격분", "중립"}
+
+    empty = build_timeline_summary({})
+    assert empty["segment_count"] == 0 and empty["dominant_emotion"] is None
+    assert empty["max_negative_streak"] == 0 and empty["peak_anger_time"] is None
+
+
+def test_incremental_merge_matches_full():
+    """재분석 세그먼트 병합 + 삭제 세그먼트 제외 후 요약 = 전체 상태로 다시 계산한 요약"""
+    updates = {"2": [10.0, "감사", 0.8], "6": [90.0, "분노", 0.6]}
+    keep_ids = {"1", "2", "3", "5", "6"}
+    merged = merge_segment_states(STATES, updates, keep_ids)
+    assert "4" not in merged and STATES["2"][1] == "짜증"  # 기존 상태는 바꾸지 않음
+
+    full = {seg_id: state for seg_id, state in {**STATES, **updates}.items() if seg_id in keep_ids}
+    assert merged == full
+    assert build_timeline_summary(merged) == build_timeline_summary(full)
+    assert merge_segment_states(None, updates) == updates
+
+
+def test_unchanged_segments_skip_fusion():
+    """입력 해시가 같은 세그먼트는 재사용, 텍스트/융합 설정이 바뀐 세그먼트만 재분석"""
+    from logical_analysis.logic_classify_system.test.django_test_utils import (
+        create_segments,
+        make_request,
+        setup_test_django
+    )
+    setup_test_django()
+    from audio_process.models import CallRecording, SpeakerSegment
+    from emotion_analysis.api import analyze_session_emotion
+    from emotion_analysis.models import EmotionTimeline
+
+    request = make_request()
+    recording = CallRecording.objects.create(audio_file="test/skip.wav", uploader=request.user)
+    segments = create_segments(recording, [
+        ("customer", "너무 화나요"),
+        ("agent", "죄송합니다"),
+        ("customer", "짜증나게 하네요"),
+        ("customer", "확인 부탁드려요"),
+    ])
+    session_id = str(recording.session_id)
+
+    calls = []
+    with text_keyword_fusion(calls):
+        assert analyze_session_emotion(request, session_id)["analyzed_segments"] == 3
+        first_hash = SpeakerSegment.objects.get(id=segments[0].id).emotion_input_hash
+
+        # 바뀐 세그먼트가 없으면 감정 분석(융합) 호출 없음
+        assert analyze_session_emotion(request, session_id)["analyzed_segments"] == 0
+        assert len(calls) == 1
+
+        # 텍스트가 바뀐 세그먼트만 재분석
+        SpeakerSegment.objects.filter(id=segments[3].id).update(text="정말 감사합니다")
+        assert analyze_session_emotion(request, session_id)["analyzed_segments"] == 1
+        assert calls[-1] == ["정말 감사합니다"]
+
+        # 융합 가중치가 바뀌면 모든 손님 세그먼트 재분석
+        assert analyze_session_emotion(request, session_id, text_weight=0.5, audio_weight=0.5)["analyzed_segments"] == 3
+    assert len(calls) == 3
+
+    assert SpeakerSegment.objects.get(id=segments[0].id).emotion_input_hash != first_hash
+    assert SpeakerSegment.objects.get(id=segments[3].id).emotion_label == "감사"
+    timeline = EmotionTimeline.objects.get(recording=recording)
+    assert (timeline.segment_count, timeline.negative_count, timeline.positive_count) == (3, 2, 1)
+
+
+def test_failed_branches_retry():
+    """텍스트/음향 분기가 모두 실패하면 해시를 저장하지 않고, 다음 요청에서 다시 분석"""
+    from logical_analysis.logic_classify_system.test.django_test_utils import (
+        create_segments,
+        make_request,
+        setup_test_django
+    )
+    setup_test_django()
+    from audio_process.models import CallRecording, SpeakerSegment
+    from emotion_analysis import api as emotion_api
+    from emotion_analysis.emotion_system.emotion.label_map import label_map
+    from emotion_analysis.emotion_system.test.test_emotion_fusion import branches, fail, peaked
+
+    request = make_request()
+    recording = CallRecording.objects.create(audio_file="test/retry.wav", uploader=request.user)
+    segments = create_segments(recording, [("customer", "너무 화나요"), ("customer", "감사합니다")])
+    session_id = str(recording.session_id)
+
+    saved = (emotion_api.download_and_convert_to_wav, emotion_api.cleanup_temp_file)
+    emotion_api.download_and_convert_to_wav = lambda audio_file: "session.wav"
+    emotion_api.cleanup_temp_file = lambda path: None
+    try:
+        with branches(fail, fail):
+            failed = emotion_api.analyze_session_emotion(request, session_id, use_audio=True)
+        stored = SpeakerSegment.objects.filter(id__in=[seg.id for seg in segments])
+        assert failed["analyzed_segments"] == 2
+        assert all(seg.emotion_input_hash is None for seg in stored)
+        assert all((seg.emotion_label, seg.emotion_confidence) == ("neutral", 0.0) for seg in stored)
+
+        # 분기가 복구되면 같은 입력이어도 다시 분석하여 해시 저장
+        text_probs = [peaked(0), peaked(15)]
+        with branches(lambda texts: (text_probs, 5.0), fail):
+            retried = emotion_api.analyze_session_emotion(request, session_id, use_audio=True)
+        assert retried["analyzed_segments"] == 2
+        with branches(fail, fail):
+            assert emotion_api.analyze_session_emotion(request, session_id, use_audio=True)["analyzed_segments"] == 0
+    finally:
+        emotion_api.download_and_convert_to_wav, emotion_api.cleanup_temp_file = saved
+
+    stored = SpeakerSegment.objects.filter(id__in=[seg.id for seg in segments]).order_by('start_time')
+    assert [seg.emotion_label for seg in stored] == [label_map[0], label_map[15]]
+    assert all(seg.emotion_input_hash is not None for seg in stored)
+
+
+def test_empty_text_clears_emotion():
+    """텍스트가 비워진 세그먼트는 감정 결과/해시를 지우고 타임라인에서 제외"""
+    from logical_analysis.logic_classify_system.test.django_test_utils import (
+        create_segments,
+        make_request,
+        setup_test_django
+    )
+    setup_test_django()
+    from audio_process.models import CallRecording, SpeakerSegment
+    from emotion_analysis.api import analyze_session_emotion
+    from emotion_analysis.models import EmotionTimeline
+
+    request = make_request()
+    recording = CallRecording.objects.create(audio_file="test/timeline.wav", uploader=request.user)
+    segments = create_segments(recording, [
+        ("customer", "너무 화나요"),
+        ("agent", "죄송합니다"),
+        ("customer", "짜증나게 하네요"),
+        ("customer", "감사합니다"),
+    ])
+    session_id = str(recording.session_id)
+
+    calls = []
+    with text_keyword_fusion(calls):
+        assert analyze_session_emotion(request, session_id)["analyzed_segments"] == 3
+        timeline = EmotionTimeline.objects.get(recording=recording)
+        assert (timeline.segment_count, timeline.negative_count) == (3, 2)
+
+        SpeakerSegment.objects.filter(id=segments[2].id).update(text="  ")
+        result = analyze_session_emotion(request, session_id)
+    assert result["analyzed_segments"] == 0 and len(calls) == 1
+
+    cleared = SpeakerSegment.objects.get(id=segments[2].id)
+    assert cleared.emotion_input_hash is None
+    assert (cleared.emotion_label, cleared.text_emotion_label, cleared.emotion_confidence) == (None, None, None)
+    assert SpeakerSegment.objects.get(id=segments[0].id).emotion_label == "분노"
+
+    timeline.refresh_from_db()
+    assert set(timeline.segment_states) == {str(segments[0].id), str(segments[3].id)}
+    assert (timeline.segment_count, timeline.negative_count, timeline.positive_count) == (2, 1, 1)
+    assert timeline.max_negative_streak == 1
+
+
+if __name__ == "__main__":
+    test_timeline_summary()
+    test_incremental_merge_matches_full()
+    test_unchanged_segments_skip_fusion()
+    test_failed_branches_retry()
+    test_empty_text_clears_emotion()
+    print("[완료] 세션 감정 타임라인 테스트 통과")
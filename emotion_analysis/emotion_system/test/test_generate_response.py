@@ -0,0 +1,138 @@
+"""
+상담사 응답 생성 테스트
+
+- 상담사 스타일에 감정 예시 응답이 있으면 LM 없이 템플릿 반환
+- 모델은 한 번만 로드하여 재사용, 모델을 쓸 수 없으면 기본 응답
+- 배치 생성 결과가 한 건씩 생성한 결과와 같고, 요청별 지연 시간은 요청이 속한 배치의 생성 시간인지
+- 배치 생성이 실패하면 해당 배치만 기본 응답, 호출 전체 시간 상한을 넘으면 남은 요청은 기본 응답인지 검증
+
+LM 생성(_generate_batch)은 샘플링 결과가 매번 달라 프롬프트로 응답이 정해지는 함수로 바꿔 검증
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from emotion_analysis.emotion_system.response import generate_response as response_module
+from emotion_analysis.emotion_system.response.generate_response import FALLBACK_RESPONSE, generate_responses
+from emotion_analysis.emotion_system.response.styles import counselor_styles
+
+ITEMS = [
+    ("불만", "배송이 너무 늦어요"),
+    ("분노", "도대체 몇 번을 말해야 돼요"),
+    ("감사", "친절하게 안내해 주셔서 감사해요"),
+    ("혼란", "무슨 말인지 모르겠어요"),
+    ("짜증", "또 연결이 끊겼어요"),
+    ("불안", "환불이 정말 되는 건가요"),
+]
+
+
+@contextmanager
+def loaded_model(batches, fail_batches=(), max_times=None):
+    """
+    로드된 모델 대신 프롬프트 마지막 발화를 응답으로 돌려주는 생성 함수 사용 (배치 크기 기록)
+
+    fail_batches: 예외를 낼 배치 순번, max_times: 배치별 max_time 인자 기록
+    """
+    saved = (response_module._model, response_module._tokenizer, response_module._generate_batch)
+
+    def generate_batch(prompts, max_new_tokens, max_time):
+        batches.append(len(prompts))
+        if max_times is not None:
+            max_times.append(max_time)
+        if len(batches) - 1 in fail_batches:
+            raise RuntimeError("CUDA out of memory")
+        return [prompt.split("사용자 발화: ")[1].split("\n")[0] + " 확인하겠습니다." for prompt in prompts]
+
+    response_module._model, response_module._tokenizer = object(), object()
+    response_module._generate_batch = generate_batch
+    try:
+        yield
+    finally:
+        response_module._model, response_module._tokenizer, response_module._generate_batch = saved
+
+
+def test_template_fast_path():
+    """스타일에 감정이 있으면 템플릿, 없는 감정은 모델 (모델이 없으면 기본 응답)"""
+    batches = []
+    with loaded_model(batches):
+        results = generate_responses(ITEMS, counselor="counselor_A")
+    styles = counselor_styles["counselor_A"]
+    for (emotion, text), result in zip(ITEMS, results):
+        if emotion in styles:
+            assert result == {"response": styles[emotion][1], "source": "template", "latency_ms": result["latency_ms"]}
+        else:
+            assert result["source"] == "model" and result["response"].startswith(text)
+    # 템플릿만 있는 요청은 모델을 호출하지 않음
+    assert batches == [4]
+    with loaded_model(batches):
+        generate_responses([("불만", "a"), ("감사", "b")])
+    assert batches == [4]
+
+
+def test_model_loaded_once_and_fallback():
+    """로드된 모델은 다시 로드하지 않고, 모델을 쓸 수 없으면 기본 응답"""
+    batches = []
+    with loaded_model(batches):
+        model = response_module._model
+        response_module.load_response_model()
+        generate_responses(ITEMS)
+        generate_responses(ITEMS)
+        assert response_module._model is model
+    assert batches == [4, 4]
+
+    saved = (response_module._model, response_module.TRANSFORMERS_AVAILABLE)
+    response_module._model, response_module.TRANSFORMERS_AVAILABLE = None, False
+    try:
+        results = generate_responses(ITEMS)
+    finally:
+        response_module._model, response_module.TRANSFORMERS_AVAILABLE = saved
+    assert [result["source"] for result in results] == ["template", "fallback", "template", "fallback", "fallback", "fallback"]
+    assert all(result["response"] == FALLBACK_RESPONSE for result in results if result["source"] == "fallback")
+
+
+def test_batch_matches_single():
+    """배치 크기와 무관하게 한 건씩 생성한 결과와 같고, 같은 배치의 요청은 배치 생성 시간을 지연으로 보고"""
+    batches = []
+    with loaded_model(batches):
+        single = [generate_responses([item])[0] for item in ITEMS]
+        batched = generate_responses(ITEMS, batch_size=3)
+    assert batches == [1] * 4 + [3, 1]
+    assert [(r["response"], r["source"]) for r in batched] == [(r["response"], r["source"]) for r in single]
+
+    model_results = [result for result in batched if result["source"] == "model"]
+    assert len({result["latency_ms"] for result in model_results[:3]}) == 1
+    assert all(set(result) == {"response", "source", "latency_ms"} for result in batched)
+
+
+def test_batch_failure_and_deadline():
+    """실패한 배치만 기본 응답, 전체 시간 상한을 넘은 배치는 생성하지 않음"""
+    batches = []
+    with loaded_model(batches, fail_batches={0}):
+        results = generate_responses(ITEMS, batch_size=3)
+    assert batches == [3, 1]
+    assert [result["source"] for result in results] == ["template", "fallback", "template", "fallback", "fallback", "model"]
+    assert all(result["response"] == FALLBACK_RESPONSE for result in results if result["source"] == "fallback")
+    assert results[0]["response"] == counselor_styles["default"]["불만"][1]
+
+    batches, max_times = [], []
+    with loaded_model(batches, max_times=max_times):
+        results = generate_responses(ITEMS, batch_size=1, max_time=2.0, max_total_time=0.5)
+    # 배치당 생성 시간은 남은 전체 시간 이하
+    assert max_times and all(0 < max_time <= 0.5 for max_time in max_times)
+    with loaded_model(batches):
+        results = generate_responses(ITEMS, max_total_time=0.0)
+    assert len(batches) == len(max_times)
+    assert [result["source"] for result in results] == ["template", "fallback", "template", "fallback", "fallback", "fallback"]
+
+
+if __name__ == "__main__":
+    test_template_fast_path()
+    test_model_loaded_once_and_fallback()
+    test_batch_matches_single()
+    test_batch_failure_and_deadline()
+    print("[완료] 상담사 응답 생성 테스트 통과")
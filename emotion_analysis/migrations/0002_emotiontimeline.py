@@ -0,0 +1,39 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_process', '0004_speakersegment_branch_emotion'),
+        ('emotion_analysis', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmotionTimeline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket_seconds', models.FloatField(default=30.0)),
+                ('segment_states', models.JSONField(default=dict)),
+                ('segment_count', models.IntegerField(default=0)),
+                ('sentiment_buckets', models.JSONField(default=list)),
+                ('positive_count', models.IntegerField(default=0)),
+                ('negative_count', models.IntegerField(default=0)),
+                ('neutral_count', models.IntegerField(default=0)),
+                ('dominant_emotion', models.CharField(blank=True, max_length=50, null=True)),
+                ('negative_streaks', models.JSONField(default=list)),
+                ('max_negative_streak', models.IntegerField(default=0)),
+                ('peak_anger_time', models.FloatField(blank=True, null=True)),
+                ('peak_anger_confidence', models.FloatField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('recording', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='emotion_timeline', to='audio_process.callrecording')),
+            ],
+            options={
+                'db_table': 'emotion_timelines',
+                'indexes': [models.Index(fields=['updated_at'], name='emotion_tim_updated_633cd0_idx'), models.Index(fields=['dominant_emotion'], name='emotion_tim_dominan_1e837a_idx')],
+            },
+        ),
+    ]
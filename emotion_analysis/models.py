@@ -9,3 +9,37 @@ class EmotionResult(models.Model):
 
     def __str__(self):
         return f"[{self.source}] {self.emotion_label} - {self.input_text[:30]}..."
+
+
+class EmotionTimeline(models.Model):
+    """세션 단위 감정 타임라인 요약 (analyze 시점에 갱신)"""
+    recording = models.OneToOneField(
+        'audio_process.CallRecording',
+        on_delete=models.CASCADE,
+        related_name='emotion_timeline'
+    )
+    bucket_seconds = models.FloatField(default=30.0)
+    # {segment_id: [start_time, label, confidence]} - 증분 갱신용 세그먼트 상태
+    segment_states = models.JSONField(default=dict)
+
+    segment_count = models.IntegerField(default=0)
+    sentiment_buckets = models.JSONField(default=list)
+    positive_count = models.IntegerField(default=0)
+    negative_count = models.IntegerField(default=0)
+    neutral_count = models.IntegerField(default=0)
+    dominant_emotion = models.CharField(max_length=50, null=True, blank=True)
+    negative_streaks = models.JSONField(default=list)
+    max_negative_streak = models.IntegerField(default=0)
+    peak_anger_time = models.FloatField(null=True, blank=True)
+    peak_anger_confidence = models.FloatField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'emotion_timelines'
+        indexes = [
+            models.Index(fields=['updated_at']),
+            models.Index(fields=['dominant_emotion']),
+        ]
+
+    def __str__(self):
+        return f"[timeline] {self.recording_id} - {self.dominant_emotion}"
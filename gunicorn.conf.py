@@ -0,0 +1,25 @@
+"""
+gunicorn 설정 (작업 디렉터리의 gunicorn.conf.py를 자동으로 읽음)
+
+preload_app: 마스터에서 Django 앱을 불러온 뒤 워커를 fork
+when_ready: fork 전에 논리 분석 파이프라인(규칙 스냅샷, 의도 분류 모델)을 1회 로드하여
+워커들이 copy-on-write로 같은 메모리 페이지를 공유
+"""
+
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8080")
+workers = int(os.environ.get("GUNICORN_WORKERS", "2"))
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "120"))
+preload_app = True
+
+
+def when_ready(server):
+    """워커 fork 직전(마스터) 파이프라인 사전 로드 (LOGIC_PRELOAD_PIPELINE=0이면 워커별 지연 로드)"""
+    if os.environ.get("LOGIC_PRELOAD_PIPELINE", "1") == "0":
+        return
+    from logical_analysis.inference import preload
+
+    preload()
+    server.log.info("logical_analysis 파이프라인 사전 로드 완료")
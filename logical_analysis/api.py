@@ -1,61 +1,105 @@
 # logical_analysis/api.py
 
 from ninja import Router
+from ninja_jwt.authentication import JWTAuth
 from django.shortcuts import get_object_or_404
 from django.db import transaction
-from django.db.models import Count
-from datetime import datetime
+from django.db.models import Count, Q
+from django.utils import timezone
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 from audio_process.models import CallRecording, SpeakerSegment
 from .models import LogicalResult as ClassificationResult
-from .schemas import AnalyzeRequest, AnalysisSessionOut, ClassificationResultOut
-from .inference import run_pipeline
+from .schemas import AnalyzeRequest, AnalysisSessionOut, ClassificationResultOut, RiskTurnOut
+from .inference import get_pipeline, run_session_pipeline, current_rules
+from .session_analysis import build_session_stt_data, build_logical_results, plan_reanalysis
 
 router = Router()
 
 @router.post("/analyze")
 def run_analysis_for_session(request, payload: AnalyzeRequest):
     recording = get_object_or_404(CallRecording, session_id=payload.session_id)
-    segments = recording.segments.all()
+    # 세션 전체를 시간순으로 한 번만 읽어 Turn 구성 (기존 결과/입력 해시도 같은 쿼리로 확인)
+    segments = list(
+        recording.segments.select_related('logical_analysis').order_by('start_time', 'id')
+    )
     
-    if not segments.exists():
+    if not segments:
         return {"status": "error", "message": "분석할 텍스트 데이터(Segments)가 없습니다."}
 
+    # 입력 해시(텍스트, 화자 역할, Turn 맥락, 규칙/모델 버전)가 바뀐 세그먼트가 속한 Turn만 재분석
+    stt_data = build_session_stt_data(payload.session_id, segments)
+    pipeline = get_pipeline()
+    rules = current_rules()
+    turns = pipeline.turn_splitter.split_into_turns(stt_data)
+    plan = plan_reanalysis(segments, turns, pipeline.analysis_version(rules))
     saved_count = 0
     
-    with transaction.atomic():
+    if not plan.up_to_date:
         results_to_create = []
-        
-        for seg in segments:
-            if hasattr(seg, 'logical_analysis'):
-                continue
-
-            ai_res = run_pipeline(seg.text, payload.session_id) 
-            res_data = ai_res.results[0] if hasattr(ai_res, 'results') and ai_res.results else ai_res
-
-            results_to_create.append(ClassificationResult(
-                segment=seg,
-                label=res_data.label,
-                label_type=res_data.label_type,
-                confidence=res_data.confidence,
-                probabilities=res_data.probabilities or {},
-                action=getattr(res_data, 'action', 'MONITOR'),
-                alert_level=getattr(res_data, 'alert_level', 'LOW'),
-                timestamp=datetime.now()
-            ))
-
-        if results_to_create:
-            ClassificationResult.objects.bulk_create(results_to_create)
-            saved_count = len(results_to_create)
-            
+        if plan.turn_indices:
+            ai_res = run_session_pipeline(stt_data, turn_indices=plan.turn_indices, rules=rules)
+            results_to_create = build_logical_results(
+                segments, ai_res, plan.stale_segment_ids, input_hashes=plan.input_hashes
+            )
+
+        with transaction.atomic():
+            # 오래된 결과 삭제 후 새 결과 저장 (segment OneToOne)
+            ClassificationResult.objects.filter(
+                Q(segment_id__in=plan.stale_segment_ids) | Q(id__in=plan.orphan_result_ids)
+            ).delete()
+            ClassificationResult.objects.bulk_create(results_to_create, batch_size=500)
+        saved_count = len(results_to_create)
 
     return {
         "status": "success",
         "session_id": payload.session_id,
-        "analyzed_segments": saved_count
+        "analyzed_segments": saved_count,
+        "reused_segments": len(plan.input_hashes) - len(plan.stale_segment_ids),
+        "analyzed_turns": len(plan.turn_indices)
     }
 
 
+@router.get("/top-risk", response=List[RiskTurnOut], auth=JWTAuth())
+def get_top_risk_turns(request, days: int = 7, limit: int = 100, label_type: Optional[str] = None):
+    """
+    본인이 올린 통화 중 기간 내 turn_risk_score 상위 Turn
+    (저장된 Turn 종합 점수로 DB에서 정렬, 파이프라인 재실행 없음)
+    기간은 분석 시각이 아닌 통화(녹음 등록) 시각 기준 (재분석해도 최근 통화로 바뀌지 않음)
+    """
+    since = timezone.now() - timedelta(days=days)
+    results = ClassificationResult.objects.filter(
+        segment__recording__uploader=request.user,
+        segment__recording__created_at__gte=since,
+        turn_risk_score__isnull=False
+    )
+    if label_type:
+        results = results.filter(label_type=label_type)
+    results = (
+        results
+        .select_related('segment__recording')
+        .order_by('-turn_risk_score', '-created_at')[:min(max(limit, 1), 1000)]
+    )
+    return [
+        {
+            "session_id": str(res.segment.recording.session_id),
+            "segment_id": res.segment_id,
+            "turn_index": res.turn_index,
+            "start_time": res.segment.start_time,
+            "text": res.segment.text,
+            "label": res.label,
+            "alert_level": res.alert_level,
+            "turn_risk_score": res.turn_risk_score,
+            "customer_problem_score": res.customer_problem_score,
+            "agent_response_quality_score": res.agent_response_quality_score,
+            "recorded_at": res.segment.recording.created_at,
+            "created_at": res.created_at
+        }
+        for res in results
+    ]
+
+
 @router.get("/{session_id}", response=AnalysisSessionOut)
 def get_analysis_result(request, session_id: str):
 
@@ -79,7 +123,10 @@ def get_analysis_result(request, session_id: str):
                 "action": res.action,
                 "alert_level": res.alert_level,
                 "timestamp": res.timestamp,
-                "created_at": res.created_at
+                "created_at": res.created_at,
+                "turn_index": res.turn_index,
+                "turn_risk_score": res.turn_risk_score,
+                "feature_scores": res.feature_scores
             })
 
     total_count = len(valid_results)
@@ -1,11 +1,55 @@
-import sys
-from django.conf import settings
-from .logic_classify_system.pipeline.main_pipeline import MainPipeline
+import gc
+import threading
 
-print("🤖 [AI System] 파이프라인 초기화 중...")
-pipeline_instance = MainPipeline()
+# 파이프라인(규칙 스냅샷 컴파일, 의도 분류 모델 로드)은 첫 요청 시 또는 preload()에서 생성
+# 모듈 import만으로는 torch/모델을 불러오지 않으므로 manage.py migrate 등 관리 명령은 로드 비용이 없음
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline():
+    # 프로세스 공용 MainPipeline (gunicorn --threads 동시 첫 요청에도 1회만 생성)
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                from .logic_classify_system.intent_classifier.cascade import cascade_config_from_env
+                from .logic_classify_system.pipeline.main_pipeline import MainPipeline
+
+                print("🤖 [AI System] 파이프라인 초기화 중...")
+                # 규칙 → 모델 캐스케이드는 LOGIC_INTENT_CASCADE(+ 임계값 환경 변수)로 설정
+                pipeline = MainPipeline(cascade=cascade_config_from_env())
+                pipeline.rule_registry.current()
+                _pipeline = pipeline
+                print("✅ [AI System] 파이프라인 로드 완료!")
+    return _pipeline
+
+
+def preload():
+    # gunicorn --preload 마스터에서 fork 전에 호출 (gunicorn.conf.py when_ready)
+    # 워커들은 마스터가 불러온 모델 가중치/규칙 페이지를 copy-on-write로 공유
+    # gc.freeze: 이후 GC가 기존 객체의 헤더(참조 카운트 외 GC 링크)를 건드려 공유 페이지가 복사되는 것을 방지
+    # fork 후 OpenMP 스레드 풀 교착을 피하기 위해 마스터에서는 모델 추론(워밍업)을 실행하지 않음
+    pipeline = get_pipeline()
+    gc.collect()
+    gc.freeze()
+    return pipeline
 
-print("✅ [AI System] 파이프라인 로드 완료!")
 
 def run_pipeline(text: str, session_id: str):
-    return pipeline_instance.process(text, session_id)
\ No newline at end of file
+    # 단일 발화를 손님 발화 1개짜리 세션으로 분석
+    return run_session_pipeline({
+        "session_id": session_id,
+        "segments": [{"speaker": "customer", "text": text}]
+    })
+
+def run_session_pipeline(stt_data: dict, turn_indices=None, rules=None):
+    # 세션 전체를 Turn 단위로 한 번에 분석 (손님 발화 모델 추론은 세션 단위 배치)
+    # turn_indices를 지정하면 해당 Turn만 분석 (시작/끝 여부는 세션 전체 기준)
+    return get_pipeline().process(stt_data, turn_indices=turn_indices, rules=rules)
+
+def current_rules():
+    # 규칙 변경 확인 후 현재 스냅샷 (입력 해시 계산과 분석에 같은 스냅샷 사용)
+    registry = get_pipeline().rule_registry
+    registry.reload_if_changed()
+    return registry.current()
@@ -5,8 +5,8 @@
 Keyword 기반 매뉴얼 준수 평가를 위한 기준
 """
 
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+from dataclasses import dataclass, field, fields, asdict
 from enum import Enum
 
 
@@ -43,12 +43,47 @@ class ManualKeywords:
 class ManualKeywordConfig:
     """매뉴얼 키워드 설정 클래스"""
     
-    def __init__(self):
-        """매뉴얼 키워드 초기화"""
+    def __init__(self, manual_map: Optional[Dict[tuple[str, str], ManualKeywords]] = None):
+        """
+        매뉴얼 키워드 초기화
+        
+        Args:
+            manual_map: 외부(규칙 레지스트리)에서 불러온 매뉴얼 매핑 (None이면 기본 키워드 사용)
+        """
         # 감정 라벨 + CAR 조합별 매뉴얼 키워드 매핑
         # Key: (emotion_label, customer_label), Value: ManualKeywords
         self.manual_map: Dict[tuple[str, str], ManualKeywords] = {}
-        self._initialize_default_keywords()
+        if manual_map is None:
+            self._initialize_default_keywords()
+        else:
+            self.manual_map.update(manual_map)
+    
+    @classmethod
+    def from_entries(cls, entries: List[Dict[str, Any]]) -> "ManualKeywordConfig":
+        """
+        직렬화된 매뉴얼 목록으로 설정 생성
+        
+        Args:
+            entries: [{"emotion_label": ..., "customer_label": ..., "greeting_keywords": [...], ...}, ...]
+        
+        Returns:
+            ManualKeywordConfig
+        """
+        field_names = {f.name for f in fields(ManualKeywords)}
+        manual_map = {}
+        for entry in entries:
+            key = (entry["emotion_label"], entry["customer_label"])
+            manual_map[key] = ManualKeywords(**{
+                name: list(value) for name, value in entry.items() if name in field_names
+            })
+        return cls(manual_map)
+    
+    def to_entries(self) -> List[Dict[str, Any]]:
+        """매뉴얼 매핑을 JSON 직렬화 가능한 목록으로 변환 (from_entries의 역변환)"""
+        return [
+            {"emotion_label": emotion_label, "customer_label": customer_label, **asdict(manual_keywords)}
+            for (emotion_label, customer_label), manual_keywords in self.manual_map.items()
+        ]
     
     def _initialize_default_keywords(self):
         """기본 매뉴얼 키워드 초기화"""
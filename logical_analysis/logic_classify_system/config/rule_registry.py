@@ -0,0 +1,332 @@
+"""
+규칙 레지스트리
+
+규칙 키워드 리스트(IntentBaselineRules, ProfanityBaselineRules)와 매뉴얼 키워드
+(ManualKeywordConfig)를 JSON 파일 또는 solution_system DB(RuleSet)에서 불러와
+매처로 컴파일한 버전별 스냅샷으로 관리
+logic_classify_system_lef의 키워드 리스트(IntentBaselineRules, ProfanityBaselineRules)와
+매뉴얼(ManualChecker.MANUAL)도 같은 스냅샷에서 조회 (config/rule_source.py)
+
+- 변경 감지 시 새 스냅샷을 컴파일한 뒤 참조를 한 번에 교체 (재시작/재배포 불필요)
+- 분석 중인 세션은 시작 시점의 스냅샷을 그대로 사용하고, 결과에 규칙 버전을 기록
+- 불러오기/컴파일에 실패하면 경고 후 기존 스냅샷 유지
+
+JSON 형식 (없는 항목은 코드 기본값 사용):
+    {
+        "version": "2026-10-19.1",
+        "rule_lists": {
+            "REQUEST_KEYWORDS": ["...", ...],
+            "HATE_SPEECH_KEYWORDS": {"gender": ["...", ...], ...},
+            ...
+        },
+        "manual_keywords": [
+            {"emotion_label": "ANGRY", "customer_label": "COMPLAINT", "required_keywords": [...], ...},
+            ...
+        ],
+        "lef_rule_lists": {
+            "PROFANITY_KEYWORDS": ["...", ...],
+            ...
+        },
+        "lef_manual": {
+            "INQUIRY": {"required_phrases": [...], "required_keywords": [...], "procedure": [...]},
+            ...
+        }
+    }
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+import tracemalloc
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .manual_keywords import ManualKeywordConfig
+from ..keyword_engine.keyword_index import (
+    INTENT_RULE_LISTS,
+    PROFANITY_RULE_LISTS,
+    KeywordIndex,
+    build_rule_categories,
+    hate_speech_category
+)
+
+# 규칙 파일 경로 환경 변수 (설정 시 기본 레지스트리가 해당 JSON을 사용)
+RULES_PATH_ENV = "LOGIC_RULES_PATH"
+# 변경 확인 최소 간격 (초)
+DEFAULT_CHECK_INTERVAL = 5.0
+BUILTIN_VERSION = "builtin"
+
+
+def builtin_rule_document() -> Dict[str, Any]:
+    """코드에 정의된 기본 규칙을 레지스트리 문서 형식으로 변환"""
+    from ..profanity_filter.baseline_rules import ProfanityBaselineRules
+    from ...logic_classify_system_lef.config.rule_source import builtin_manual, builtin_rule_lists
+
+    categories = build_rule_categories()
+    rule_lists: Dict[str, Any] = {name: categories[name] for name in INTENT_RULE_LISTS + PROFANITY_RULE_LISTS}
+    rule_lists["HATE_SPEECH_KEYWORDS"] = {
+        sub_category: list(keywords)
+        for sub_category, keywords in ProfanityBaselineRules.HATE_SPEECH_KEYWORDS.items()
+    }
+    return {
+        "version": BUILTIN_VERSION,
+        "rule_lists": rule_lists,
+        "manual_keywords": ManualKeywordConfig().to_entries(),
+        "lef_rule_lists": builtin_rule_lists(),
+        "lef_manual": builtin_manual(),
+    }
+
+
+def document_checksum(document: Dict[str, Any]) -> str:
+    """규칙 문서 내용 해시 (버전이 없을 때 버전 문자열로 사용)"""
+    payload = json.dumps(
+        {key: value for key, value in document.items() if key != "version"},
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+class RuleSnapshot:
+    """컴파일된 규칙 스냅샷 (생성 후 변경하지 않음)"""
+
+    def __init__(self, document: Dict[str, Any], source: str = BUILTIN_VERSION):
+        """
+        규칙 문서를 매처로 컴파일
+
+        Args:
+            document: 규칙 문서 (builtin_rule_document 형식, 없는 항목은 기본값)
+            source: 규칙 출처 (예: "builtin", "json:/path/rules.json", "db:default")
+        """
+        from ..feature_extractor.manual_compliance_checker import ManualComplianceChecker
+
+        start = time.perf_counter()
+        builtin = builtin_rule_document()
+        rule_lists = dict(builtin["rule_lists"])
+        rule_lists.update(document.get("rule_lists") or {})
+        manual_entries = document.get("manual_keywords")
+        if manual_entries is None:
+            manual_entries = builtin["manual_keywords"]
+        lef_rule_lists = dict(builtin["lef_rule_lists"])
+        lef_rule_lists.update(document.get("lef_rule_lists") or {})
+        lef_manual = document.get("lef_manual")
+        if lef_manual is None:
+            lef_manual = builtin["lef_manual"]
+
+        self.checksum = document_checksum({
+            "rule_lists": rule_lists,
+            "manual_keywords": manual_entries,
+            "lef_rule_lists": lef_rule_lists,
+            "lef_manual": lef_manual,
+        })
+        self.version = str(document.get("version") or f"sha-{self.checksum}")
+        self.source = source
+        self.keyword_index = KeywordIndex(self._categories(rule_lists))
+        self.manual_config = ManualKeywordConfig.from_entries(manual_entries)
+        self.compliance_checker = ManualComplianceChecker(self.manual_config)
+        # logic_classify_system_lef 규칙 (키워드 포함 여부 검사에 리스트를 그대로 사용)
+        self.lef_rule_lists = lef_rule_lists
+        self.lef_manual = lef_manual
+        self.compile_seconds = time.perf_counter() - start
+        self.loaded_at = time.time()
+
+    @staticmethod
+    def _categories(rule_lists: Dict[str, Any]) -> Dict[str, List[str]]:
+        """규칙 리스트를 키워드 인덱스 카테고리로 변환 (혐오 표현은 세부 카테고리별)"""
+        categories: Dict[str, List[str]] = {}
+        for name, keywords in rule_lists.items():
+            if name == "HATE_SPEECH_KEYWORDS":
+                for sub_category, sub_keywords in keywords.items():
+                    categories[hate_speech_category(sub_category)] = [str(kw) for kw in sub_keywords]
+            else:
+                categories[name] = [str(kw) for kw in keywords]
+        return categories
+
+    def stats(self) -> Dict[str, Any]:
+        """스냅샷 요약 (버전, 출처, 컴파일 시간, 규모)"""
+        return {
+            "version": self.version,
+            "source": self.source,
+            "checksum": self.checksum,
+            "compile_seconds": self.compile_seconds,
+            "num_keywords": len(self.keyword_index.keywords),
+            "num_states": self.keyword_index.automaton.num_states,
+            "num_manuals": len(self.manual_config.manual_map),
+            "num_lef_manuals": len(self.lef_manual),
+        }
+
+
+def measure_snapshot(document: Dict[str, Any], source: str = BUILTIN_VERSION) -> Dict[str, Any]:
+    """
+    스냅샷 1개의 컴파일 시간과 메모리 측정 (tracemalloc 사용, 측정 전용)
+
+    Returns:
+        stats() + {"memory_bytes": 스냅샷이 유지하는 메모리, "peak_memory_bytes": 컴파일 중 최대 메모리}
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        snapshot = RuleSnapshot(document, source)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    stats = snapshot.stats()
+    stats["memory_bytes"] = after - before
+    stats["peak_memory_bytes"] = peak - before
+    return stats
+
+
+class BuiltinRuleSource:
+    """코드 기본 규칙 (변경되지 않음)"""
+
+    name = BUILTIN_VERSION
+
+    def fingerprint(self) -> Any:
+        return BUILTIN_VERSION
+
+    def load(self) -> Dict[str, Any]:
+        return builtin_rule_document()
+
+
+class JsonRuleSource:
+    """JSON 파일 규칙 (수정 시각/크기로 변경 감지)"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.name = f"json:{self.path}"
+
+    def fingerprint(self) -> Any:
+        stat = self.path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self) -> Dict[str, Any]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+class DatabaseRuleSource:
+    """solution_system.RuleSet 규칙 (활성 규칙 세트의 최신 버전으로 변경 감지)"""
+
+    def __init__(self, name: str = "default"):
+        self.rule_set_name = name
+        self.name = f"db:{name}"
+
+    def _queryset(self):
+        from solution_system.models import RuleSet
+        return RuleSet.objects.filter(name=self.rule_set_name, is_active=True).order_by("-version")
+
+    def fingerprint(self) -> Any:
+        return self._queryset().values_list("id", "version").first()
+
+    def load(self) -> Dict[str, Any]:
+        rule_set = self._queryset().first()
+        if rule_set is None:
+            raise LookupError(f"활성 RuleSet이 없습니다: {self.rule_set_name}")
+        document = dict(rule_set.rules)
+        document.setdefault("version", f"{self.rule_set_name}-v{rule_set.version}")
+        return document
+
+
+class RuleRegistry:
+    """버전별 규칙 스냅샷 레지스트리"""
+
+    def __init__(self, source=None, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        """
+        레지스트리 생성 (생성 시 1회 컴파일)
+
+        Args:
+            source: 규칙 출처 (BuiltinRuleSource/JsonRuleSource/DatabaseRuleSource, None이면 기본 규칙)
+            check_interval: reload_if_changed의 변경 확인 최소 간격 (초)
+        """
+        self.source = source if source is not None else BuiltinRuleSource()
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self._fingerprint = None
+        self._snapshot: Optional[RuleSnapshot] = None
+        if not self.reload(force=True):
+            # 최초 불러오기 실패 시 코드 기본 규칙으로 시작
+            self._snapshot = RuleSnapshot(builtin_rule_document())
+
+    def current(self) -> RuleSnapshot:
+        """현재 스냅샷 (참조 읽기만 하므로 잠금 없이 호출 가능)"""
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        규칙을 다시 불러와 컴파일 후 교체
+
+        Args:
+            force: 변경 감지 없이 항상 다시 불러오기
+
+        Returns:
+            스냅샷 교체 여부
+        """
+        with self._lock:
+            try:
+                fingerprint = self.source.fingerprint()
+                if not force and fingerprint == self._fingerprint:
+                    return False
+                snapshot = RuleSnapshot(self.source.load(), self.source.name)
+            except Exception as e:
+                current_version = self._snapshot.version if self._snapshot is not None else BUILTIN_VERSION
+                warnings.warn(f"규칙 불러오기 실패 ({self.source.name}), 기존 규칙 유지 ({current_version}): {e}")
+                return False
+            self._fingerprint = fingerprint
+            current = self._snapshot
+            if current is not None and (snapshot.version, snapshot.checksum) == (current.version, current.checksum):
+                return False
+            # 참조 교체는 원자적: 진행 중인 분석은 이전 스냅샷을 끝까지 사용
+            self._snapshot = snapshot
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """check_interval이 지났으면 변경 여부 확인 후 필요 시 교체 (요청 경로에서 호출해도 저렴)"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+        return self.reload()
+
+
+_rule_registry: Optional[RuleRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_rule_registry() -> RuleRegistry:
+    """프로세스 기본 규칙 레지스트리 (LOGIC_RULES_PATH가 있으면 해당 JSON 사용)"""
+    global _rule_registry
+    if _rule_registry is None:
+        with _registry_lock:
+            if _rule_registry is None:
+                path = os.environ.get(RULES_PATH_ENV)
+                _rule_registry = RuleRegistry(JsonRuleSource(path) if path else None)
+    return _rule_registry
+
+
+def configure_rule_registry(source=None, check_interval: float = DEFAULT_CHECK_INTERVAL) -> RuleRegistry:
+    """기본 규칙 레지스트리의 출처 교체 (예: DatabaseRuleSource("default"))"""
+    global _rule_registry
+    registry = RuleRegistry(source, check_interval=check_interval)
+    with _registry_lock:
+        _rule_registry = registry
+    return registry
+
+
+def export_builtin_rules(path: str) -> Path:
+    """코드 기본 규칙을 JSON 파일로 저장 (규칙 파일 편집 시작점)"""
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(builtin_rule_document(), f, ensure_ascii=False, indent=2)
+    return output_path
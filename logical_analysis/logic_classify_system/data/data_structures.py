@@ -2,14 +2,140 @@
 Turn 단위 분석 데이터 구조 정의
 
 기존 구조를 확장하여 Turn 단위 특징점 추출 결과를 포함
+
+결과 객체는 __slots__ dataclass로 인스턴스 __dict__를 만들지 않고,
+특징점/종합 점수는 키 순서가 고정된 스키마의 float64 배열(FeatureScores)에 저장
 """
 
+from array import array
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Mapping, Tuple
 from datetime import datetime
 
+# FeatureScores에서 값이 설정되지 않은 칸 (dict의 "키 없음"에 해당)
+_UNSET = float("nan")
+
+
+class FeatureScores(MutableMapping):
+    """
+    고정 스키마 특징점 점수
+
+    dict처럼 get/[]/items/len으로 사용하며, 값은 KEYS 순서의 float64 배열(values)에 저장
+    설정되지 않은 칸(NaN)은 없는 키로 취급하고, 스키마에 없는 키는 설정할 수 없음
+    """
+
+    __slots__ = ("values",)
+
+    KEYS: Tuple[str, ...] = ()
+    INDEX: Dict[str, int] = {}
+    _EMPTY: array = array("d")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.INDEX = {key: idx for idx, key in enumerate(cls.KEYS)}
+        cls._EMPTY = array("d", [_UNSET] * len(cls.KEYS))
+
+    def __init__(self, scores: Optional[Mapping[str, float]] = None):
+        self.values = self._EMPTY[:]
+        if scores:
+            for key, value in scores.items():
+                self[key] = value
+
+    @classmethod
+    def from_values(cls, values: array) -> 'FeatureScores':
+        """KEYS 순서의 float64 배열로 생성 (배열을 복사하지 않음)"""
+        scores = cls.__new__(cls)
+        scores.values = values
+        return scores
+
+    def __getitem__(self, key: str) -> float:
+        value = self.values[self.INDEX[key]]
+        if value != value:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: float) -> None:
+        index = self.INDEX.get(key)
+        if index is None:
+            raise KeyError(f"{type(self).__name__} 스키마에 없는 특징점: {key}")
+        self.values[index] = value
+
+    def __delitem__(self, key: str) -> None:
+        if self.get(key) is None:
+            raise KeyError(key)
+        self.values[self.INDEX[key]] = _UNSET
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, value in zip(self.KEYS, self.values) if value == value)
 
-@dataclass
+    def __len__(self) -> int:
+        return sum(1 for value in self.values if value == value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self.INDEX.get(key)
+        if index is None:
+            return default
+        value = self.values[index]
+        return default if value != value else value
+
+    def to_dict(self) -> Dict[str, float]:
+        """설정된 점수만 담은 dict (JSON 저장용)"""
+        return {key: value for key, value in zip(self.KEYS, self.values) if value == value}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return type(self).from_values, (self.values,)
+
+
+class CustomerFeatureScores(FeatureScores):
+    """손님 발화 Turn 특징점 점수 스키마 (CustomerFeatureExtractor)"""
+    __slots__ = ()
+    KEYS = (
+        # Special Label 특징점 (korcen + baseline 규칙 기반)
+        "profanity_score",
+        "threat_score",
+        "sexual_harassment_score",
+        "hate_speech_score",
+        "unreasonable_demand_score",
+        "repetition_keyword_score",
+        # Special Label 신뢰도 (요인들 합산)
+        "special_label_confidence",
+        # Special Label 요인별 점수 (probabilities 기반, 해당 요인이 있을 때만 설정)
+        "profanity_factor_score",
+        "violence_threat_factor_score",
+        "sexual_harassment_factor_score",
+        "hate_speech_factor_score",
+        "unreasonable_demand_factor_score",
+        "repetition_factor_score",
+    )
+
+
+class AgentFeatureScores(FeatureScores):
+    """상담원 발화 Turn 특징점 점수 스키마 (AgentFeatureExtractor)"""
+    __slots__ = ()
+    KEYS = (
+        "manual_compliance_score",
+        "information_accuracy_score",
+        "communication_clarity_score",
+        "empathy_score",
+        "problem_solving_score",
+    )
+
+
+class TurnScores(FeatureScores):
+    """Turn 단위 종합 점수 스키마 (MainPipeline._calculate_turn_scores)"""
+    __slots__ = ()
+    KEYS = (
+        "customer_problem_score",
+        "agent_response_quality_score",
+        "turn_risk_score",
+    )
+
+
+@dataclass(slots=True)
 class ProfanityResult:
     """욕설 감지 결과"""
     is_profanity: bool
@@ -18,7 +144,7 @@ class ProfanityResult:
     method: Optional[str]  # "korcen" or "baseline"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """분류 결과"""
     label: str  # 분류된 Label
@@ -27,9 +153,11 @@ class ClassificationResult:
     text: str  # 원본 문장
     probabilities: Optional[Dict[str, float]] = None  # 각 Label별 확률
     timestamp: Optional[datetime] = None
+    rule_version: Optional[str] = None  # 분류에 사용한 규칙 스냅샷 버전
+    model_calls: int = 0  # 이 분류에 사용한 모델 추론 횟수 (배치 선추론 결과도 1, 캐스케이드 생략 시 0)
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerAnalysisResult:
     """손님 발화 Turn 분석 결과"""
     # 기본 정보
@@ -43,7 +171,7 @@ class CustomerAnalysisResult:
     classification_result: ClassificationResult
     
     # Turn 단위 특징점 점수 (해당 Turn만으로 추출)
-    feature_scores: Dict[str, float]
+    feature_scores: CustomerFeatureScores
     # 예: {
     #   # Special Label 특징점 (korcen + baseline 규칙 기반)
     #   "profanity_score": 0.8,           # 해당 Turn 내 욕설 감지 신뢰도
@@ -73,7 +201,7 @@ class CustomerAnalysisResult:
     # }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentAnalysisResult:
     """상담원 발화 Turn 분석 결과 (Keyword 기반 매뉴얼 준수 평가)"""
     # 기본 정보 (필수 필드 먼저 정의)
@@ -134,7 +262,7 @@ class AgentAnalysisResult:
     # }
     
     # Turn 단위 특징점 점수 (해당 Turn만으로 추출)
-    feature_scores: Dict[str, float] = field(default_factory=dict)
+    feature_scores: AgentFeatureScores = field(default_factory=AgentFeatureScores)
     # 예: {
     #   "manual_compliance_score": 0.8,         # 해당 Turn의 매뉴얼 준수도
     #   "information_accuracy_score": 0.9,      # 해당 Turn의 정보 제공 정확성
@@ -157,7 +285,7 @@ class AgentAnalysisResult:
     # }
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnAnalysisResult:
     """발화 턴별 분석 결과 (Turn 단위)"""
     session_id: str
@@ -167,7 +295,7 @@ class TurnAnalysisResult:
     
     # Turn 단위 종합 Score Resource (다음 단계에서 활용)
     # 주의: 이 점수들은 "해당 Turn"에 대한 평가만 포함
-    turn_scores: Dict[str, float]
+    turn_scores: TurnScores
     # 예: {
     #   "customer_problem_score": 0.7,           # 해당 Turn의 손님 문제 발생 가능성
     #   "agent_response_quality_score": 0.8,     # 해당 Turn의 상담원 대응 품질
@@ -175,13 +303,17 @@ class TurnAnalysisResult:
     #   # 주의: "overall_turn_score"는 Turn 단위 평가지만,
     #   #       세션 전체 평가는 후속 모듈에서 수행
     # }
+    
+    # Turn을 구성한 STT segments 인덱스 (첫 번째는 손님 발화, 나머지는 상담원 발화)
+    segment_indices: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """파이프라인 결과 (Turn 기반)"""
     session_id: str
     turn_results: List[TurnAnalysisResult]  # Turn 단위 분석 결과 리스트
     timestamp: Optional[datetime] = None
+    rule_version: Optional[str] = None  # 세션 분석에 사용한 규칙 스냅샷 버전
 
 
@@ -0,0 +1,213 @@
+"""
+PipelineResult 바이너리 직렬화
+
+형식: 고정 헤더 + 메타데이터 + float64 점수 블록
+- 헤더: MAGIC(4B) + 형식 버전(1B) + 메타데이터 형식(1B) + 메타데이터 길이(uint32, little endian)
+- 메타데이터: Turn별 구조 정보(텍스트, 라벨, 상세 정보)를 필드 이름 없는 리스트로 저장
+  (분석 시각은 세션 내 고유값 표로 저장하고 인덱스로 참조)
+  - "json": 저장/외부 전달용 (기본값)
+  - "pickle": 같은 배포 내 프로세스 간 전달용 (더 빠르고 작지만 신뢰할 수 있는 데이터만 복원)
+- 점수 블록: 손님 특징점 / 상담원 특징점 / Turn 종합 점수 배열을 스키마 순서대로 이어 붙인 float64
+  (FeatureScores.values를 그대로 복사하므로 점수 키별 Python 처리가 없음)
+
+복원 결과는 원본과 같은 PipelineResult
+"""
+
+import json
+import pickle
+import struct
+from array import array
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .data_structures import (
+    PipelineResult,
+    TurnAnalysisResult,
+    CustomerAnalysisResult,
+    AgentAnalysisResult,
+    ProfanityResult,
+    ClassificationResult,
+    CustomerFeatureScores,
+    AgentFeatureScores,
+    TurnScores
+)
+
+MAGIC = b"LTPR"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBBI")
+
+# 메타데이터 형식 이름 → 헤더 코드
+META_FORMATS = {"json": 1, "pickle": 2}
+
+
+class _TimestampTable:
+    """분석 시각 → 인덱스 (세션 내 결과들은 보통 같은 시각을 공유)"""
+
+    def __init__(self):
+        self.index: Dict[Optional[datetime], int] = {}
+        self.values: List[Optional[str]] = []
+
+    def add(self, timestamp: Optional[datetime]) -> int:
+        idx = self.index.get(timestamp)
+        if idx is None:
+            idx = self.index[timestamp] = len(self.values)
+            self.values.append(timestamp.isoformat() if timestamp is not None else None)
+        return idx
+
+
+def _dump_meta(meta: List[Any], meta_format: str) -> bytes:
+    if meta_format == "json":
+        return json.dumps(meta, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def encode_pipeline_result(result: PipelineResult, meta_format: str = "json") -> bytes:
+    """
+    PipelineResult → bytes
+
+    Args:
+        result: 직렬화할 파이프라인 결과
+        meta_format: 메타데이터 형식 ("json" 또는 "pickle")
+    """
+    if meta_format not in META_FORMATS:
+        raise ValueError(f"알 수 없는 메타데이터 형식: {meta_format} (사용 가능: {list(META_FORMATS)})")
+    timestamps = _TimestampTable()
+    customer_scores = array("d")
+    agent_scores = array("d")
+    turn_scores = array("d")
+    turns = []
+
+    for turn in result.turn_results:
+        customer = turn.customer_result
+        profanity = customer.profanity_result
+        classification = customer.classification_result
+        customer_scores.extend(customer.feature_scores.values)
+        turn_scores.extend(turn.turn_scores.values)
+
+        agent = turn.agent_result
+        agent_row = None
+        if agent is not None:
+            agent_scores.extend(agent.feature_scores.values)
+            agent_row = [
+                agent.session_id, agent.turn_index, agent.text, timestamps.add(agent.timestamp),
+                agent.corresponding_customer_label, agent.manual_compliance_score,
+                agent.compliance_details, agent.emotion_label, agent.extracted_features
+            ]
+
+        turns.append([
+            turn.session_id, turn.turn_index, turn.segment_indices,
+            [
+                customer.session_id, customer.turn_index, customer.text, timestamps.add(customer.timestamp),
+                [profanity.is_profanity, profanity.category, profanity.confidence, profanity.method],
+                [
+                    classification.label, classification.label_type, classification.confidence,
+                    # 분류 텍스트는 보통 손님 발화와 같으므로 다를 때만 저장
+                    None if classification.text == customer.text else classification.text,
+                    classification.probabilities, timestamps.add(classification.timestamp),
+                    classification.rule_version, classification.model_calls
+                ],
+                customer.extracted_features
+            ],
+            agent_row
+        ])
+
+    meta = _dump_meta(
+        [result.session_id, timestamps.add(result.timestamp), result.rule_version, turns, timestamps.values],
+        meta_format
+    )
+    return b"".join((
+        _HEADER.pack(MAGIC, FORMAT_VERSION, META_FORMATS[meta_format], len(meta)),
+        meta,
+        customer_scores.tobytes(),
+        agent_scores.tobytes(),
+        turn_scores.tobytes()
+    ))
+
+
+def _scores_reader(block: array, scores_cls):
+    """점수 블록에서 스키마 크기만큼 잘라 FeatureScores를 순서대로 생성"""
+    width = len(scores_cls.KEYS)
+    offset = 0
+
+    def take():
+        nonlocal offset
+        scores = scores_cls.from_values(block[offset:offset + width])
+        offset += width
+        return scores
+
+    return take
+
+
+def decode_pipeline_result(data: bytes, allow_pickle: bool = False) -> PipelineResult:
+    """
+    bytes → PipelineResult (encode_pipeline_result의 역변환)
+
+    Args:
+        data: encode_pipeline_result 결과
+        allow_pickle: pickle 메타데이터 복원 허용 여부 (신뢰할 수 있는 데이터에만 True)
+    """
+    magic, version, meta_code, meta_length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("PipelineResult 직렬화 데이터가 아닙니다.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 PipelineResult 직렬화 버전: {version}")
+
+    view = memoryview(data)
+    meta_end = _HEADER.size + meta_length
+    meta_bytes = view[_HEADER.size:meta_end]
+    if meta_code == META_FORMATS["json"]:
+        meta = json.loads(bytes(meta_bytes).decode('utf-8'))
+    elif meta_code == META_FORMATS["pickle"]:
+        if not allow_pickle:
+            raise ValueError("pickle 메타데이터는 allow_pickle=True일 때만 복원할 수 있습니다.")
+        meta = pickle.loads(meta_bytes)
+    else:
+        raise ValueError(f"알 수 없는 메타데이터 형식 코드: {meta_code}")
+    session_id, timestamp_idx, rule_version, turns, timestamp_values = meta
+    parsed_timestamps = [
+        datetime.fromisoformat(value) if value is not None else None for value in timestamp_values
+    ]
+
+    agent_count = sum(1 for row in turns if row[3] is not None)
+    scores = array("d")
+    scores.frombytes(view[meta_end:])
+    customer_end = len(turns) * len(CustomerFeatureScores.KEYS)
+    agent_end = customer_end + agent_count * len(AgentFeatureScores.KEYS)
+    take_customer = _scores_reader(scores[:customer_end], CustomerFeatureScores)
+    take_agent = _scores_reader(scores[customer_end:agent_end], AgentFeatureScores)
+    take_turn = _scores_reader(scores[agent_end:], TurnScores)
+
+    turn_results = []
+    for turn_session_id, turn_index, segment_indices, customer_row, agent_row in turns:
+        (c_session_id, c_turn_index, c_text, c_timestamp,
+         profanity_row, classification_row, c_extracted) = customer_row
+        (label, label_type, confidence, classification_text, probabilities,
+         classification_timestamp, classification_rule_version, model_calls) = classification_row
+
+        customer = CustomerAnalysisResult(
+            c_session_id, c_turn_index, c_text, parsed_timestamps[c_timestamp],
+            ProfanityResult(*profanity_row),
+            ClassificationResult(
+                label, label_type, confidence,
+                c_text if classification_text is None else classification_text,
+                probabilities, parsed_timestamps[classification_timestamp],
+                classification_rule_version, model_calls
+            ),
+            take_customer(),
+            c_extracted
+        )
+
+        agent = None
+        if agent_row is not None:
+            (a_session_id, a_turn_index, a_text, a_timestamp, customer_label,
+             compliance_score, compliance_details, emotion_label, a_extracted) = agent_row
+            agent = AgentAnalysisResult(
+                a_session_id, a_turn_index, a_text, parsed_timestamps[a_timestamp], customer_label,
+                compliance_score, compliance_details, emotion_label, take_agent(), a_extracted
+            )
+
+        turn_results.append(TurnAnalysisResult(
+            turn_session_id, turn_index, customer, agent, take_turn(), segment_indices
+        ))
+
+    return PipelineResult(session_id, turn_results, parsed_timestamps[timestamp_idx], rule_version)
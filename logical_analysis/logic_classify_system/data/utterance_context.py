@@ -0,0 +1,73 @@
+"""
+발화 단위 분석 컨텍스트
+
+손님 발화 하나에 대해 파이프라인 단계(욕설 감지 -> 의도 분류 -> 특징점 추출)가
+공유하는 중간 결과(정규화 텍스트, 키워드 스캔 결과, 모델 출력)를 한 번만 계산해 보관
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from ..keyword_engine.keyword_index import KeywordHits, get_keyword_index
+from ..config.rule_registry import RuleSnapshot
+
+
+class UtteranceContext:
+    """발화 하나에 대한 단계 간 공유 컨텍스트"""
+
+    __slots__ = ("text", "rules", "_text_lower", "_keyword_hits", "_model_outputs", "scan_count", "model_call_count")
+
+    def __init__(self, text: str, rules: Optional[RuleSnapshot] = None):
+        """
+        컨텍스트 생성
+
+        Args:
+            text: 원문 발화
+            rules: 사용할 규칙 스냅샷 (None이면 스캔 시점의 현재 스냅샷)
+        """
+        self.text = text
+        self.rules = rules
+        self._text_lower: Optional[str] = None
+        self._keyword_hits: Optional[KeywordHits] = None
+        self._model_outputs: Dict[str, Any] = {}
+        # 계측용 카운터 (중복 작업이 없으면 발화당 최대 1)
+        self.scan_count = 0
+        self.model_call_count = 0
+
+    @property
+    def text_lower(self) -> str:
+        """소문자 정규화 텍스트 (규칙 키워드 검사 기준)"""
+        if self._text_lower is None:
+            self._text_lower = self.text.lower()
+        return self._text_lower
+
+    @property
+    def keyword_hits(self) -> KeywordHits:
+        """규칙 키워드 스캔 결과 (최초 접근 시 1회 스캔)"""
+        if self._keyword_hits is None:
+            index = self.rules.keyword_index if self.rules is not None else get_keyword_index()
+            self._keyword_hits = index.scan(self.text_lower)
+            self.scan_count += 1
+        return self._keyword_hits
+
+    def model_output(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        모델 출력 조회 (없으면 compute()로 계산 후 저장)
+
+        Args:
+            key: 출력 이름 (예: "sentence_classifier")
+            compute: 출력 계산 함수
+
+        Returns:
+            저장된 모델 출력
+        """
+        if key not in self._model_outputs:
+            self._model_outputs[key] = compute()
+            self.model_call_count += 1
+        return self._model_outputs[key]
+
+    def set_model_output(self, key: str, output: Any) -> None:
+        """미리 계산한 모델 출력 저장 (배치 추론 결과 주입용)"""
+        self._model_outputs[key] = output
+
+    def has_model_output(self, key: str) -> bool:
+        return key in self._model_outputs
@@ -7,6 +7,7 @@ Keyword 기반 매뉴얼 준수 평가 수행
 
 from typing import Dict, Any, Optional
 from .manual_compliance_checker import ManualComplianceChecker
+from ..data.data_structures import AgentFeatureScores
 
 
 class AgentFeatureExtractor:
@@ -22,8 +23,9 @@ class AgentFeatureExtractor:
         customer_label: str,
         emotion_label: Optional[str] = None,
         is_start: bool = False,
-        is_end: bool = False
-    ) -> tuple[Dict[str, float], Dict[str, Any], Dict[str, Any]]:
+        is_end: bool = False,
+        compliance_checker: Optional[ManualComplianceChecker] = None
+    ) -> tuple[AgentFeatureScores, Dict[str, Any], Dict[str, Any]]:
         """
         상담원 발화 Turn 특징점 추출
         
@@ -33,23 +35,28 @@ class AgentFeatureExtractor:
             emotion_label: 감정 라벨 (None이면 "NEUTRAL" 사용)
             is_start: 세션 시작 여부 (인사 확인용)
             is_end: 세션 종료 여부 (마무리 확인용)
+            compliance_checker: 사용할 매뉴얼 준수도 검사기 (규칙 스냅샷의 검사기, None이면 기본)
         
         Returns:
             (feature_scores, compliance_details, extracted_features)
-            - feature_scores: 특징점 점수 딕셔너리
+            - feature_scores: 특징점 점수 (고정 스키마)
             - compliance_details: 매뉴얼 준수 상세 정보
             - extracted_features: 추출된 특징점 상세 정보
         """
-        feature_scores = {}
-        compliance_details = {}
+        feature_scores = AgentFeatureScores()
         extracted_features = {}
+        checker = compliance_checker if compliance_checker is not None else self.compliance_checker
         
         # 감정 라벨 기본값 설정
+        # 감정 라벨이 없으면 모든 감정 라벨 기준 준수도도 함께 제공 (비트셋 인덱스로 1회 스캔)
         if emotion_label is None:
             emotion_label = "NEUTRAL"
+            extracted_features["compliance_by_emotion"] = checker.compliance_by_emotion(
+                text, customer_label, is_start=is_start, is_end=is_end
+            )
         
         # 1. 매뉴얼 준수도 평가 (Keyword 기반)
-        compliance_score, compliance_info = self.compliance_checker.check_compliance(
+        compliance_score, compliance_info = checker.check_compliance(
             agent_text=text,
             emotion_label=emotion_label,
             customer_label=customer_label,
@@ -57,7 +64,8 @@ class AgentFeatureExtractor:
             is_end=is_end
         )
         feature_scores["manual_compliance_score"] = compliance_score
-        compliance_details.update(compliance_info)
+        # check_compliance가 호출마다 새 dict를 만들므로 복사 없이 그대로 사용
+        compliance_details = compliance_info
         
         # compliance_details에서 공감 표현 점수 추출 (empathy_score와 통합 가능)
         empathy_phrase_score = compliance_info.get("empathy_phrase_score", 0.5)
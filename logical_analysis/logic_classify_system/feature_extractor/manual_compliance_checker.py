@@ -5,17 +5,293 @@ Keyword 기반으로 상담원 발화가 매뉴얼을 얼마나 준수했는지
 작은 조각 단위(키워드/구)로 문장 내 포함 여부 확인
 """
 
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any, Optional
 import re
-from ..config.manual_keywords import ManualKeywordConfig, ManualKeywords
+from ..config.manual_keywords import ManualKeywordConfig, ManualKeywords, EmotionLabel
+from ..keyword_engine.keyword_index import KeywordIndex
+
+# 매뉴얼 준수 검사에 사용하는 키워드 카테고리 (ManualKeywords 필드명)
+COMPLIANCE_CATEGORIES = (
+    "greeting_keywords", "closing_keywords", "required_keywords",
+    "prohibited_keywords", "response_phrases", "empathy_phrases",
+)
+
+# 공백/문장부호 무시 비교용 (_contains_keyword의 [^\w가-힣] 제거와 동일한 문자 집합)
+WORD_CHAR_RUN_REGEX = re.compile(r'[\w가-힣]+')
+NON_WORD_CHAR_REGEX = re.compile(r'[^\w가-힣]')
+
+
+class NormalizedText:
+    """
+    상담원 발화의 정규화 형태 (발화당 1회 계산)
+
+    - normalized: 소문자 + 공백 정규화 (_normalize_text와 동일)
+    - stripped: 공백/문장부호 제거 형태
+    - offsets: stripped의 각 문자가 원문에서 위치한 인덱스
+    """
+
+    __slots__ = ("original", "normalized", "stripped", "offsets")
+
+    def __init__(self, text: str):
+        self.original = text
+        lowered = text.lower()
+        self.normalized = re.sub(r'\s+', ' ', lowered).strip()
+
+        # 소문자 변환으로 길이가 바뀌는 문자가 있으면 문자별로 원문 위치 추적
+        if len(lowered) == len(text):
+            origin = None
+        else:
+            origin = [index for index, ch in enumerate(text) for _ in ch.lower()]
+
+        chunks = []
+        offsets: List[int] = []
+        for match in WORD_CHAR_RUN_REGEX.finditer(lowered):
+            start, end = match.span()
+            chunks.append(match.group(0))
+            offsets.extend(range(start, end) if origin is None else origin[start:end])
+        self.stripped = "".join(chunks)
+        self.offsets = offsets
+
+    def original_span(self, start: int, end: int) -> Tuple[int, int]:
+        """stripped 기준 구간 [start, end)에 해당하는 원문 구간"""
+        return self.offsets[start], self.offsets[end - 1] + 1
+
+
+class CompiledManual:
+    """(감정 라벨, CAR) 매뉴얼 하나의 키워드를 컴파일한 매처"""
+
+    def __init__(self, manual_keywords: ManualKeywords):
+        self.manual_keywords = manual_keywords
+        categories: Dict[str, List[str]] = {}
+        # 카테고리별 [인덱스 키워드 위치 -> 원래 리스트 위치]
+        self.index_positions: Dict[str, List[int]] = {}
+        # 공백/문장부호 제거 후 빈 키워드는 정규화 텍스트에서 직접 검사
+        self.fallback_keywords: Dict[str, List[Tuple[int, str]]] = {}
+
+        for category in COMPLIANCE_CATEGORIES:
+            keywords = getattr(manual_keywords, category)
+            stripped_keywords, positions, fallback = [], [], []
+            for position, keyword in enumerate(keywords):
+                keyword_normalized = keyword.lower().strip()
+                keyword_stripped = NON_WORD_CHAR_REGEX.sub('', keyword_normalized)
+                if keyword_stripped:
+                    stripped_keywords.append(keyword_stripped)
+                    positions.append(position)
+                else:
+                    fallback.append((position, keyword_normalized))
+            categories[category] = stripped_keywords
+            self.index_positions[category] = positions
+            self.fallback_keywords[category] = fallback
+
+        self.index = KeywordIndex(categories)
+
+    def match(self, text: NormalizedText) -> Dict[str, List[str]]:
+        """
+        카테고리별 포함된 키워드 (원래 리스트 순서)
+
+        _contains_keyword를 키워드마다 호출한 결과와 동일
+        """
+        hits = self.index.scan(text.stripped)
+        found: Dict[str, List[str]] = {}
+        for category in COMPLIANCE_CATEGORIES:
+            keywords = getattr(self.manual_keywords, category)
+            positions = self.index_positions[category]
+            found_positions = [positions[index] for index in hits.indices(category)]
+            for position, keyword_normalized in self.fallback_keywords[category]:
+                if keyword_normalized in text.normalized:
+                    found_positions.append(position)
+            found_positions.sort()
+            found[category] = [keywords[position] for position in found_positions]
+        return found
+
+
+class ManualComplianceIndex:
+    """
+    모든 (감정 라벨, CAR) 매뉴얼 키워드의 비트셋 인덱스
+
+    모든 매뉴얼의 키워드를 하나의 오토마톤으로 한 번 스캔해 비트셋(int)으로 만들고,
+    매뉴얼/카테고리별 미리 계산한 마스크와의 popcount로 점수를 계산
+    (check_compliance의 종합 점수와 동일한 값)
+    """
+
+    # 정확한 조합이 없을 때 쓰는 기본 매뉴얼 키
+    DEFAULT_KEY = None
+
+    def __init__(self, keyword_config: ManualKeywordConfig, overall_score_fn):
+        """
+        인덱스 생성
+
+        Args:
+            keyword_config: 매뉴얼 키워드 설정
+            overall_score_fn: 종합 점수 함수 (ManualComplianceChecker._calculate_overall_score)
+        """
+        self.keyword_config = keyword_config
+        self._overall_score = overall_score_fn
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """현재 매뉴얼 설정으로 인덱스 다시 생성 (매뉴얼 변경 시 호출)"""
+        forms: Dict[Tuple[str, str], int] = {}
+        manuals: Dict[Any, ManualKeywords] = dict(self.keyword_config.manual_map)
+        manuals[self.DEFAULT_KEY] = self.keyword_config.get_keywords(None, None)
+
+        # 매뉴얼별 카테고리 (마스크, 중복 비트, 리스트 길이)
+        self.masks: Dict[Any, Tuple[Tuple[int, Tuple[int, ...], int], ...]] = {}
+        for key, manual_keywords in manuals.items():
+            category_masks = []
+            for category in COMPLIANCE_CATEGORIES:
+                mask = 0
+                duplicate_bits = []
+                keywords = getattr(manual_keywords, category)
+                for keyword in keywords:
+                    keyword_normalized = keyword.lower().strip()
+                    keyword_stripped = NON_WORD_CHAR_REGEX.sub('', keyword_normalized)
+                    # 공백/문장부호만 있는 키워드는 정규화 텍스트에서 직접 검사
+                    form = ("stripped", keyword_stripped) if keyword_stripped else ("normalized", keyword_normalized)
+                    bit = forms.setdefault(form, len(forms))
+                    if mask >> bit & 1:
+                        # 같은 형태의 키워드가 리스트에 여러 번 있으면 개수만큼 세야 함
+                        duplicate_bits.append(bit)
+                    mask |= 1 << bit
+                category_masks.append((mask, tuple(duplicate_bits), len(keywords)))
+            self.masks[key] = tuple(category_masks)
+
+        stripped_forms = [(bit, value) for (kind, value), bit in forms.items() if kind == "stripped"]
+        self.stripped_bits = [bit for bit, _ in stripped_forms]
+        self.normalized_forms = [(bit, value) for (kind, value), bit in forms.items() if kind == "normalized"]
+        self.index = KeywordIndex({"manual": [value for _, value in stripped_forms]})
+        self.num_bits = len(forms)
+
+    def found_bits(self, text: NormalizedText) -> int:
+        """텍스트에 포함된 모든 매뉴얼 키워드의 비트셋"""
+        bits = 0
+        stripped_bits = self.stripped_bits
+        for position in self.index.scan(text.stripped).indices("manual"):
+            bits |= 1 << stripped_bits[position]
+        for bit, keyword_normalized in self.normalized_forms:
+            if keyword_normalized in text.normalized:
+                bits |= 1 << bit
+        return bits
+
+    def score(self, found_bits: int, key, is_start: bool = False, is_end: bool = False) -> float:
+        """
+        비트셋으로 매뉴얼 하나의 종합 준수도 계산
+
+        Args:
+            found_bits: found_bits() 결과
+            key: (감정 라벨, CAR) (매뉴얼이 없으면 기본 매뉴얼)
+            is_start: 세션 시작 여부
+            is_end: 세션 종료 여부
+        """
+        category_masks = self.masks.get(key) or self.masks[self.DEFAULT_KEY]
+        counts = []
+        totals = []
+        for mask, duplicate_bits, total in category_masks:
+            count = (found_bits & mask).bit_count()
+            for bit in duplicate_bits:
+                count += found_bits >> bit & 1
+            counts.append(count)
+            totals.append(total)
+        greeting, closing, required, prohibited, response, empathy = counts
+        greeting_total, closing_total, required_total, prohibited_total, response_total, empathy_total = totals
+
+        # 카테고리 점수 (ManualComplianceChecker._check_* 와 동일한 규칙)
+        greeting_score = min(1.0, greeting / max(1, greeting_total)) if greeting else 0.0
+        closing_score = min(1.0, closing / max(1, closing_total)) if closing else 0.0
+
+        if not required_total:
+            required_score = 1.0
+        else:
+            found_ratio = required / required_total
+            if found_ratio == 1.0:
+                required_score = 1.0
+            elif found_ratio >= 0.5:
+                required_score = 0.5 + (found_ratio - 0.5) * 1.0
+            else:
+                required_score = found_ratio * 1.0
+
+        prohibited_score = 0.0 if prohibited_total and prohibited else 1.0
+        if not response_total:
+            response_score = 1.0
+        else:
+            response_score = min(1.0, response / max(1, response_total)) if response else 0.5
+        if not empathy_total:
+            empathy_score = 1.0
+        else:
+            empathy_score = min(1.0, empathy / max(1, empathy_total)) if empathy else 0.5
+
+        return self._overall_score(
+            greeting_score=greeting_score if is_start else None,
+            closing_score=closing_score if is_end else None,
+            required_score=required_score,
+            prohibited_score=prohibited_score,
+            response_score=response_score,
+            empathy_score=empathy_score
+        )
+
+    def score_all(self, text: NormalizedText, is_start: bool = False, is_end: bool = False) -> Dict[Any, float]:
+        """모든 매뉴얼(기본 매뉴얼 포함)의 종합 준수도 {(감정 라벨, CAR): 점수}"""
+        found_bits = self.found_bits(text)
+        return {key: self.score(found_bits, key, is_start, is_end) for key in self.masks}
 
 
 class ManualComplianceChecker:
     """매뉴얼 준수도 검사기"""
     
-    def __init__(self):
-        """매뉴얼 준수도 검사기 초기화"""
-        self.keyword_config = ManualKeywordConfig()
+    def __init__(self, keyword_config: Optional[ManualKeywordConfig] = None):
+        """
+        매뉴얼 준수도 검사기 초기화
+        
+        Args:
+            keyword_config: 매뉴얼 키워드 설정 (None이면 기본 설정, 규칙 레지스트리 스냅샷에서 주입)
+        """
+        self.keyword_config = keyword_config if keyword_config is not None else ManualKeywordConfig()
+        # (감정 라벨, CAR) 매뉴얼별 컴파일된 매처 (초기화 시 모두 컴파일)
+        self._default_matcher = CompiledManual(self.keyword_config.get_keywords(None, None))
+        self._matchers: Dict[Tuple[str, str], CompiledManual] = {
+            key: CompiledManual(manual_keywords)
+            for key, manual_keywords in self.keyword_config.manual_map.items()
+        }
+        # 모든 매뉴얼을 한 번에 채점하기 위한 비트셋 인덱스
+        self.compliance_index = ManualComplianceIndex(self.keyword_config, self._calculate_overall_score)
+    
+    def get_matcher(self, emotion_label: str, customer_label: str) -> CompiledManual:
+        """(감정 라벨, CAR) 조합의 컴파일된 매처 (매뉴얼이 바뀌었으면 다시 컴파일)"""
+        key = (emotion_label, customer_label)
+        manual_keywords = self.keyword_config.manual_map.get(key)
+        if manual_keywords is None:
+            return self._default_matcher
+        matcher = self._matchers.get(key)
+        if matcher is None or matcher.manual_keywords is not manual_keywords:
+            matcher = CompiledManual(manual_keywords)
+            self._matchers[key] = matcher
+        return matcher
+    
+    def compliance_by_emotion(
+        self,
+        agent_text: str,
+        customer_label: str,
+        is_start: bool = False,
+        is_end: bool = False
+    ) -> Dict[str, float]:
+        """
+        모든 감정 라벨에 대한 매뉴얼 준수도 (감정 라벨이 아직 없을 때 참고용)
+        
+        Args:
+            agent_text: 상담원 발화 텍스트
+            customer_label: 손님 발화 Label (CAR)
+            is_start: 세션 시작 여부
+            is_end: 세션 종료 여부
+        
+        Returns:
+            {감정 라벨: 종합 준수도} (check_compliance의 점수와 동일)
+        """
+        index = self.compliance_index
+        found_bits = index.found_bits(NormalizedText(agent_text))
+        return {
+            emotion.value: index.score(found_bits, (emotion.value, customer_label), is_start, is_end)
+            for emotion in EmotionLabel
+        }
     
     def check_compliance(
         self,
@@ -43,36 +319,37 @@ class ManualComplianceChecker:
         # 매뉴얼 키워드 가져오기
         manual_keywords = self.keyword_config.get_keywords(emotion_label, customer_label)
         
-        # 텍스트 전처리 (소문자 변환 및 공백 정규화)
-        text_normalized = self._normalize_text(agent_text)
+        # 텍스트 정규화는 1회만 수행하고, 매뉴얼 키워드는 컴파일된 매처로 한 번에 탐색
+        normalized_text = NormalizedText(agent_text)
+        found = self.get_matcher(emotion_label, customer_label).match(normalized_text)
         
         # 1. 인사 키워드 검사 (시작/끝)
         greeting_score, greeting_details = self._check_greeting(
-            text_normalized, manual_keywords, is_start
+            found["greeting_keywords"], manual_keywords, is_start
         )
         
         closing_score, closing_details = self._check_closing(
-            text_normalized, manual_keywords, is_end
+            found["closing_keywords"], manual_keywords, is_end
         )
         
         # 2. 필수 키워드 검사 (작은 조각 단위)
         required_score, required_details = self._check_required_keywords(
-            text_normalized, manual_keywords
+            found["required_keywords"], manual_keywords
         )
         
         # 3. 금지 키워드 검사
         prohibited_score, prohibited_details = self._check_prohibited_keywords(
-            text_normalized, manual_keywords
+            found["prohibited_keywords"], manual_keywords
         )
         
         # 4. 응대 표현 검사 (구 단위)
         response_score, response_details = self._check_response_phrases(
-            text_normalized, manual_keywords
+            found["response_phrases"], manual_keywords
         )
         
         # 5. 공감 표현 검사 (empathy_score와 겹치는 부분)
         empathy_score, empathy_details = self._check_empathy_phrases(
-            text_normalized, manual_keywords
+            found["empathy_phrases"], manual_keywords
         )
         
         # 종합 점수 계산
@@ -124,7 +401,7 @@ class ManualComplianceChecker:
     
     def _check_greeting(
         self,
-        text: str,
+        found_keywords: List[str],
         manual_keywords: ManualKeywords,
         is_start: bool
     ) -> Tuple[float, Dict[str, Any]]:
@@ -137,11 +414,6 @@ class ManualComplianceChecker:
         if not is_start:
             return 1.0, {"checked": False, "reason": "세션 시작이 아님"}
         
-        found_keywords = []
-        for keyword in manual_keywords.greeting_keywords:
-            if self._contains_keyword(text, keyword):
-                found_keywords.append(keyword)
-        
         if found_keywords:
             score = min(1.0, len(found_keywords) / max(1, len(manual_keywords.greeting_keywords)))
             return score, {
@@ -159,7 +431,7 @@ class ManualComplianceChecker:
     
     def _check_closing(
         self,
-        text: str,
+        found_keywords: List[str],
         manual_keywords: ManualKeywords,
         is_end: bool
     ) -> Tuple[float, Dict[str, Any]]:
@@ -172,11 +444,6 @@ class ManualComplianceChecker:
         if not is_end:
             return 1.0, {"checked": False, "reason": "세션 종료가 아님"}
         
-        found_keywords = []
-        for keyword in manual_keywords.closing_keywords:
-            if self._contains_keyword(text, keyword):
-                found_keywords.append(keyword)
-        
         if found_keywords:
             score = min(1.0, len(found_keywords) / max(1, len(manual_keywords.closing_keywords)))
             return score, {
@@ -194,7 +461,7 @@ class ManualComplianceChecker:
     
     def _check_required_keywords(
         self,
-        text: str,
+        found_keywords: List[str],
         manual_keywords: ManualKeywords
     ) -> Tuple[float, Dict[str, Any]]:
         """
@@ -206,14 +473,8 @@ class ManualComplianceChecker:
         if not manual_keywords.required_keywords:
             return 1.0, {"checked": False, "reason": "필수 키워드 없음"}
         
-        found_keywords = []
-        missing_keywords = []
-        
-        for keyword in manual_keywords.required_keywords:
-            if self._contains_keyword(text, keyword):
-                found_keywords.append(keyword)
-            else:
-                missing_keywords.append(keyword)
+        found_set = set(found_keywords)
+        missing_keywords = [kw for kw in manual_keywords.required_keywords if kw not in found_set]
         
         # 필수 키워드 포함 비율로 점수 계산
         if len(manual_keywords.required_keywords) == 0:
@@ -239,7 +500,7 @@ class ManualComplianceChecker:
     
     def _check_prohibited_keywords(
         self,
-        text: str,
+        found_prohibited: List[str],
         manual_keywords: ManualKeywords
     ) -> Tuple[float, Dict[str, Any]]:
         """
@@ -251,11 +512,6 @@ class ManualComplianceChecker:
         if not manual_keywords.prohibited_keywords:
             return 1.0, {"checked": False, "reason": "금지 키워드 없음"}
         
-        found_prohibited = []
-        for keyword in manual_keywords.prohibited_keywords:
-            if self._contains_keyword(text, keyword):
-                found_prohibited.append(keyword)
-        
         if found_prohibited:
             # 금지 키워드 사용 시 점수 0.0
             return 0.0, {
@@ -270,7 +526,7 @@ class ManualComplianceChecker:
     
     def _check_response_phrases(
         self,
-        text: str,
+        found_phrases: List[str],
         manual_keywords: ManualKeywords
     ) -> Tuple[float, Dict[str, Any]]:
         """
@@ -282,11 +538,6 @@ class ManualComplianceChecker:
         if not manual_keywords.response_phrases:
             return 1.0, {"checked": False, "reason": "응대 표현 없음"}
         
-        found_phrases = []
-        for phrase in manual_keywords.response_phrases:
-            if self._contains_keyword(text, phrase):
-                found_phrases.append(phrase)
-        
         if found_phrases:
             score = min(1.0, len(found_phrases) / max(1, len(manual_keywords.response_phrases)))
             return score, {
@@ -302,7 +553,7 @@ class ManualComplianceChecker:
     
     def _check_empathy_phrases(
         self,
-        text: str,
+        found_phrases: List[str],
         manual_keywords: ManualKeywords
     ) -> Tuple[float, Dict[str, Any]]:
         """
@@ -314,11 +565,6 @@ class ManualComplianceChecker:
         if not manual_keywords.empathy_phrases:
             return 1.0, {"checked": False, "reason": "공감 표현 없음"}
         
-        found_phrases = []
-        for phrase in manual_keywords.empathy_phrases:
-            if self._contains_keyword(text, phrase):
-                found_phrases.append(phrase)
-        
         if found_phrases:
             score = min(1.0, len(found_phrases) / max(1, len(manual_keywords.empathy_phrases)))
             return score, {
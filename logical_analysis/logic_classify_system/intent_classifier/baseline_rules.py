@@ -6,6 +6,8 @@ Turn 단위 분석을 위해 반복성 감지를 키워드만으로 제한
 
 from typing import List, Tuple, Optional
 
+from ..keyword_engine.keyword_index import KeywordHits, scan_keywords
+
 
 class IntentBaselineRules:
     """발화 의도 분류용 Baseline 규칙"""
@@ -84,13 +86,15 @@ class IntentBaselineRules:
     ]
     
     @staticmethod
-    def detect_normal_labels(text: str, session_context: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+    def detect_normal_labels(text: str, session_context: Optional[List[str]] = None,
+                             keyword_hits: Optional[KeywordHits] = None) -> List[Tuple[str, float]]:
         """
         Normal Label 감지 (Baseline 규칙 기반)
         
         Args:
             text: 분석할 텍스트 (해당 Turn만)
             session_context: 세션 맥락 (선택사항, 최소 사용)
+            keyword_hits: 키워드 스캔 결과 (None이면 직접 스캔)
         
         Returns:
             [(label, confidence), ...] 리스트
@@ -98,40 +102,40 @@ class IntentBaselineRules:
             - confidence: 신뢰도 (0.0-1.0)
         """
         results = []
-        text_lower = text.lower()
+        hits = keyword_hits if keyword_hits is not None else scan_keywords(text)
         
         # 1. REQUEST (요청) 감지
-        request_keywords = [kw for kw in IntentBaselineRules.REQUEST_KEYWORDS if kw in text_lower]
+        request_keywords = hits.found("REQUEST_KEYWORDS")
         if request_keywords:
             confidence = min(0.6 + len(request_keywords) * 0.15, 0.9)
             results.append(("REQUEST", confidence))
         
         # 2. COMPLAINT (불만) 감지
-        complaint_keywords = [kw for kw in IntentBaselineRules.COMPLAINT_KEYWORDS if kw in text_lower]
+        complaint_keywords = hits.found("COMPLAINT_KEYWORDS")
         if complaint_keywords:
             confidence = min(0.6 + len(complaint_keywords) * 0.15, 0.9)
             results.append(("COMPLAINT", confidence))
         
         # 3. CLARIFICATION (명확화 요청) 감지
-        clarification_keywords = [kw for kw in IntentBaselineRules.CLARIFICATION_KEYWORDS if kw in text_lower]
+        clarification_keywords = hits.found("CLARIFICATION_KEYWORDS")
         if clarification_keywords:
             confidence = min(0.6 + len(clarification_keywords) * 0.15, 0.9)
             results.append(("CLARIFICATION", confidence))
         
         # 4. CONFIRMATION (확인) 감지
-        confirmation_keywords = [kw for kw in IntentBaselineRules.CONFIRMATION_KEYWORDS if kw in text_lower]
+        confirmation_keywords = hits.found("CONFIRMATION_KEYWORDS")
         if confirmation_keywords:
             confidence = min(0.6 + len(confirmation_keywords) * 0.15, 0.9)
             results.append(("CONFIRMATION", confidence))
         
         # 5. CLOSING (종료) 감지
-        closing_keywords = [kw for kw in IntentBaselineRules.CLOSING_KEYWORDS if kw in text_lower]
+        closing_keywords = hits.found("CLOSING_KEYWORDS")
         if closing_keywords:
             confidence = min(0.7 + len(closing_keywords) * 0.1, 0.9)
             results.append(("CLOSING", confidence))
         
         # 6. INQUIRY (문의) 감지 (기본값)
-        inquiry_keywords = [kw for kw in IntentBaselineRules.INQUIRY_KEYWORDS if kw in text_lower]
+        inquiry_keywords = hits.found("INQUIRY_KEYWORDS")
         if inquiry_keywords:
             confidence = min(0.5 + len(inquiry_keywords) * 0.1, 0.8)
             results.append(("INQUIRY", confidence))
@@ -139,7 +143,8 @@ class IntentBaselineRules:
         return results
     
     @staticmethod
-    def detect_special_labels(text: str, session_context: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+    def detect_special_labels(text: str, session_context: Optional[List[str]] = None,
+                              keyword_hits: Optional[KeywordHits] = None) -> List[Tuple[str, float]]:
         """
         특수 Label 감지 (Baseline 규칙 기반)
         
@@ -149,6 +154,7 @@ class IntentBaselineRules:
         Args:
             text: 분석할 텍스트 (해당 Turn만)
             session_context: 세션 맥락 (선택사항, 최소 사용)
+            keyword_hits: 키워드 스캔 결과 (None이면 직접 스캔)
         
         Returns:
             [(label, confidence), ...] 리스트
@@ -156,35 +162,31 @@ class IntentBaselineRules:
             - confidence: 신뢰도 (0.0-1.0)
         """
         results = []
-        text_lower = text.lower()
+        hits = keyword_hits if keyword_hits is not None else scan_keywords(text)
         
         # 1. 반복 표현 키워드 감지 (Turn 단위: 키워드만 감지)
         # 실제 반복 여부 판단은 후속 모듈에서 수행
-        repetition_count = sum(1 for indicator in IntentBaselineRules.REPETITION_INDICATORS 
-                               if indicator in text_lower)
+        repetition_count = hits.count("REPETITION_INDICATORS")
         if repetition_count > 0:
             # 키워드만으로 감지 (세션 맥락 최소 사용)
             confidence = min(0.4 + repetition_count * 0.2, 0.8)  # 최대 0.8로 제한 (후속 모듈에서 실제 판단)
             results.append(("REPETITION", confidence))
         
         # 2. 무리한 요구 감지 (실제로 무리한 요구만, '지금', '당장' 같은 것은 REQUEST로 분류)
-        strong_unreasonable = [kw for kw in IntentBaselineRules.UNREASONABLE_DEMAND_STRONG 
-                              if kw in text_lower]
+        strong_unreasonable = hits.found("UNREASONABLE_DEMAND_STRONG")
         if strong_unreasonable:
             # 강한 표현이 있으면 HIGH 심각도
             confidence = min(0.7 + len(strong_unreasonable) * 0.1, 1.0)
             results.append(("UNREASONABLE_DEMAND", confidence))
         else:
             # 일반적인 무리한 요구 표현 (2개 이상 감지)
-            unreasonable_count = sum(1 for kw in IntentBaselineRules.UNREASONABLE_DEMAND_INDICATORS 
-                                    if kw in text_lower)
+            unreasonable_count = hits.count("UNREASONABLE_DEMAND_INDICATORS")
             if unreasonable_count >= 2:
                 confidence = min(0.5 + unreasonable_count * 0.15, 1.0)
                 results.append(("UNREASONABLE_DEMAND", confidence))
         
         # 3. 부당성/무관성 감지
-        irrelevance_count = sum(1 for kw in IntentBaselineRules.IRRELEVANCE_INDICATORS 
-                               if kw in text_lower)
+        irrelevance_count = hits.count("IRRELEVANCE_INDICATORS")
         if irrelevance_count > 0:
             confidence = min(0.3 + irrelevance_count * 0.25, 1.0)
             results.append(("IRRELEVANCE", confidence))
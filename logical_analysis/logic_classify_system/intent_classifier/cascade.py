@@ -0,0 +1,84 @@
+"""
+규칙 → 모델 캐스케이드 게이트
+
+Baseline 규칙을 먼저 적용하고, 규칙 신뢰도가 불확실 구간에 있을 때만
+문장 분류 모델을 호출하도록 판단
+(예: 강한 무리한 요구 표현, 욕설 감지, 명확한 종료 인사는 규칙만으로 결정)
+"""
+
+import os
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Tuple
+
+# 캐스케이드 사용 여부 환경 변수 ("1"/"true"/"on"이면 사용, 없으면 모든 발화에 모델 사용)
+CASCADE_ENV = "LOGIC_INTENT_CASCADE"
+# 임계값 환경 변수 → CascadeConfig 필드 (없으면 기본값)
+CASCADE_THRESHOLD_ENVS = {
+    "LOGIC_INTENT_CASCADE_SPECIAL_ACCEPT": "special_accept",
+    "LOGIC_INTENT_CASCADE_NORMAL_ACCEPT": "normal_accept",
+    "LOGIC_INTENT_CASCADE_NORMAL_MARGIN": "normal_margin",
+}
+
+
+@dataclass
+class CascadeConfig:
+    """캐스케이드 게이트 임계값 설정"""
+    enabled: bool = True
+    # Special 요인(욕설/규칙) 최고 신뢰도가 이 값 이상이면 모델 생략
+    special_accept: float = 0.7
+    # Special 요인이 없고 Normal 규칙 최고 신뢰도가 이 값 이상이면 모델 생략
+    # (기본값: 종료 인사 1개(0.8) 또는 일반 Normal 키워드 2개 이상(0.9)이면 생략, 키워드 1개(0.75)는 모델 호출)
+    normal_accept: float = 0.78
+    # Normal 규칙 1위와 2위 신뢰도 차이가 이 값 이상일 때만 생략 (경합 시 모델 호출)
+    normal_margin: float = 0.1
+
+    def needs_model(
+        self,
+        special_factors: List[Tuple[str, float]],
+        normal_results: Optional[List[Tuple[str, float]]] = None
+    ) -> bool:
+        """
+        규칙 결과가 불확실 구간에 있어 모델 호출이 필요한지 판단
+
+        Args:
+            special_factors: [(Special Label, 신뢰도), ...] (욕설 감지 + Special 규칙)
+            normal_results: [(Normal Label, 신뢰도), ...] (Special 요인이 없을 때만 사용)
+
+        Returns:
+            모델 호출 필요 여부
+        """
+        if not self.enabled:
+            return True
+        if special_factors:
+            return max(conf for _, conf in special_factors) < self.special_accept
+        if not normal_results:
+            return True
+        confidences = sorted((conf for _, conf in normal_results), reverse=True)
+        runner_up = confidences[1] if len(confidences) > 1 else 0.0
+        decisive = confidences[0] >= self.normal_accept and confidences[0] - runner_up >= self.normal_margin
+        return not decisive
+
+
+def cascade_config_from_env(environ: Optional[Mapping[str, str]] = None) -> Optional[CascadeConfig]:
+    """
+    환경 변수로 캐스케이드 설정 생성
+
+    Args:
+        environ: 환경 변수 (None이면 os.environ)
+
+    Returns:
+        LOGIC_INTENT_CASCADE가 켜져 있으면 CascadeConfig, 아니면 None
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get(CASCADE_ENV, "").strip().lower() not in ("1", "true", "yes", "on"):
+        return None
+    thresholds = {}
+    for env_name, field in CASCADE_THRESHOLD_ENVS.items():
+        value = environ.get(env_name)
+        if value is None or not value.strip():
+            continue
+        try:
+            thresholds[field] = float(value)
+        except ValueError:
+            raise ValueError(f"{env_name} 값이 숫자가 아닙니다: {value}") from None
+    return CascadeConfig(**thresholds)
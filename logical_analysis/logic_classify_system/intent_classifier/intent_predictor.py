@@ -6,29 +6,49 @@ Turn 단위 분석에 맞게 수정
 
 from typing import Optional, List
 from datetime import datetime
+import os
 import warnings
 
 from .baseline_rules import IntentBaselineRules
 from .sentence_classifier import SentenceClassifier
+from .ngram_classifier import HashedNgramClassifier
+from .cascade import CascadeConfig
 from ..data.data_structures import ClassificationResult
+from ..data.utterance_context import UtteranceContext
 from ..config.labels import NORMAL_LABELS, SPECIAL_LABELS
 
+# 모델 백엔드 선택 환경 변수 (배포 이미지에 torch/transformers가 없으면 "ngram" 사용)
+INTENT_BACKEND_ENV = "LOGIC_INTENT_BACKEND"
+# 백엔드 이름 → 분류기 클래스 (predict/predict_batch/is_available 인터페이스 공통)
+CLASSIFIER_BACKENDS = {
+    "transformer": SentenceClassifier,
+    "ngram": HashedNgramClassifier,
+}
+
 
 class IntentPredictor:
     """발화 의도 예측기"""
     
-    def __init__(self, use_model: bool = True, model_path: Optional[str] = None):
+    def __init__(self, use_model: bool = True, model_path: Optional[str] = None,
+                 cascade: Optional[CascadeConfig] = None, backend: Optional[str] = None):
         """
         발화 의도 예측기 초기화
         
         Args:
             use_model: 모델 분류기 사용 여부 (True이면 모델 사용, False이면 baseline 규칙만 사용)
-            model_path: 모델 경로 (None이면 기본 경로 사용)
+            model_path: 모델 경로 (None이면 백엔드 기본 경로 사용)
+            cascade: 규칙 → 모델 캐스케이드 설정 (None이면 모든 발화에 모델 사용)
+            backend: 모델 백엔드 ("transformer" 또는 "ngram", None이면 LOGIC_INTENT_BACKEND 환경 변수,
+                     없으면 "transformer")
         """
+        self.backend = backend or os.environ.get(INTENT_BACKEND_ENV) or "transformer"
+        if self.backend not in CLASSIFIER_BACKENDS:
+            raise ValueError(f"알 수 없는 의도 분류 백엔드: {self.backend} (사용 가능: {list(CLASSIFIER_BACKENDS)})")
+        
         # 모델 분류기 로드
         if use_model:
             try:
-                self.classifier = SentenceClassifier(model_path=model_path)
+                self.classifier = CLASSIFIER_BACKENDS[self.backend](model_path=model_path)
                 if not self.classifier.is_available():
                     warnings.warn("모델 분류기를 사용할 수 없습니다. Baseline 규칙만 사용합니다.")
                     self.classifier = None
@@ -40,11 +60,19 @@ class IntentPredictor:
         else:
             self.classifier = None
         
+        self.cascade = cascade
+        
+        # 계측: 모델 추론 누적 횟수 (predict_batch는 호출 1회로 계산), 캐스케이드로 생략한 발화 수
+        self.model_call_count = 0
+        self.model_skip_count = 0
+        
         # Baseline 규칙은 모듈 내부에 포함
         self.baseline_rules = IntentBaselineRules()
     
     def predict(self, text: str, profanity_detected: bool, profanity_confidence: float = 0.0,
-                session_context: Optional[List[str]] = None) -> ClassificationResult:
+                session_context: Optional[List[str]] = None,
+                context: Optional[UtteranceContext] = None,
+                timestamp: Optional[datetime] = None) -> ClassificationResult:
         """
         발화 의도 예측 (통합)
         
@@ -59,10 +87,16 @@ class IntentPredictor:
             profanity_detected: 1차 필터링에서 욕설 감지 여부
             profanity_confidence: 욕설 감지 신뢰도 (0.0-1.0)
             session_context: 세션 맥락 (선택사항, 최소 사용)
+            context: 발화 컨텍스트 (키워드 스캔 결과/모델 출력 재사용)
+            timestamp: 분류 시각 (None이면 현재 시각, 파이프라인은 세션 분석 시각 전달)
         
         Returns:
             ClassificationResult (label, label_type, confidence, ...)
         """
+        keyword_hits = context.keyword_hits if context is not None else None
+        if timestamp is None:
+            timestamp = datetime.now()
+        
         # Special Label 감지 요인 수집 (korcen + baseline 규칙 + 모델)
         special_factors = []  # [(label, confidence), ...]
         
@@ -71,34 +105,41 @@ class IntentPredictor:
             special_factors.append(("PROFANITY", profanity_confidence))
         
         # 2. Baseline 규칙으로 Special Label 감지 (Turn 단위)
-        baseline_results = self.baseline_rules.detect_special_labels(text, session_context)
+        baseline_results = self.baseline_rules.detect_special_labels(text, session_context, keyword_hits=keyword_hits)
         special_factors.extend(baseline_results)
         
+        # 모델 추론은 발화당 1회만 수행하고 Special/Normal 판단에 같은 결과 사용
+        # (캐스케이드 사용 시 규칙 결과가 불확실 구간일 때만 추론)
+        normal_baseline_results = None
+        run_model = True
+        if self.cascade is not None and self._model_available():
+            run_model, normal_baseline_results = self._cascade_gate(
+                text, session_context, keyword_hits, special_factors
+            )
+            if not run_model:
+                self.model_skip_count += 1
+        model_result = self._evaluate_model(text, context) if run_model else None
+        # 이 발화 분류에 사용한 모델 추론 횟수 (배치 선추론 결과도 발화당 1회, 생략/실패 시 0)
+        model_calls = 1 if model_result is not None else 0
+        
         # 3. 모델로 Special Label 예측 (모델이 사용 가능한 경우)
-        if self.classifier and self.classifier.is_available():
-            try:
-                model_result = self.classifier.predict(text, return_probabilities=True)
-                # 모델이 Special Label로 예측한 경우 추가
-                if model_result.get('label_type') == 'SPECIAL':
-                    model_label = model_result.get('label')
-                    model_confidence = model_result.get('confidence', 0.0)
-                    # 기존에 같은 label이 없거나, 모델 신뢰도가 더 높은 경우 추가/업데이트
-                    existing_label_idx = None
-                    for i, (label, conf) in enumerate(special_factors):
-                        if label == model_label:
-                            existing_label_idx = i
-                            break
-                    
-                    if existing_label_idx is not None:
-                        # 기존 신뢰도와 모델 신뢰도 중 높은 값 사용
-                        _, existing_conf = special_factors[existing_label_idx]
-                        special_factors[existing_label_idx] = (model_label, max(existing_conf, model_confidence))
-                    else:
-                        # 새로운 Special Label 추가
-                        special_factors.append((model_label, model_confidence))
-            except Exception as e:
-                # 모델 예측 실패 시 무시하고 계속 진행
-                warnings.warn(f"모델 예측 중 오류 발생: {e}")
+        if model_result is not None and model_result.get('label_type') == 'SPECIAL':
+            model_label = model_result.get('label')
+            model_confidence = model_result.get('confidence', 0.0)
+            # 기존에 같은 label이 없거나, 모델 신뢰도가 더 높은 경우 추가/업데이트
+            existing_label_idx = None
+            for i, (label, conf) in enumerate(special_factors):
+                if label == model_label:
+                    existing_label_idx = i
+                    break
+            
+            if existing_label_idx is not None:
+                # 기존 신뢰도와 모델 신뢰도 중 높은 값 사용
+                _, existing_conf = special_factors[existing_label_idx]
+                special_factors[existing_label_idx] = (model_label, max(existing_conf, model_confidence))
+            else:
+                # 새로운 Special Label 추가
+                special_factors.append((model_label, model_confidence))
         
         # Special Label 요인들이 있는 경우
         if special_factors:
@@ -128,34 +169,32 @@ class IntentPredictor:
                 confidence=special_label_confidence,
                 text=text,
                 probabilities=probabilities,
-                timestamp=datetime.now()
+                timestamp=timestamp,
+                model_calls=model_calls
             )
         
         # Special Label이 아닌 경우: Normal Label로 분류
-        # 1. 모델로 Normal Label 예측 시도 (모델이 사용 가능한 경우)
-        if self.classifier and self.classifier.is_available():
-            try:
-                model_result = self.classifier.predict(text, return_probabilities=True)
-                # 모델이 Normal Label로 예측한 경우
-                if model_result.get('label_type') == 'NORMAL':
-                    label = model_result.get('label')
-                    confidence = model_result.get('confidence', 0.3)
-                    probabilities = model_result.get('probabilities', {label: 1.0})
-                    
-                    return ClassificationResult(
-                        label=label,
-                        label_type="NORMAL",
-                        confidence=confidence,
-                        text=text,
-                        probabilities=probabilities,
-                        timestamp=datetime.now()
-                    )
-            except Exception as e:
-                # 모델 예측 실패 시 baseline 규칙 사용
-                warnings.warn(f"모델 예측 중 오류 발생: {e}. Baseline 규칙 사용")
+        # 1. 모델 Normal Label 예측 사용 (위에서 계산한 같은 모델 출력)
+        if model_result is not None and model_result.get('label_type') == 'NORMAL':
+            label = model_result.get('label')
+            confidence = model_result.get('confidence', 0.3)
+            probabilities = model_result.get('probabilities', {label: 1.0})
+            
+            return ClassificationResult(
+                label=label,
+                label_type="NORMAL",
+                confidence=confidence,
+                text=text,
+                probabilities=probabilities,
+                timestamp=timestamp,
+                model_calls=model_calls
+            )
         
         # 2. Baseline 규칙으로 Normal Label 분류
-        normal_baseline_results = self.baseline_rules.detect_normal_labels(text, session_context)
+        if normal_baseline_results is None:
+            normal_baseline_results = self.baseline_rules.detect_normal_labels(
+                text, session_context, keyword_hits=keyword_hits
+            )
         
         if normal_baseline_results:
             # 가장 높은 신뢰도의 Normal Label 선택
@@ -172,8 +211,92 @@ class IntentPredictor:
             confidence=0.3,  # 낮은 신뢰도 (Special Label이 아닐 뿐)
             text=text,
             probabilities={label: 1.0},
-            timestamp=datetime.now()
+            timestamp=timestamp,
+            model_calls=model_calls
+        )
+    
+    def prefill_model_outputs(self, contexts: List[UtteranceContext], batch_size: int = 32) -> None:
+        """
+        여러 발화의 모델 출력을 배치 추론으로 미리 계산해 컨텍스트에 저장
+        
+        이후 predict(context=...)는 저장된 출력을 재사용하므로 발화마다 배치 1 추론을 하지 않음
+        
+        Args:
+            contexts: 발화 컨텍스트 리스트 (예: 세션의 모든 손님 발화)
+            batch_size: 한 번에 추론할 문장 수
+        """
+        if not self._model_available():
+            return
+        pending = [context for context in contexts if not context.has_model_output("sentence_classifier")]
+        if self.cascade is not None:
+            # 욕설 감지 전이므로 규칙만으로 결정되는 발화만 제외 (욕설 요인은 신뢰도를 높이기만 함)
+            pending = [
+                context for context in pending
+                if self._cascade_gate(
+                    context.text, None, context.keyword_hits,
+                    self.baseline_rules.detect_special_labels(context.text, None, keyword_hits=context.keyword_hits)
+                )[0]
+            ]
+        if not pending:
+            return
+        outputs = self.classifier.predict_batch(
+            [context.text for context in pending],
+            batch_size=batch_size,
+            return_probabilities=True
         )
+        self.model_call_count += 1
+        for context, output in zip(pending, outputs):
+            context.set_model_output("sentence_classifier", output)
+    
+    @property
+    def model_version(self) -> str:
+        """분류에 사용하는 모델 식별자 (결과 캐시 무효화용, 모델이 없으면 "rules")"""
+        if not self._model_available():
+            return "rules"
+        model_path = getattr(self.classifier, 'model_path', None)
+        version = f"{self.backend}:{model_path}" if model_path else self.backend
+        # 캐스케이드로 모델을 생략한 발화는 결과가 달라지므로 임계값도 버전에 포함
+        if self.cascade is not None and self.cascade.enabled:
+            cascade = self.cascade
+            version += f"+cascade:{cascade.special_accept}/{cascade.normal_accept}/{cascade.normal_margin}"
+        return version
+    
+    def _model_available(self) -> bool:
+        return bool(self.classifier and self.classifier.is_available())
+    
+    def _cascade_gate(self, text, session_context, keyword_hits, special_factors):
+        """
+        캐스케이드 게이트 판단
+        
+        Returns:
+            (모델 호출 필요 여부, 판단에 사용한 Normal 규칙 결과 또는 None)
+        """
+        normal_results = None
+        if not special_factors:
+            normal_results = self.baseline_rules.detect_normal_labels(text, session_context, keyword_hits=keyword_hits)
+        return self.cascade.needs_model(special_factors, normal_results), normal_results
+    
+    def _evaluate_model(self, text: str, context: Optional[UtteranceContext] = None) -> Optional[dict]:
+        """
+        모델 분류 1회 실행 (컨텍스트에 저장된 출력이 있으면 재사용)
+        
+        Returns:
+            모델 출력 딕셔너리 (모델이 없거나 예측 실패 시 None → Baseline 규칙 사용)
+        """
+        if not self._model_available():
+            return None
+        try:
+            if context is None:
+                return self._run_model(text)
+            return context.model_output("sentence_classifier", lambda: self._run_model(text))
+        except Exception as e:
+            warnings.warn(f"모델 예측 중 오류 발생: {e}. Baseline 규칙 사용")
+            return None
+    
+    def _run_model(self, text: str) -> dict:
+        """모델 추론 (호출 횟수 계측)"""
+        self.model_call_count += 1
+        return self.classifier.predict(text, return_probabilities=True)
     
     def _determine_label_type(self, label: str) -> str:
         """
@@ -0,0 +1,323 @@
+"""
+해시 문자 n-gram 선형 분류기 (NumPy 전용)
+
+transformers/torch 없이 동작하는 경량 의도 분류 백엔드
+문자 n-gram을 해시 버킷으로 매핑한 특징에 Softmax 선형 모델을 적용하며,
+talksets 정답지로 오프라인 학습한 가중치를 .npz 파일에서 로드
+
+SentenceClassifier와 같은 predict/predict_batch/is_available 인터페이스를 제공하므로
+IntentPredictor.classifier로 그대로 사용 가능
+"""
+
+import re
+import warnings
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config.labels import NORMAL_LABELS, SPECIAL_LABELS
+
+# 기본 모델 경로 (models/ngram/intent_ngram.npz)
+DEFAULT_MODEL_PATH = Path(__file__).parent.parent / 'models' / 'ngram' / 'intent_ngram.npz'
+
+_WHITESPACE = re.compile(r'\s+')
+_SEPARATOR = 0  # 발화 구분 문자 코드 (정규화된 텍스트에는 나오지 않음)
+_HASH_PRIME = np.uint64(1099511628211)
+_HASH_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def normalize_text(text: str) -> str:
+    """공백 정규화 + 소문자 변환 + 앞뒤 경계 공백 추가 (어절 시작/끝 n-gram 구분)"""
+    return f" {_WHITESPACE.sub(' ', text.replace(chr(_SEPARATOR), ' ')).strip().lower()} "
+
+
+def hash_ngrams(
+    texts: Sequence[str],
+    n_features: int,
+    ngram_range: Tuple[int, int] = (1, 3)
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    여러 발화의 문자 n-gram 해시 버킷을 한 번에 계산
+
+    모든 발화를 구분 문자로 이어 붙인 코드 배열에서 n-gram 해시를 벡터 연산으로 계산하고,
+    구분 문자를 걸치는 n-gram은 제외
+
+    Args:
+        texts: 발화 리스트
+        n_features: 해시 버킷 수 (2의 거듭제곱)
+        ngram_range: (최소 n, 최대 n)
+
+    Returns:
+        (doc_ids, buckets, scales)
+        - doc_ids: n-gram별 발화 인덱스 (오름차순 정렬)
+        - buckets: n-gram별 해시 버킷
+        - scales: 발화별 특징 정규화 계수 (1 / sqrt(n-gram 수))
+    """
+    joined = chr(_SEPARATOR).join(normalize_text(text) for text in texts)
+    codes = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    positions_doc = np.cumsum(codes == _SEPARATOR)
+    mask = np.uint64(n_features - 1)
+
+    doc_parts, bucket_parts = [], []
+    min_n, max_n = ngram_range
+    with np.errstate(over='ignore'):
+        for n in range(min_n, max_n + 1):
+            length = len(codes) - n + 1
+            if length <= 0:
+                continue
+            hashes = np.full(length, n, dtype=np.uint64)
+            for offset in range(n):
+                hashes = hashes * _HASH_PRIME + codes[offset:offset + length]
+            hashes ^= hashes >> np.uint64(29)
+            hashes *= _HASH_MIX
+            hashes ^= hashes >> np.uint64(32)
+            valid = (codes[:length] != _SEPARATOR) & (positions_doc[:length] == positions_doc[n - 1:])
+            doc_parts.append(positions_doc[:length][valid])
+            bucket_parts.append((hashes[valid] & mask).astype(np.int64))
+
+    doc_ids = np.concatenate(doc_parts).astype(np.int64)
+    buckets = np.concatenate(bucket_parts)
+    order = np.argsort(doc_ids, kind='stable')
+    doc_ids, buckets = doc_ids[order], buckets[order]
+    counts = np.bincount(doc_ids, minlength=len(texts))
+    scales = 1.0 / np.sqrt(np.maximum(counts, 1))
+    return doc_ids, buckets, scales
+
+
+class HashedNgramClassifier:
+    """해시 문자 n-gram + Softmax 선형 모델 의도 분류기"""
+
+    def __init__(self, model_path: Optional[str] = None):
+        """
+        분류기 초기화
+
+        Args:
+            model_path: 학습된 가중치 .npz 경로 (None이면 기본 경로 사용)
+        """
+        self.model_path = Path(model_path) if model_path is not None else DEFAULT_MODEL_PATH
+        self.weights: Optional[np.ndarray] = None  # (n_features, n_labels)
+        self.bias: Optional[np.ndarray] = None  # (n_labels,)
+        self.labels: List[str] = []
+        self.ngram_range: Tuple[int, int] = (1, 3)
+
+        if self.model_path.exists():
+            self.load(self.model_path)
+        else:
+            warnings.warn(f"n-gram 분류기 가중치 파일이 존재하지 않습니다: {self.model_path}")
+
+    @property
+    def n_features(self) -> int:
+        return 0 if self.weights is None else self.weights.shape[0]
+
+    def load(self, path) -> None:
+        """가중치 .npz 로드"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                self.weights = data['weights'].astype(np.float32)
+                self.bias = data['bias'].astype(np.float32)
+                self.labels = [str(label) for label in data['labels']]
+                self.ngram_range = tuple(int(n) for n in data['ngram_range'])
+            print(f"n-gram 분류기 로드 완료: {path} (버킷 {self.n_features:,}개, Label {len(self.labels)}개)")
+        except Exception as e:
+            warnings.warn(f"n-gram 분류기 로드 중 오류 발생: {e}")
+            self.weights = None
+            self.bias = None
+            self.labels = []
+
+    def save(self, path) -> Path:
+        """가중치를 압축 .npz로 저장 (사용하지 않는 버킷은 0이라 압축률이 높음)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            labels=np.array(self.labels),
+            ngram_range=np.array(self.ngram_range)
+        )
+        return path
+
+    @classmethod
+    def train(
+        cls,
+        texts: Sequence[str],
+        labels: Sequence[str],
+        n_features: int = 2 ** 16,
+        ngram_range: Tuple[int, int] = (1, 3),
+        epochs: int = 8,
+        batch_size: int = 256,
+        learning_rate: float = 0.5,
+        l2: float = 1e-6,
+        seed: int = 0
+    ) -> 'HashedNgramClassifier':
+        """
+        Softmax 선형 모델 학습 (미니배치 Adagrad)
+
+        Args:
+            texts: 학습 발화 리스트
+            labels: 발화별 정답 Label
+            n_features: 해시 버킷 수 (2의 거듭제곱)
+            ngram_range: 문자 n-gram 범위
+            epochs: 학습 반복 횟수
+            batch_size: 미니배치 크기
+            learning_rate: Adagrad 학습률
+            l2: L2 정규화 계수
+            seed: 셔플 시드
+
+        Returns:
+            학습된 분류기
+        """
+        if n_features & (n_features - 1):
+            raise ValueError(f"n_features는 2의 거듭제곱이어야 합니다: {n_features}")
+
+        classifier = cls.__new__(cls)
+        classifier.model_path = None
+        classifier.labels = sorted(set(labels))
+        classifier.ngram_range = tuple(ngram_range)
+        label_index = {label: idx for idx, label in enumerate(classifier.labels)}
+        targets = np.array([label_index[label] for label in labels], dtype=np.int64)
+        num_labels = len(classifier.labels)
+
+        weights = np.zeros((n_features, num_labels), dtype=np.float64)
+        bias = np.zeros(num_labels, dtype=np.float64)
+        weight_grad_sq = np.full_like(weights, 1e-8)
+        bias_grad_sq = np.full_like(bias, 1e-8)
+
+        rng = np.random.default_rng(seed)
+        texts = list(texts)
+        for _ in range(epochs):
+            order = rng.permutation(len(texts))
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                doc_ids, buckets, scales = hash_ngrams([texts[idx] for idx in batch], n_features, ngram_range)
+                values = scales[doc_ids]
+
+                logits = _sum_rows(weights, doc_ids, buckets, values, len(batch)) + bias
+                probs = _softmax(logits)
+                probs[np.arange(len(batch)), targets[batch]] -= 1.0
+                probs /= len(batch)
+
+                # 배치에 등장한 버킷만 희소 업데이트
+                unique_buckets, inverse = np.unique(buckets, return_inverse=True)
+                contributions = probs[doc_ids] * values[:, None]
+                grad = np.stack([
+                    np.bincount(inverse, weights=contributions[:, label], minlength=len(unique_buckets))
+                    for label in range(num_labels)
+                ], axis=1)
+                grad += l2 * weights[unique_buckets]
+                weight_grad_sq[unique_buckets] += grad ** 2
+                weights[unique_buckets] -= learning_rate * grad / np.sqrt(weight_grad_sq[unique_buckets])
+
+                bias_grad = probs.sum(axis=0)
+                bias_grad_sq += bias_grad ** 2
+                bias -= learning_rate * bias_grad / np.sqrt(bias_grad_sq)
+
+        classifier.weights = weights.astype(np.float32)
+        classifier.bias = bias.astype(np.float32)
+        return classifier
+
+    def predict(
+        self,
+        text: str,
+        max_length: int = 128,
+        return_probabilities: bool = True
+    ) -> Dict[str, any]:
+        """
+        문장 분류 예측 (SentenceClassifier.predict와 같은 반환 형식)
+
+        Args:
+            text: 분류할 텍스트
+            max_length: 인터페이스 호환용 (문자 n-gram은 길이 제한 없음)
+            return_probabilities: 확률 분포 반환 여부
+        """
+        return self.predict_batch([text], return_probabilities=return_probabilities)[0]
+
+    def predict_batch(
+        self,
+        texts: List[str],
+        max_length: int = 128,
+        batch_size: int = 256,
+        return_probabilities: bool = True
+    ) -> List[Dict[str, any]]:
+        """
+        여러 문장 배치 분류 예측
+
+        Args:
+            texts: 분류할 텍스트 리스트
+            max_length: 인터페이스 호환용
+            batch_size: 한 번에 특징을 계산할 문장 수 (메모리 사용량 제한)
+            return_probabilities: 확률 분포 반환 여부
+
+        Returns:
+            입력 순서와 같은 predict 결과 딕셔너리 리스트
+        """
+        if not texts:
+            return []
+        if not self.is_available():
+            return [self._default_result() for _ in texts]
+
+        results = []
+        for start in range(0, len(texts), batch_size):
+            probabilities = self.predict_proba(texts[start:start + batch_size])
+            results.extend(self._result_from_probabilities(row, return_probabilities) for row in probabilities)
+        return results
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """발화별 Label 확률 행렬 (len(texts), n_labels)"""
+        doc_ids, buckets, scales = hash_ngrams(texts, self.n_features, self.ngram_range)
+        logits = _sum_rows(self.weights, doc_ids, buckets, scales[doc_ids], len(texts)) + self.bias
+        return _softmax(logits)
+
+    def _result_from_probabilities(self, probabilities: np.ndarray, return_probabilities: bool = True) -> Dict[str, any]:
+        """한 문장의 Softmax 확률로 예측 결과 딕셔너리 생성"""
+        predicted_idx = int(np.argmax(probabilities))
+        predicted_label = self.labels[predicted_idx]
+        result = {
+            'label': predicted_label,
+            'confidence': float(probabilities[predicted_idx]),
+            'label_type': self._determine_label_type(predicted_label)
+        }
+        if return_probabilities:
+            result['probabilities'] = dict(zip(self.labels, probabilities.tolist()))
+        return result
+
+    @staticmethod
+    def _default_result() -> Dict[str, any]:
+        """가중치가 없을 때 기본 결과 (SentenceClassifier와 동일)"""
+        return {
+            'label': 'INQUIRY',
+            'confidence': 0.3,
+            'probabilities': {'INQUIRY': 1.0},
+            'label_type': 'NORMAL'
+        }
+
+    @staticmethod
+    def _determine_label_type(label: str) -> str:
+        if label in NORMAL_LABELS:
+            return "NORMAL"
+        elif label in SPECIAL_LABELS:
+            return "SPECIAL"
+        else:
+            return "UNKNOWN"
+
+    def is_available(self) -> bool:
+        """모델 사용 가능 여부"""
+        return self.weights is not None and self.bias is not None
+
+
+def _sum_rows(weights: np.ndarray, doc_ids: np.ndarray, buckets: np.ndarray,
+              values: np.ndarray, num_docs: int) -> np.ndarray:
+    """발화별로 등장한 버킷 가중치 행을 값으로 가중 합산 (doc_ids 오름차순 전제)"""
+    counts = np.bincount(doc_ids, minlength=num_docs)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rows = weights[buckets] * values[:, None]
+    sums = np.add.reduceat(rows, np.minimum(starts, len(rows) - 1), axis=0)
+    sums[counts == 0] = 0.0
+    return sums
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
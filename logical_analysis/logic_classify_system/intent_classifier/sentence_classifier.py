@@ -24,6 +24,23 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
     warnings.warn("transformers 라이브러리가 설치되지 않았습니다. 모델 분류기를 사용할 수 없습니다.")
 
+# 모델의 Label ID 매핑 (모델에 따라 수정 필요)
+# 기본값: 모델 설정에서 확인하거나 직접 매핑
+LABEL_MAPPING = {
+    0: 'INQUIRY',
+    1: 'COMPLAINT',
+    2: 'REQUEST',
+    3: 'CLARIFICATION',
+    4: 'CONFIRMATION',
+    5: 'CLOSING',
+    6: 'PROFANITY',
+    7: 'VIOLENCE_THREAT',
+    8: 'SEXUAL_HARASSMENT',
+    9: 'HATE_SPEECH',
+    10: 'UNREASONABLE_DEMAND',
+    11: 'REPETITION'
+}
+
 
 class SentenceClassifier:
     """문장 분류 모델"""
@@ -134,80 +151,126 @@ class SentenceClassifier:
                 'label_type': str       # "NORMAL" or "SPECIAL"
             }
         """
+        # max_length 고정 패딩 대신 실제 토큰 길이만큼만 패딩 (predict_batch와 동일 경로)
+        return self.predict_batch([text], max_length=max_length, return_probabilities=return_probabilities)[0]
+    
+    def predict_batch(
+        self,
+        texts: List[str],
+        max_length: int = 128,
+        batch_size: int = 32,
+        return_probabilities: bool = True
+    ) -> List[Dict[str, any]]:
+        """
+        여러 문장 배치 분류 예측
+        
+        토큰 길이순으로 정렬한 뒤 batch_size 단위 버킷으로 묶고, 버킷마다 가장 긴
+        문장 길이까지만 패딩하여 한 번에 추론 (짧은 발화가 max_length만큼 패딩되지 않음)
+        
+        Args:
+            texts: 분류할 텍스트 리스트
+            max_length: 최대 토큰 길이 (초과 시 잘라냄)
+            batch_size: 한 번에 추론할 문장 수
+            return_probabilities: 확률 분포 반환 여부
+        
+        Returns:
+            입력 순서와 같은 predict 결과 딕셔너리 리스트
+        """
+        if not texts:
+            return []
         if self.model is None or self.tokenizer is None:
             # 모델이 없으면 기본값 반환
-            return {
-                'label': 'INQUIRY',
-                'confidence': 0.3,
-                'probabilities': {'INQUIRY': 1.0},
-                'label_type': 'NORMAL'
-            }
+            return [self._default_result() for _ in texts]
         
         try:
-            # 토크나이징
-            encoding = self.tokenizer(
-                text,
-                truncation=True,
-                padding='max_length',
-                max_length=max_length,
-                return_tensors='pt'
-            )
-            
-            # GPU로 이동
-            input_ids = encoding['input_ids'].to(self.device)
-            attention_mask = encoding['attention_mask'].to(self.device)
+            # 토크나이징 (패딩 없이 길이만 확인)
+            encoding = self.tokenizer(list(texts), truncation=True, max_length=max_length)
+            input_ids = encoding['input_ids']
+            attention_masks = encoding['attention_mask']
             
-            # 예측
-            with torch.no_grad():
-                outputs = self.model(input_ids=input_ids, attention_mask=attention_mask)
+            # 길이순 정렬 후 버킷 단위로 최장 길이까지만 패딩
+            order = sorted(range(len(texts)), key=lambda idx: len(input_ids[idx]))
+            results: List[Optional[Dict[str, any]]] = [None] * len(texts)
+            for start in range(0, len(order), batch_size):
+                bucket = order[start:start + batch_size]
+                batch = self.tokenizer.pad(
+                    {
+                        'input_ids': [input_ids[idx] for idx in bucket],
+                        'attention_mask': [attention_masks[idx] for idx in bucket]
+                    },
+                    padding='longest',
+                    return_tensors='pt'
+                )
                 
-                # 로짓 추출
-                logits = outputs.logits
+                # 예측
+                with torch.no_grad():
+                    outputs = self.model(
+                        input_ids=batch['input_ids'].to(self.device),
+                        attention_mask=batch['attention_mask'].to(self.device)
+                    )
+                    logits = outputs.logits
+                    if logits.dim() > 1 and logits.size(1) > 1:
+                        # Multi-class classification: 확률 계산 (Softmax)
+                        probabilities = torch.softmax(logits, dim=-1).cpu().tolist()
+                    else:
+                        probabilities = [None] * len(bucket)
                 
-                # 확률 계산 (Softmax)
-                if logits.dim() > 1 and logits.size(1) > 1:
-                    # Multi-class classification
-                    probabilities = torch.softmax(logits, dim=-1)
-                    predicted_idx = torch.argmax(probabilities, dim=-1).item()
-                    confidence = probabilities[0][predicted_idx].item()
-                    
-                    # Label ID를 Label 이름으로 변환
-                    predicted_label = self._id_to_label(predicted_idx)
-                    
-                    # 확률 분포 생성
-                    label_probs = {}
-                    for idx in range(probabilities.size(1)):
-                        label = self._id_to_label(idx)
-                        label_probs[label] = probabilities[0][idx].item()
-                else:
-                    # Binary classification or Regression
-                    # 기본값 반환 (모델 출력 형태에 따라 수정 필요)
-                    predicted_label = 'INQUIRY'
-                    confidence = 0.5
-                    label_probs = {'INQUIRY': 0.5}
+                for idx, row in zip(bucket, probabilities):
+                    results[idx] = self._result_from_probabilities(row, return_probabilities)
             
-            # Label 타입 결정
-            label_type = self._determine_label_type(predicted_label)
-            
-            result = {
-                'label': predicted_label,
-                'confidence': confidence,
-                'label_type': label_type
-            }
-            
-            if return_probabilities:
-                result['probabilities'] = label_probs
-            
-            return result
+            return results
         
         except Exception as e:
             warnings.warn(f"예측 중 오류 발생: {e}")
-            return {
-                'label': 'INQUIRY',
-                'confidence': 0.3,
-                'probabilities': {'INQUIRY': 1.0},
-                'label_type': 'NORMAL'
-            }
+            return [self._default_result() for _ in texts]
+    
+    def _result_from_probabilities(
+        self,
+        probabilities: Optional[List[float]],
+        return_probabilities: bool = True
+    ) -> Dict[str, any]:
+        """한 문장의 Softmax 확률로 예측 결과 딕셔너리 생성"""
+        if probabilities is not None:
+            predicted_idx = max(range(len(probabilities)), key=probabilities.__getitem__)
+            confidence = probabilities[predicted_idx]
+            
+            # Label ID를 Label 이름으로 변환
+            predicted_label = self._id_to_label(predicted_idx)
+            
+            # 확률 분포 생성
+            label_probs = {}
+            for idx, prob in enumerate(probabilities):
+                label_probs[self._id_to_label(idx)] = prob
+        else:
+            # Binary classification or Regression
+            # 기본값 반환 (모델 출력 형태에 따라 수정 필요)
+            predicted_label = 'INQUIRY'
+            confidence = 0.5
+            label_probs = {'INQUIRY': 0.5}
+        
+        # Label 타입 결정
+        label_type = self._determine_label_type(predicted_label)
+        
+        result = {
+            'label': predicted_label,
+            'confidence': confidence,
+            'label_type': label_type
+        }
+        
+        if return_probabilities:
+            result['probabilities'] = label_probs
+        
+        return result
+    
+    @staticmethod
+    def _default_result() -> Dict[str, any]:
+        """모델이 없거나 예측 실패 시 기본 결과"""
+        return {
+            'label': 'INQUIRY',
+            'confidence': 0.3,
+            'probabilities': {'INQUIRY': 1.0},
+            'label_type': 'NORMAL'
+        }
     
     def _id_to_label(self, label_id: int) -> str:
         """
@@ -219,24 +282,7 @@ class SentenceClassifier:
         Returns:
             Label 이름
         """
-        # 모델의 Label ID 매핑 (모델에 따라 수정 필요)
-        # 기본값: 모델 설정에서 확인하거나 직접 매핑
-        label_mapping = {
-            0: 'INQUIRY',
-            1: 'COMPLAINT',
-            2: 'REQUEST',
-            3: 'CLARIFICATION',
-            4: 'CONFIRMATION',
-            5: 'CLOSING',
-            6: 'PROFANITY',
-            7: 'VIOLENCE_THREAT',
-            8: 'SEXUAL_HARASSMENT',
-            9: 'HATE_SPEECH',
-            10: 'UNREASONABLE_DEMAND',
-            11: 'REPETITION'
-        }
-        
-        return label_mapping.get(label_id, 'INQUIRY')
+        return LABEL_MAPPING.get(label_id, 'INQUIRY')
     
     def _determine_label_type(self, label: str) -> str:
         """
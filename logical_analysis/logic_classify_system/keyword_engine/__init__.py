@@ -0,0 +1,4 @@
+"""
+키워드 매칭 엔진 모듈
+"""
+
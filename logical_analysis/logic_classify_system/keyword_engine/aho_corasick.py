@@ -0,0 +1,172 @@
+"""
+Aho-Corasick 다중 패턴 매칭 오토마톤
+
+여러 키워드를 한 번의 텍스트 스캔으로 모두 찾기 위한 오토마톤
+(겹치는 키워드, 다른 키워드에 포함된 키워드까지 모두 보고)
+
+- KeywordAutomaton: 패턴 ID(리스트 인덱스) 단위
+- TaggedKeywordAutomaton: 그룹별 패턴 리스트를 (그룹, 그룹 내 순번) 태그로 조회
+  (logic_classify_system_lef Korcen 엔진/스트리밍 감지기에서도 사용)
+"""
+
+from collections import deque
+from typing import Collection, Dict, List, Sequence, Set, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 오토마톤"""
+
+    def __init__(self, patterns: Sequence[str]):
+        """
+        오토마톤 생성
+
+        Args:
+            patterns: 패턴 리스트 (패턴 ID = 리스트 인덱스, 빈 문자열은 무시)
+        """
+        self.patterns = list(patterns)
+        self.pattern_lengths = [len(p) for p in self.patterns]
+
+        # 1. 트라이 구성
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[int, ...]] = [()]
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    out.append(())
+                state = next_state
+            out[state] = out[state] + (pattern_id,)
+
+        # 2. 실패 링크를 BFS로 계산하면서 전이 테이블 보완
+        # - 각 상태의 전이에는 루트 전이와 다른 것만 저장하고, 없으면 루트 전이로 폴백
+        root = goto[0]
+        delta: List[Dict[str, int]] = [root] + [{} for _ in range(len(goto) - 1)]
+        fail = [0] * len(goto)
+        queue = deque(root.values())
+        while queue:
+            state = queue.popleft()
+            fail_state = fail[state]
+            if fail_state:
+                merged = dict(delta[fail_state])
+                merged.update(goto[state])
+                delta[state] = merged
+                out[state] = out[state] + out[fail_state]
+            else:
+                delta[state] = goto[state]
+
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail_state].get(ch) or root.get(ch, 0) if fail_state else root.get(ch, 0)
+                queue.append(child)
+
+        self._root = root
+        self._delta = delta
+        self._out = out
+        self.num_states = len(goto)
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        텍스트에서 모든 패턴 출현 위치 탐색
+
+        Args:
+            text: 검사할 텍스트
+
+        Returns:
+            [(start, end, pattern_id), ...] (end 기준 오름차순)
+        """
+        delta = self._delta
+        root_get = self._root.get
+        out = self._out
+        lengths = self.pattern_lengths
+        matches = []
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch) or root_get(ch, 0)
+            if out[state]:
+                for pattern_id in out[state]:
+                    matches.append((end - lengths[pattern_id], end, pattern_id))
+        return matches
+
+    def find_ids(self, text: str) -> set:
+        """텍스트에 한 번 이상 출현한 패턴 ID 집합 (위치 불필요 시)"""
+        delta = self._delta
+        root_get = self._root.get
+        out = self._out
+        found = set()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch) or root_get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class TaggedKeywordAutomaton:
+    """
+    그룹별 패턴 리스트를 (그룹, 그룹 내 순번) 태그와 함께 담은 오토마톤
+
+    한 번의 스캔으로 여러 그룹의 패턴 출현을 모두 찾고, 그룹별로
+    정규식 `search`와 같은 첫 매칭(가장 왼쪽 시작, 같은 위치면 리스트 앞 패턴)을 고름
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]]):
+        """
+        오토마톤 생성
+
+        Args:
+            groups: {그룹: 패턴 리스트} (빈 문자열은 무시)
+        """
+        self.tags: List[Tuple[str, int]] = []
+        patterns: List[str] = []
+        for group, group_patterns in groups.items():
+            for pattern_index, pattern in enumerate(group_patterns):
+                self.tags.append((group, pattern_index))
+                patterns.append(pattern)
+        self.automaton = KeywordAutomaton(patterns)
+        self.num_states = self.automaton.num_states
+
+    def matched_patterns(self, text: str) -> Set[Tuple[str, int]]:
+        """
+        텍스트에 나타난 모든 패턴
+
+        Returns:
+            {(group, pattern_index)}
+        """
+        tags = self.tags
+        return {tags[pattern_id] for pattern_id in self.automaton.find_ids(text)}
+
+    def first_matches(self, text: str, groups: Collection[str]) -> Dict[str, Tuple[int, int]]:
+        """
+        그룹별 첫 매칭 (정규식 search와 동일한 선택)
+
+        Args:
+            text: 검사할 텍스트
+            groups: 이 텍스트로 검사할 그룹 집합
+
+        Returns:
+            {group: (start, pattern_index)}
+        """
+        automaton = self.automaton
+        delta = automaton._delta
+        root_get = automaton._root.get
+        out = automaton._out
+        lengths = automaton.pattern_lengths
+        tags = self.tags
+        best: Dict[str, Tuple[int, int]] = {}
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch) or root_get(ch, 0)
+            if out[state]:
+                for pattern_id in out[state]:
+                    group, pattern_index = tags[pattern_id]
+                    if group in groups:
+                        candidate = (end - lengths[pattern_id], pattern_index)
+                        current = best.get(group)
+                        if current is None or candidate < current:
+                            best[group] = candidate
+        return best
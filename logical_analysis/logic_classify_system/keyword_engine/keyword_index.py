@@ -0,0 +1,200 @@
+"""
+카테고리 태그 키워드 인덱스
+
+모든 규칙 키워드 리스트(IntentBaselineRules, ProfanityBaselineRules)를
+하나의 Aho-Corasick 오토마톤으로 컴파일하고, 한 번의 스캔 결과를
+카테고리(리스트 이름)별로 조회할 수 있도록 제공
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .aho_corasick import KeywordAutomaton
+
+# 인덱스에 포함할 규칙 키워드 리스트 이름
+INTENT_RULE_LISTS = (
+    "REPETITION_INDICATORS", "UNREASONABLE_DEMAND_STRONG", "UNREASONABLE_DEMAND_INDICATORS",
+    "IRRELEVANCE_INDICATORS", "REQUEST_KEYWORDS", "COMPLAINT_KEYWORDS",
+    "CLARIFICATION_KEYWORDS", "CONFIRMATION_KEYWORDS", "CLOSING_KEYWORDS", "INQUIRY_KEYWORDS",
+)
+PROFANITY_RULE_LISTS = (
+    "PROFANITY_KEYWORDS", "INSULT_KEYWORDS", "THREAT_KEYWORDS", "SEXUAL_HARASSMENT_KEYWORDS",
+)
+HATE_SPEECH_PREFIX = "HATE_SPEECH_KEYWORDS:"
+
+
+class KeywordHits:
+    """한 텍스트에 대한 키워드 스캔 결과"""
+
+    __slots__ = ("text", "_index", "_matches", "_found_ids", "_found_cache")
+
+    def __init__(self, text: str, index: "KeywordIndex", matches: List[Tuple[int, int, int]]):
+        self.text = text
+        self._index = index
+        self._matches = matches
+        self._found_ids = {pattern_id for _, _, pattern_id in matches} | index.empty_pattern_ids
+        self._found_cache: Optional[Dict[str, List[int]]] = None
+
+    @property
+    def index(self) -> "KeywordIndex":
+        """스캔에 사용한 키워드 인덱스"""
+        return self._index
+
+    @property
+    def hits(self) -> List[Tuple[int, int, str]]:
+        """모든 출현 위치 [(start, end, keyword), ...]"""
+        keywords = self._index.keywords
+        return [(start, end, keywords[pattern_id]) for start, end, pattern_id in self._matches]
+
+    def found(self, category: str) -> List[str]:
+        """
+        카테고리 키워드 중 텍스트에 포함된 키워드
+
+        기존 `[kw for kw in LIST if kw in text_lower]`와 같은 결과
+        (원래 리스트 순서, 리스트 내 중복 포함)
+        """
+        if self._found_cache is None:
+            self._found_cache = self._group_by_category()
+        positions = self._found_cache.get(category)
+        if not positions:
+            return []
+        entries = self._index.category_entries[category]
+        return [entries[position][0] for position in positions]
+
+    def indices(self, category: str) -> List[int]:
+        """카테고리 리스트에서 텍스트에 포함된 키워드의 위치 (오름차순)"""
+        if self._found_cache is None:
+            self._found_cache = self._group_by_category()
+        return list(self._found_cache.get(category, ()))
+
+    def _group_by_category(self) -> Dict[str, List[int]]:
+        """발견된 패턴을 카테고리별 리스트 위치로 묶기 (키워드 수가 아닌 히트 수에 비례)"""
+        pattern_slots = self._index.pattern_slots
+        positions: Dict[str, List[int]] = {}
+        for pattern_id in self._found_ids:
+            for category, position in pattern_slots[pattern_id]:
+                positions.setdefault(category, []).append(position)
+        for category_positions in positions.values():
+            category_positions.sort()
+        return positions
+
+    def count(self, category: str) -> int:
+        """카테고리 키워드 중 포함된 키워드 수"""
+        return len(self.found(category))
+
+    def positions(self, category: str) -> List[Tuple[int, int, str]]:
+        """카테고리 키워드의 출현 위치 [(start, end, keyword), ...]"""
+        pattern_ids = self._index.category_pattern_ids[category]
+        keywords = self._index.keywords
+        return [
+            (start, end, keywords[pattern_id])
+            for start, end, pattern_id in self._matches
+            if pattern_id in pattern_ids
+        ]
+
+
+class KeywordIndex:
+    """카테고리 태그가 붙은 키워드 오토마톤"""
+
+    def __init__(self, categories: Dict[str, Sequence[str]]):
+        """
+        키워드 인덱스 생성
+
+        Args:
+            categories: {카테고리명: [키워드, ...]}
+        """
+        self.keywords: List[str] = []
+        keyword_ids: Dict[str, int] = {}
+        self.category_entries: Dict[str, List[Tuple[str, int]]] = {}
+        self.category_pattern_ids: Dict[str, frozenset] = {}
+        # 패턴 ID별 [(카테고리, 리스트 내 위치), ...]
+        self.pattern_slots: List[List[Tuple[str, int]]] = []
+        self.keyword_categories: Dict[str, List[str]] = {}
+
+        # 같은 키워드가 여러 카테고리에 있어도 패턴은 하나만 등록
+        for category, keywords in categories.items():
+            entries = []
+            for keyword in keywords:
+                pattern_id = keyword_ids.get(keyword)
+                if pattern_id is None:
+                    pattern_id = len(self.keywords)
+                    keyword_ids[keyword] = pattern_id
+                    self.keywords.append(keyword)
+                    self.pattern_slots.append([])
+                    self.keyword_categories[keyword] = []
+                if category not in self.keyword_categories[keyword]:
+                    self.keyword_categories[keyword].append(category)
+                entries.append((keyword, pattern_id))
+            self.category_entries[category] = entries
+            for position, (_, pattern_id) in enumerate(entries):
+                self.pattern_slots[pattern_id].append((category, position))
+            self.category_pattern_ids[category] = frozenset(pattern_id for _, pattern_id in entries)
+
+        # 빈 키워드는 (`"" in text`와 같이) 항상 포함된 것으로 처리
+        self.empty_pattern_ids = frozenset(
+            pattern_id for pattern_id, keyword in enumerate(self.keywords) if not keyword
+        )
+        self.automaton = KeywordAutomaton(self.keywords)
+        # 혐오 표현 세부 카테고리 (등록 순서 유지)
+        self.hate_speech_categories = [
+            category for category in self.category_entries if category.startswith(HATE_SPEECH_PREFIX)
+        ]
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self.category_entries)
+
+    def scan(self, text: str) -> KeywordHits:
+        """
+        텍스트 한 번 스캔으로 모든 카테고리의 키워드 출현 탐색
+
+        Args:
+            text: 검사할 텍스트 (정규화는 호출 측에서 수행)
+
+        Returns:
+            KeywordHits
+        """
+        return KeywordHits(text, self, self.automaton.find_all(text))
+
+
+def build_rule_categories() -> Dict[str, List[str]]:
+    """
+    Baseline 규칙 클래스의 키워드 리스트를 카테고리 딕셔너리로 수집
+
+    카테고리명은 규칙 클래스의 리스트 이름을 그대로 사용
+    (혐오 표현은 "HATE_SPEECH_KEYWORDS:<세부 카테고리>")
+    """
+    from ..intent_classifier.baseline_rules import IntentBaselineRules
+    from ..profanity_filter.baseline_rules import ProfanityBaselineRules
+
+    categories: Dict[str, List[str]] = {}
+    for name in INTENT_RULE_LISTS:
+        categories[name] = list(getattr(IntentBaselineRules, name))
+    for name in PROFANITY_RULE_LISTS:
+        categories[name] = list(getattr(ProfanityBaselineRules, name))
+    for sub_category, keywords in ProfanityBaselineRules.HATE_SPEECH_KEYWORDS.items():
+        categories[hate_speech_category(sub_category)] = list(keywords)
+    return categories
+
+
+def hate_speech_category(sub_category: str) -> str:
+    """혐오 표현 세부 카테고리의 인덱스 카테고리명"""
+    return f"{HATE_SPEECH_PREFIX}{sub_category}"
+
+
+def get_keyword_index() -> KeywordIndex:
+    """현재 규칙 스냅샷의 키워드 인덱스 (규칙 레지스트리가 컴파일/교체)"""
+    from ..config.rule_registry import get_rule_registry
+    return get_rule_registry().current().keyword_index
+
+
+def scan_keywords(text: str) -> KeywordHits:
+    """
+    규칙 키워드 스캔 (기존 규칙과 동일하게 소문자 변환 후 검사)
+
+    Args:
+        text: 원문 텍스트
+
+    Returns:
+        KeywordHits
+    """
+    return get_keyword_index().scan(text.lower())
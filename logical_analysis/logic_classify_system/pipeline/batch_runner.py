@@ -0,0 +1,161 @@
+"""
+멀티 세션 병렬 배치 분석
+
+Turn 단위 파이프라인(TurnSplitter, ProfanityDetector, IntentPredictor, 특징점 추출기,
+ManualComplianceChecker)은 순수 Python CPU 연산이라 GIL 때문에 한 프로세스에서는 1코어만 사용
+세션들을 청크 단위로 프로세스 풀에 분배하고, 워커마다 MainPipeline을 1회만 초기화하여 재사용
+
+결과는 입력 세션 순서대로 스트리밍되며, writer를 지정하면 write_batch_size 단위로 묶어 전달
+워커 → 메인 프로세스 결과 전달은 result_codec 바이너리 형식 사용 (결과 객체 pickle보다 빠름)
+"""
+
+import os
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .main_pipeline import MainPipeline
+from ..data.data_structures import PipelineResult
+from ..data.result_codec import encode_pipeline_result, decode_pipeline_result
+
+# 워커 프로세스의 파이프라인 (프로세스당 1회 초기화)
+_worker_pipeline: Optional[MainPipeline] = None
+
+
+def _init_worker(pipeline_kwargs: Dict[str, Any]) -> None:
+    """워커 초기화: 규칙 스냅샷 컴파일/모델 로드를 워커당 1회만 수행"""
+    global _worker_pipeline
+    _worker_pipeline = MainPipeline(**pipeline_kwargs)
+
+
+def _process_chunk(stt_chunk: List[Dict[str, Any]]) -> List[bytes]:
+    """워커에서 세션 청크 분석 (같은 배포의 프로세스 간 전달이므로 pickle 메타데이터 사용)"""
+    return [
+        encode_pipeline_result(_worker_pipeline.process(stt_data), meta_format="pickle")
+        for stt_data in stt_chunk
+    ]
+
+
+def _decode_chunk(encoded_chunk: List[bytes]) -> Iterator[PipelineResult]:
+    for data in encoded_chunk:
+        yield decode_pipeline_result(data, allow_pickle=True)
+
+
+def _chunked(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BatchRunner:
+    """프로세스 풀 기반 멀티 세션 배치 분석기"""
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        chunk_size: int = 4,
+        pipeline_kwargs: Optional[Dict[str, Any]] = None,
+        max_pending_chunks: Optional[int] = None
+    ):
+        """
+        배치 분석기 초기화
+
+        Args:
+            num_workers: 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 풀 없이 현재 프로세스에서 실행)
+            chunk_size: 워커에 한 번에 보낼 세션 수 (클수록 IPC 오버헤드 감소, 작을수록 부하 균형)
+            pipeline_kwargs: 워커별 MainPipeline 생성 인자 (예: {"intent_backend": "ngram"})
+            max_pending_chunks: 동시에 제출해 둘 최대 청크 수 (None이면 워커 수 × 2, 메모리 사용량 제한)
+        """
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.pipeline_kwargs = dict(pipeline_kwargs or {})
+        self.max_pending_chunks = max_pending_chunks or self.num_workers * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._local_pipeline: Optional[MainPipeline] = None
+
+    def __enter__(self) -> 'BatchRunner':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """워커 프로세스 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork 후 torch 스레드 풀 교착을 피하기 위해 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.pipeline_kwargs,)
+            )
+        return self._executor
+
+    def imap(self, sessions: Iterable[Dict[str, Any]]) -> Iterator[PipelineResult]:
+        """
+        세션들을 분석하여 입력 순서대로 결과 스트리밍
+
+        Args:
+            sessions: STT 세션 입력({"session_id", "segments": [...]}) 이터러블 (지연 소비)
+
+        Yields:
+            세션별 PipelineResult (입력 순서)
+        """
+        if self.num_workers == 1:
+            if self._local_pipeline is None:
+                self._local_pipeline = MainPipeline(**self.pipeline_kwargs)
+            for stt_data in sessions:
+                yield self._local_pipeline.process(stt_data)
+            return
+
+        executor = self._get_executor()
+        pending = deque()
+        for chunk in _chunked(sessions, self.chunk_size):
+            pending.append(executor.submit(_process_chunk, chunk))
+            # 가장 오래된 청크부터 꺼내므로 완료 순서와 무관하게 입력 순서 유지
+            while len(pending) >= self.max_pending_chunks:
+                yield from _decode_chunk(pending.popleft().result())
+        while pending:
+            yield from _decode_chunk(pending.popleft().result())
+
+    def run(
+        self,
+        sessions: Iterable[Dict[str, Any]],
+        writer: Optional[Callable[[List[PipelineResult]], None]] = None,
+        write_batch_size: int = 100
+    ) -> int:
+        """
+        세션들을 분석하여 writer에 묶음 단위로 전달
+
+        Args:
+            sessions: STT 세션 입력 이터러블
+            writer: 결과 묶음을 받는 콜백 (예: DB bulk_create, None이면 결과를 버림)
+            write_batch_size: writer에 한 번에 전달할 결과 수
+
+        Returns:
+            분석한 세션 수
+        """
+        count = 0
+        buffer: List[PipelineResult] = []
+        for result in self.imap(sessions):
+            count += 1
+            if writer is None:
+                continue
+            buffer.append(result)
+            if len(buffer) >= write_batch_size:
+                writer(buffer)
+                buffer = []
+        if writer is not None and buffer:
+            writer(buffer)
+        return count
@@ -4,38 +4,53 @@ Turn 단위 분석 메인 파이프라인
 Turn 단위로 발화를 분석하여 특징점을 추출하고 스코어링
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 
 from ..preprocessing.text_splitter import TurnSplitter, Turn
 from ..profanity_filter.profanity_detector import ProfanityDetector
 from ..intent_classifier.intent_predictor import IntentPredictor
+from ..intent_classifier.cascade import CascadeConfig
 from ..feature_extractor.customer_feature_extractor import CustomerFeatureExtractor
 from ..feature_extractor.agent_feature_extractor import AgentFeatureExtractor
+from ..config.rule_registry import RuleSnapshot, get_rule_registry
+from ..data.utterance_context import UtteranceContext
 from ..data.data_structures import (
     PipelineResult,
     TurnAnalysisResult,
     CustomerAnalysisResult,
     AgentAnalysisResult,
     ProfanityResult,
-    ClassificationResult
+    ClassificationResult,
+    TurnScores
 )
 
 
 class MainPipeline:
     """Turn 단위 분석 메인 파이프라인"""
     
-    def __init__(self):
+    def __init__(self, cascade: Optional[CascadeConfig] = None, intent_backend: Optional[str] = None):
         """
         파이프라인 초기화
+        
+        Args:
+            cascade: 의도 분류 규칙 → 모델 캐스케이드 설정 (None이면 모든 발화에 모델 사용)
+            intent_backend: 의도 분류 모델 백엔드 ("transformer"/"ngram", None이면 환경 변수 또는 기본값)
         """
         self.turn_splitter = TurnSplitter()
         self.profanity_detector = ProfanityDetector(use_korcen=False)
-        self.intent_predictor = IntentPredictor()
+        self.intent_predictor = IntentPredictor(cascade=cascade, backend=intent_backend)
         self.customer_feature_extractor = CustomerFeatureExtractor()
         self.agent_feature_extractor = AgentFeatureExtractor()
+        # 규칙 스냅샷(키워드 오토마톤, 매뉴얼 매처)은 첫 요청이 아닌 초기화 시점에 컴파일
+        self.rule_registry = get_rule_registry()
     
-    def process(self, stt_data: Dict[str, Any]) -> PipelineResult:
+    def process(
+        self,
+        stt_data: Dict[str, Any],
+        turn_indices: Optional[Set[int]] = None,
+        rules: Optional[RuleSnapshot] = None
+    ) -> PipelineResult:
         """
         STT 결과를 Turn 단위로 처리
         
@@ -49,38 +64,72 @@ class MainPipeline:
                         ...
                     ]
                 }
+            turn_indices: 분석할 Turn 인덱스 (None이면 전체, 시작/끝 여부는 세션 전체 기준)
+            rules: 규칙 스냅샷 (None이면 변경 확인 후 현재 스냅샷)
         
         Returns:
             PipelineResult (Turn 단위 분석 결과 리스트)
         """
         session_id = stt_data.get("session_id", "unknown")
         
+        # 규칙 변경 확인 후 세션 시작 시점의 스냅샷으로 세션 전체를 분석
+        if rules is None:
+            self.rule_registry.reload_if_changed()
+            rules = self.rule_registry.current()
+        
         # 1. Turn 단위로 분할
         turns = self.turn_splitter.split_into_turns(stt_data)
         total_turns = len(turns)
+        selected = [
+            (idx, turn) for idx, turn in enumerate(turns)
+            if turn_indices is None or turn.turn_index in turn_indices
+        ]
         
-        # 2. 각 Turn 처리
+        # 세션의 모든 손님 발화 모델 추론을 배치로 먼저 수행 (발화마다 배치 1 추론 방지)
+        contexts = [UtteranceContext(turn.customer_text, rules=rules) for _, turn in selected]
+        self.intent_predictor.prefill_model_outputs(contexts)
+        
+        # 2. 각 Turn 처리 (세션 내 결과는 같은 분석 시각 공유)
+        timestamp = datetime.now()
         turn_results = []
-        for idx, turn in enumerate(turns):
+        for (idx, turn), context in zip(selected, contexts):
             # 세션 시작/끝 여부 결정
             is_start = (idx == 0)
             is_end = (idx == total_turns - 1)
             
-            turn_result = self.process_turn(turn, session_id, is_start=is_start, is_end=is_end)
+            turn_result = self.process_turn(
+                turn, session_id, is_start=is_start, is_end=is_end, rules=rules, context=context,
+                timestamp=timestamp
+            )
             turn_results.append(turn_result)
         
         return PipelineResult(
             session_id=session_id,
             turn_results=turn_results,
-            timestamp=datetime.now()
+            timestamp=timestamp,
+            rule_version=rules.version
         )
     
+    def analysis_version(self, rules: Optional[RuleSnapshot] = None) -> str:
+        """
+        분석 결과를 좌우하는 규칙/모델 버전 식별자 (저장된 결과의 재사용 가능 여부 판단용)
+        
+        Args:
+            rules: 규칙 스냅샷 (None이면 현재 스냅샷)
+        """
+        if rules is None:
+            rules = self.rule_registry.current()
+        return f"{rules.version}/{self.intent_predictor.model_version}"
+    
     def process_turn(
         self,
         turn: Turn,
         session_id: str,
         is_start: bool = False,
-        is_end: bool = False
+        is_end: bool = False,
+        rules: Optional[RuleSnapshot] = None,
+        context: Optional[UtteranceContext] = None,
+        timestamp: Optional[datetime] = None
     ) -> TurnAnalysisResult:
         """
         단일 Turn 처리
@@ -90,18 +139,26 @@ class MainPipeline:
             session_id: 세션 ID
             is_start: 세션 시작 여부 (인사 검사용)
             is_end: 세션 종료 여부 (마무리 검사용)
+            rules: 규칙 스냅샷 (None이면 현재 스냅샷)
+            context: 손님 발화 컨텍스트 (배치 추론 결과가 채워진 경우 재사용)
+            timestamp: 분석 시각 (None이면 현재 시각)
         
         Returns:
             TurnAnalysisResult
         """
-        timestamp = datetime.now()
+        if timestamp is None:
+            timestamp = datetime.now()
+        if rules is None:
+            rules = self.rule_registry.current()
         
         # 1. 손님 발화 분석
         customer_result = self._analyze_customer_turn(
             turn.customer_text,
             session_id,
             turn.turn_index,
-            timestamp
+            timestamp,
+            rules=rules,
+            context=context
         )
         
         # 2. 상담원 발화 분석 (있는 경우)
@@ -114,7 +171,8 @@ class MainPipeline:
                 turn.turn_index,
                 timestamp,
                 is_start=is_start,
-                is_end=is_end
+                is_end=is_end,
+                rules=rules
             )
         
         # 3. Turn 단위 종합 점수 계산
@@ -125,7 +183,8 @@ class MainPipeline:
             turn_index=turn.turn_index,
             customer_result=customer_result,
             agent_result=agent_result,
-            turn_scores=turn_scores
+            turn_scores=turn_scores,
+            segment_indices=list(turn.segment_indices)
         )
     
     def _analyze_customer_turn(
@@ -133,11 +192,17 @@ class MainPipeline:
         text: str,
         session_id: str,
         turn_index: int,
-        timestamp: datetime
+        timestamp: datetime,
+        rules: Optional[RuleSnapshot] = None,
+        context: Optional[UtteranceContext] = None
     ) -> CustomerAnalysisResult:
         """손님 발화 Turn 분석"""
+        # 발화 컨텍스트: 키워드 스캔/모델 출력을 단계 간 공유 (발화당 1회 계산)
+        if context is None:
+            context = UtteranceContext(text, rules=rules)
+        
         # 1. 욕설 필터링
-        profanity_result = self.profanity_detector.detect(text)
+        profanity_result = self.profanity_detector.detect(text, context=context)
         
         # 2. 발화 의도 분류 (Turn 단위이므로 session_context 최소 사용)
         # profanity_result 정보를 IntentPredictor에 전달하여 통합 처리
@@ -145,14 +210,19 @@ class MainPipeline:
             text,
             profanity_result.is_profanity,
             profanity_confidence=profanity_result.confidence if profanity_result.is_profanity else 0.0,
-            session_context=None  # Turn 단위 분석이므로 세션 맥락 미사용
+            session_context=None,  # Turn 단위 분석이므로 세션 맥락 미사용
+            context=context,
+            timestamp=timestamp
         )
+        if rules is not None:
+            classification_result.rule_version = rules.version
         
         # 3. 특징점 추출
         feature_scores, extracted_features = self.customer_feature_extractor.extract_features(
             text,
             profanity_result,
-            classification_result
+            classification_result,
+            context=context
         )
         
         return CustomerAnalysisResult(
@@ -174,7 +244,8 @@ class MainPipeline:
         turn_index: int,
         timestamp: datetime,
         is_start: bool = False,
-        is_end: bool = False
+        is_end: bool = False,
+        rules: Optional[RuleSnapshot] = None
     ) -> AgentAnalysisResult:
         """
         상담원 발화 Turn 분석 (Keyword 기반 매뉴얼 준수 평가)
@@ -187,6 +258,7 @@ class MainPipeline:
             timestamp: 타임스탬프
             is_start: 세션 시작 여부 (인사 검사용)
             is_end: 세션 종료 여부 (마무리 검사용)
+            rules: 규칙 스냅샷 (매뉴얼 키워드 매처 제공)
         
         Returns:
             AgentAnalysisResult
@@ -204,7 +276,8 @@ class MainPipeline:
             customer_label=customer_label,
             emotion_label=emotion_label,  # None일 경우 내부에서 "NEUTRAL" 사용
             is_start=is_start,
-            is_end=is_end
+            is_end=is_end,
+            compliance_checker=rules.compliance_checker if rules is not None else None
         )
         
         # 매뉴얼 준수도 점수 추출
@@ -227,13 +300,13 @@ class MainPipeline:
         self,
         customer_result: CustomerAnalysisResult,
         agent_result: Optional[AgentAnalysisResult]
-    ) -> Dict[str, float]:
+    ) -> TurnScores:
         """
         Turn 단위 종합 점수 계산
         
         주의: 해당 Turn에 대한 평가만 포함 (세션 전체 평가는 후속 모듈에서 수행)
         """
-        turn_scores = {}
+        turn_scores = TurnScores()
         
         # 1. 손님 문제 발생 가능성 점수
         # Special Label 또는 높은 리스크 특징점 기반
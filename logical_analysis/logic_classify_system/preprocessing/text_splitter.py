@@ -5,7 +5,7 @@ STT 결과에서 Turn 단위로 텍스트를 분할
 """
 
 from typing import List, Tuple, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -15,6 +15,8 @@ class Turn:
     customer_text: str  # 손님 발화
     agent_text: Optional[str] = None  # 상담원 발화 (있는 경우)
     timestamp: Optional[Any] = None  # 타임스탬프 (선택사항)
+    # Turn을 구성한 STT segments 인덱스 (첫 번째는 손님 발화, 나머지는 상담원 발화)
+    segment_indices: List[int] = field(default_factory=list)
 
 
 class TurnSplitter:
@@ -47,9 +49,10 @@ class TurnSplitter:
         
         current_customer_text = None
         current_agent_text = None
+        current_indices: List[int] = []
         turn_index = 0
         
-        for segment in segments:
+        for segment_index, segment in enumerate(segments):
             speaker = segment.get("speaker", "").lower()
             text = segment.get("text", "").strip()
             
@@ -64,15 +67,19 @@ class TurnSplitter:
                         turn_index=turn_index,
                         customer_text=current_customer_text,
                         agent_text=current_agent_text,
-                        timestamp=segment.get("timestamp")
+                        timestamp=segment.get("timestamp"),
+                        segment_indices=current_indices
                     ))
                     turn_index += 1
                 
                 current_customer_text = text
                 current_agent_text = None
+                current_indices = [segment_index]
             
             elif speaker == "agent":
-                # 상담원 발화는 현재 Turn에 추가
+                # 상담원 발화는 현재 Turn에 추가 (첫 손님 발화 이전 상담원 발화는 Turn에 포함되지 않음)
+                if current_customer_text is not None:
+                    current_indices.append(segment_index)
                 if current_agent_text:
                     current_agent_text += " " + text
                 else:
@@ -84,7 +91,8 @@ class TurnSplitter:
                 turn_index=turn_index,
                 customer_text=current_customer_text,
                 agent_text=current_agent_text,
-                timestamp=segments[-1].get("timestamp") if segments else None
+                timestamp=segments[-1].get("timestamp") if segments else None,
+                segment_indices=current_indices
             ))
         
         return turns
@@ -6,6 +6,8 @@
 
 from typing import Tuple, Optional
 
+from ..keyword_engine.keyword_index import KeywordHits, scan_keywords
+
 
 class ProfanityBaselineRules:
     """욕설 감지용 Baseline 규칙"""
@@ -47,12 +49,13 @@ class ProfanityBaselineRules:
     }
     
     @staticmethod
-    def detect_profanity(text: str) -> Tuple[bool, Optional[str], float]:
+    def detect_profanity(text: str, keyword_hits: Optional[KeywordHits] = None) -> Tuple[bool, Optional[str], float]:
         """
         Baseline 규칙 기반 욕설 감지
         
         Args:
             text: 분석할 텍스트
+            keyword_hits: 키워드 스캔 결과 (None이면 직접 스캔)
         
         Returns:
             (is_profanity, category, confidence)
@@ -60,35 +63,31 @@ class ProfanityBaselineRules:
             - category: 감지된 카테고리 (PROFANITY, VIOLENCE_THREAT, SEXUAL_HARASSMENT, HATE_SPEECH, INSULT)
             - confidence: 신뢰도 (0.0-1.0)
         """
-        text_lower = text.lower()
+        hits = keyword_hits if keyword_hits is not None else scan_keywords(text)
         
         # 1. 직접적 욕설 감지 (최우선)
-        profanity_count = sum(1 for kw in ProfanityBaselineRules.PROFANITY_KEYWORDS 
-                             if kw in text_lower)
+        profanity_count = hits.count("PROFANITY_KEYWORDS")
         if profanity_count > 0:
             return True, "PROFANITY", min(0.5 + profanity_count * 0.15, 1.0)
         
         # 2. 위협 표현 감지 (CRITICAL)
-        threat_count = sum(1 for kw in ProfanityBaselineRules.THREAT_KEYWORDS 
-                          if kw in text_lower)
+        threat_count = hits.count("THREAT_KEYWORDS")
         if threat_count > 0:
             return True, "VIOLENCE_THREAT", min(0.7 + threat_count * 0.15, 1.0)
         
         # 3. 성희롱 감지 (CRITICAL)
-        sexual_count = sum(1 for kw in ProfanityBaselineRules.SEXUAL_HARASSMENT_KEYWORDS 
-                          if kw in text_lower)
+        sexual_count = hits.count("SEXUAL_HARASSMENT_KEYWORDS")
         if sexual_count > 0:
             return True, "SEXUAL_HARASSMENT", min(0.6 + sexual_count * 0.2, 1.0)
         
         # 4. 혐오 표현 감지
-        for category, keywords in ProfanityBaselineRules.HATE_SPEECH_KEYWORDS.items():
-            hate_count = sum(1 for kw in keywords if kw in text_lower)
+        for category in hits.index.hate_speech_categories:
+            hate_count = hits.count(category)
             if hate_count > 0:
                 return True, "HATE_SPEECH", min(0.6 + hate_count * 0.15, 1.0)
         
         # 5. 모욕/조롱 감지
-        insult_count = sum(1 for kw in ProfanityBaselineRules.INSULT_KEYWORDS 
-                         if kw in text_lower)
+        insult_count = hits.count("INSULT_KEYWORDS")
         if insult_count > 0:
             return True, "INSULT", min(0.4 + insult_count * 0.2, 1.0)
         
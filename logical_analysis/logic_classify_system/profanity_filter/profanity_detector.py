@@ -7,6 +7,7 @@
 from typing import Optional
 from .baseline_rules import ProfanityBaselineRules
 from ..data.data_structures import ProfanityResult
+from ..data.utterance_context import UtteranceContext
 
 
 class ProfanityDetector:
@@ -37,12 +38,13 @@ class ProfanityDetector:
         # Baseline 규칙은 모듈 내부에 포함 (의존성 없음)
         self.baseline_rules = ProfanityBaselineRules()
     
-    def detect(self, text: str) -> ProfanityResult:
+    def detect(self, text: str, context: Optional[UtteranceContext] = None) -> ProfanityResult:
         """
         욕설 감지 (통합)
         
         Args:
             text: 분석할 텍스트
+            context: 발화 컨텍스트 (있으면 키워드 스캔 결과 재사용)
         
         Returns:
             ProfanityResult (is_profanity, category, confidence, method)
@@ -63,7 +65,9 @@ class ProfanityDetector:
                 print(f"Warning: Korcen 필터 실행 중 오류 발생: {e}. Baseline 규칙으로 전환합니다.")
         
         # 2. Baseline 규칙 사용 (모듈 내부 규칙)
-        is_prof, category, confidence = self.baseline_rules.detect_profanity(text)
+        is_prof, category, confidence = self.baseline_rules.detect_profanity(
+            text, keyword_hits=context.keyword_hits if context is not None else None
+        )
         if is_prof:
             return ProfanityResult(
                 is_profanity=True,
@@ -0,0 +1,97 @@
+"""
+멀티 세션 병렬 배치 분석 확장성 벤치마크
+
+워커 수 1 → N(CPU 코어 수)으로 늘리며 BatchRunner 처리량(sessions/s)과
+1워커 대비 속도 향상 측정 (워커 초기화 시간은 제외하고 워밍업 후 측정)
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_batch_runner.py [최대 워커 수] [청크 크기]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.pipeline.batch_runner import BatchRunner
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    generate_synthetic_sessions,
+    load_talksets_sessions,
+    save_benchmark_results
+)
+
+
+def worker_counts(max_workers: int) -> List[int]:
+    """1, 2, 4, ... max_workers"""
+    counts, count = [], 1
+    while count < max_workers:
+        counts.append(count)
+        count *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def benchmark_batch_runner(sessions: List[Dict[str, Any]], max_workers: int, chunk_size: int) -> Dict[str, Any]:
+    """
+    워커 수별 처리량 측정
+
+    Args:
+        sessions: STT 세션 리스트
+        max_workers: 최대 워커 수
+        chunk_size: 워커에 한 번에 보낼 세션 수
+
+    Returns:
+        워커 수별 처리량/속도 향상
+    """
+    results: Dict[str, Any] = {
+        "num_sessions": len(sessions),
+        "num_segments": sum(len(session["segments"]) for session in sessions),
+        "cpu_count": os.cpu_count(),
+        "chunk_size": chunk_size,
+    }
+    baseline = None
+    for num_workers in worker_counts(max_workers):
+        with BatchRunner(num_workers=num_workers, chunk_size=chunk_size) as runner:
+            # 워밍업: 워커 생성 + 워커별 파이프라인 초기화
+            runner.run(sessions[:num_workers * chunk_size])
+            start = time.perf_counter()
+            runner.run(sessions)
+            seconds = time.perf_counter() - start
+        sessions_per_sec = len(sessions) / seconds
+        baseline = baseline or sessions_per_sec
+        results[f"workers_{num_workers}"] = {
+            "seconds": seconds,
+            "sessions_per_sec": sessions_per_sec,
+            "speedup": sessions_per_sec / baseline,
+        }
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("멀티 세션 병렬 배치 분석 확장성 벤치마크")
+    print("=" * 80)
+
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    sessions = load_talksets_sessions(limit=400) or generate_synthetic_sessions(400, segments_per_session=40)
+
+    results = benchmark_batch_runner(sessions, max_workers, chunk_size)
+    print(f"세션 {results['num_sessions']}개 (세그먼트 {results['num_segments']:,}개), "
+          f"CPU {results['cpu_count']}코어, 청크 {chunk_size}")
+    for num_workers in worker_counts(max_workers):
+        stats = results[f"workers_{num_workers}"]
+        print(f"  워커 {num_workers:>3}  {stats['sessions_per_sec']:>8,.1f} sessions/s  ({stats['speedup']:.2f}x)")
+
+    output_path = save_benchmark_results(results, 'batch_runner_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
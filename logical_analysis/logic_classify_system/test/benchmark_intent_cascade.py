@@ -0,0 +1,147 @@
+"""
+규칙 → 모델 캐스케이드 리포트
+
+캐스케이드 설정별로 모델 호출을 생략한 발화 비율, 모든 발화에 모델을 사용할 때와의
+결과 일치율, 정답지(test_with_ground_truth.py) 기준 정확도와 처리 시간 측정
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_intent_cascade.py [talksets-train-6.json] [모델 경로]
+    (talksets 파일이 없으면 합성 발화로 생략 비율/일치율만 측정)
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.intent_classifier.cascade import CascadeConfig
+from logical_analysis.logic_classify_system.intent_classifier.intent_predictor import IntentPredictor
+from logical_analysis.logic_classify_system.profanity_filter.profanity_detector import ProfanityDetector
+from logical_analysis.logic_classify_system.test.benchmark_sentence_classifier import build_classifier
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    load_customer_utterances,
+    save_benchmark_results
+)
+
+# 비교할 캐스케이드 설정 (None: 모든 발화에 모델 사용)
+CASCADE_CONFIGS: Dict[str, Optional[CascadeConfig]] = {
+    "full_model": None,
+    "conservative": CascadeConfig(special_accept=0.9, normal_accept=0.9, normal_margin=0.2),
+    "default": CascadeConfig(),
+    "aggressive": CascadeConfig(special_accept=0.5, normal_accept=0.7, normal_margin=0.0),
+}
+
+
+def load_ground_truth_items(talksets_file: Optional[Path], sample_size: int = 500) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    정답지 손님 발화 로드 (test_with_ground_truth.create_ground_truth_dataset 사용)
+
+    Returns:
+        [(text, 정답 Label, 정답 Label 타입), ...] (talksets 파일이 없으면 합성 발화, 정답 None)
+    """
+    if talksets_file is not None and talksets_file.exists():
+        from logical_analysis.logic_classify_system.test.test_with_ground_truth import create_ground_truth_dataset
+        _, ground_truth_list = create_ground_truth_dataset(talksets_file, sample_size=sample_size)
+        return [
+            (segment["text"], segment["ground_truth_label"], segment["ground_truth_label_type"])
+            for ground_truth in ground_truth_list
+            for segment in ground_truth["segments"]
+        ]
+    return [(text, None, None) for text in load_customer_utterances(2000, seed=7)]
+
+
+def run_predictor(predictor: IntentPredictor, detector: ProfanityDetector, texts: List[str]) -> List[Tuple[str, str]]:
+    """MainPipeline과 같은 순서(욕설 감지 -> 의도 분류)로 발화별 (label, label_type) 예측"""
+    predictions = []
+    for text in texts:
+        profanity_result = detector.detect(text)
+        result = predictor.predict(
+            text,
+            profanity_result.is_profanity,
+            profanity_confidence=profanity_result.confidence if profanity_result.is_profanity else 0.0
+        )
+        predictions.append((result.label, result.label_type))
+    return predictions
+
+
+def benchmark_intent_cascade(items: List[Tuple[str, Optional[str], Optional[str]]],
+                             classifier) -> Dict[str, Any]:
+    """
+    캐스케이드 설정별 모델 생략 비율/일치율/정확도 측정
+
+    Args:
+        items: [(text, 정답 Label, 정답 Label 타입), ...]
+        classifier: 모든 설정이 공유할 문장 분류기
+
+    Returns:
+        설정별 측정 결과
+    """
+    texts = [text for text, _, _ in items]
+    has_ground_truth = any(label is not None for _, label, _ in items)
+    detector = ProfanityDetector(use_korcen=False)
+    results: Dict[str, Any] = {"num_texts": len(texts), "has_ground_truth": has_ground_truth}
+
+    reference = None
+    for name, cascade in CASCADE_CONFIGS.items():
+        predictor = IntentPredictor(use_model=False, cascade=cascade)
+        predictor.classifier = classifier
+        start = time.perf_counter()
+        predictions = run_predictor(predictor, detector, texts)
+        seconds = time.perf_counter() - start
+        if reference is None:
+            reference = predictions
+
+        stats = {
+            "seconds": seconds,
+            "texts_per_sec": len(texts) / seconds,
+            "model_calls": predictor.model_call_count,
+            "skip_fraction": predictor.model_skip_count / len(texts),
+            "agreement_label": sum(a == b for a, b in zip(predictions, reference)) / len(texts),
+            "agreement_label_type": sum(a[1] == b[1] for a, b in zip(predictions, reference)) / len(texts),
+        }
+        if cascade is not None:
+            stats["config"] = vars(cascade)
+        if has_ground_truth:
+            stats["accuracy_label"] = sum(
+                predicted[0] == label for predicted, (_, label, _) in zip(predictions, items)
+            ) / len(items)
+            stats["accuracy_label_type"] = sum(
+                predicted[1] == label_type for predicted, (_, _, label_type) in zip(predictions, items)
+            ) / len(items)
+        results[name] = stats
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("규칙 → 모델 캐스케이드 리포트")
+    print("=" * 80)
+
+    talksets_file = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parent / 'talksets-train-6.json'
+    classifier = build_classifier(sys.argv[2] if len(sys.argv) > 2 else None)
+    items = load_ground_truth_items(talksets_file)
+    results = benchmark_intent_cascade(items, classifier)
+
+    print(f"발화 수: {results['num_texts']}, 정답지 사용: {results['has_ground_truth']}, "
+          f"모델: {type(classifier.model).__name__}")
+    for name in CASCADE_CONFIGS:
+        stats = results[name]
+        line = (f"  {name:<14} 모델 생략 {stats['skip_fraction']:6.1%}  "
+                f"일치율(label) {stats['agreement_label']:6.1%}  "
+                f"일치율(type) {stats['agreement_label_type']:6.1%}  "
+                f"{stats['texts_per_sec']:>8,.0f} texts/s")
+        if results["has_ground_truth"]:
+            line += f"  정확도(label) {stats['accuracy_label']:6.1%}  정확도(type) {stats['accuracy_label_type']:6.1%}"
+        print(line)
+
+    output_path = save_benchmark_results(results, 'intent_cascade_report.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+키워드 엔진 벤치마크
+
+Turn마다 규칙 키워드 리스트를 `kw in text_lower`로 반복 검사하던 기존 방식과
+Aho-Corasick 단일 스캔(KeywordIndex) 방식의 발화당 비용을 비교
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.keyword_engine.keyword_index import (
+    build_rule_categories,
+    get_keyword_index,
+    scan_keywords
+)
+from logical_analysis.logic_classify_system.intent_classifier.baseline_rules import IntentBaselineRules
+from logical_analysis.logic_classify_system.profanity_filter.baseline_rules import ProfanityBaselineRules
+from logical_analysis.logic_classify_system.feature_extractor.customer_feature_extractor import CustomerFeatureExtractor
+from logical_analysis.logic_classify_system.data.data_structures import ProfanityResult, ClassificationResult
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    load_customer_utterances,
+    measure,
+    save_benchmark_results
+)
+
+
+def legacy_turn_scans(categories: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    기존 코드가 손님 Turn 하나에 대해 수행하던 키워드 리스트 검사 순서
+
+    ProfanityBaselineRules.detect_profanity -> IntentBaselineRules.detect_special_labels
+    -> detect_normal_labels -> CustomerFeatureExtractor.extract_features
+    """
+    hate_lists = [name for name in categories if name.startswith("HATE_SPEECH_KEYWORDS:")]
+    names = (
+        ["PROFANITY_KEYWORDS", "THREAT_KEYWORDS", "SEXUAL_HARASSMENT_KEYWORDS"] + hate_lists + ["INSULT_KEYWORDS"]
+        + ["REPETITION_INDICATORS", "UNREASONABLE_DEMAND_STRONG", "UNREASONABLE_DEMAND_INDICATORS",
+           "IRRELEVANCE_INDICATORS"]
+        + ["REQUEST_KEYWORDS", "COMPLAINT_KEYWORDS", "CLARIFICATION_KEYWORDS", "CONFIRMATION_KEYWORDS",
+           "CLOSING_KEYWORDS", "INQUIRY_KEYWORDS"]
+        + ["THREAT_KEYWORDS", "SEXUAL_HARASSMENT_KEYWORDS"] + hate_lists
+        + ["UNREASONABLE_DEMAND_STRONG", "UNREASONABLE_DEMAND_INDICATORS", "REPETITION_INDICATORS"]
+    )
+    return [categories[name] for name in names]
+
+
+def legacy_keyword_pass(text: str, scans: List[List[str]]) -> List[List[str]]:
+    """기존 방식: 리스트마다 키워드 전체를 부분 문자열 검사"""
+    text_lower = text.lower()
+    return [[kw for kw in keywords if kw in text_lower] for keywords in scans]
+
+
+def benchmark_keyword_engine(num_utterances: int = 5000) -> Dict[str, Any]:
+    """
+    키워드 검사 방식별 발화당 비용 측정
+
+    Args:
+        num_utterances: 측정할 손님 발화 수
+
+    Returns:
+        방식별 측정 결과 딕셔너리
+    """
+    utterances = load_customer_utterances(num_utterances)
+    categories = build_rule_categories()
+    index = get_keyword_index()
+
+    results: Dict[str, Any] = {
+        "num_utterances": len(utterances),
+        "num_categories": len(categories),
+        "num_keywords": len(index.keywords),
+        "num_states": index.automaton.num_states,
+    }
+
+    # 1. 키워드 검사만: Turn당 반복 리스트 검사 vs 단일 스캔 + 카테고리별 조회
+    scans = legacy_turn_scans(categories)
+    results["legacy_scans_per_turn"] = len(scans)
+    results["legacy_substring_pass"] = measure(lambda text: legacy_keyword_pass(text, scans), utterances)
+
+    def single_scan(text: str):
+        hits = scan_keywords(text)
+        return {category: hits.found(category) for category in categories}
+
+    results["single_scan"] = measure(single_scan, utterances)
+
+    # 2. 규칙 단계 전체 (의도 규칙 + 욕설 규칙 + 특징 추출)
+    extractor = CustomerFeatureExtractor()
+
+    def rule_stages(text: str):
+        hits = scan_keywords(text)
+        IntentBaselineRules.detect_normal_labels(text, keyword_hits=hits)
+        IntentBaselineRules.detect_special_labels(text, keyword_hits=hits)
+        is_profanity, category, confidence = ProfanityBaselineRules.detect_profanity(text, keyword_hits=hits)
+        extractor.extract_features(
+            text,
+            ProfanityResult(is_profanity, category, confidence, "baseline"),
+            ClassificationResult(label="INQUIRY", label_type="NORMAL", confidence=0.5, text=text)
+        )
+
+    results["rule_stages_single_scan"] = measure(rule_stages, utterances)
+    results["speedup_keyword_pass"] = (
+        results["single_scan"]["ops_per_sec"] / results["legacy_substring_pass"]["ops_per_sec"]
+    )
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("키워드 엔진 벤치마크 (기존 반복 검사 vs Aho-Corasick 단일 스캔)")
+    print("=" * 80)
+
+    results = benchmark_keyword_engine()
+    print(f"발화 수: {results['num_utterances']}, 카테고리: {results['num_categories']}, "
+          f"키워드: {results['num_keywords']}, 상태 수: {results['num_states']}, "
+          f"기존 Turn당 리스트 검사: {results['legacy_scans_per_turn']}회")
+    for name in ("legacy_substring_pass", "single_scan", "rule_stages_single_scan"):
+        stats = results[name]
+        print(f"{name:<26} {stats['ops_per_sec']:>12,.0f} ops/s  "
+              f"p50 {stats['p50_us']:>8.1f}us  p99 {stats['p99_us']:>8.1f}us")
+    print(f"키워드 검사 속도 향상: {results['speedup_keyword_pass']:.2f}x")
+
+    output_path = save_benchmark_results(results, 'keyword_engine_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+logical_analysis.inference 지연 초기화 / gunicorn --preload 메모리 공유 벤치마크
+
+1. 시작 시간: Django 설정 후 logical_analysis.api import 시간과 RSS
+   - eager: 기존 방식 (import 시 MainPipeline 생성 → torch/모델 로드)
+   - lazy: import만 수행 (manage.py migrate 등 관리 명령의 비용)
+2. 워커 메모리: 마스터 프로세스에서 워커 N개를 fork하고 각 워커가 세션을 분석한 뒤
+   /proc/self/smaps_rollup의 RSS/PSS/USS(Private) 측정
+   - lazy: 워커마다 파이프라인 생성 (preload 없음)
+   - preload: 마스터에서 파이프라인 생성 후 fork (gc.freeze 없음)
+   - preload_freeze: inference.preload() (파이프라인 생성 + gc.freeze) 후 fork
+
+각 측정은 깨끗한 하위 프로세스에서 실행 (모듈 캐시 영향 제거)
+모델 가중치가 없으면 소형 인코더 분류기를 끼워 측정 (benchmark_sentence_classifier.build_classifier)
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_lazy_init.py [워커 수]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+STARTUP_MODES = ("eager", "lazy")
+WORKER_MODES = ("lazy", "preload", "preload_freeze")
+
+
+def memory_usage_mb() -> Dict[str, float]:
+    """현재 프로세스 RSS/PSS/USS (MB, /proc/self/smaps_rollup)"""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss_mb": fields.get("Rss", 0.0),
+        "pss_mb": fields.get("Pss", 0.0),
+        "uss_mb": fields.get("Private_Clean", 0.0) + fields.get("Private_Dirty", 0.0),
+    }
+
+
+def setup_django() -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'linguaproject.settings')
+    import django
+    django.setup()
+
+
+def install_classifier(pipeline) -> None:
+    """모델 분류기가 없으면 벤치마크용 소형 인코더 분류기 사용"""
+    if pipeline.intent_predictor.classifier is None:
+        from logical_analysis.logic_classify_system.test.benchmark_sentence_classifier import build_classifier
+        pipeline.intent_predictor.classifier = build_classifier()
+
+
+def child_startup(mode: str) -> Dict[str, Any]:
+    """API 모듈 import 시간 (eager는 기존처럼 import 직후 파이프라인 생성)"""
+    setup_django()
+    start = time.perf_counter()
+    import logical_analysis.api  # noqa: F401
+    from logical_analysis import inference
+    if mode == "eager":
+        inference.get_pipeline()
+    return {"import_ms": (time.perf_counter() - start) * 1000, **memory_usage_mb()}
+
+
+def child_workers(mode: str, num_workers: int) -> Dict[str, Any]:
+    """마스터에서 워커를 fork하여 워커별 세션 분석 후 메모리 측정"""
+    setup_django()
+    import logical_analysis.api  # noqa: F401
+    from logical_analysis import inference
+    from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_sessions
+
+    sessions = generate_synthetic_sessions(5, segments_per_session=20)
+    if mode != "lazy":
+        install_classifier(inference.get_pipeline())
+        if mode == "preload_freeze":
+            inference.preload()
+    master = memory_usage_mb()
+
+    workers = []
+    for _ in range(num_workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            start = time.perf_counter()
+            pipeline = inference.get_pipeline()
+            install_classifier(pipeline)
+            init_ms = (time.perf_counter() - start) * 1000
+            for stt_data in sessions:
+                pipeline.process(stt_data)
+            with os.fdopen(write_fd, "w") as f:
+                json.dump({"init_ms": init_ms, **memory_usage_mb()}, f)
+            os._exit(0)
+        os.close(write_fd)
+        workers.append((pid, read_fd))
+
+    # 모든 워커가 살아 있는 동안 측정해야 공유 페이지가 PSS에 나뉘어 반영되므로 결과는 마지막에 수집
+    reports = []
+    for pid, read_fd in workers:
+        with os.fdopen(read_fd) as f:
+            reports.append(json.load(f))
+        os.waitpid(pid, 0)
+
+    def mean(key):
+        return sum(report[key] for report in reports) / len(reports)
+
+    return {
+        "master": master,
+        "workers": reports,
+        "worker_mean": {key: mean(key) for key in ("init_ms", "rss_mb", "pss_mb", "uss_mb")},
+    }
+
+
+def run_child(*args: str) -> Dict[str, Any]:
+    """이 스크립트를 하위 프로세스로 실행하여 마지막 줄의 JSON 결과 반환"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", *args],
+        capture_output=True, text=True, check=True, cwd=project_root
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """메인 함수"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        kind, mode = sys.argv[2], sys.argv[3]
+        result = child_startup(mode) if kind == "startup" else child_workers(mode, int(sys.argv[4]))
+        print(json.dumps(result))
+        return
+
+    from logical_analysis.logic_classify_system.test.benchmark_utils import save_benchmark_results
+
+    num_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+
+    print("=" * 80)
+    print("logical_analysis.inference 지연 초기화 / --preload 메모리 공유 벤치마크")
+    print("=" * 80)
+
+    results: Dict[str, Any] = {"num_workers": num_workers, "startup": {}, "workers": {}}
+
+    print("\n[1] API 모듈 import (Django 관리 명령 시작 비용)")
+    for mode in STARTUP_MODES:
+        row = run_child("startup", mode)
+        results["startup"][mode] = row
+        print(f"  {mode:<8} import {row['import_ms']:>8,.0f} ms  RSS {row['rss_mb']:>7,.1f} MB")
+
+    print(f"\n[2] 워커 {num_workers}개 fork 후 세션 분석 (워커 평균)")
+    for mode in WORKER_MODES:
+        row = run_child("workers", mode, str(num_workers))
+        results["workers"][mode] = row
+        worker = row["worker_mean"]
+        print(f"  {mode:<15} 초기화 {worker['init_ms']:>7,.0f} ms  RSS {worker['rss_mb']:>7,.1f} MB  "
+              f"PSS {worker['pss_mb']:>7,.1f} MB  USS {worker['uss_mb']:>7,.1f} MB")
+
+    output_path = save_benchmark_results(results, 'lazy_init_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+매뉴얼 준수도 검사 벤치마크
+
+키워드마다 텍스트를 다시 정규화하던 기존 _contains_keyword 반복 방식과
+정규화 1회 + 컴파일된 매뉴얼 매처 방식의 발화당 비용을 발화 길이별로 비교하고,
+모든 (감정 라벨, CAR) 매뉴얼 채점을 비트셋 인덱스와 매뉴얼별 check_compliance로 비교
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.feature_extractor.manual_compliance_checker import (
+    ManualComplianceChecker,
+    NormalizedText
+)
+from logical_analysis.logic_classify_system.test.benchmark_utils import measure, save_benchmark_results
+from logical_analysis.logic_classify_system.test.test_manual_compliance import make_agent_texts, legacy_found
+
+# 측정할 매뉴얼 (키워드가 가장 많은 조합)
+EMOTION_LABEL = "ANGRY"
+CUSTOMER_LABEL = "PROFANITY"
+
+
+def benchmark_manual_compliance(num_texts: int = 2000, repeats: List[int] = (1, 4, 16)) -> Dict[str, Any]:
+    """
+    발화 길이(기본 발화 반복 횟수)별 키워드 탐색 비용 측정
+
+    Args:
+        num_texts: 측정할 상담원 발화 수
+        repeats: 발화 길이를 늘리기 위한 반복 횟수 목록
+
+    Returns:
+        길이별 측정 결과 딕셔너리
+    """
+    checker = ManualComplianceChecker()
+    manual_keywords = checker.keyword_config.get_keywords(EMOTION_LABEL, CUSTOMER_LABEL)
+    matcher = checker.get_matcher(EMOTION_LABEL, CUSTOMER_LABEL)
+    base_texts = make_agent_texts(checker, num_texts, seed=1)
+
+    results: Dict[str, Any] = {"num_texts": len(base_texts), "manual": [EMOTION_LABEL, CUSTOMER_LABEL]}
+    for repeat in repeats:
+        texts = [" ".join([text] * repeat) for text in base_texts]
+        legacy = measure(lambda text: legacy_found(checker, text, manual_keywords), texts)
+        compiled = measure(lambda text: matcher.match(NormalizedText(text)), texts)
+        full = measure(
+            lambda text: checker.check_compliance(text, EMOTION_LABEL, CUSTOMER_LABEL, is_start=True, is_end=True),
+            texts
+        )
+        # 모든 (감정 라벨, CAR) 매뉴얼 채점: 매뉴얼마다 check_compliance vs 비트셋 인덱스
+        all_keys = list(checker.keyword_config.manual_map)
+        per_manual = measure(
+            lambda text: [checker.check_compliance(text, emotion, label, True, True) for emotion, label in all_keys],
+            texts[:200]
+        )
+        bitset = measure(
+            lambda text: checker.compliance_index.score_all(NormalizedText(text), is_start=True, is_end=True),
+            texts
+        )
+        results[f"x{repeat}"] = {
+            "mean_chars": sum(len(text) for text in texts) / len(texts),
+            "legacy_keyword_loop": legacy,
+            "compiled_matcher": compiled,
+            "check_compliance": full,
+            "speedup": legacy["mean_us"] / compiled["mean_us"],
+            "num_manuals": len(all_keys),
+            "all_manuals_check_compliance": per_manual,
+            "all_manuals_bitset": bitset,
+            "all_manuals_speedup": per_manual["mean_us"] / bitset["mean_us"],
+        }
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("매뉴얼 준수도 검사 벤치마크 (키워드별 정규화 vs 컴파일된 매처)")
+    print("=" * 80)
+
+    results = benchmark_manual_compliance()
+    for name, value in results.items():
+        if not isinstance(value, dict):
+            continue
+        print(f"[{name}] 평균 {value['mean_chars']:.0f}자")
+        for method in ("legacy_keyword_loop", "compiled_matcher", "check_compliance",
+                       "all_manuals_check_compliance", "all_manuals_bitset"):
+            stats = value[method]
+            print(f"  {method:<30} {stats['ops_per_sec']:>10,.0f} ops/s  "
+                  f"p50 {stats['p50_us']:>8.1f}us  p99 {stats['p99_us']:>8.1f}us")
+        print(f"  키워드 탐색 속도 향상: {value['speedup']:.2f}x, "
+              f"전체 {value['num_manuals']}개 매뉴얼 채점 속도 향상: {value['all_manuals_speedup']:.1f}x")
+
+    output_path = save_benchmark_results(results, 'manual_compliance_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+해시 n-gram 의도 분류기 처리량 벤치마크 (CPU 1코어)
+
+HashedNgramClassifier의 predict(단건)/predict_batch 처리량, 학습 시간,
+.npz 크기/로드 시간, 평가 정확도 측정
+(talksets 데이터가 있으면 정답지로, 없으면 Baseline 규칙으로 Label을 붙인 합성 발화로 학습)
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_ngram_classifier.py [talksets-train*.json | ground_truth.json]
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 1코어 처리량 측정을 위해 NumPy import 전에 BLAS 스레드 고정
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.intent_classifier.ngram_classifier import HashedNgramClassifier
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    load_customer_utterances,
+    measure,
+    save_benchmark_results
+)
+from logical_analysis.logic_classify_system.test.train_ngram_classifier import (
+    evaluate,
+    load_talksets_training_data,
+    rule_labeled_utterances,
+    split_train_test
+)
+
+
+def benchmark_ngram_classifier(train_texts: List[str], train_labels: List[str],
+                               test_texts: List[str], test_labels: List[str],
+                               texts: List[str]) -> Dict[str, Any]:
+    """
+    학습/저장/로드/추론 측정
+
+    Args:
+        train_texts, train_labels: 학습 데이터
+        test_texts, test_labels: 평가 데이터
+        texts: 처리량 측정용 발화
+
+    Returns:
+        측정 결과
+    """
+    results: Dict[str, Any] = {"num_train": len(train_texts), "num_test": len(test_texts), "num_texts": len(texts)}
+
+    start = time.perf_counter()
+    classifier = HashedNgramClassifier.train(train_texts, train_labels)
+    results["train_seconds"] = time.perf_counter() - start
+    results["accuracy"] = evaluate(classifier, test_texts, test_labels)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = classifier.save(Path(tmp_dir) / 'intent_ngram.npz')
+        results["npz_kb"] = path.stat().st_size / 1024
+        start = time.perf_counter()
+        HashedNgramClassifier(model_path=str(path))
+        results["load_ms"] = (time.perf_counter() - start) * 1000
+
+    results["predict_single"] = measure(classifier.predict, texts)
+    for batch_size in (32, 256, 1024):
+        start = time.perf_counter()
+        classifier.predict_batch(texts, batch_size=batch_size)
+        seconds = time.perf_counter() - start
+        results[f"predict_batch_{batch_size}"] = {"seconds": seconds, "ops_per_sec": len(texts) / seconds}
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("해시 n-gram 의도 분류기 벤치마크 (CPU 1코어)")
+    print("=" * 80)
+
+    if len(sys.argv) > 1:
+        texts, labels = load_talksets_training_data(Path(sys.argv[1]))
+        source = "talksets"
+    else:
+        texts, labels = rule_labeled_utterances(20000, seed=0)
+        source = "synthetic (rule labels)"
+    train_texts, train_labels, test_texts, test_labels = split_train_test(texts, labels)
+
+    results = benchmark_ngram_classifier(
+        train_texts, train_labels, test_texts, test_labels, load_customer_utterances(5000, seed=1)
+    )
+    results["source"] = source
+    print(f"학습 데이터: {source}, 학습 {results['num_train']:,}개 / 평가 {results['num_test']:,}개")
+    print(f"  학습 시간      {results['train_seconds']:.1f}s")
+    print(f"  평가 정확도    {results['accuracy']:.1%}")
+    print(f"  .npz 크기      {results['npz_kb']:.0f} KB (로드 {results['load_ms']:.1f} ms)")
+    print(f"  predict 단건   {results['predict_single']['ops_per_sec']:>10,.0f} texts/s "
+          f"(p50 {results['predict_single']['p50_us']:.0f}us, p99 {results['predict_single']['p99_us']:.0f}us)")
+    for batch_size in (32, 256, 1024):
+        print(f"  predict_batch {batch_size:<5}{results[f'predict_batch_{batch_size}']['ops_per_sec']:>10,.0f} texts/s")
+
+    output_path = save_benchmark_results(results, 'ngram_classifier_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""
+로직 분류 파이프라인 단계별 벤치마크
+
+단계별로 발화 하나를 처리하는 비용을 코퍼스(talksets STT, 합성 발화)와 발화 수(기본 1k/10k/100k)별로 측정
+- profanity_detect: ProfanityDetector.detect
+- korcen_check: KorcenFilter.check_profanity (logic_classify_system_lef의 Korcen 필터)
+- intent_rules: IntentPredictor.predict (Baseline 규칙만)
+- intent_model: IntentPredictor.predict (모든 발화에 모델 사용, build_classifier 분류기)
+- customer_features: CustomerFeatureExtractor.extract_features
+- manual_compliance: ManualComplianceChecker.check_compliance (상담원 발화)
+- pipeline_rules / pipeline_model: MainPipeline.process (세션 단위, 모델 없이 / 모델 사용)
+
+항목별 ops/sec, p50/p99 지연과 최대 메모리(tracemalloc, 지연 측정과 별도 실행)를 JSON으로 저장하고,
+기준 결과 파일을 주면 허용 범위를 넘게 느려지거나 메모리가 늘어난 항목을 회귀로 보고
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_pipeline_stages.py [발화 수 목록] [기준 결과 JSON]
+    예: ... benchmark_pipeline_stages.py 1000,10000 test_results/benchmarks/pipeline_stages_baseline.json
+"""
+
+import os
+import sys
+import json
+import random
+import platform
+import subprocess
+import tracemalloc
+import warnings
+import contextlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.feature_extractor.customer_feature_extractor import CustomerFeatureExtractor
+from logical_analysis.logic_classify_system.feature_extractor.manual_compliance_checker import ManualComplianceChecker
+from logical_analysis.logic_classify_system.intent_classifier.intent_predictor import IntentPredictor
+from logical_analysis.logic_classify_system.pipeline.main_pipeline import MainPipeline
+from logical_analysis.logic_classify_system.profanity_filter.profanity_detector import ProfanityDetector
+from logical_analysis.logic_classify_system_lef.profanity_filter.korcen_filter import KorcenFilter
+from logical_analysis.logic_classify_system.test.benchmark_sentence_classifier import build_classifier
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    generate_synthetic_sessions,
+    generate_synthetic_utterances,
+    load_talksets_sessions,
+    measure,
+    save_benchmark_results
+)
+from logical_analysis.logic_classify_system.test.test_manual_compliance import make_agent_texts
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+SEED = 42
+SEGMENTS_PER_SESSION = 20
+# 모델 추론 단계는 발화 수가 커도 이 수까지만 측정 (CPU에서 100k 발화는 수십 분 소요)
+MODEL_MAX_ITEMS = 10000
+# 최대 메모리 측정에 사용할 항목 수 (tracemalloc 오버헤드로 지연 측정과 분리)
+MEMORY_SAMPLE = 1000
+# 기준 결과 대비 회귀 판정 허용 범위 (20%)
+REGRESSION_TOLERANCE = 0.2
+
+STAGES = [
+    "profanity_detect", "korcen_check", "intent_rules", "intent_model",
+    "customer_features", "manual_compliance", "pipeline_rules", "pipeline_model",
+]
+MODEL_STAGES = {"intent_model", "pipeline_model"}
+
+
+def build_corpus(name: str, size: int, checker: ManualComplianceChecker,
+                 talksets_sessions: List[Dict[str, Any]], seed: int = SEED) -> Dict[str, Any]:
+    """
+    코퍼스별 단계 입력 생성
+
+    Args:
+        name: "talksets" 또는 "synthetic"
+        size: 발화(세그먼트) 수 (talksets는 데이터가 부족하면 있는 만큼만 사용)
+        checker: 상담원 발화 생성과 매뉴얼 선택에 사용할 검사기
+        talksets_sessions: load_talksets_sessions 결과
+        seed: 난수 시드
+
+    Returns:
+        {"customer_texts", "agent_items": [(상담원 발화, 감정 라벨, 손님 Label)], "sessions", "num_utterances"}
+    """
+    if name == "talksets":
+        sessions, customer_texts, agent_texts = [], [], []
+        num_utterances = 0
+        for session in talksets_sessions:
+            segments = [seg for seg in session.get("segments", []) if seg.get("text")]
+            segments = segments[:size - num_utterances]
+            if not segments:
+                break
+            sessions.append({**session, "segments": segments})
+            for seg in segments:
+                (customer_texts if seg.get("speaker") == "customer" else agent_texts).append(seg["text"])
+            num_utterances += len(segments)
+    else:
+        customer_texts = generate_synthetic_utterances(size, seed=seed)
+        agent_texts = make_agent_texts(checker, size, seed=seed)[:size]
+        sessions = generate_synthetic_sessions(max(1, size // SEGMENTS_PER_SESSION), SEGMENTS_PER_SESSION, seed=seed)
+        num_utterances = size
+
+    # 상담원 발화마다 (감정 라벨, 손님 Label) 매뉴얼을 고르게 배정
+    rng = random.Random(seed)
+    manual_keys = list(checker.keyword_config.manual_map)
+    agent_items = [(text,) + rng.choice(manual_keys) for text in agent_texts]
+    return {
+        "customer_texts": customer_texts,
+        "agent_items": agent_items,
+        "sessions": sessions,
+        "num_utterances": num_utterances,
+    }
+
+
+def peak_memory_kb(fn: Callable[[Any], Any], items: Sequence[Any]) -> float:
+    """항목 처리 중 최대 추가 할당량 (KB, 결과는 버림)"""
+    tracemalloc.start()
+    try:
+        for item in items:
+            fn(item)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_stage(fn: Callable[[Any], Any], items: Sequence[Any], max_items: Optional[int] = None,
+                    repeat: int = 1) -> Dict[str, Any]:
+    """단계 하나의 지연/처리량 측정 후 별도 실행으로 최대 메모리 측정"""
+    measured = list(items[:max_items]) if max_items else list(items)
+    if not measured:
+        return {"num_items": 0}
+    fn(measured[0])  # 지연 초기화(정규식 컴파일, 모델 첫 호출 등) 제외
+    stats = measure(fn, measured, repeat=repeat)
+    stats["num_items"] = len(measured)
+    stats["truncated"] = len(measured) < len(items)
+    stats["peak_memory_kb"] = peak_memory_kb(fn, measured[:MEMORY_SAMPLE])
+    return stats
+
+
+def benchmark_pipeline_stages(corpus: Dict[str, Any], components: Dict[str, Any],
+                              stages: Optional[List[str]] = None, repeat: int = 1) -> Dict[str, Any]:
+    """
+    코퍼스 하나에 대해 단계별 측정
+
+    Args:
+        corpus: build_corpus 결과
+        components: build_components 결과 (모든 코퍼스/발화 수가 공유)
+        stages: 측정할 단계 이름 (None이면 전체)
+        repeat: 지연 측정 반복 횟수
+
+    Returns:
+        단계 이름 → 측정 결과
+    """
+    stages = stages or STAGES
+    detector: ProfanityDetector = components["profanity_detector"]
+    predictor: IntentPredictor = components["intent_predictor"]
+    extractor: CustomerFeatureExtractor = components["customer_feature_extractor"]
+    checker: ManualComplianceChecker = components["manual_compliance_checker"]
+    pipeline: MainPipeline = components["pipeline"]
+    classifier = components["classifier"]
+    timestamp = datetime.now()
+
+    texts = corpus["customer_texts"]
+    # 뒤 단계 입력: MainPipeline과 같은 순서로 앞 단계 결과를 미리 계산
+    need_upstream = {"intent_rules", "intent_model", "customer_features"} & set(stages)
+    profanity_results = [detector.detect(text) for text in texts] if need_upstream else []
+    intent_items = list(zip(texts, profanity_results))
+
+    def predict(item):
+        text, profanity_result = item
+        return predictor.predict(
+            text,
+            profanity_result.is_profanity,
+            profanity_confidence=profanity_result.confidence if profanity_result.is_profanity else 0.0,
+            timestamp=timestamp
+        )
+
+    feature_items = []
+    if "customer_features" in stages:
+        predictor.classifier = None
+        feature_items = [(text, profanity_result, predict((text, profanity_result)))
+                         for text, profanity_result in intent_items]
+
+    def run_pipeline(session, intent_classifier):
+        pipeline.intent_predictor.classifier = intent_classifier
+        return pipeline.process(session)
+
+    stage_fns = {
+        "profanity_detect": (detector.detect, texts),
+        "korcen_check": (components["korcen_filter"].check_profanity, texts),
+        "intent_rules": (predict, intent_items),
+        "intent_model": (predict, intent_items),
+        "customer_features": (lambda item: extractor.extract_features(*item), feature_items),
+        "manual_compliance": (
+            lambda item: checker.check_compliance(item[0], item[1], item[2]), corpus["agent_items"]
+        ),
+        "pipeline_rules": (lambda session: run_pipeline(session, None), corpus["sessions"]),
+        "pipeline_model": (lambda session: run_pipeline(session, classifier), corpus["sessions"]),
+    }
+
+    results: Dict[str, Any] = {}
+    for stage in stages:
+        fn, items = stage_fns[stage]
+        predictor.classifier = classifier if stage == "intent_model" else None
+        max_items = MODEL_MAX_ITEMS if stage in MODEL_STAGES else None
+        if stage.startswith("pipeline_") and max_items:
+            max_items = max(1, max_items // SEGMENTS_PER_SESSION)
+        results[stage] = benchmark_stage(fn, items, max_items=max_items, repeat=repeat)
+        if stage.startswith("pipeline_"):
+            # 세션 단위 측정값에 발화(세그먼트) 처리량 추가
+            measured = corpus["sessions"][:results[stage]["num_items"]]
+            num_segments = sum(len(session["segments"]) for session in measured)
+            results[stage]["utterances_per_sec"] = (
+                results[stage]["ops_per_sec"] * num_segments / max(len(measured), 1)
+            )
+    predictor.classifier = None
+    return results
+
+
+def build_components(model_path: Optional[str] = None) -> Dict[str, Any]:
+    """단계별 객체 생성 (모델 분류기는 한 번만 만들어 의도 분류/파이프라인이 공유)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            pipeline = MainPipeline()
+        classifier = build_classifier(model_path)
+    return {
+        "profanity_detector": ProfanityDetector(),
+        "korcen_filter": KorcenFilter(),
+        "intent_predictor": IntentPredictor(use_model=False),
+        "customer_feature_extractor": CustomerFeatureExtractor(),
+        "manual_compliance_checker": ManualComplianceChecker(),
+        "pipeline": pipeline,
+        "classifier": classifier,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """측정한 코드의 git 커밋 (git이 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any],
+                          tolerance: float = REGRESSION_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    기준 결과 대비 회귀 항목
+
+    같은 (코퍼스, 발화 수, 단계)에서 처리량이 tolerance보다 줄었거나
+    p99 지연/최대 메모리가 tolerance보다 늘어난 지표
+
+    Returns:
+        [{"corpus", "size", "stage", "metric", "baseline", "current", "ratio"}, ...]
+    """
+    regressions = []
+    for corpus_name, sizes in results.get("corpora", {}).items():
+        for size, stages in sizes.items():
+            baseline_stages = baseline.get("corpora", {}).get(corpus_name, {}).get(size, {})
+            for stage, current in stages.items():
+                previous = baseline_stages.get(stage)
+                if not isinstance(current, dict) or not previous or not current.get("num_items"):
+                    continue
+                for metric, higher_is_better in (("ops_per_sec", True), ("p99_us", False), ("peak_memory_kb", False)):
+                    before, after = previous.get(metric), current.get(metric)
+                    if not before or after is None:
+                        continue
+                    ratio = after / before
+                    if (ratio < 1 - tolerance) if higher_is_better else (ratio > 1 + tolerance):
+                        regressions.append({
+                            "corpus": corpus_name, "size": size, "stage": stage, "metric": metric,
+                            "baseline": before, "current": after, "ratio": ratio,
+                        })
+    return regressions
+
+
+def run_benchmark(sizes: List[int], stages: Optional[List[str]] = None, model_path: Optional[str] = None,
+                  repeat: int = 1) -> Dict[str, Any]:
+    """
+    코퍼스 × 발화 수 × 단계 측정
+
+    Returns:
+        {"metadata": {...}, "corpora": {코퍼스: {발화 수(문자열): {단계: 측정 결과}}}}
+    """
+    components = build_components(model_path)
+    talksets_sessions = load_talksets_sessions()
+    classifier = components["classifier"]
+    results: Dict[str, Any] = {
+        "metadata": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": SEED,
+            "sizes": sizes,
+            "repeat": repeat,
+            "model_max_items": MODEL_MAX_ITEMS,
+            "memory_sample": MEMORY_SAMPLE,
+            "classifier": type(classifier.model).__name__,
+            "talksets_sessions": len(talksets_sessions),
+        },
+        "corpora": {},
+    }
+
+    corpus_names = ["talksets", "synthetic"] if talksets_sessions else ["synthetic"]
+    checker = components["manual_compliance_checker"]
+    for corpus_name in corpus_names:
+        results["corpora"][corpus_name] = {}
+        for size in sizes:
+            corpus = build_corpus(corpus_name, size, checker, talksets_sessions)
+            with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+                stage_results = benchmark_pipeline_stages(corpus, components, stages=stages, repeat=repeat)
+            stage_results["num_utterances"] = corpus["num_utterances"]
+            results["corpora"][corpus_name][str(size)] = stage_results
+            if corpus_name == "talksets" and corpus["num_utterances"] < size:
+                # talksets 발화를 모두 사용했으면 더 큰 크기는 같은 결과이므로 생략
+                break
+    return results
+
+
+def main():
+    """메인 함수"""
+    sizes = [int(size) for size in sys.argv[1].split(",")] if len(sys.argv) > 1 else DEFAULT_SIZES
+    baseline_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    print("=" * 80)
+    print("로직 분류 파이프라인 단계별 벤치마크")
+    print("=" * 80)
+
+    results = run_benchmark(sizes)
+    metadata = results["metadata"]
+    print(f"커밋 {metadata['git_commit']}, Python {metadata['python']}, 분류기 {metadata['classifier']}, "
+          f"talksets 세션 {metadata['talksets_sessions']}개")
+
+    for corpus_name, size_results in results["corpora"].items():
+        for size, stage_results in size_results.items():
+            print(f"\n[{corpus_name}] 발화 {stage_results['num_utterances']:,}개")
+            for stage in STAGES:
+                stats = stage_results.get(stage)
+                if not stats or not stats.get("num_items"):
+                    continue
+                print(f"  {stage:<18} {stats['ops_per_sec']:>10,.0f} ops/s  p50 {stats['p50_us']:>9.1f}us  "
+                      f"p99 {stats['p99_us']:>9.1f}us  peak {stats['peak_memory_kb']:>8.1f}KB  "
+                      f"(n={stats['num_items']:,}{', 일부' if stats['truncated'] else ''})")
+
+    if baseline_path is not None:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        results["baseline"] = {"path": str(baseline_path), "git_commit": baseline.get("metadata", {}).get("git_commit")}
+        results["regressions"] = regressions = compare_with_baseline(results, baseline)
+        print(f"\n기준 결과({baseline_path.name}) 대비 회귀 {len(regressions)}건 (허용 범위 {REGRESSION_TOLERANCE:.0%})")
+        for row in regressions:
+            print(f"  [{row['corpus']} {row['size']}] {row['stage']} {row['metric']}: "
+                  f"{row['baseline']:,.1f} → {row['current']:,.1f} ({row['ratio']:.2f}x)")
+
+    output_path = save_benchmark_results(results, 'pipeline_stages_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+PipelineResult 결과 객체 메모리 / 직렬화 처리량 벤치마크
+
+1. 결과 생성: 1000 Turn 세션 분석 처리량(turns/s)과 결과 보관 메모리(tracemalloc)
+2. 점수 객체 크기: 고정 스키마 FeatureScores(float64 배열) vs 같은 내용의 dict
+3. 직렬화 왕복(encode + decode) 시간과 크기
+   - asdict_json: dataclasses.asdict + json (복원 없음, 인코딩만)
+   - pickle: PipelineResult 그대로 pickle
+   - codec_json / codec_pickle: result_codec (메타데이터 JSON / pickle + float64 점수 블록)
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_result_structures.py [Turn 수]
+"""
+
+import gc
+import json
+import pickle
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Any, Callable
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.pipeline.main_pipeline import MainPipeline
+from logical_analysis.logic_classify_system.data.data_structures import PipelineResult
+from logical_analysis.logic_classify_system.data.result_codec import (
+    encode_pipeline_result,
+    decode_pipeline_result
+)
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    generate_synthetic_sessions,
+    save_benchmark_results
+)
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """repeat회 중 최소 실행 시간(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_build(pipeline: MainPipeline, stt_data: Dict[str, Any]) -> Dict[str, Any]:
+    """세션 분석 처리량과 결과 보관 메모리"""
+    pipeline.process(stt_data)
+    seconds = best_of(lambda: pipeline.process(stt_data), repeat=3)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = pipeline.process(stt_data)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    turns = len(result.turn_results)
+    return {
+        "turns": turns,
+        "turns_per_sec": turns / seconds,
+        "retained_kb": retained / 1024,
+        "retained_bytes_per_turn": retained / turns,
+    }
+
+
+def deep_sizeof(scores) -> int:
+    """점수 객체 크기 (FeatureScores는 배열 포함, dict는 키/값 객체 제외한 테이블 크기)"""
+    if hasattr(scores, "values") and not isinstance(scores, dict):
+        return sys.getsizeof(scores) + sys.getsizeof(scores.values)
+    return sys.getsizeof(scores)
+
+
+def benchmark_score_objects(result: PipelineResult) -> Dict[str, Any]:
+    """Turn 하나의 점수 객체 크기 (스키마 배열 vs dict)"""
+    turn = next(t for t in result.turn_results if t.agent_result is not None)
+    rows = {
+        "customer": turn.customer_result.feature_scores,
+        "agent": turn.agent_result.feature_scores,
+        "turn": turn.turn_scores,
+    }
+    return {
+        name: {"schema_bytes": deep_sizeof(scores), "dict_bytes": deep_sizeof(scores.to_dict())}
+        for name, scores in rows.items()
+    }
+
+
+def benchmark_serialization(result: PipelineResult) -> Dict[str, Any]:
+    """직렬화 방식별 왕복 시간과 크기"""
+    codecs = {
+        "asdict_json": (
+            lambda r: json.dumps(asdict(r), default=str, ensure_ascii=False).encode('utf-8'),
+            None
+        ),
+        "pickle": (lambda r: pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "codec_json": (encode_pipeline_result, decode_pipeline_result),
+        "codec_pickle": (
+            lambda r: encode_pipeline_result(r, meta_format="pickle"),
+            lambda data: decode_pipeline_result(data, allow_pickle=True)
+        ),
+    }
+    rows = {}
+    for name, (encode, decode) in codecs.items():
+        data = encode(result)
+        row = {"bytes": len(data), "encode_ms": best_of(lambda: encode(result)) * 1000}
+        if decode is not None:
+            assert decode(data) == result, f"{name} 왕복 결과 불일치"
+            row["decode_ms"] = best_of(lambda: decode(data)) * 1000
+            row["round_trip_ms"] = row["encode_ms"] + row["decode_ms"]
+        rows[name] = row
+    return rows
+
+
+def main():
+    """메인 함수"""
+    num_turns = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print("=" * 80)
+    print("PipelineResult 결과 객체 메모리 / 직렬화 처리량 벤치마크")
+    print("=" * 80)
+
+    pipeline = MainPipeline()
+    stt_data = generate_synthetic_sessions(1, segments_per_session=num_turns * 2)[0]
+
+    results: Dict[str, Any] = {}
+    results["build"] = build = benchmark_build(pipeline, stt_data)
+    print(f"\n[1] 세션 분석 ({build['turns']} Turn)")
+    print(f"  {build['turns_per_sec']:>8,.0f} turns/s  결과 보관 {build['retained_kb']:>8,.0f} KB "
+          f"({build['retained_bytes_per_turn']:,.0f} B/Turn)")
+
+    result = pipeline.process(stt_data)
+    results["score_objects"] = score_objects = benchmark_score_objects(result)
+    print("\n[2] 점수 객체 크기 (Turn 1개)")
+    for name, row in score_objects.items():
+        print(f"  {name:<10} schema {row['schema_bytes']:>5} B  dict {row['dict_bytes']:>5} B")
+
+    results["serialization"] = serialization = benchmark_serialization(result)
+    print("\n[3] 직렬화")
+    for name, row in serialization.items():
+        round_trip = f"왕복 {row['round_trip_ms']:>7,.1f} ms" if "round_trip_ms" in row else "왕복        -"
+        print(f"  {name:<13} encode {row['encode_ms']:>7,.1f} ms  {round_trip}  {row['bytes'] / 1024:>8,.0f} KB")
+
+    output_path = save_benchmark_results(results, 'result_structures_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+규칙 레지스트리 벤치마크
+
+규칙 규모(기본 키워드 + 합성 키워드)별 스냅샷 1개의 컴파일 시간과 메모리,
+요청 경로에서 호출하는 reload_if_changed(변경 없음) 비용 측정
+"""
+
+import sys
+import json
+import random
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.config.rule_registry import (
+    JsonRuleSource,
+    RuleRegistry,
+    builtin_rule_document,
+    measure_snapshot
+)
+from logical_analysis.logic_classify_system.test.benchmark_utils import measure, save_benchmark_results
+
+_SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+
+
+def scaled_rule_document(extra_keywords_per_list: int, seed: int = 0) -> Dict[str, Any]:
+    """기본 규칙 리스트마다 합성 키워드를 추가한 규칙 문서"""
+    rng = random.Random(seed)
+    document = builtin_rule_document()
+    document["version"] = f"scaled-{extra_keywords_per_list}"
+
+    def synthetic_keywords():
+        return ["".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 5)))
+                for _ in range(extra_keywords_per_list)]
+
+    for name, keywords in document["rule_lists"].items():
+        if isinstance(keywords, dict):
+            for sub_category in keywords:
+                keywords[sub_category] = keywords[sub_category] + synthetic_keywords()
+        else:
+            document["rule_lists"][name] = keywords + synthetic_keywords()
+    for entry in document["manual_keywords"]:
+        entry["required_keywords"] = entry["required_keywords"] + synthetic_keywords()
+    return document
+
+
+def benchmark_rule_registry(scales: List[int] = (0, 100, 1000)) -> Dict[str, Any]:
+    """
+    규칙 규모별 스냅샷 컴파일 시간/메모리 측정
+
+    Args:
+        scales: 규칙 리스트당 추가할 합성 키워드 수 목록
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    results: Dict[str, Any] = {"snapshots": {}}
+    for scale in scales:
+        results["snapshots"][f"extra_{scale}"] = measure_snapshot(scaled_rule_document(scale), source="benchmark")
+
+    # 변경이 없을 때 요청 경로 비용 (파일 stat 1회 + 비교)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "rules.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(builtin_rule_document(), f, ensure_ascii=False)
+        registry = RuleRegistry(JsonRuleSource(str(path)), check_interval=0.0)
+        results["reload_if_changed_unchanged"] = measure(lambda _: registry.reload_if_changed(), range(5000))
+        results["current"] = measure(lambda _: registry.current(), range(5000))
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("규칙 레지스트리 벤치마크 (스냅샷 컴파일 시간/메모리)")
+    print("=" * 80)
+
+    results = benchmark_rule_registry()
+    for name, stats in results["snapshots"].items():
+        print(f"[{name}] 키워드 {stats['num_keywords']:,}개, 상태 {stats['num_states']:,}개, "
+              f"컴파일 {stats['compile_seconds'] * 1000:.1f}ms, "
+              f"유지 메모리 {stats['memory_bytes'] / 1024 / 1024:.2f}MB, "
+              f"최대 {stats['peak_memory_bytes'] / 1024 / 1024:.2f}MB")
+    for name in ("reload_if_changed_unchanged", "current"):
+        stats = results[name]
+        print(f"{name:<28} p50 {stats['p50_us']:.2f}us  p99 {stats['p99_us']:.2f}us")
+
+    output_path = save_benchmark_results(results, 'rule_registry_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
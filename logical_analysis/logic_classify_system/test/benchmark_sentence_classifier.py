@@ -0,0 +1,167 @@
+"""
+SentenceClassifier 배치 추론 벤치마크 (CPU)
+
+기존 방식(max_length=128 고정 패딩 + 배치 1 추론)과
+predict(동적 패딩, 배치 1), predict_batch(길이순 버킷 + 동적 패딩)의 처리량 비교
+
+학습된 모델(models/aihub/base_model)과 transformers가 있으면 실제 모델을 사용하고,
+없으면 같은 입력/출력 형태의 소형 Transformer 인코더 분류기로 측정
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_sentence_classifier.py [모델 경로]
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional
+
+import torch
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.intent_classifier.sentence_classifier import (
+    LABEL_MAPPING,
+    SentenceClassifier
+)
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    load_customer_utterances,
+    save_benchmark_results
+)
+
+
+class CharTokenizer:
+    """문자 단위 토크나이저 (HuggingFace 토크나이저의 __call__/pad 인터페이스 중 사용하는 부분만 구현)"""
+
+    PAD_ID, CLS_ID, SEP_ID, UNK_ID = 0, 1, 2, 3
+
+    def __init__(self, vocab_size: int = 4096):
+        self.vocab_size = vocab_size
+
+    def _encode(self, text: str, max_length: int) -> List[int]:
+        ids = [self.CLS_ID] + [4 + ord(ch) % (self.vocab_size - 4) for ch in text] + [self.SEP_ID]
+        if len(ids) > max_length:
+            ids = ids[:max_length - 1] + [self.SEP_ID]
+        return ids
+
+    def __call__(self, texts, truncation: bool = True, padding=False, max_length: int = 128, return_tensors=None):
+        single = isinstance(texts, str)
+        input_ids = [self._encode(text, max_length) for text in ([texts] if single else texts)]
+        features = {"input_ids": input_ids, "attention_mask": [[1] * len(ids) for ids in input_ids]}
+        if padding == 'max_length':
+            return self.pad(features, padding='max_length', max_length=max_length, return_tensors=return_tensors)
+        return features
+
+    def pad(self, features, padding='longest', max_length: Optional[int] = None, return_tensors=None):
+        target = max_length if padding == 'max_length' else max(len(ids) for ids in features["input_ids"])
+        input_ids = [ids + [self.PAD_ID] * (target - len(ids)) for ids in features["input_ids"]]
+        attention_mask = [mask + [0] * (target - len(mask)) for mask in features["attention_mask"]]
+        if return_tensors == 'pt':
+            return {"input_ids": torch.tensor(input_ids), "attention_mask": torch.tensor(attention_mask)}
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
+
+class TinyEncoderClassifier(torch.nn.Module):
+    """소형 Transformer 인코더 분류기 (패딩 토큰도 연산하는 BERT와 같은 비용 구조)"""
+
+    def __init__(self, vocab_size: int = 4096, hidden_size: int = 256, num_layers: int = 4,
+                 num_labels: int = len(LABEL_MAPPING), max_position: int = 512):
+        super().__init__()
+        self.embeddings = torch.nn.Embedding(vocab_size, hidden_size)
+        self.positions = torch.nn.Embedding(max_position, hidden_size)
+        layer = torch.nn.TransformerEncoderLayer(hidden_size, nhead=4, dim_feedforward=hidden_size * 4,
+                                                 batch_first=True)
+        self.encoder = torch.nn.TransformerEncoder(layer, num_layers, enable_nested_tensor=False)
+        self.classifier = torch.nn.Linear(hidden_size, num_labels)
+
+    def forward(self, input_ids, attention_mask):
+        positions = torch.arange(input_ids.size(1), device=input_ids.device).unsqueeze(0)
+        hidden = self.embeddings(input_ids) + self.positions(positions)
+        hidden = self.encoder(hidden, src_key_padding_mask=attention_mask == 0)
+        return SimpleNamespace(logits=self.classifier(hidden[:, 0]))
+
+
+def build_classifier(model_path: Optional[str] = None) -> SentenceClassifier:
+    """실제 모델을 불러오고, 사용할 수 없으면 소형 인코더 분류기를 끼운 SentenceClassifier 반환"""
+    classifier = SentenceClassifier(model_path=model_path, use_gpu=False)
+    if classifier.is_available():
+        return classifier
+    torch.manual_seed(0)
+    classifier.model = TinyEncoderClassifier().eval()
+    classifier.tokenizer = CharTokenizer()
+    classifier.device = torch.device('cpu')
+    return classifier
+
+
+def legacy_predict(classifier: SentenceClassifier, text: str, max_length: int = 128) -> Dict[str, Any]:
+    """기존 방식: max_length 고정 패딩 + 배치 1 추론"""
+    encoding = classifier.tokenizer(
+        text, truncation=True, padding='max_length', max_length=max_length, return_tensors='pt'
+    )
+    with torch.no_grad():
+        logits = classifier.model(
+            input_ids=encoding['input_ids'].to(classifier.device),
+            attention_mask=encoding['attention_mask'].to(classifier.device)
+        ).logits
+    return classifier._result_from_probabilities(torch.softmax(logits, dim=-1)[0].tolist())
+
+
+def benchmark_sentence_classifier(classifier: SentenceClassifier, texts: List[str],
+                                  batch_sizes: List[int] = (8, 32, 64)) -> Dict[str, Any]:
+    """
+    추론 방식별 CPU 처리량 측정
+
+    Args:
+        classifier: 측정할 분류기
+        texts: 손님 발화 리스트
+        batch_sizes: predict_batch 버킷 크기 목록
+
+    Returns:
+        방식별 texts/sec
+    """
+    def timed(fn):
+        start = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - start
+        return {"seconds": seconds, "texts_per_sec": len(texts) / seconds}
+
+    results: Dict[str, Any] = {
+        "num_texts": len(texts),
+        "mean_chars": sum(len(text) for text in texts) / len(texts),
+        "torch_threads": torch.get_num_threads(),
+        "model": type(classifier.model).__name__,
+    }
+    results["legacy_max_length_batch1"] = timed(lambda: [legacy_predict(classifier, text) for text in texts])
+    results["predict_dynamic_batch1"] = timed(lambda: [classifier.predict(text) for text in texts])
+    for batch_size in batch_sizes:
+        results[f"predict_batch_{batch_size}"] = timed(
+            lambda: classifier.predict_batch(texts, batch_size=batch_size)
+        )
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("SentenceClassifier 배치 추론 벤치마크 (CPU)")
+    print("=" * 80)
+
+    classifier = build_classifier(sys.argv[1] if len(sys.argv) > 1 else None)
+    texts = load_customer_utterances(1000, seed=0)
+    results = benchmark_sentence_classifier(classifier, texts)
+    print(f"모델: {results['model']}, 발화 {results['num_texts']}개 (평균 {results['mean_chars']:.0f}자), "
+          f"스레드 {results['torch_threads']}")
+    baseline = results["legacy_max_length_batch1"]["texts_per_sec"]
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print(f"  {name:<28} {value['texts_per_sec']:>10,.0f} texts/s  ({value['texts_per_sec'] / baseline:.1f}x)")
+
+    output_path = save_benchmark_results(results, 'sentence_classifier_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+POST /api/analysis/analyze 세션 단위 분석 지연 시간 벤치마크
+
+세그먼트 수(50/200/1000)별로 다음 두 경로의 요청 1회 처리 시간 측정
+- per_segment: 기존 방식 (세그먼트마다 발화 1개짜리 세션으로 파이프라인 실행)
+- session: 세션 전체를 Turn 단위로 한 번 분석 (배치 모델 추론) + bulk_create 1회
+- unchanged: 결과 저장 후 변경 없이 재요청 (입력 해시 일치 → 파이프라인 미실행)
+- one_edit: 손님 세그먼트 1개 텍스트 수정 후 재요청 (해당 Turn만 재분석)
+
+Django 설정(linguaproject.settings)과 .env가 필요하며, 테스트 DB(SQLite 메모리)에
+모델 정의대로 테이블을 만들어 측정 (운영 DB 미사용)
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_session_analysis.py [모델 경로]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'linguaproject.settings')
+
+import django
+
+django.setup()
+
+from django.db import transaction
+
+from audio_process.models import CallRecording, SpeakerSegment
+from logical_analysis import inference
+from logical_analysis.api import run_analysis_for_session
+from logical_analysis.models import LogicalResult
+from logical_analysis.schemas import AnalyzeRequest
+from logical_analysis.logic_classify_system.test.benchmark_sentence_classifier import build_classifier
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    generate_synthetic_sessions,
+    save_benchmark_results
+)
+from logical_analysis.logic_classify_system.test.django_test_utils import create_test_database
+
+SEGMENT_COUNTS = (50, 200, 1000)
+
+
+def create_recording(num_segments: int, seed: int, uploader=None) -> CallRecording:
+    """합성 세션을 CallRecording/SpeakerSegment(client/counselor)로 저장"""
+    session = generate_synthetic_sessions(1, segments_per_session=num_segments, seed=seed)[0]
+    recording = CallRecording.objects.create(
+        audio_file=f"bench/{seed}.wav", file_name=f"{seed}.wav", uploader=uploader
+    )
+    SpeakerSegment.objects.bulk_create([
+        SpeakerSegment(
+            recording=recording,
+            speaker_label="counselor" if segment["speaker"] == "agent" else "client",
+            is_counselor=segment["speaker"] == "agent",
+            start_time=float(idx),
+            end_time=float(idx) + 1.0,
+            text=segment["text"]
+        )
+        for idx, segment in enumerate(session["segments"])
+    ])
+    return recording
+
+
+def legacy_analyze(session_id: str) -> int:
+    """기존 방식: 세그먼트마다 파이프라인 실행 후 손님 발화 분류 결과 저장"""
+    recording = CallRecording.objects.get(session_id=session_id)
+    rows = []
+    for seg in recording.segments.all():
+        ai_res = inference.run_pipeline(seg.text, session_id)
+        classification = ai_res.turn_results[0].customer_result.classification_result
+        rows.append(LogicalResult(
+            segment=seg,
+            label=classification.label,
+            label_type=classification.label_type,
+            confidence=classification.confidence,
+            probabilities=classification.probabilities or {},
+            action='MONITOR',
+            alert_level='LOW'
+        ))
+    with transaction.atomic():
+        LogicalResult.objects.bulk_create(rows)
+    return len(rows)
+
+
+def timed(fn, session_id: str) -> Dict[str, float]:
+    """분석 1회 지연 시간 측정 (측정 후 결과 삭제)"""
+    start = time.perf_counter()
+    fn(session_id)
+    seconds = time.perf_counter() - start
+    saved = LogicalResult.objects.filter(segment__recording__session_id=session_id).count()
+    LogicalResult.objects.filter(segment__recording__session_id=session_id).delete()
+    return {"latency_ms": seconds * 1000, "saved_rows": saved}
+
+
+def timed_reanalysis(session_id: str) -> Dict[str, Dict[str, float]]:
+    """결과 저장 상태에서 변경 없음 / 세그먼트 1개 수정 후 재분석 지연 시간"""
+    analyze = lambda: run_analysis_for_session(None, AnalyzeRequest(session_id=session_id))
+    analyze()
+
+    start = time.perf_counter()
+    unchanged = analyze()
+    unchanged_ms = (time.perf_counter() - start) * 1000
+
+    segment = SpeakerSegment.objects.filter(
+        recording__session_id=session_id, is_counselor=False
+    ).order_by('start_time')[1]
+    segment.text = f"{segment.text} 다시 확인해 주세요"
+    segment.save(update_fields=['text'])
+
+    start = time.perf_counter()
+    edited = analyze()
+    edited_ms = (time.perf_counter() - start) * 1000
+
+    LogicalResult.objects.filter(segment__recording__session_id=session_id).delete()
+    return {
+        "unchanged": {"latency_ms": unchanged_ms, "analyzed_segments": unchanged["analyzed_segments"]},
+        "one_edit": {"latency_ms": edited_ms, "analyzed_segments": edited["analyzed_segments"]},
+    }
+
+
+def benchmark_session_analysis(segment_counts=SEGMENT_COUNTS) -> Dict[str, Any]:
+    """세그먼트 수별 per_segment / session 경로 지연 시간"""
+    results: Dict[str, Any] = {}
+    for seed, num_segments in enumerate(segment_counts):
+        recording = create_recording(num_segments, seed)
+        session_id = str(recording.session_id)
+        results[str(num_segments)] = {
+            "per_segment": timed(legacy_analyze, session_id),
+            "session": timed(
+                lambda sid: run_analysis_for_session(None, AnalyzeRequest(session_id=sid)), session_id
+            ),
+            **timed_reanalysis(session_id),
+        }
+    return results
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("POST /api/analysis/analyze 세션 단위 분석 지연 시간 벤치마크")
+    print("=" * 80)
+
+    create_test_database()
+    classifier = build_classifier(sys.argv[1] if len(sys.argv) > 1 else None)
+    inference.get_pipeline().intent_predictor.classifier = classifier
+    print(f"모델: {type(classifier.model).__name__}")
+
+    # 워밍업 (규칙 스냅샷/모델 첫 실행)
+    warmup = create_recording(10, seed=99)
+    run_analysis_for_session(None, AnalyzeRequest(session_id=str(warmup.session_id)))
+
+    results = benchmark_session_analysis()
+    results["model"] = type(classifier.model).__name__
+    for num_segments in SEGMENT_COUNTS:
+        row = results[str(num_segments)]
+        legacy, session = row["per_segment"], row["session"]
+        print(f"  {num_segments:>5} segments  per_segment {legacy['latency_ms']:>9,.0f} ms  "
+              f"session {session['latency_ms']:>8,.0f} ms  ({legacy['latency_ms'] / session['latency_ms']:.1f}x, "
+              f"저장 {session['saved_rows']}행)")
+        print(f"  {'':>5}           unchanged {row['unchanged']['latency_ms']:>9,.0f} ms  "
+              f"one_edit {row['one_edit']['latency_ms']:>7,.0f} ms  "
+              f"(재분석 {row['one_edit']['analyzed_segments']}개 세그먼트)")
+
+    output_path = save_benchmark_results(results, 'session_analysis_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+GET /api/analysis/top-risk 위험 Turn 상위 N개 조회 벤치마크
+
+세션 여러 개를 분석해 LogicalResult(특징점/Turn 종합 점수 컬럼)를 저장한 뒤
+"최근 7일 turn_risk_score 상위 100 Turn"을 구하는 두 방식 비교
+- recompute: 저장된 세그먼트로 세션마다 파이프라인을 다시 실행하여 Turn 점수 정렬 (기존 방식)
+- db: 저장된 turn_risk_score 컬럼으로 DB에서 정렬 (인덱스 사용)
+
+Django 설정(linguaproject.settings)과 .env가 필요하며, 테스트 DB(SQLite 메모리)에서 측정
+
+사용법:
+    python logical_analysis/logic_classify_system/test/benchmark_top_risk.py [세션 수] [세션당 세그먼트 수]
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.test.benchmark_session_analysis import create_recording
+from audio_process.models import CallRecording
+from logical_analysis import inference
+from logical_analysis.api import run_analysis_for_session, get_top_risk_turns
+from logical_analysis.models import LogicalResult
+from logical_analysis.schemas import AnalyzeRequest
+from logical_analysis.session_analysis import build_session_stt_data
+from logical_analysis.logic_classify_system.test.benchmark_utils import save_benchmark_results
+from logical_analysis.logic_classify_system.test.django_test_utils import create_test_database, make_request
+
+TOP_N = 100
+
+
+def recompute_top_risk(limit: int = TOP_N) -> List[Dict[str, Any]]:
+    """기존 방식: 세션마다 파이프라인을 다시 실행하여 Turn 위험 점수 상위 N개"""
+    turns = []
+    for recording in CallRecording.objects.prefetch_related('segments'):
+        segments = sorted(recording.segments.all(), key=lambda seg: (seg.start_time, seg.id))
+        result = inference.run_session_pipeline(build_session_stt_data(str(recording.session_id), segments))
+        for turn in result.turn_results:
+            turns.append({
+                "segment_id": segments[turn.segment_indices[0]].id,
+                "turn_risk_score": turn.turn_scores["turn_risk_score"]
+            })
+    turns.sort(key=lambda row: row["turn_risk_score"], reverse=True)
+    return turns[:limit]
+
+
+def timed(fn, repeat: int = 3) -> Dict[str, Any]:
+    """최소 실행 시간과 결과"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return {"latency_ms": best * 1000, "result": result}
+
+
+def main():
+    """메인 함수"""
+    num_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    segments_per_session = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    print("=" * 80)
+    print("GET /api/analysis/top-risk 위험 Turn 상위 N개 조회 벤치마크")
+    print("=" * 80)
+
+    create_test_database()
+    request = make_request()
+    start = time.perf_counter()
+    for seed in range(num_sessions):
+        recording = create_recording(segments_per_session, seed, uploader=request.user)
+        run_analysis_for_session(request, AnalyzeRequest(session_id=str(recording.session_id)))
+    setup_seconds = time.perf_counter() - start
+    stored = LogicalResult.objects.filter(turn_risk_score__isnull=False).count()
+    print(f"세션 {num_sessions}개 × 세그먼트 {segments_per_session}개 분석/저장 {setup_seconds:.1f}s "
+          f"(Turn 점수 행 {stored:,}개)")
+
+    recompute = timed(recompute_top_risk, repeat=1)
+    db = timed(lambda: get_top_risk_turns(request, days=7, limit=TOP_N))
+    same = [row["turn_risk_score"] for row in recompute["result"]] == [
+        row["turn_risk_score"] for row in db["result"]
+    ]
+    query_plan = (
+        LogicalResult.objects.filter(turn_risk_score__isnull=False)
+        .order_by('-turn_risk_score')[:TOP_N].explain()
+    )
+
+    print(f"\n  recompute  {recompute['latency_ms']:>10,.1f} ms")
+    print(f"  db         {db['latency_ms']:>10,.1f} ms  ({recompute['latency_ms'] / db['latency_ms']:,.0f}x, "
+          f"상위 {TOP_N}개 점수 일치: {same})")
+    print(f"  쿼리 계획: {query_plan}")
+
+    results = {
+        "num_sessions": num_sessions,
+        "segments_per_session": segments_per_session,
+        "turn_rows": stored,
+        "recompute_ms": recompute["latency_ms"],
+        "db_ms": db["latency_ms"],
+        "same_top_scores": same,
+        "query_plan": query_plan,
+    }
+    output_path = save_benchmark_results(results, 'top_risk_benchmark.json')
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+벤치마크 공통 유틸리티
+
+talksets STT 데이터 로드(없으면 합성 데이터 생성), 합성 세션 생성,
+처리량/지연 시간 측정 함수 제공
+"""
+
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# 합성 발화용 일반 구문 (규칙 키워드가 없는 평범한 상담 발화)
+FILLER_PHRASES = [
+    "제가 지난주에 주문한 상품이", "배송 조회를 해봤는데", "고객센터 번호로 전화했어요",
+    "요금이 이번 달에 좀 많이 나와서", "앱에서 결제가 계속 실패하고", "카드 등록을 다시 했는데도",
+    "상담원 연결이 너무 오래 걸려서", "서비스 해지를 하려고 하는데", "포인트 적립이 안 된 것 같아서",
+    "주소 변경을 하고 싶은데", "환불 처리 상태가 궁금해서", "제품 설명서에 나온 대로 했는데",
+]
+
+AGENT_PHRASES = [
+    "안녕하세요 고객님 무엇을 도와드릴까요", "불편을 드려 죄송합니다", "확인 후 바로 안내드리겠습니다",
+    "처리 절차를 안내해 드리겠습니다", "해결 방안을 말씀드리겠습니다", "추가 문의 있으시면 연락 주세요",
+    "감사합니다 좋은 하루 되세요", "고객님 마음 충분히 이해합니다", "담당 부서로 조치하겠습니다",
+]
+
+
+def rule_keywords() -> List[str]:
+    """Baseline 규칙 키워드 전체 (합성 발화에 섞어 넣을 용도)"""
+    from logical_analysis.logic_classify_system.keyword_engine.keyword_index import build_rule_categories
+
+    keywords = []
+    for category_keywords in build_rule_categories().values():
+        keywords.extend(category_keywords)
+    return keywords
+
+
+def generate_synthetic_utterances(count: int, seed: int = 42, keyword_ratio: float = 0.5) -> List[str]:
+    """
+    합성 손님 발화 생성
+
+    Args:
+        count: 생성할 발화 수
+        seed: 난수 시드
+        keyword_ratio: 규칙 키워드를 포함할 발화 비율
+
+    Returns:
+        발화 리스트
+    """
+    rng = random.Random(seed)
+    keywords = rule_keywords()
+    utterances = []
+    for _ in range(count):
+        parts = rng.sample(FILLER_PHRASES, rng.randint(1, 3))
+        if rng.random() < keyword_ratio:
+            for _ in range(rng.randint(1, 3)):
+                parts.insert(rng.randint(0, len(parts)), rng.choice(keywords))
+        utterances.append(" ".join(parts))
+    return utterances
+
+
+def generate_synthetic_sessions(num_sessions: int, segments_per_session: int = 20,
+                                seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    합성 STT 세션 생성 (손님/상담원 교대 발화)
+
+    Returns:
+        MainPipeline.process 입력 형식의 세션 리스트
+    """
+    rng = random.Random(seed)
+    customer_texts = generate_synthetic_utterances(num_sessions * segments_per_session, seed=seed)
+    sessions = []
+    text_idx = 0
+    for session_idx in range(num_sessions):
+        segments = []
+        for seg_idx in range(segments_per_session):
+            if seg_idx % 2 == 0:
+                speaker, text = "customer", customer_texts[text_idx]
+                text_idx += 1
+            else:
+                speaker, text = "agent", " ".join(rng.sample(AGENT_PHRASES, rng.randint(1, 2)))
+            segments.append({
+                "speaker": speaker,
+                "text": text,
+                "start": seg_idx * 2.0,
+                "end": (seg_idx + 1) * 2.0
+            })
+        sessions.append({"session_id": f"synthetic_{session_idx}", "segments": segments})
+    return sessions
+
+
+def load_talksets_sessions(data_dir: Optional[Path] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    preprocess_talksets_to_stt.py로 만든 talksets STT 세션 로드
+
+    Args:
+        data_dir: talksets_stt 디렉토리 (None이면 test/talksets_stt)
+        limit: 최대 세션 수
+
+    Returns:
+        세션 리스트 (데이터가 없으면 빈 리스트)
+    """
+    data_dir = data_dir or Path(__file__).parent / 'talksets_stt'
+    if not data_dir.exists():
+        return []
+
+    sessions = []
+    for path in sorted(data_dir.glob('*.json')):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                sessions.append(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"  [경고] 파일 로드 실패 ({path.name}): {e}")
+            continue
+        if limit and len(sessions) >= limit:
+            break
+    return sessions
+
+
+def load_customer_utterances(count: int, seed: int = 42) -> List[str]:
+    """talksets 손님 발화를 우선 사용하고 부족하면 합성 발화로 채움"""
+    utterances = [
+        seg["text"]
+        for session in load_talksets_sessions()
+        for seg in session.get("segments", [])
+        if seg.get("speaker") == "customer" and seg.get("text")
+    ][:count]
+    if len(utterances) < count:
+        utterances.extend(generate_synthetic_utterances(count - len(utterances), seed=seed))
+    return utterances
+
+
+def measure(fn: Callable[[Any], Any], items: Sequence[Any], repeat: int = 1) -> Dict[str, float]:
+    """
+    항목별 처리 시간 측정
+
+    Args:
+        fn: 항목 하나를 처리하는 함수
+        items: 입력 항목
+        repeat: 반복 횟수
+
+    Returns:
+        {"ops_per_sec", "mean_us", "p50_us", "p99_us", "total_seconds"}
+    """
+    durations = []
+    perf_counter = time.perf_counter
+    for _ in range(repeat):
+        for item in items:
+            start = perf_counter()
+            fn(item)
+            durations.append(perf_counter() - start)
+
+    return summarize_durations(durations)
+
+
+def summarize_durations(durations: List[float]) -> Dict[str, float]:
+    """처리 시간 리스트(초) 요약"""
+    if not durations:
+        return {"ops_per_sec": 0.0, "mean_us": 0.0, "p50_us": 0.0, "p99_us": 0.0, "total_seconds": 0.0}
+
+    ordered = sorted(durations)
+    total = sum(ordered)
+
+    def percentile(p: float) -> float:
+        return ordered[min(int(len(ordered) * p), len(ordered) - 1)] * 1e6
+
+    return {
+        "ops_per_sec": len(ordered) / total if total > 0 else 0.0,
+        "mean_us": total / len(ordered) * 1e6,
+        "p50_us": percentile(0.50),
+        "p99_us": percentile(0.99),
+        "total_seconds": total,
+    }
+
+
+def save_benchmark_results(results: Dict[str, Any], filename: str) -> Path:
+    """벤치마크 결과를 test_results/benchmarks/ 아래에 JSON으로 저장"""
+    output_dir = Path(__file__).parent / 'test_results' / 'benchmarks'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / filename
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    return output_path
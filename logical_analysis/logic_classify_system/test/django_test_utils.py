@@ -0,0 +1,82 @@
+"""
+Django 모델/API 테스트 공통 유틸리티
+
+.env가 없는 환경에서도 linguaproject.settings를 불러올 수 있도록 필수 환경 변수에 테스트용 기본값을 채우고,
+테스트 DB(SQLite 메모리)에 현재 모델 정의대로 테이블을 만듦 (프로세스당 1회, 운영 DB 미사용)
+"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# .env 또는 실행 환경에 값이 있으면 그 값을 사용
+TEST_ENV = {
+    "SECRET_KEY": "test-secret-key",
+    "DEBUG": "False",
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "AWS_STORAGE_BUCKET_NAME": "test",
+}
+
+_database_ready = False
+
+
+def setup_test_django() -> None:
+    """Django 설정 로드 + 테스트 DB 생성"""
+    global _database_ready
+    if _database_ready:
+        return
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'linguaproject.settings')
+    for key, value in TEST_ENV.items():
+        os.environ.setdefault(key, value)
+
+    create_test_database()
+    _database_ready = True
+
+
+def create_test_database() -> None:
+    """Django 설정 로드 후 마이그레이션 없이 현재 모델 정의대로 테스트 DB 생성"""
+    import django
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    settings.MIGRATION_MODULES = {app.label: None for app in django.apps.apps.get_app_configs()}
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+
+def make_request(username: str = "tester") -> SimpleNamespace:
+    """인증을 거친 요청 (API 함수를 직접 호출할 때 request.user만 사용)"""
+    from django.contrib.auth import get_user_model
+
+    user, _ = get_user_model().objects.get_or_create(username=username)
+    return SimpleNamespace(user=user)
+
+
+def create_segments(recording, segments) -> list:
+    """
+    (speaker, text) 또는 (speaker, text, start_time) 리스트를 SpeakerSegment로 저장
+
+    speaker: "customer"(client) / "agent"(counselor), start_time 생략 시 순서대로 2초 간격
+    """
+    from audio_process.models import SpeakerSegment
+
+    rows = []
+    for idx, (speaker, text, *start) in enumerate(segments):
+        start_time = start[0] if start else idx * 2.0
+        rows.append(SpeakerSegment.objects.create(
+            recording=recording,
+            speaker_label="counselor" if speaker == "agent" else "client",
+            is_counselor=speaker == "agent",
+            start_time=start_time,
+            end_time=start_time + 1.0,
+            text=text
+        ))
+    return rows
@@ -0,0 +1,44 @@
+"""
+멀티 세션 병렬 배치 분석 테스트
+
+프로세스 풀 결과가 입력 순서대로 스트리밍되고 단일 프로세스 결과와 같은지,
+writer가 묶음 단위로 호출되는지 검증
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.pipeline.batch_runner import BatchRunner
+from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_sessions
+
+
+def _summary(result):
+    return (
+        result.session_id,
+        [(turn.customer_result.classification_result.label, turn.turn_scores["turn_risk_score"])
+         for turn in result.turn_results]
+    )
+
+
+def test_pool_results_in_order_and_match_single_process():
+    """워커 2개/청크 2개로 나눠도 입력 순서와 결과가 단일 프로세스와 같은지 확인"""
+    sessions = generate_synthetic_sessions(7, segments_per_session=10, seed=21)
+    with BatchRunner(num_workers=1) as runner:
+        expected = [_summary(result) for result in runner.imap(sessions)]
+
+    batches = []
+    with BatchRunner(num_workers=2, chunk_size=2, max_pending_chunks=2) as runner:
+        count = runner.run(iter(sessions), writer=lambda batch: batches.append([_summary(r) for r in batch]),
+                           write_batch_size=3)
+    assert count == len(sessions)
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [item for batch in batches for item in batch] == expected
+
+
+if __name__ == "__main__":
+    test_pool_results_in_order_and_match_single_process()
+    print("[완료] 배치 분석 테스트 통과")
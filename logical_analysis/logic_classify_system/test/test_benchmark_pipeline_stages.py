@@ -0,0 +1,60 @@
+"""
+단계별 벤치마크 테스트
+
+작은 발화 수로 벤치마크를 실행했을 때 모든 단계가 JSON 직렬화 가능한 고정 형식으로 측정되는지,
+기준 결과 비교가 허용 범위를 넘는 지표만 회귀로 보고하는지 검증
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.test.benchmark_pipeline_stages import (
+    STAGES,
+    compare_with_baseline,
+    run_benchmark
+)
+
+
+def test_run_benchmark_schema():
+    """발화 40개: 코퍼스/크기/단계별 ops/sec, p50/p99, 최대 메모리 기록"""
+    results = run_benchmark([40])
+    json.dumps(results)
+    assert results["metadata"]["sizes"] == [40]
+
+    stage_results = results["corpora"]["synthetic"]["40"]
+    assert stage_results["num_utterances"] == 40
+    for stage in STAGES:
+        stats = stage_results[stage]
+        assert stats["num_items"] > 0, stage
+        assert stats["ops_per_sec"] > 0 and stats["p50_us"] <= stats["p99_us"], stage
+        assert stats["peak_memory_kb"] > 0, stage
+    assert stage_results["pipeline_rules"]["num_items"] == 2
+    assert stage_results["pipeline_rules"]["utterances_per_sec"] > stage_results["pipeline_rules"]["ops_per_sec"]
+
+
+def test_compare_with_baseline():
+    """처리량 감소, p99/메모리 증가가 허용 범위를 넘을 때만 회귀"""
+    def result(ops, p99, peak):
+        stats = {"num_items": 10, "ops_per_sec": ops, "p99_us": p99, "peak_memory_kb": peak}
+        return {"corpora": {"synthetic": {"1000": {"num_utterances": 1000, "profanity_detect": stats}}}}
+
+    baseline = result(1000.0, 50.0, 10.0)
+    assert compare_with_baseline(result(900.0, 55.0, 11.0), baseline) == []
+
+    regressions = compare_with_baseline(result(500.0, 80.0, 10.0), baseline)
+    assert [row["metric"] for row in regressions] == ["ops_per_sec", "p99_us"]
+    assert regressions[0]["ratio"] == 0.5
+
+    # 기준 결과에 없는 단계/크기는 비교하지 않음
+    assert compare_with_baseline(result(1.0, 1e6, 1e6), {"corpora": {}}) == []
+
+
+if __name__ == "__main__":
+    test_run_benchmark_schema()
+    test_compare_with_baseline()
+    print("[완료] 단계별 벤치마크 테스트 통과")
@@ -0,0 +1,93 @@
+"""
+규칙 → 모델 캐스케이드 테스트
+
+규칙 결과가 확실한 발화는 모델을 호출하지 않고, 불확실한 발화만 모델을 호출하는지,
+게이트를 끄면 기존(모든 발화 모델 사용) 결과와 같은지 검증
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.intent_classifier.cascade import CascadeConfig, cascade_config_from_env
+from logical_analysis.logic_classify_system.intent_classifier.intent_predictor import IntentPredictor
+from logical_analysis.logic_classify_system.data.utterance_context import UtteranceContext
+from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_utterances
+from logical_analysis.logic_classify_system.test.test_sentence_classifier_batch import _small_classifier
+
+
+def _predictor(cascade):
+    predictor = IntentPredictor(use_model=False, cascade=cascade)
+    predictor.classifier = _small_classifier()
+    return predictor
+
+
+def test_decisive_rules_skip_model():
+    """강한 무리한 요구/욕설/명확한 종료 인사는 모델을 호출하지 않는지 확인"""
+    predictor = _predictor(CascadeConfig())
+    assert predictor.predict("경찰에 고소할 거예요", profanity_detected=False).model_calls == 0
+    assert predictor.predict("아 진짜", profanity_detected=True, profanity_confidence=0.8).model_calls == 0
+    assert predictor.predict("네 감사합니다 수고하셨습니다", profanity_detected=False).model_calls == 0
+    # 규칙 근거가 없거나 약하면 모델 호출
+    assert predictor.predict("요금제 변경은 어떻게 하나요", profanity_detected=False).model_calls == 1
+    assert predictor.predict("그냥 그래요", profanity_detected=False).model_calls == 1
+    assert predictor.model_skip_count == 3
+    assert predictor.model_call_count == 2
+
+
+def test_disabled_cascade_matches_full_model():
+    """게이트를 끄면 모든 발화에 모델을 사용하던 기존 결과와 같은지 확인"""
+    full = _predictor(None)
+    disabled = _predictor(CascadeConfig(enabled=False))
+    for text in generate_synthetic_utterances(100, seed=12):
+        expected = full.predict(text, profanity_detected=False)
+        result = disabled.predict(text, profanity_detected=False)
+        assert (result.label, result.label_type, result.confidence, result.probabilities) == \
+            (expected.label, expected.label_type, expected.confidence, expected.probabilities)
+    assert disabled.model_call_count == full.model_call_count == 100
+
+
+def test_prefill_skips_decisive_utterances():
+    """배치 선추론에서도 규칙으로 결정되는 발화는 제외하고, 선추론 결과를 쓴 발화의 model_calls를 집계하는지 확인"""
+    predictor = _predictor(CascadeConfig())
+    contexts = [UtteranceContext(text) for text in ["법원에 가겠습니다", "그냥 그래요", "감사합니다"]]
+    predictor.prefill_model_outputs(contexts)
+    assert [context.has_model_output("sentence_classifier") for context in contexts] == [False, True, False]
+    # 배치 선추론 결과를 사용한 발화만 model_calls 1 (배치는 모델 호출 1회)
+    results = [predictor.predict(context.text, profanity_detected=False, context=context) for context in contexts]
+    assert [result.model_calls for result in results] == [0, 1, 0]
+    assert predictor.model_call_count == 1
+
+
+def test_cascade_config_from_env():
+    """LOGIC_INTENT_CASCADE가 켜져 있을 때만 설정 생성, 임계값 환경 변수 반영"""
+    assert cascade_config_from_env({}) is None
+    assert cascade_config_from_env({"LOGIC_INTENT_CASCADE": "0"}) is None
+    assert cascade_config_from_env({"LOGIC_INTENT_CASCADE": "true"}) == CascadeConfig()
+    config = cascade_config_from_env({
+        "LOGIC_INTENT_CASCADE": "1",
+        "LOGIC_INTENT_CASCADE_SPECIAL_ACCEPT": "0.9",
+        "LOGIC_INTENT_CASCADE_NORMAL_MARGIN": "0.2",
+    })
+    assert (config.special_accept, config.normal_accept, config.normal_margin) == (0.9, 0.78, 0.2)
+    try:
+        cascade_config_from_env({"LOGIC_INTENT_CASCADE": "1", "LOGIC_INTENT_CASCADE_NORMAL_ACCEPT": "high"})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("숫자가 아닌 임계값은 ValueError")
+
+    # 캐스케이드 임계값이 다르면 분석 결과 재사용 판단용 모델 버전도 다름
+    versions = {_predictor(cascade).model_version for cascade in (None, CascadeConfig(), config)}
+    assert len(versions) == 3
+
+
+if __name__ == "__main__":
+    test_decisive_rules_skip_model()
+    test_disabled_cascade_matches_full_model()
+    test_prefill_skips_decisive_utterances()
+    test_cascade_config_from_env()
+    print("[완료] 캐스케이드 테스트 통과")
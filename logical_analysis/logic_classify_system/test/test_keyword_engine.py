@@ -0,0 +1,117 @@
+"""
+키워드 엔진 동등성 테스트
+
+Aho-Corasick 단일 스캔 결과가 기존 `[kw for kw in LIST if kw in text_lower]`
+검사와 카테고리별로 동일한지 검증
+그룹 태그 오토마톤의 그룹별 첫 매칭이 정규식 search와 같은지 검증
+"""
+
+import re
+import sys
+import random
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.keyword_engine.aho_corasick import (
+    KeywordAutomaton,
+    TaggedKeywordAutomaton
+)
+from logical_analysis.logic_classify_system.keyword_engine.keyword_index import (
+    KeywordIndex,
+    build_rule_categories,
+    scan_keywords
+)
+from logical_analysis.logic_classify_system.intent_classifier.baseline_rules import IntentBaselineRules
+from logical_analysis.logic_classify_system.profanity_filter.baseline_rules import ProfanityBaselineRules
+from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_utterances
+
+EDGE_CASES = [
+    "",
+    "다시 다시 다시 말씀드리지만 지금 당장 환불해 주세요!!",
+    "HELLO 씨발 Fuck 뭐라고요?",
+    "고소할 거예요. 감사합니다 수고하세요",
+]
+
+
+def test_automaton_matches_brute_force():
+    """오토마톤이 겹치는/포함된 패턴까지 모두 찾는지 확인"""
+    rng = random.Random(0)
+    for _ in range(200):
+        patterns = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 8))]
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+        expected = sorted(
+            (start, start + len(pattern), pattern_id)
+            for pattern_id, pattern in enumerate(patterns)
+            for start in range(len(text) - len(pattern) + 1)
+            if text.startswith(pattern, start)
+        )
+        assert sorted(KeywordAutomaton(patterns).find_all(text)) == expected
+
+
+def test_tagged_automaton_matches_regex_search():
+    """그룹별 첫 매칭 = 패턴 리스트 정규식 search (가장 왼쪽, 같은 위치면 리스트 앞 패턴)"""
+    rng = random.Random(1)
+    for _ in range(200):
+        groups = {
+            group: ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 5))]
+            for group in ("x", "y", "z")
+        }
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+        automaton = TaggedKeywordAutomaton(groups)
+        first = automaton.first_matches(text, {"x", "z"})
+        assert "y" not in first
+        for group in ("x", "z"):
+            match = re.search("|".join(map(re.escape, groups[group])), text)
+            if match is None:
+                assert group not in first
+            else:
+                start, pattern_index = first[group]
+                assert start == match.start() and groups[group][pattern_index] == match.group()
+        assert automaton.matched_patterns(text) == {
+            (group, index) for group, patterns in groups.items() for index, pattern in enumerate(patterns)
+            if pattern in text
+        }
+
+
+def test_found_matches_substring_checks():
+    """모든 규칙 카테고리에서 found()가 기존 부분 문자열 검사와 동일한지 확인"""
+    categories = build_rule_categories()
+    for text in EDGE_CASES + generate_synthetic_utterances(300, seed=7):
+        hits = scan_keywords(text)
+        text_lower = text.lower()
+        for category, keywords in categories.items():
+            assert hits.found(category) == [kw for kw in keywords if kw in text_lower], (category, text)
+
+
+def test_shared_keywords_and_empty_keyword():
+    """여러 카테고리에 속한 키워드와 빈 키워드 처리 확인"""
+    index = KeywordIndex({"A": ["환불", "", "환불"], "B": ["환불", "교환"]})
+    hits = index.scan("환불 요청")
+    assert hits.found("A") == ["환불", "", "환불"]
+    assert hits.found("B") == ["환불"]
+    assert index.keyword_categories["환불"] == ["A", "B"]
+    assert hits.positions("B") == [(0, 2, "환불")]
+
+
+def test_rule_outputs_with_shared_hits():
+    """미리 스캔한 결과를 넘겨도 규칙 출력이 같은지 확인"""
+    for text in EDGE_CASES + generate_synthetic_utterances(100, seed=11):
+        hits = scan_keywords(text)
+        assert IntentBaselineRules.detect_normal_labels(text) == \
+            IntentBaselineRules.detect_normal_labels(text, keyword_hits=hits)
+        assert IntentBaselineRules.detect_special_labels(text) == \
+            IntentBaselineRules.detect_special_labels(text, keyword_hits=hits)
+        assert ProfanityBaselineRules.detect_profanity(text) == \
+            ProfanityBaselineRules.detect_profanity(text, keyword_hits=hits)
+
+
+if __name__ == "__main__":
+    test_automaton_matches_brute_force()
+    test_tagged_automaton_matches_regex_search()
+    test_found_matches_substring_checks()
+    test_shared_keywords_and_empty_keyword()
+    test_rule_outputs_with_shared_hits()
+    print("[완료] 키워드 엔진 동등성 테스트 통과")
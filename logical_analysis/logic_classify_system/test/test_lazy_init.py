@@ -0,0 +1,64 @@
+"""
+logical_analysis.inference 지연 초기화 테스트
+
+모듈 import만으로는 파이프라인을 만들지 않고, 첫 사용 시 프로세스당 1회만 생성되는지 검증
+"""
+
+import gc
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis import inference
+
+
+def test_import_does_not_build_pipeline():
+    """import 시점에는 파이프라인을 만들지 않고 torch/파이프라인 모듈도 불러오지 않아야 함 (새 프로세스에서 확인)"""
+    code = (
+        "import sys; from logical_analysis import inference; "
+        "assert inference._pipeline is None; "
+        "assert 'torch' not in sys.modules; "
+        "assert 'logical_analysis.logic_classify_system.pipeline.main_pipeline' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=project_root, check=True)
+
+
+def test_get_pipeline_once_across_threads():
+    """여러 스레드의 동시 첫 호출에도 같은 인스턴스 반환"""
+    instances = []
+    threads = [threading.Thread(target=lambda: instances.append(inference.get_pipeline())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(instance) for instance in instances}) == 1
+    assert inference.get_pipeline() is instances[0]
+
+
+def test_preload_freezes_gc():
+    """preload는 같은 파이프라인을 반환하고 기존 객체를 GC 대상에서 제외"""
+    try:
+        pipeline = inference.preload()
+        assert pipeline is inference.get_pipeline()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_run_pipeline_uses_shared_pipeline():
+    """단일 발화 분석이 공용 파이프라인으로 동작"""
+    result = inference.run_pipeline("요금이 왜 이렇게 많이 나왔어요", "lazy_init")
+    assert len(result.turn_results) == 1
+
+
+if __name__ == "__main__":
+    test_import_does_not_build_pipeline()
+    test_get_pipeline_once_across_threads()
+    test_preload_freezes_gc()
+    test_run_pipeline_uses_shared_pipeline()
+    print("[완료] 파이프라인 지연 초기화 테스트 통과")
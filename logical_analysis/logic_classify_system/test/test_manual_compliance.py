@@ -0,0 +1,119 @@
+"""
+매뉴얼 준수도 검사 동등성 테스트
+
+컴파일된 매뉴얼 매처(CompiledManual) 결과가 키워드마다 _contains_keyword를
+호출하던 기존 방식과 동일한지, 원문 위치 매핑이 올바른지 검증
+"""
+
+import sys
+import random
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.feature_extractor.manual_compliance_checker import (
+    COMPLIANCE_CATEGORIES,
+    CompiledManual,
+    ManualComplianceChecker,
+    NormalizedText
+)
+from logical_analysis.logic_classify_system.config.manual_keywords import ManualKeywords, EmotionLabel
+from logical_analysis.logic_classify_system.test.benchmark_utils import AGENT_PHRASES
+
+
+def make_agent_texts(checker, count, seed=0):
+    """매뉴얼 키워드를 공백/문장부호/대소문자 변형과 섞은 상담원 발화 생성"""
+    rng = random.Random(seed)
+    keywords = sorted({
+        keyword
+        for manual_keywords in checker.keyword_config.manual_map.values()
+        for category in COMPLIANCE_CATEGORIES
+        for keyword in getattr(manual_keywords, category)
+    })
+    texts = ["", "   ", "!!!", "ΑΣ İstanbul 안녕 하세요."]
+    for _ in range(count):
+        parts = rng.sample(AGENT_PHRASES, rng.randint(0, 2))
+        for _ in range(rng.randint(0, 3)):
+            keyword = rng.choice(keywords)
+            if rng.random() < 0.3:
+                keyword = rng.choice([" ", ".", ", ", "\n"]).join(keyword)
+            parts.append(keyword)
+        rng.shuffle(parts)
+        texts.append(rng.choice([" ", "  ", ". ", "\t"]).join(parts))
+    return texts
+
+
+def legacy_found(checker, text, manual_keywords):
+    """기존 방식: 키워드마다 _contains_keyword 호출"""
+    text_normalized = checker._normalize_text(text)
+    return {
+        category: [kw for kw in getattr(manual_keywords, category) if checker._contains_keyword(text_normalized, kw)]
+        for category in COMPLIANCE_CATEGORIES
+    }
+
+
+def test_compiled_manual_matches_contains_keyword():
+    """모든 매뉴얼에서 컴파일된 매처 결과가 기존 키워드별 검사와 같은지 확인"""
+    checker = ManualComplianceChecker()
+    keys = list(checker.keyword_config.manual_map) + [("UNKNOWN", "INQUIRY")]
+    for text in make_agent_texts(checker, 300):
+        normalized_text = NormalizedText(text)
+        for emotion_label, customer_label in keys:
+            manual_keywords = checker.keyword_config.get_keywords(emotion_label, customer_label)
+            assert checker.get_matcher(emotion_label, customer_label).match(normalized_text) == \
+                legacy_found(checker, text, manual_keywords), (text, emotion_label, customer_label)
+
+
+def test_punctuation_only_keyword():
+    """공백/문장부호만 있는 키워드는 정규화 텍스트에서 직접 검사"""
+    checker = ManualComplianceChecker()
+    manual_keywords = ManualKeywords(required_keywords=["?!", "확인"], prohibited_keywords=["…"])
+    matcher = CompiledManual(manual_keywords)
+    for text in ["확인 ?!", "확인?", "… 네", "확 인"]:
+        assert matcher.match(NormalizedText(text)) == legacy_found(checker, text, manual_keywords), text
+
+
+def test_bitset_index_scores_match_check_compliance():
+    """비트셋 인덱스 점수가 모든 매뉴얼/시작·종료 조합에서 check_compliance와 같은지 확인"""
+    checker = ManualComplianceChecker()
+    index = checker.compliance_index
+    keys = list(checker.keyword_config.manual_map) + [("UNKNOWN", "INQUIRY")]
+    for text in make_agent_texts(checker, 150, seed=2):
+        normalized_text = NormalizedText(text)
+        for is_start, is_end in ((False, False), (True, False), (False, True), (True, True)):
+            all_scores = index.score_all(normalized_text, is_start=is_start, is_end=is_end)
+            for emotion_label, customer_label in keys:
+                expected, _ = checker.check_compliance(text, emotion_label, customer_label, is_start, is_end)
+                key = (emotion_label, customer_label)
+                assert all_scores.get(key, all_scores[index.DEFAULT_KEY]) == expected, (text, key)
+
+
+def test_compliance_by_emotion():
+    """감정 라벨별 준수도가 감정 라벨마다 check_compliance를 호출한 결과와 같은지 확인"""
+    checker = ManualComplianceChecker()
+    text = "불편을 드려 죄송합니다. 이해합니다, 바로 처리 해결해 드리겠습니다. 감사합니다"
+    by_emotion = checker.compliance_by_emotion(text, "COMPLAINT", is_end=True)
+    for emotion_label, score in by_emotion.items():
+        assert score == checker.check_compliance(text, emotion_label, "COMPLAINT", is_end=True)[0]
+    assert set(by_emotion) == {emotion.value for emotion in EmotionLabel}
+
+
+def test_offsets_map_back_to_original():
+    """stripped 위치가 원문 위치로 매핑되는지 확인"""
+    text = "고객님, 불편을  드려 죄송합니다!"
+    normalized_text = NormalizedText(text)
+    start = normalized_text.stripped.index("죄송")
+    original_start, original_end = normalized_text.original_span(start, start + 2)
+    assert text[original_start:original_end] == "죄송"
+    assert all(text[offset].lower() == ch for offset, ch in zip(normalized_text.offsets, normalized_text.stripped))
+
+
+if __name__ == "__main__":
+    test_compiled_manual_matches_contains_keyword()
+    test_punctuation_only_keyword()
+    test_bitset_index_scores_match_check_compliance()
+    test_compliance_by_emotion()
+    test_offsets_map_back_to_original()
+    print("[완료] 매뉴얼 준수도 검사 동등성 테스트 통과")
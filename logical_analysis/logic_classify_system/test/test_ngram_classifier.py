@@ -0,0 +1,88 @@
+"""
+해시 n-gram 의도 분류기 테스트
+
+학습/저장/로드 후 결과가 같은지, 단건/배치 결과가 같은지,
+IntentPredictor 백엔드로 사용할 수 있는지 검증
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.intent_classifier.intent_predictor import IntentPredictor
+from logical_analysis.logic_classify_system.intent_classifier.ngram_classifier import (
+    HashedNgramClassifier,
+    hash_ngrams
+)
+from logical_analysis.logic_classify_system.test.train_ngram_classifier import (
+    evaluate,
+    rule_labeled_utterances,
+    split_train_test
+)
+
+
+def _trained_classifier():
+    texts, labels = rule_labeled_utterances(1500, seed=3)
+    train_texts, train_labels, test_texts, test_labels = split_train_test(texts, labels)
+    return HashedNgramClassifier.train(train_texts, train_labels, n_features=2 ** 14), test_texts, test_labels
+
+
+def test_hash_ngrams_per_text_independent():
+    """배치로 계산한 n-gram 버킷이 발화별 단독 계산과 같은지 확인 (발화 경계를 넘지 않음)"""
+    texts = ["", "네", "환불 해주세요", "a\x00b   C"]
+    doc_ids, buckets, _ = hash_ngrams(texts, 2 ** 12)
+    for idx, text in enumerate(texts):
+        _, single, _ = hash_ngrams([text], 2 ** 12)
+        assert sorted(buckets[doc_ids == idx].tolist()) == sorted(single.tolist())
+
+
+def test_train_save_load_roundtrip():
+    """학습 정확도와 .npz 저장/로드 후 예측이 같은지 확인"""
+    classifier, test_texts, test_labels = _trained_classifier()
+    assert evaluate(classifier, test_texts, test_labels) > 0.8
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = classifier.save(Path(tmp_dir) / 'intent_ngram.npz')
+        loaded = HashedNgramClassifier(model_path=str(path))
+    assert loaded.is_available()
+    assert loaded.labels == classifier.labels
+    assert np.allclose(loaded.predict_proba(test_texts), classifier.predict_proba(test_texts))
+
+    batch = classifier.predict_batch(test_texts, batch_size=7)
+    for text, result in zip(test_texts, batch):
+        single = classifier.predict(text)
+        assert (single['label'], single['label_type']) == (result['label'], result['label_type'])
+        assert abs(single['confidence'] - result['confidence']) < 1e-6
+
+
+def test_missing_weights_fall_back_to_rules():
+    """가중치 파일이 없으면 사용 불가로 처리되어 Baseline 규칙만 사용하는지 확인"""
+    predictor = IntentPredictor(backend="ngram", model_path="/nonexistent/intent_ngram.npz")
+    assert predictor.classifier is None
+    assert predictor.predict("환불 해주세요", profanity_detected=False).model_calls == 0
+
+
+def test_intent_predictor_ngram_backend():
+    """IntentPredictor에 n-gram 분류기를 끼웠을 때 모델 출력을 사용하는지 확인"""
+    classifier, _, _ = _trained_classifier()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = classifier.save(Path(tmp_dir) / 'intent_ngram.npz')
+        predictor = IntentPredictor(backend="ngram", model_path=str(path))
+    assert isinstance(predictor.classifier, HashedNgramClassifier)
+    result = predictor.predict("요금제 변경은 어떻게 하나요", profanity_detected=False)
+    assert result.model_calls == 1
+    assert result.label_type in ("NORMAL", "SPECIAL")
+
+
+if __name__ == "__main__":
+    test_hash_ngrams_per_text_independent()
+    test_train_save_load_roundtrip()
+    test_missing_weights_fall_back_to_rules()
+    test_intent_predictor_ngram_backend()
+    print("[완료] n-gram 분류기 테스트 통과")
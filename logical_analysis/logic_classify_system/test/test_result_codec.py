@@ -0,0 +1,75 @@
+"""
+고정 스키마 특징점 점수(FeatureScores)와 PipelineResult 직렬화 테스트
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.pipeline.main_pipeline import MainPipeline
+from logical_analysis.logic_classify_system.data.data_structures import CustomerFeatureScores, TurnScores
+from logical_analysis.logic_classify_system.data.result_codec import (
+    encode_pipeline_result,
+    decode_pipeline_result
+)
+from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_sessions
+
+
+def test_feature_scores_mapping():
+    """설정한 키만 dict처럼 보이고, 스키마에 없는 키는 거부"""
+    scores = CustomerFeatureScores({"profanity_score": 0.8})
+    scores["special_label_confidence"] = 0.0
+    assert scores == {"profanity_score": 0.8, "special_label_confidence": 0.0}
+    assert list(scores) == ["profanity_score", "special_label_confidence"]
+    assert scores.get("threat_score") is None
+    assert scores.get("threat_score", 0.0) == 0.0
+    assert "threat_score" not in scores
+    try:
+        scores["unknown_score"] = 1.0
+        assert False, "스키마에 없는 키가 설정됨"
+    except KeyError:
+        pass
+    del scores["profanity_score"]
+    assert scores.to_dict() == {"special_label_confidence": 0.0}
+
+
+def test_feature_scores_pickle():
+    """피클 왕복 후에도 같은 스키마/값 유지"""
+    scores = TurnScores({"customer_problem_score": 0.7, "turn_risk_score": 0.75})
+    restored = pickle.loads(pickle.dumps(scores))
+    assert type(restored) is TurnScores
+    assert restored == scores
+
+
+def test_codec_round_trip():
+    """JSON/pickle 메타데이터 모두 원본과 같은 PipelineResult로 복원"""
+    stt_data = generate_synthetic_sessions(1, segments_per_session=40)[0]
+    result = MainPipeline().process(stt_data)
+    assert any(turn.agent_result is not None for turn in result.turn_results)
+
+    assert decode_pipeline_result(encode_pipeline_result(result)) == result
+    encoded = encode_pipeline_result(result, meta_format="pickle")
+    assert decode_pipeline_result(encoded, allow_pickle=True) == result
+
+
+def test_codec_rejects_pickle_by_default():
+    """pickle 메타데이터는 allow_pickle 없이 복원하지 않음"""
+    result = MainPipeline().process(generate_synthetic_sessions(1, segments_per_session=4)[0])
+    encoded = encode_pipeline_result(result, meta_format="pickle")
+    try:
+        decode_pipeline_result(encoded)
+        assert False, "allow_pickle 없이 pickle 메타데이터를 복원함"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_feature_scores_mapping()
+    test_feature_scores_pickle()
+    test_codec_round_trip()
+    test_codec_rejects_pickle_by_default()
+    print("[완료] 특징점 점수 스키마 / PipelineResult 직렬화 테스트 통과")
@@ -0,0 +1,167 @@
+"""
+규칙 레지스트리 테스트
+
+기본 스냅샷이 코드 규칙과 같은 결과를 내는지, JSON 규칙 변경 시 재시작 없이
+스냅샷이 교체되고 결과에 규칙 버전이 기록되는지, 잘못된 규칙은 무시되는지 검증
+logic_classify_system_lef 키워드/매뉴얼도 같은 스냅샷에서 재시작 없이 교체되는지 검증
+"""
+
+import sys
+import json
+import tempfile
+import warnings
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.config.rule_registry import (
+    JsonRuleSource,
+    RuleRegistry,
+    RuleSnapshot,
+    builtin_rule_document,
+    configure_rule_registry
+)
+from logical_analysis.logic_classify_system.keyword_engine.keyword_index import build_rule_categories
+from logical_analysis.logic_classify_system.data.utterance_context import UtteranceContext
+from logical_analysis.logic_classify_system.profanity_filter.baseline_rules import ProfanityBaselineRules
+from logical_analysis.logic_classify_system.pipeline.main_pipeline import MainPipeline
+from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_sessions
+from logical_analysis.logic_classify_system_lef.evaluation.manual_checker import ManualChecker
+from logical_analysis.logic_classify_system_lef.filtering.streaming_detector import StreamingSpecialLabelDetector
+from logical_analysis.logic_classify_system_lef.intent_classifier.baseline_rules import (
+    IntentBaselineRules as LefIntentBaselineRules
+)
+from logical_analysis.logic_classify_system_lef.profanity_filter.baseline_rules import (
+    ProfanityBaselineRules as LefProfanityBaselineRules
+)
+
+NEW_KEYWORD = "테스트욕설"
+
+
+def _write_rules(path: Path, document):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False)
+
+
+def test_builtin_snapshot_matches_code_rules():
+    """기본 스냅샷의 키워드 인덱스/매뉴얼이 코드 정의와 같은지 확인"""
+    snapshot = RuleSnapshot(builtin_rule_document())
+    assert snapshot.version == "builtin"
+    categories = build_rule_categories()
+    assert snapshot.keyword_index.categories == list(categories)
+    for category, keywords in categories.items():
+        assert [keyword for keyword, _ in snapshot.keyword_index.category_entries[category]] == keywords
+    default_manuals = snapshot.compliance_checker.keyword_config.manual_map
+    assert default_manuals == RuleSnapshot({}).manual_config.manual_map
+    assert snapshot.lef_manual == ManualChecker.MANUAL
+    assert snapshot.lef_rule_lists["PROFANITY_KEYWORDS"] == LefProfanityBaselineRules.PROFANITY_KEYWORDS
+    assert snapshot.lef_rule_lists["HATE_SPEECH_KEYWORDS"] == LefProfanityBaselineRules.HATE_SPEECH_KEYWORDS
+    assert snapshot.lef_rule_lists["UNREASONABLE_DEMAND_STRONG"] == LefIntentBaselineRules.UNREASONABLE_DEMAND_STRONG
+
+
+def test_json_reload_swaps_snapshot():
+    """JSON 규칙 변경 시 새 스냅샷으로 교체되고 이전 스냅샷은 그대로인지 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "rules.json"
+        _write_rules(path, {"version": "v1"})
+        registry = RuleRegistry(JsonRuleSource(str(path)), check_interval=0.0)
+        old = registry.current()
+        assert old.version == "v1"
+        assert not registry.reload_if_changed()
+
+        document = {"version": "v2", "rule_lists": {
+            "PROFANITY_KEYWORDS": ProfanityBaselineRules.PROFANITY_KEYWORDS + [NEW_KEYWORD]
+        }}
+        _write_rules(path, document)
+        assert registry.reload(force=True)
+        new = registry.current()
+        assert new.version == "v2"
+
+        text = f"이 {NEW_KEYWORD} 같은"
+        assert UtteranceContext(text, rules=new).keyword_hits.found("PROFANITY_KEYWORDS") == [NEW_KEYWORD]
+        assert UtteranceContext(text, rules=old).keyword_hits.found("PROFANITY_KEYWORDS") == []
+
+
+def test_invalid_rules_keep_previous_snapshot():
+    """잘못된 규칙 파일은 경고 후 기존 스냅샷을 유지하는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "rules.json"
+        _write_rules(path, {"version": "v1"})
+        registry = RuleRegistry(JsonRuleSource(str(path)), check_interval=0.0)
+        path.write_text("{not json", encoding='utf-8')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert not registry.reload(force=True)
+        assert caught
+        assert registry.version == "v1"
+
+
+def test_pipeline_stamps_rule_version():
+    """파이프라인 결과와 분류 결과에 규칙 버전이 기록되고, 매뉴얼 변경이 반영되는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "rules.json"
+        manual_entries = builtin_rule_document()["manual_keywords"]
+        for entry in manual_entries:
+            entry["prohibited_keywords"] = entry["prohibited_keywords"] + ["확인"]
+        _write_rules(path, {"version": "manual-v2", "manual_keywords": manual_entries})
+        try:
+            configure_rule_registry(JsonRuleSource(str(path)))
+            pipeline = MainPipeline()
+            result = pipeline.process(generate_synthetic_sessions(1, segments_per_session=6, seed=5)[0])
+            assert result.rule_version == "manual-v2"
+            for turn_result in result.turn_results:
+                assert turn_result.customer_result.classification_result.rule_version == "manual-v2"
+
+            score, details = pipeline.rule_registry.current().compliance_checker.check_compliance(
+                "확인해보겠습니다", "NEUTRAL", "INQUIRY"
+            )
+            assert "확인" in details["found_prohibited"]
+        finally:
+            configure_rule_registry()
+
+
+def test_lef_rules_follow_registry():
+    """_lef 욕설/의도 키워드와 매뉴얼이 재시작 없이 새 스냅샷 값으로 바뀌는지 확인"""
+    text = f"이 {NEW_KEYWORD} 같은"
+    agent_text = "테스트안내 문구입니다"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "rules.json"
+        _write_rules(path, {"version": "lef-v1"})
+        try:
+            configure_rule_registry(JsonRuleSource(str(path)), check_interval=0.0)
+            detector = StreamingSpecialLabelDetector(hold_back=0)
+            checker = ManualChecker()
+            old_score = checker.check_compliance("INQUIRY", agent_text)
+            assert LefProfanityBaselineRules.detect_profanity(text) == (False, None, 0.0)
+            assert LefIntentBaselineRules.detect_special_labels(text) == []
+
+            _write_rules(path, {
+                "version": "lef-v2",
+                "lef_rule_lists": {
+                    "PROFANITY_KEYWORDS": LefProfanityBaselineRules.PROFANITY_KEYWORDS + [NEW_KEYWORD],
+                    "IRRELEVANCE_INDICATORS": [NEW_KEYWORD],
+                },
+                "lef_manual": {
+                    "INQUIRY": {"required_phrases": ["테스트안내"], "required_keywords": ["테스트안내"], "procedure": []}
+                }
+            })
+            assert LefProfanityBaselineRules.detect_profanity(text)[:2] == (True, "PROFANITY")
+            assert [label for label, _ in LefIntentBaselineRules.detect_special_labels(text)] == ["IRRELEVANCE"]
+            assert checker.check_compliance("INQUIRY", agent_text) > old_score
+            assert "COMPLAINT" not in checker.manual
+            # 이미 만든 스트리밍 감지기도 다음 업데이트부터 새 키워드 사용
+            events = detector.update("lef-rules", 0, text, final=True)
+            assert [event.label for event in events] == ["PROFANITY"]
+        finally:
+            configure_rule_registry()
+
+
+if __name__ == "__main__":
+    test_builtin_snapshot_matches_code_rules()
+    test_json_reload_swaps_snapshot()
+    test_invalid_rules_keep_previous_snapshot()
+    test_pipeline_stamps_rule_version()
+    test_lef_rules_follow_registry()
+    print("[완료] 규칙 레지스트리 테스트 통과")
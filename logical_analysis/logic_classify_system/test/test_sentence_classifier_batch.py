@@ -0,0 +1,87 @@
+"""
+SentenceClassifier 배치 추론 동등성 테스트
+
+predict_batch(길이순 버킷 + 동적 패딩) 결과가 기존 max_length 고정 패딩 + 배치 1
+추론 결과와 같은지, 파이프라인이 세션의 손님 발화를 배치로 추론하는지 검증
+"""
+
+import sys
+import math
+from pathlib import Path
+
+import torch
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.intent_classifier.sentence_classifier import SentenceClassifier
+from logical_analysis.logic_classify_system.pipeline.main_pipeline import MainPipeline
+from logical_analysis.logic_classify_system.test.benchmark_sentence_classifier import (
+    CharTokenizer,
+    TinyEncoderClassifier,
+    legacy_predict
+)
+from logical_analysis.logic_classify_system.test.benchmark_utils import (
+    generate_synthetic_sessions,
+    generate_synthetic_utterances
+)
+
+
+def _small_classifier():
+    """테스트용 소형 인코더 분류기를 끼운 SentenceClassifier"""
+    classifier = SentenceClassifier(use_gpu=False)
+    torch.manual_seed(1)
+    classifier.model = TinyEncoderClassifier(hidden_size=64, num_layers=2).eval()
+    classifier.tokenizer = CharTokenizer()
+    classifier.device = torch.device('cpu')
+    return classifier
+
+
+def _assert_same(result, expected):
+    assert result['label'] == expected['label']
+    assert result['label_type'] == expected['label_type']
+    assert math.isclose(result['confidence'], expected['confidence'], abs_tol=1e-5)
+    assert result['probabilities'].keys() == expected['probabilities'].keys()
+    for label, prob in expected['probabilities'].items():
+        assert math.isclose(result['probabilities'][label], prob, abs_tol=1e-5)
+
+
+def test_predict_batch_matches_max_length_padding():
+    """배치/동적 패딩 결과가 입력 순서대로 기존 단건 추론과 같은지 확인"""
+    classifier = _small_classifier()
+    texts = ["네", "", "가" * 300] + generate_synthetic_utterances(60, seed=4)
+    batch_results = classifier.predict_batch(texts, batch_size=8)
+    assert len(batch_results) == len(texts)
+    for text, result in zip(texts, batch_results):
+        expected = legacy_predict(classifier, text)
+        _assert_same(result, expected)
+        _assert_same(classifier.predict(text), expected)
+    assert classifier.predict_batch([]) == []
+
+
+def test_pipeline_batches_session_forwards():
+    """파이프라인이 세션 손님 발화를 배치로 추론하고 결과는 발화별 추론과 같은지 확인"""
+    pipeline = MainPipeline()
+    pipeline.intent_predictor.classifier = _small_classifier()
+    forward_calls = []
+    pipeline.intent_predictor.classifier.model.register_forward_hook(lambda *args: forward_calls.append(1))
+
+    session = generate_synthetic_sessions(1, segments_per_session=80, seed=6)[0]
+    result = pipeline.process(session)
+    num_turns = len(result.turn_results)
+    assert len(forward_calls) == math.ceil(num_turns / 32)
+
+    turns = pipeline.turn_splitter.split_into_turns(session)
+    for turn, turn_result in zip(turns, result.turn_results):
+        expected = pipeline.process_turn(turn, session["session_id"])
+        batched = turn_result.customer_result.classification_result
+        single = expected.customer_result.classification_result
+        assert (batched.label, batched.label_type) == (single.label, single.label_type)
+        assert math.isclose(batched.confidence, single.confidence, abs_tol=1e-5)
+
+
+if __name__ == "__main__":
+    test_predict_batch_matches_max_length_padding()
+    test_pipeline_batches_session_forwards()
+    print("[완료] SentenceClassifier 배치 추론 테스트 통과")
@@ -0,0 +1,166 @@
+"""
+세션 단위 논리 분석 저장/조회 테스트
+
+- build_logical_results가 특징점/Turn 종합 점수 컬럼, turn_index, feature_scores를 채우는지
+- 상담원 발화만 수정해도 손님 행의 Turn 종합 점수가 갱신되어 전체 재분석 결과와 같은지
+- GET /top-risk가 본인 통화만 turn_risk_score 내림차순으로 정렬하고 통화 시각 기준 기간(days) 조건을 적용하는지 검증
+
+테스트 DB(SQLite 메모리) 사용
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.test.django_test_utils import (
+    create_segments,
+    make_request,
+    setup_test_django
+)
+
+setup_test_django()
+
+from django.utils import timezone
+
+from audio_process.models import CallRecording, SpeakerSegment
+from logical_analysis import inference
+from logical_analysis.api import get_top_risk_turns, run_analysis_for_session
+from logical_analysis.models import LogicalResult
+from logical_analysis.schemas import AnalyzeRequest
+from logical_analysis.session_analysis import (
+    AGENT_LABEL_TYPE,
+    AGENT_SCORE_COLUMNS,
+    CUSTOMER_SCORE_COLUMNS,
+    TURN_SCORE_COLUMNS,
+    build_logical_results,
+    build_session_stt_data
+)
+
+SESSION = [
+    ("agent", "안녕하세요 고객님 무엇을 도와드릴까요"),
+    ("customer", "요금이 왜 이렇게 많이 나왔어요 당장 환불해 주세요"),
+    ("agent", "불편을 드려 죄송합니다 요금 내역 확인 후 환불 도와드리겠습니다"),
+    ("customer", "이 XX 진짜 장난하나 고소할 거예요"),
+    ("agent", "고객님 진정하시고 말씀해 주세요"),
+    ("customer", "네 알겠습니다 감사합니다"),
+    ("agent", "감사합니다 좋은 하루 되세요"),
+]
+RESULT_COLUMNS = (
+    list(CUSTOMER_SCORE_COLUMNS.values()) + list(AGENT_SCORE_COLUMNS.values()) + list(TURN_SCORE_COLUMNS)
+    + ["turn_index", "label", "label_type", "feature_scores"]
+)
+
+
+def _analyzed_recording(file_name):
+    request = make_request()
+    recording = CallRecording.objects.create(audio_file=f"test/{file_name}", uploader=request.user)
+    segments = create_segments(recording, SESSION)
+    run_analysis_for_session(request, AnalyzeRequest(session_id=str(recording.session_id)))
+    return recording, segments
+
+
+def _stored_results(recording):
+    """segment_id → 결과 컬럼 값"""
+    return {
+        row.segment_id: {column: getattr(row, column) for column in RESULT_COLUMNS}
+        for row in LogicalResult.objects.filter(segment__recording=recording)
+    }
+
+
+def test_build_logical_results_columns():
+    """손님 행은 특징점/Turn 점수 컬럼, 상담원 행은 상담원 점수 컬럼과 turn_index/feature_scores를 채움"""
+    recording = CallRecording.objects.create(audio_file="test/columns.wav")
+    segments = create_segments(recording, SESSION)
+    result = inference.run_session_pipeline(build_session_stt_data(str(recording.session_id), segments))
+    rows = build_logical_results(segments, result)
+    assert [row.segment_id for row in rows] == [seg.id for seg in segments[1:]]
+    assert all(timezone.is_aware(row.timestamp) for row in rows)
+
+    turn_of = {}
+    for turn in result.turn_results:
+        for idx in turn.segment_indices:
+            turn_of[segments[idx].id] = turn
+    for row in rows:
+        turn = turn_of[row.segment_id]
+        assert row.turn_index == turn.turn_index
+        if row.label_type == AGENT_LABEL_TYPE:
+            expected_scores = turn.agent_result.feature_scores.to_dict()
+            columns = AGENT_SCORE_COLUMNS
+            assert all(getattr(row, column) is None for column in TURN_SCORE_COLUMNS)
+        else:
+            expected_scores = turn.customer_result.feature_scores.to_dict()
+            columns = CUSTOMER_SCORE_COLUMNS
+            for column in TURN_SCORE_COLUMNS:
+                assert getattr(row, column) == turn.turn_scores[column]
+        assert row.feature_scores == expected_scores
+        for key, column in columns.items():
+            assert getattr(row, column) is not None, column
+            if key in expected_scores and column != "manual_compliance_score":
+                assert getattr(row, column) == expected_scores[key]
+
+    # pending_segment_ids로 일부 세그먼트 결과만 생성
+    pending = build_logical_results(segments, result, pending_segment_ids=[segments[3].id, segments[4].id])
+    assert [row.segment_id for row in pending] == [segments[3].id, segments[4].id]
+
+
+def test_agent_edit_refreshes_customer_turn_scores():
+    """상담원 발화만 수정해도 손님 행의 Turn 종합 점수가 전체 재분석 결과와 같음"""
+    recording, segments = _analyzed_recording("agent_edit.wav")
+    before = _stored_results(recording)
+    session_id = str(recording.session_id)
+
+    SpeakerSegment.objects.filter(id=segments[2].id).update(text="몰라요 알아서 하세요")
+    result = run_analysis_for_session(make_request(), AnalyzeRequest(session_id=session_id))
+    assert (result["analyzed_turns"], result["analyzed_segments"]) == (1, 2)
+    incremental = _stored_results(recording)
+    assert incremental[segments[1].id] != before[segments[1].id]
+    assert incremental[segments[3].id] == before[segments[3].id]
+
+    LogicalResult.objects.filter(segment__recording=recording).delete()
+    run_analysis_for_session(make_request(), AnalyzeRequest(session_id=session_id))
+    full = _stored_results(recording)
+    for column in TURN_SCORE_COLUMNS:
+        assert incremental[segments[1].id][column] == full[segments[1].id][column], column
+    assert incremental == full
+
+
+def test_top_risk_order_and_period():
+    """turn_risk_score 내림차순, 본인 통화만, 통화 시각 기준 days 기간 밖 제외, label_type/limit 적용"""
+    request = make_request()
+    recent, _ = _analyzed_recording("risk_recent.wav")
+    old, _ = _analyzed_recording("risk_old.wav")
+    other = CallRecording.objects.create(audio_file="test/risk_other.wav", uploader=make_request("other").user)
+    create_segments(other, SESSION)
+    run_analysis_for_session(request, AnalyzeRequest(session_id=str(other.session_id)))
+    # 오래된 통화는 방금 (재)분석되었어도 기간 밖
+    CallRecording.objects.filter(id=old.id).update(created_at=timezone.now() - timedelta(days=10))
+    recent_id, old_id, other_id = str(recent.session_id), str(old.session_id), str(other.session_id)
+
+    turns = get_top_risk_turns(request, days=7, limit=1000)
+    scores = [turn["turn_risk_score"] for turn in turns]
+    assert scores == sorted(scores, reverse=True)
+    assert None not in scores
+    session_ids = {turn["session_id"] for turn in turns}
+    assert recent_id in session_ids and old_id not in session_ids and other_id not in session_ids
+    recent_rows = LogicalResult.objects.filter(segment__recording=recent, turn_risk_score__isnull=False)
+    assert sum(turn["session_id"] == recent_id for turn in turns) == recent_rows.count()
+    assert all(turn["recorded_at"] >= timezone.now() - timedelta(days=7) for turn in turns)
+
+    assert old_id in {turn["session_id"] for turn in get_top_risk_turns(request, days=30, limit=1000)}
+    assert other_id in {turn["session_id"] for turn in get_top_risk_turns(make_request("other"), days=7, limit=1000)}
+    assert get_top_risk_turns(request, days=7, limit=2) == turns[:2]
+    special = get_top_risk_turns(request, days=7, limit=1000, label_type="SPECIAL")
+    assert special and all(
+        LogicalResult.objects.get(segment_id=turn["segment_id"]).label_type == "SPECIAL" for turn in special
+    )
+
+
+if __name__ == "__main__":
+    test_build_logical_results_columns()
+    test_agent_edit_refreshes_customer_turn_scores()
+    test_top_risk_order_and_period()
+    print("[완료] 세션 단위 논리 분석 저장/조회 테스트 통과")
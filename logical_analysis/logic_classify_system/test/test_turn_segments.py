@@ -0,0 +1,151 @@
+"""
+Turn ↔ STT segments 인덱스 매핑 테스트
+
+세션 단위 분석 결과를 세그먼트별로 저장할 수 있도록 Turn/TurnAnalysisResult가
+자신을 구성한 segments 인덱스를 기록하는지 검증
+재분석 계획(plan_reanalysis)이 입력 해시가 바뀐 세그먼트/Turn만 고르는지 검증
+(session_analysis는 LogicalResult 모델을 불러오므로 해당 테스트만 Django 설정 후 실행)
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.preprocessing.text_splitter import TurnSplitter
+from logical_analysis.logic_classify_system.pipeline.main_pipeline import MainPipeline
+
+STT_DATA = {
+    "session_id": "turn_segments",
+    "segments": [
+        {"speaker": "agent", "text": "안녕하세요 고객님"},          # 0: 첫 손님 발화 이전 → Turn 없음
+        {"speaker": "customer", "text": "요금이 많이 나왔어요"},    # 1
+        {"speaker": "agent", "text": "확인해 드리겠습니다"},        # 2
+        {"speaker": "agent", "text": ""},                           # 3: 빈 발화 → 제외
+        {"speaker": "agent", "text": "잠시만 기다려 주세요"},       # 4
+        {"speaker": "customer", "text": "빨리 해주세요"},           # 5
+        {"speaker": "customer", "text": "감사합니다"},              # 6
+    ]
+}
+
+
+def test_turn_segment_indices():
+    """Turn별 손님/상담원 segments 인덱스 확인"""
+    turns = TurnSplitter().split_into_turns(STT_DATA)
+    assert [turn.segment_indices for turn in turns] == [[1, 2, 4], [5], [6]]
+
+
+def test_pipeline_result_segment_indices():
+    """PipelineResult의 Turn 결과에도 같은 인덱스가 전달되는지 확인"""
+    result = MainPipeline().process(STT_DATA)
+    assert [turn.segment_indices for turn in result.turn_results] == [[1, 2, 4], [5], [6]]
+
+
+def test_process_selected_turns():
+    """turn_indices로 일부 Turn만 분석해도 세션 시작/끝 기준과 결과가 전체 분석과 같은지 확인"""
+    pipeline = MainPipeline()
+    full = pipeline.process(STT_DATA)
+    partial = pipeline.process(STT_DATA, turn_indices={2})
+    assert [turn.turn_index for turn in partial.turn_results] == [2]
+    assert partial.turn_results[0].segment_indices == [6]
+    assert (partial.turn_results[0].customer_result.classification_result.label
+            == full.turn_results[2].customer_result.classification_result.label)
+
+
+def _session_segments():
+    """STT_DATA와 같은 순서/화자의 SpeakerSegment 대용 객체 (id = 100 + 인덱스)"""
+    return [
+        SimpleNamespace(
+            id=100 + idx,
+            speaker_label="counselor" if seg["speaker"] == "agent" else "client",
+            is_counselor=seg["speaker"] == "agent",
+            text=seg["text"],
+            start_time=idx * 2.0,
+            end_time=idx * 2.0 + 1.0,
+            logical_analysis=None
+        )
+        for idx, seg in enumerate(STT_DATA["segments"])
+    ]
+
+
+def _plan(segments, version="rules-v1/model-v1"):
+    from logical_analysis.logic_classify_system.test.django_test_utils import setup_test_django
+    setup_test_django()
+    from logical_analysis.session_analysis import build_session_stt_data, plan_reanalysis
+
+    turns = TurnSplitter().split_into_turns(build_session_stt_data("turn_segments", segments))
+    return plan_reanalysis(segments, turns, version)
+
+
+def _store_results(segments, plan):
+    """계획의 입력 해시로 결과가 저장된 상태로 만듦 (결과 id = 1000 + 인덱스)"""
+    for idx, segment in enumerate(segments):
+        if idx in plan.input_hashes:
+            segment.logical_analysis = SimpleNamespace(id=1000 + idx, input_hash=plan.input_hashes[idx])
+
+
+def _analyzed_session():
+    segments = _session_segments()
+    first = _plan(segments)
+    assert sorted(first.stale_segment_ids) == [101, 102, 104, 105, 106]
+    assert first.turn_indices == {0, 1, 2}
+    _store_results(segments, first)
+    assert _plan(segments).up_to_date
+    return segments
+
+
+def test_plan_only_changed_segments():
+    """텍스트가 바뀐 세그먼트와 그 Turn만 재분석"""
+    segments = _analyzed_session()
+    segments[5].text = "지금 당장 해주세요"
+    plan = _plan(segments)
+    assert plan.stale_segment_ids == [105]
+    assert plan.turn_indices == {1}
+    assert plan.orphan_result_ids == []
+
+
+def test_plan_speaker_flip_invalidates_neighbours():
+    """화자 변경으로 Turn 경계가 바뀌면 같은 Turn이 된 이웃 세그먼트도 재분석"""
+    segments = _analyzed_session()
+    segments[5].speaker_label, segments[5].is_counselor = "counselor", True
+    plan = _plan(segments)
+    # 5번이 첫 Turn의 상담원 발화로 합쳐져 기존 상담원 세그먼트(2, 4)의 맥락도 바뀜
+    assert {102, 104, 105} <= set(plan.stale_segment_ids)
+    assert 106 not in plan.stale_segment_ids
+    assert plan.turn_indices == {0}
+
+
+def test_plan_dropped_segments_become_orphans():
+    """Turn에서 빠진 세그먼트(빈 발화, 첫 손님 발화 이전)의 기존 결과는 삭제 대상"""
+    segments = _analyzed_session()
+    segments[2].text = ""
+    segments[0].logical_analysis = SimpleNamespace(id=999, input_hash="old")
+    plan = _plan(segments)
+    assert sorted(plan.orphan_result_ids) == [999, 1002]
+    assert 2 not in plan.input_hashes
+    # 남은 상담원 세그먼트는 합쳐진 상담원 발화가 바뀌어 재분석
+    assert 104 in plan.stale_segment_ids and 102 not in plan.stale_segment_ids
+    assert plan.turn_indices == {0}
+
+
+def test_plan_version_bump_invalidates_all():
+    """규칙/모델 버전이 바뀌면 모든 세그먼트 재분석"""
+    segments = _analyzed_session()
+    plan = _plan(segments, version="rules-v2/model-v1")
+    assert sorted(plan.stale_segment_ids) == [101, 102, 104, 105, 106]
+    assert plan.turn_indices == {0, 1, 2}
+    assert plan.orphan_result_ids == []
+
+
+if __name__ == "__main__":
+    test_turn_segment_indices()
+    test_pipeline_result_segment_indices()
+    test_process_selected_turns()
+    test_plan_only_changed_segments()
+    test_plan_speaker_flip_invalidates_neighbours()
+    test_plan_dropped_segments_become_orphans()
+    test_plan_version_bump_invalidates_all()
+    print("[완료] Turn segments 인덱스 테스트 통과")
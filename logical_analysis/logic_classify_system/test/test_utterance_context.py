@@ -0,0 +1,90 @@
+"""
+발화 컨텍스트 동등성 테스트
+
+UtteranceContext를 공유해도 욕설 감지/의도 분류/특징점 추출 결과가
+컨텍스트 없이 각 단계가 따로 스캔할 때와 동일한지, 스캔이 발화당 1회인지 검증
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.data.utterance_context import UtteranceContext
+from logical_analysis.logic_classify_system.profanity_filter.profanity_detector import ProfanityDetector
+from logical_analysis.logic_classify_system.intent_classifier.intent_predictor import IntentPredictor
+from logical_analysis.logic_classify_system.feature_extractor.customer_feature_extractor import CustomerFeatureExtractor
+from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_utterances
+
+
+def _analyze(text, detector, predictor, extractor, context=None):
+    """MainPipeline._analyze_customer_turn과 같은 순서로 단계 실행"""
+    profanity_result = detector.detect(text, context=context)
+    classification_result = predictor.predict(
+        text,
+        profanity_result.is_profanity,
+        profanity_confidence=profanity_result.confidence if profanity_result.is_profanity else 0.0,
+        context=context
+    )
+    feature_scores, extracted_features = extractor.extract_features(
+        text, profanity_result, classification_result, context=context
+    )
+    classification_result.timestamp = None
+    return profanity_result, classification_result, feature_scores, extracted_features
+
+
+def test_context_outputs_match_independent_stages():
+    """컨텍스트 공유 여부와 관계없이 단계별 출력이 같은지 확인"""
+    detector = ProfanityDetector(use_korcen=False)
+    predictor = IntentPredictor(use_model=False)
+    extractor = CustomerFeatureExtractor()
+
+    texts = ["", "다시 말하지만 지금 당장 환불해! 씨발", "감사합니다 수고하세요"]
+    for text in texts + generate_synthetic_utterances(200, seed=3):
+        context = UtteranceContext(text)
+        assert _analyze(text, detector, predictor, extractor) == \
+            _analyze(text, detector, predictor, extractor, context=context)
+        assert context.scan_count == 1
+
+
+def test_context_model_output_computed_once():
+    """같은 키의 모델 출력은 한 번만 계산되는지 확인"""
+    context = UtteranceContext("환불해 주세요")
+    calls = []
+    for _ in range(3):
+        output = context.model_output("sentence_classifier", lambda: calls.append(1) or {"label": "REQUEST"})
+    assert output == {"label": "REQUEST"}
+    assert len(calls) == 1
+    assert context.model_call_count == 1
+
+
+def test_predict_runs_model_once_per_text():
+    """컨텍스트 없이 호출해도 Special/Normal 판단에 모델 추론을 1회만 사용하는지 확인"""
+    from logical_analysis.logic_classify_system.test.test_sentence_classifier_batch import _small_classifier
+
+    predictor = IntentPredictor(use_model=False)
+    predictor.classifier = _small_classifier()
+    forward_calls = []
+    predictor.classifier.model.register_forward_hook(lambda *args: forward_calls.append(1))
+
+    texts = generate_synthetic_utterances(50, seed=8)
+    for text in texts:
+        result = predictor.predict(text, profanity_detected=False)
+        assert result.model_calls == 1
+    assert len(forward_calls) == len(texts)
+    assert predictor.model_call_count == len(texts)
+
+    # 컨텍스트에 배치로 미리 계산한 모델 출력이 있으면 추가 추론 없이 사용 (모델 추론 1회로 집계)
+    context = UtteranceContext(texts[0])
+    predictor.prefill_model_outputs([context])
+    assert predictor.predict(texts[0], profanity_detected=False, context=context).model_calls == 1
+    assert len(forward_calls) == len(texts) + 1
+
+
+if __name__ == "__main__":
+    test_context_outputs_match_independent_stages()
+    test_context_model_output_computed_once()
+    test_predict_runs_model_once_per_text()
+    print("[완료] 발화 컨텍스트 동등성 테스트 통과")
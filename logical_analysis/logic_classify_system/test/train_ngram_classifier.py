@@ -0,0 +1,131 @@
+"""
+해시 n-gram 의도 분류기 오프라인 학습
+
+talksets 정답지(test_with_ground_truth.py가 저장한 ground_truth.json) 또는
+talksets-train 원본 파일의 손님 발화로 HashedNgramClassifier를 학습하여 .npz로 저장
+
+사용법:
+    python logical_analysis/logic_classify_system/test/train_ngram_classifier.py <ground_truth.json | talksets-train*.json | 디렉토리> [출력 .npz]
+"""
+
+import sys
+import json
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system.intent_classifier.baseline_rules import IntentBaselineRules
+from logical_analysis.logic_classify_system.intent_classifier.ngram_classifier import (
+    DEFAULT_MODEL_PATH,
+    HashedNgramClassifier
+)
+from logical_analysis.logic_classify_system.test.benchmark_utils import generate_synthetic_utterances
+
+
+def load_talksets_training_data(path: Path) -> Tuple[List[str], List[str]]:
+    """
+    talksets 정답지/원본에서 (손님 발화, 정답 Label) 로드
+
+    Args:
+        path: ground_truth.json, talksets-train*.json 파일 또는 talksets-train*.json이 있는 디렉토리
+
+    Returns:
+        (texts, labels)
+    """
+    from logical_analysis.logic_classify_system.test.test_with_ground_truth import map_talksets_types_to_label
+
+    files = sorted(path.glob('talksets-train*.json')) if path.is_dir() else [path]
+    texts, labels = [], []
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            data = [data]
+        for item in data:
+            if 'segments' in item:
+                # 정답지 형식 (손님 발화만 포함)
+                for segment in item['segments']:
+                    texts.append(segment['text'])
+                    labels.append(segment['ground_truth_label'])
+                continue
+            # talksets 원본 형식 (speaker 1: 손님)
+            for sentence in item.get('sentences', []):
+                text = sentence.get('text', '').strip()
+                if not text or sentence.get('speaker', 1) != 1:
+                    continue
+                label, _ = map_talksets_types_to_label(
+                    sentence.get('types', []),
+                    sentence.get('is_immoral', False),
+                    sentence.get('intensity', 0.0)
+                )
+                texts.append(text)
+                labels.append(label)
+    return texts, labels
+
+
+def rule_labeled_utterances(count: int, seed: int = 42) -> Tuple[List[str], List[str]]:
+    """
+    talksets 데이터가 없을 때 사용할 합성 학습 데이터 (Baseline 규칙 결과를 Label로 사용)
+
+    Returns:
+        (texts, labels)
+    """
+    rules = IntentBaselineRules()
+    texts = generate_synthetic_utterances(count, seed=seed)
+    labels = []
+    for text in texts:
+        results = rules.detect_special_labels(text) or rules.detect_normal_labels(text)
+        labels.append(max(results, key=lambda x: x[1])[0] if results else "INQUIRY")
+    return texts, labels
+
+
+def split_train_test(texts: List[str], labels: List[str], test_ratio: float = 0.1, seed: int = 0):
+    """학습/평가 데이터 분할"""
+    indices = list(range(len(texts)))
+    random.Random(seed).shuffle(indices)
+    test_size = int(len(indices) * test_ratio)
+    test_idx, train_idx = indices[:test_size], indices[test_size:]
+    return ([texts[i] for i in train_idx], [labels[i] for i in train_idx],
+            [texts[i] for i in test_idx], [labels[i] for i in test_idx])
+
+
+def evaluate(classifier: HashedNgramClassifier, texts: List[str], labels: List[str]) -> float:
+    """Label 정확도"""
+    if not texts:
+        return 0.0
+    predictions = classifier.predict_batch(texts, return_probabilities=False)
+    return sum(p['label'] == label for p, label in zip(predictions, labels)) / len(texts)
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("해시 n-gram 의도 분류기 학습")
+    print("=" * 80)
+
+    if len(sys.argv) < 2:
+        print("[오류] 학습 데이터 경로를 지정하세요 (ground_truth.json / talksets-train*.json / 디렉토리)")
+        return
+    data_path = Path(sys.argv[1])
+    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MODEL_PATH
+
+    texts, labels = load_talksets_training_data(data_path)
+    if not texts:
+        print(f"[오류] 학습 데이터가 없습니다: {data_path}")
+        return
+    train_texts, train_labels, test_texts, test_labels = split_train_test(texts, labels)
+    print(f"학습 {len(train_texts):,}개 / 평가 {len(test_texts):,}개, Label {len(set(labels))}종")
+
+    classifier = HashedNgramClassifier.train(train_texts, train_labels)
+    print(f"평가 정확도: {evaluate(classifier, test_texts, test_labels):.1%}")
+
+    saved_path = classifier.save(output_path)
+    print(f"\n[저장 완료] {saved_path} ({saved_path.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+규칙 키워드 출처
+
+IntentBaselineRules/ProfanityBaselineRules 키워드 리스트와 ManualChecker 매뉴얼을
+logic_classify_system 규칙 레지스트리(JSON 파일 또는 solution_system.RuleSet)의 현재 스냅샷에서 조회
+(규칙 문서의 "lef_rule_lists", "lef_manual" 항목, 없는 항목은 클래스 속성 기본값)
+
+- 규칙 변경 시 재배포/재시작 없이 다음 호출부터 새 스냅샷 사용
+- 한 번의 감지/평가 안에서는 같은 스냅샷을 사용하도록 호출 시작 시 한 번만 조회
+"""
+
+import copy
+from typing import Any, Dict
+
+# 레지스트리에서 불러오는 키워드 리스트 이름 (클래스 속성 이름과 같음)
+INTENT_RULE_LISTS = (
+    "REPETITION_INDICATORS", "UNREASONABLE_DEMAND_STRONG", "UNREASONABLE_DEMAND_INDICATORS",
+    "IRRELEVANCE_INDICATORS",
+)
+PROFANITY_RULE_LISTS = (
+    "PROFANITY_KEYWORDS", "INSULT_KEYWORDS", "THREAT_KEYWORDS", "SEXUAL_HARASSMENT_KEYWORDS",
+    "HATE_SPEECH_KEYWORDS",
+)
+
+
+def builtin_rule_lists() -> Dict[str, Any]:
+    """클래스 속성에 정의된 기본 키워드 리스트 (혐오 표현은 세부 카테고리별 dict)"""
+    from ..intent_classifier.baseline_rules import IntentBaselineRules
+    from ..profanity_filter.baseline_rules import ProfanityBaselineRules
+
+    rule_lists: Dict[str, Any] = {name: list(getattr(IntentBaselineRules, name)) for name in INTENT_RULE_LISTS}
+    for name in PROFANITY_RULE_LISTS:
+        rule_lists[name] = copy.deepcopy(getattr(ProfanityBaselineRules, name))
+    return rule_lists
+
+
+def builtin_manual() -> Dict[str, Dict]:
+    """ManualChecker.MANUAL 기본 매뉴얼"""
+    from ..evaluation.manual_checker import ManualChecker
+
+    return copy.deepcopy(ManualChecker.MANUAL)
+
+
+def current_snapshot():
+    """규칙 레지스트리의 현재 스냅샷 (변경 확인 간격이 지났으면 변경 여부 확인 후 교체)"""
+    from ...logic_classify_system.config.rule_registry import get_rule_registry
+
+    registry = get_rule_registry()
+    registry.reload_if_changed()
+    return registry.current()
+
+
+def current_rule_lists() -> Dict[str, Any]:
+    """현재 스냅샷의 키워드 리스트 {리스트 이름: 키워드}"""
+    return current_snapshot().lef_rule_lists
+
+
+def current_manual() -> Dict[str, Dict]:
+    """현재 스냅샷의 매뉴얼 {Normal Label: {required_phrases, required_keywords, procedure}}"""
+    return current_snapshot().lef_manual
@@ -1,66 +1,62 @@
 """
 세션 관리
 
-대화 맥락을 저장하고 관리
+대화 맥락을 저장하고 관리 (저장소는 session_store 참고)
 """
 
-from typing import Dict, List, Optional
+from typing import List, Optional
+
+from .session_store import SessionStore, create_session_store
 
 
 class SessionManager:
     """세션 매니저"""
-    
-    def __init__(self):
+
+    def __init__(self, store: Optional[SessionStore] = None):
         """
         세션 매니저 초기화
+
+        Args:
+            store: 세션 맥락 저장소 (None이면 LEF_SESSION_STORE 환경 변수로 선택, 기본 memory)
         """
-        self.sessions: Dict[str, List[str]] = {}
-    
+        self.store = store if store is not None else create_session_store()
+
     def create_session(self, session_id: str):
         """
-        세션 생성
-        
+        세션 생성 (저장소는 첫 문장 추가 시 세션을 만들므로 호환용)
+
         Args:
             session_id: 세션 ID
         """
-        if session_id not in self.sessions:
-            self.sessions[session_id] = []
-    
+
     def add_sentence(self, session_id: str, sentence: str):
         """
-        문장 추가
-        
+        문장 추가 (세션 링 버퍼가 가득 차면 가장 오래된 문장 제거)
+
         Args:
             session_id: 세션 ID
             sentence: 추가할 문장
         """
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        self.sessions[session_id].append(sentence)
-    
+        self.store.append(session_id, sentence)
+
     def get_context(self, session_id: str, window_size: int = 5) -> List[str]:
         """
         세션 맥락 반환 (최근 N개 문장)
-        
+
         Args:
             session_id: 세션 ID
             window_size: 반환할 최근 문장 수
-        
+
         Returns:
-            최근 문장 리스트
+            최근 문장 리스트 (없거나 만료된 세션이면 빈 리스트)
         """
-        if session_id not in self.sessions:
-            return []
-        return self.sessions[session_id][-window_size:]
-    
+        return self.store.get_context(session_id, window_size)
+
     def clear_session(self, session_id: str):
         """
         세션 초기화
-        
+
         Args:
             session_id: 세션 ID
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-
-
+        self.store.clear(session_id)
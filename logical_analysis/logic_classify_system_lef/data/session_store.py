@@ -0,0 +1,435 @@
+"""
+세션 맥락 저장소
+
+세션별 최근 문장을 고정 크기 링 버퍼로 보관하고, TTL(마지막 접근 후 만료)과
+최대 세션 수(LRU 제거)로 메모리 사용량을 제한
+
+백엔드:
+- memory: 프로세스 내 OrderedDict + 링 버퍼 (가장 빠름, gunicorn 워커 간 공유 안 됨)
+- sqlite: SQLite 파일 (같은 호스트의 워커 프로세스 간 공유, WAL 모드)
+- kv: Redis 호환 키-값 클라이언트 (rpush/ltrim/lrange/expire)
+      redis 패키지가 없으면 LocalKeyValueClient(프로세스 내 대체 구현) 사용
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+# 저장소 선택 환경 변수 ("memory" / "sqlite" / "kv")
+SESSION_STORE_ENV = "LEF_SESSION_STORE"
+# sqlite 파일 경로 / kv 서버 URL 환경 변수
+SESSION_STORE_PATH_ENV = "LEF_SESSION_STORE_PATH"
+SESSION_STORE_URL_ENV = "LEF_SESSION_STORE_URL"
+
+DEFAULT_MAX_SESSIONS = 10000
+DEFAULT_TTL_SECONDS = 1800.0
+DEFAULT_MAX_SENTENCES = 20
+
+
+class SessionStore:
+    """세션 맥락 저장소 인터페이스"""
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_sentences: int = DEFAULT_MAX_SENTENCES
+    ):
+        """
+        Args:
+            max_sessions: 보관할 최대 세션 수 (초과 시 가장 오래 접근하지 않은 세션 제거)
+            ttl_seconds: 마지막 접근 후 세션 만료 시간 (초)
+            max_sentences: 세션별 링 버퍼 크기 (최근 N개 문장만 보관)
+        """
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.max_sentences = max_sentences
+
+    def append(self, session_id: str, sentence: str) -> None:
+        raise NotImplementedError
+
+    def get_context(self, session_id: str, window_size: int = 5) -> List[str]:
+        raise NotImplementedError
+
+    def clear(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    def session_count(self) -> int:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class _RingBuffer:
+    """
+    고정 크기 문장 링 버퍼 (가득 차면 가장 오래된 문장 자리에 덮어씀)
+
+    deque(maxlen)보다 세션당 메모리가 작음 (deque는 문장 수와 무관하게 64칸 블록 할당)
+    """
+
+    __slots__ = ("items", "start", "accessed")
+
+    def __init__(self, accessed: float):
+        self.items: List[str] = []
+        self.start = 0
+        self.accessed = accessed
+
+    def append(self, sentence: str, capacity: int) -> None:
+        if len(self.items) < capacity:
+            self.items.append(sentence)
+        else:
+            self.items[self.start] = sentence
+            self.start = (self.start + 1) % capacity
+
+    def last(self, n: int) -> List[str]:
+        """최근 n개 문장 (오래된 순)"""
+        items, start = self.items, self.start
+        ordered = items[start:] + items[:start] if start else items
+        return ordered[-n:] if n < len(ordered) else list(ordered)
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 내 세션 저장소 (OrderedDict LRU + 세션별 링 버퍼)"""
+
+    def __init__(self, *args, clock: Callable[[], float] = time.monotonic, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.clock = clock
+        # session_id → 링 버퍼, 접근 순서대로 정렬 (앞쪽이 가장 오래 접근하지 않은 세션)
+        self._sessions: "OrderedDict[str, _RingBuffer]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        """접근 순서 앞쪽부터 만료 세션 제거 (만료되지 않은 세션을 만나면 중단)"""
+        deadline = now - self.ttl_seconds
+        sessions = self._sessions
+        while sessions:
+            session_id = next(iter(sessions))
+            if sessions[session_id].accessed > deadline:
+                break
+            del sessions[session_id]
+
+    def append(self, session_id: str, sentence: str) -> None:
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            buffer = self._sessions.get(session_id)
+            if buffer is None:
+                buffer = self._sessions[session_id] = _RingBuffer(now)
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                buffer.accessed = now
+                self._sessions.move_to_end(session_id)
+            buffer.append(sentence, self.max_sentences)
+
+    def get_context(self, session_id: str, window_size: int = 5) -> List[str]:
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            buffer = self._sessions.get(session_id)
+            if buffer is None:
+                return []
+            buffer.accessed = now
+            self._sessions.move_to_end(session_id)
+            if window_size <= 0:
+                return []
+            return buffer.last(window_size)
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def session_count(self) -> int:
+        with self._lock:
+            self._expire(self.clock())
+            return len(self._sessions)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite 파일 세션 저장소 (워커 프로세스 간 공유)
+
+    sentences 테이블은 (session_id, slot) 기본 키의 링 버퍼 (slot = seq % max_sentences)
+    만료/초과 세션 정리는 purge_interval번 쓰기마다 한 번씩 수행
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *args,
+        clock: Callable[[], float] = time.time,
+        purge_interval: int = 1000,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.path = path
+        self.clock = clock
+        self.purge_interval = purge_interval
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    next_seq INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS sessions_accessed_at ON sessions (accessed_at);
+                CREATE TABLE IF NOT EXISTS sentences (
+                    session_id TEXT NOT NULL,
+                    slot INTEGER NOT NULL,
+                    seq INTEGER NOT NULL,
+                    sentence TEXT NOT NULL,
+                    PRIMARY KEY (session_id, slot)
+                ) WITHOUT ROWID;
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결 (WAL: 읽기와 쓰기가 서로 막지 않음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, session_id: str, sentence: str) -> None:
+        conn = self._connection()
+        now = self.clock()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT next_seq, accessed_at FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            seq = 0
+            if row is not None:
+                seq = row[0]
+                if row[1] <= now - self.ttl_seconds:
+                    # 만료된 세션은 새 세션으로 시작
+                    conn.execute("DELETE FROM sentences WHERE session_id = ?", (session_id,))
+                    seq = 0
+            conn.execute(
+                "INSERT OR REPLACE INTO sentences (session_id, slot, seq, sentence) VALUES (?, ?, ?, ?)",
+                (session_id, seq % self.max_sentences, seq, sentence)
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, next_seq, accessed_at) VALUES (?, ?, ?)",
+                (session_id, seq + 1, now)
+            )
+        self._writes += 1
+        if self._writes % self.purge_interval == 0:
+            self.purge()
+
+    def get_context(self, session_id: str, window_size: int = 5) -> List[str]:
+        if window_size <= 0:
+            return []
+        conn = self._connection()
+        now = self.clock()
+        updated = conn.execute(
+            "UPDATE sessions SET accessed_at = ? WHERE session_id = ? AND accessed_at > ?",
+            (now, session_id, now - self.ttl_seconds)
+        ).rowcount
+        if not updated:
+            return []
+        rows = conn.execute(
+            "SELECT sentence FROM sentences WHERE session_id = ? ORDER BY seq DESC LIMIT ?",
+            (session_id, min(window_size, self.max_sentences))
+        ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def clear(self, session_id: str) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM sentences WHERE session_id = ?", (session_id,))
+
+    def purge(self) -> int:
+        """만료 세션과 max_sessions 초과분(가장 오래 접근하지 않은 순) 제거, 제거한 세션 수 반환"""
+        conn = self._connection()
+        now = self.clock()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS purge_ids (session_id TEXT PRIMARY KEY)
+            """)
+            conn.execute("DELETE FROM purge_ids")
+            conn.execute(
+                "INSERT INTO purge_ids SELECT session_id FROM sessions WHERE accessed_at <= ?",
+                (now - self.ttl_seconds,)
+            )
+            conn.execute("""
+                INSERT OR IGNORE INTO purge_ids
+                SELECT session_id FROM sessions ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            """, (self.max_sessions,))
+            removed = conn.execute("SELECT COUNT(*) FROM purge_ids").fetchone()[0]
+            conn.execute("DELETE FROM sentences WHERE session_id IN (SELECT session_id FROM purge_ids)")
+            conn.execute("DELETE FROM sessions WHERE session_id IN (SELECT session_id FROM purge_ids)")
+        return removed
+
+    def session_count(self) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM sessions WHERE accessed_at > ?", (self.clock() - self.ttl_seconds,)
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class LocalKeyValueClient:
+    """
+    Redis 리스트 명령 일부(rpush/ltrim/lrange/expire/delete/dbsize)의 프로세스 내 대체 구현
+
+    Redis 서버 없이 KeyValueSessionStore를 사용하기 위한 용도
+    max_keys를 넘으면 가장 오래 접근하지 않은 키 제거 (Redis maxmemory-policy allkeys-lru 대응)
+    """
+
+    def __init__(self, max_keys: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        # key → (리스트, 만료 시각 또는 None), 접근 순서대로 정렬
+        self._data: "OrderedDict[str, Tuple[List[str], Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= self.clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def rpush(self, key: str, *values: str) -> int:
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                entry = self._data[key] = ([], None)
+            entry[0].extend(values)
+            if self.max_keys is not None:
+                while len(self._data) > self.max_keys:
+                    self._data.popitem(last=False)
+            return len(entry[0])
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        with self._lock:
+            entry = self._get(key)
+            if entry is not None:
+                values = entry[0]
+                stop = len(values) + end + 1 if end < 0 else end + 1
+                values[:] = values[start:stop]
+            return True
+
+    def lrange(self, key: str, start: int, end: int) -> List[str]:
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                return []
+            values = entry[0]
+            stop = len(values) + end + 1 if end < 0 else end + 1
+            return values[start:stop]
+
+    def expire(self, key: str, seconds: float) -> bool:
+        with self._lock:
+            entry = self._get(key)
+            if entry is None:
+                return False
+            self._data[key] = (entry[0], self.clock() + seconds)
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def dbsize(self) -> int:
+        with self._lock:
+            now = self.clock()
+            return sum(1 for _, expires in self._data.values() if expires is None or expires > now)
+
+
+class KeyValueSessionStore(SessionStore):
+    """
+    Redis 호환 키-값 세션 저장소 (세션당 리스트 키 1개)
+
+    링 버퍼: rpush 후 ltrim으로 최근 max_sentences개만 유지, TTL: 접근할 때마다 expire 갱신
+    세션 수 제한은 서버의 maxmemory-policy(allkeys-lru)에 맡김 (LocalKeyValueClient는 max_keys)
+    """
+
+    def __init__(self, client=None, *args, key_prefix: str = "lef:session:", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = client if client is not None else LocalKeyValueClient(max_keys=self.max_sessions)
+        self.key_prefix = key_prefix
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    def _ttl(self) -> int:
+        # Redis EXPIRE는 정수 초 단위
+        return max(1, int(self.ttl_seconds))
+
+    def append(self, session_id: str, sentence: str) -> None:
+        key = self._key(session_id)
+        # redis 클라이언트는 pipeline으로 왕복 1회, 대체 구현은 직접 호출
+        pipe = self.client.pipeline() if hasattr(self.client, "pipeline") else self.client
+        pipe.rpush(key, sentence)
+        pipe.ltrim(key, -self.max_sentences, -1)
+        pipe.expire(key, self._ttl())
+        if pipe is not self.client:
+            pipe.execute()
+
+    def get_context(self, session_id: str, window_size: int = 5) -> List[str]:
+        if window_size <= 0:
+            return []
+        key = self._key(session_id)
+        values = self.client.lrange(key, -min(window_size, self.max_sentences), -1)
+        if values:
+            self.client.expire(key, self._ttl())
+        return [value.decode("utf-8") if isinstance(value, bytes) else value for value in values]
+
+    def clear(self, session_id: str) -> None:
+        self.client.delete(self._key(session_id))
+
+    def session_count(self) -> int:
+        return self.client.dbsize()
+
+
+def create_session_store(backend: Optional[str] = None, **kwargs) -> SessionStore:
+    """
+    세션 저장소 생성
+
+    Args:
+        backend: "memory" / "sqlite" / "kv" (None이면 LEF_SESSION_STORE 환경 변수, 없으면 "memory")
+        **kwargs: 저장소 생성 인자 (max_sessions, ttl_seconds, max_sentences 등)
+            sqlite: path (None이면 LEF_SESSION_STORE_PATH, 없으면 ./lef_sessions.sqlite3)
+            kv: client 또는 url (None이면 LEF_SESSION_STORE_URL, 없거나 redis 미설치 시 LocalKeyValueClient)
+    """
+    backend = backend or os.environ.get(SESSION_STORE_ENV) or "memory"
+    if backend == "memory":
+        return MemorySessionStore(**kwargs)
+    if backend == "sqlite":
+        path = kwargs.pop("path", None) or os.environ.get(SESSION_STORE_PATH_ENV) or "lef_sessions.sqlite3"
+        return SQLiteSessionStore(path, **kwargs)
+    if backend == "kv":
+        client = kwargs.pop("client", None)
+        url = kwargs.pop("url", None) or os.environ.get(SESSION_STORE_URL_ENV)
+        if client is None and url:
+            if not REDIS_AVAILABLE:
+                raise ImportError("redis 패키지가 설치되지 않아 LEF_SESSION_STORE_URL을 사용할 수 없습니다.")
+            client = redis.Redis.from_url(url)
+        return KeyValueSessionStore(client, **kwargs)
+    raise ValueError(f"알 수 없는 세션 저장소: {backend} (사용 가능: memory, sqlite, kv)")
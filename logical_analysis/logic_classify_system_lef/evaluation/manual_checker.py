@@ -8,11 +8,13 @@ from typing import Dict, Optional
 import json
 from pathlib import Path
 
+from ..config.rule_source import current_manual
+
 
 class ManualChecker:
     """매뉴얼 체커"""
     
-    # 매뉴얼 정의 (임시, 향후 JSON 파일로 이동)
+    # 기본 매뉴얼 정의 (평가 시에는 규칙 레지스트리의 현재 스냅샷 값을 사용, config/rule_source.py)
     MANUAL: Dict[str, Dict] = {
         "INQUIRY": {
             "required_phrases": ["안내드리겠습니다", "확인해보겠습니다"],
@@ -53,13 +55,16 @@ class ManualChecker:
         Args:
             manual_path: 매뉴얼 JSON 파일 경로 (향후 구현)
         """
-        if manual_path and Path(manual_path).exists():
-            # JSON 파일에서 로드 (향후 구현)
-            # with open(manual_path, 'r', encoding='utf-8') as f:
-            #     self.manual = json.load(f)
-            self.manual = self.MANUAL
-        else:
-            self.manual = self.MANUAL
+        self.manual_path = manual_path
+        # JSON 파일에서 로드 (향후 구현)
+        # if manual_path and Path(manual_path).exists():
+        #     with open(manual_path, 'r', encoding='utf-8') as f:
+        #         self.manual = json.load(f)
+    
+    @property
+    def manual(self) -> Dict[str, Dict]:
+        """현재 규칙 스냅샷의 매뉴얼 (규칙 변경 시 재시작 없이 반영)"""
+        return current_manual()
     
     def check_compliance(self, label: str, agent_text: str) -> float:
         """
@@ -72,10 +77,11 @@ class ManualChecker:
         Returns:
             점수 (0.0-1.0)
         """
-        if label not in self.manual:
+        manual = self.manual
+        if label not in manual:
             return 0.5  # 기본값
         
-        manual_data = self.manual[label]
+        manual_data = manual[label]
         agent_lower = agent_text.lower()
         
         # 필수 표현 사용 여부 확인
@@ -87,7 +93,7 @@ class ManualChecker:
         keyword_score = self._check_keywords(agent_lower, required_keywords)
         
         # 절차 순서 확인 (간단한 구현)
-        procedure_score = self._check_procedure(label, agent_lower)
+        procedure_score = self._check_procedure(label, agent_lower, manual)
         
         # 종합 점수 (가중치: phrase 40%, keyword 30%, procedure 30%)
         total_score = phrase_score * 0.4 + keyword_score * 0.3 + procedure_score * 0.3
@@ -132,20 +138,25 @@ class ManualChecker:
         else:
             return 0.5 + (found_count / len(required_keywords)) * 0.4
     
-    def _check_procedure(self, label: str, agent_text: str) -> float:
+    def _check_procedure(self, label: str, agent_text: str, manual: Optional[Dict[str, Dict]] = None) -> float:
         """
         절차 순서 확인 (간단한 구현)
         
+        Args:
+            manual: 사용할 매뉴얼 (None이면 현재 스냅샷)
+        
         Returns:
             점수 (0.0-1.0)
         """
         # 향후 더 정교한 절차 순서 확인 구현 필요
         # 현재는 키워드 기반으로 간단히 확인
+        if manual is None:
+            manual = self.manual
         
-        if label not in self.manual:
+        if label not in manual:
             return 0.5
         
-        procedure = self.manual[label].get("procedure", [])
+        procedure = manual[label].get("procedure", [])
         if not procedure:
             return 0.7
         
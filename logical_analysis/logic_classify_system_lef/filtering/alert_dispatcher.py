@@ -0,0 +1,208 @@
+"""
+비동기 알림 디스패처
+
+분류 경로(send_alert 호출 스레드)에서는 큐에 넣기만 하고, 실제 발송은 백그라운드 스레드가
+묶음(batch) 단위로 싱크(상담사 알림, 관리자 알림, 통화 중단 등)에 전달
+
+- 제한된 큐: max_queue를 넘으면 대기 중인 덜 심각한 알림부터 버림 (없으면 새 알림을 버림)
+- 병합: 같은 세션/Label 알림이 아직 발송 대기 중이면 새로 넣지 않고 최신 내용과 반복 횟수만 갱신
+- 이력: 최근 history_size개 발송 알림만 보관하는 링 버퍼
+"""
+
+import atexit
+import os
+import threading
+import warnings
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import replace
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+from .event_generator import FilteringEvent
+
+# 알림 등급 우선순위 (작을수록 먼저 발송, 큐가 가득 차면 큰 것부터 버림)
+ALERT_PRIORITY: Dict[str, int] = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
+
+class AlertSink:
+    """알림 발송 대상 인터페이스"""
+
+    def send(self, events: List[FilteringEvent]) -> None:
+        """
+        알림 묶음 발송 (디스패처 스레드에서 호출, 심각도 순 정렬)
+
+        Args:
+            events: 발송할 필터링 이벤트 리스트
+        """
+        raise NotImplementedError
+
+
+class CallbackAlertSink(AlertSink):
+    """이벤트마다 콜백 함수를 호출하는 싱크"""
+
+    def __init__(self, callback: Callable[[FilteringEvent], Any]):
+        self.callback = callback
+
+    def send(self, events: List[FilteringEvent]) -> None:
+        for event in events:
+            self.callback(event)
+
+
+def _close_dispatcher(ref: "weakref.ref[AlertDispatcher]") -> None:
+    """인터프리터 종료 시 대기 중인 알림 발송"""
+    dispatcher = ref()
+    if dispatcher is not None:
+        dispatcher.close()
+
+
+class AlertDispatcher:
+    """제한된 큐 + 백그라운드 발송 스레드"""
+
+    def __init__(
+        self,
+        sinks: List[AlertSink],
+        max_queue: int = 1024,
+        batch_size: int = 64,
+        history_size: int = 1000
+    ):
+        """
+        Args:
+            sinks: 알림 발송 대상 리스트
+            max_queue: 발송 대기 알림 최대 수
+            batch_size: 싱크에 한 번에 전달할 최대 알림 수
+            history_size: 보관할 발송 이력 수
+        """
+        self.sinks = list(sinks)
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.history: Deque[FilteringEvent] = deque(maxlen=history_size)
+        self.stats = {"enqueued": 0, "coalesced": 0, "dropped": 0, "sent": 0, "sink_errors": 0}
+
+        # 우선순위별 대기열: 병합 키 → 대기 중 이벤트 (삽입 순서 = 발송 순서)
+        self._queues: List["OrderedDict[Hashable, FilteringEvent]"] = [
+            OrderedDict() for _ in range(len(ALERT_PRIORITY) + 1)
+        ]
+        # 병합 키 → 우선순위
+        self._pending: Dict[Hashable, int] = {}
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._sequence = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        atexit.register(_close_dispatcher, weakref.ref(self))
+
+    def _coalesce_key(self, event: FilteringEvent) -> Hashable:
+        """세션 ID가 없는 이벤트는 병합하지 않음"""
+        if event.session_id is None:
+            self._sequence += 1
+            return (None, self._sequence)
+        return (event.session_id, event.label)
+
+    def _ensure_thread(self) -> None:
+        """발송 스레드 시작 (fork된 워커에서는 부모 스레드가 없으므로 다시 시작)"""
+        if self._thread is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="alert-dispatcher", daemon=True)
+            self._thread.start()
+
+    def _evict_for(self, priority: int) -> bool:
+        """새 알림보다 덜 심각한 대기 알림 중 가장 오래된 것을 버림"""
+        for queue in reversed(self._queues[priority + 1:]):
+            if queue:
+                key, _ = queue.popitem(last=False)
+                del self._pending[key]
+                return True
+        return False
+
+    def submit(self, event: FilteringEvent) -> bool:
+        """
+        알림을 발송 대기열에 추가 (호출 스레드에서는 발송하지 않음)
+
+        Args:
+            event: 필터링 이벤트
+
+        Returns:
+            대기열에 추가(또는 병합)되었으면 True, 큐가 가득 차 버렸으면 False
+        """
+        priority = ALERT_PRIORITY.get(event.alert_level, len(ALERT_PRIORITY))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("닫힌 AlertDispatcher에는 알림을 추가할 수 없습니다.")
+            key = self._coalesce_key(event)
+            pending_priority = self._pending.get(key)
+            if pending_priority is not None:
+                # 대기 순서는 유지하고 최신 발화와 반복 횟수만 갱신
+                queue = self._queues[pending_priority]
+                queue[key] = replace(event, repeat_count=queue[key].repeat_count + event.repeat_count)
+                self.stats["coalesced"] += 1
+                return True
+            if len(self._pending) >= self.max_queue:
+                self.stats["dropped"] += 1
+                if not self._evict_for(priority):
+                    return False
+            self._queues[priority][key] = event
+            self._pending[key] = priority
+            self.stats["enqueued"] += 1
+            self._ensure_thread()
+            self._cond.notify()
+            return True
+
+    def _take_batch(self) -> List[FilteringEvent]:
+        """심각한 등급의 대기열부터 batch_size개까지 꺼냄"""
+        batch = []
+        for queue in self._queues:
+            while queue and len(batch) < self.batch_size:
+                key, event = queue.popitem(last=False)
+                del self._pending[key]
+                batch.append(event)
+        return batch
+
+    def _run(self) -> None:
+        """대기열에서 묶음을 꺼내 심각도 순으로 싱크에 전달"""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch = self._take_batch()
+                self._in_flight = len(batch)
+
+            for sink in self.sinks:
+                try:
+                    sink.send(batch)
+                except Exception as e:
+                    self.stats["sink_errors"] += 1
+                    warnings.warn(f"알림 싱크 발송 실패 ({type(sink).__name__}): {e}")
+            self.history.extend(batch)
+
+            with self._cond:
+                self.stats["sent"] += len(batch)
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 알림이 모두 발송될 때까지 대기
+
+        Returns:
+            시간 안에 모두 발송되었으면 True
+        """
+        with self._cond:
+            if self._pending:
+                self._ensure_thread()
+            return self._cond.wait_for(lambda: not self._pending and not self._in_flight, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """대기 중인 알림을 발송하고 스레드 종료"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            if self._pending and (self._thread is None or self._pid != os.getpid()):
+                self._ensure_thread()
+            self._cond.notify_all()
+            thread = self._thread if self._pid == os.getpid() else None
+        if thread is not None:
+            thread.join(timeout)
@@ -1,40 +1,35 @@
 """
 알림 시스템
 
-경고, 통화 중단 등의 알림 발송
+경고, 통화 중단 등의 알림 발송 (AlertDispatcher로 비동기 발송)
 """
 
-from typing import List
+from typing import Deque, List, Optional
 from .event_generator import FilteringEvent
+from .alert_dispatcher import AlertSink, AlertDispatcher
 
 
-class AlertSystem:
-    """알림 시스템"""
-    
-    def __init__(self):
-        """
-        알림 시스템 초기화
-        """
-        self.alert_history: List[FilteringEvent] = []
+class ConsoleAlertSink(AlertSink):
+    """알림 등급별 콘솔 출력 싱크"""
     
-    def send_alert(self, event: FilteringEvent):
+    def send(self, events: List[FilteringEvent]):
         """
-        알림 발송
+        알림 묶음 출력
         
         Args:
-            event: 필터링 이벤트
+            events: 필터링 이벤트 리스트
         """
-        # 알림 이력 저장
-        self.alert_history.append(event)
-        
-        if event.alert_level == "CRITICAL":
-            self._send_critical_alert(event)
-        elif event.alert_level == "HIGH":
-            self._send_high_alert(event)
-        elif event.alert_level == "MEDIUM":
-            self._send_medium_alert(event)
-        else:
-            self._send_low_alert(event)
+        for event in events:
+            if event.alert_level == "CRITICAL":
+                self._send_critical_alert(event)
+            elif event.alert_level == "HIGH":
+                self._send_high_alert(event)
+            elif event.alert_level == "MEDIUM":
+                self._send_medium_alert(event)
+            else:
+                self._send_low_alert(event)
+            if event.repeat_count > 1:
+                print(f"  → 세션 {event.session_id}에서 {event.repeat_count}회 반복")
     
     def _send_critical_alert(self, event: FilteringEvent):
         """
@@ -115,3 +110,53 @@ class AlertSystem:
         # - 로그 기록만
 
 
+class AlertSystem:
+    """알림 시스템"""
+    
+    def __init__(self, sinks: Optional[List[AlertSink]] = None,
+                 max_queue: int = 1024, history_size: int = 1000):
+        """
+        알림 시스템 초기화
+        
+        Args:
+            sinks: 알림 발송 대상 (None이면 콘솔 출력)
+            max_queue: 발송 대기 알림 최대 수
+            history_size: 보관할 알림 이력 수
+        """
+        self.dispatcher = AlertDispatcher(
+            sinks if sinks is not None else [ConsoleAlertSink()],
+            max_queue=max_queue,
+            history_size=history_size
+        )
+    
+    @property
+    def alert_history(self) -> Deque[FilteringEvent]:
+        """최근 발송 알림 이력 (링 버퍼)"""
+        return self.dispatcher.history
+    
+    def send_alert(self, event: FilteringEvent) -> bool:
+        """
+        알림 발송 (대기열에 추가하고 즉시 반환)
+        
+        Args:
+            event: 필터링 이벤트
+        
+        Returns:
+            대기열에 추가되었으면 True, 큐가 가득 차 버렸으면 False
+        """
+        return self.dispatcher.submit(event)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 알림이 모두 발송될 때까지 대기
+        
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        """
+        return self.dispatcher.flush(timeout)
+    
+    def close(self):
+        """
+        대기 중인 알림을 발송하고 발송 스레드 종료
+        """
+        self.dispatcher.close()
@@ -22,6 +22,8 @@ class FilteringEvent:
     session_context: Optional[List[str]]
     timestamp: datetime
     config: Dict[str, Any]  # 추가 설정 정보
+    session_id: Optional[str] = None  # 세션 ID (같은 세션/Label 알림 병합 기준)
+    repeat_count: int = 1  # 발송 대기 중 병합된 알림 수
 
 
 class EventGenerator:
@@ -35,7 +37,8 @@ class EventGenerator:
         self.baseline_rules = FilteringBaselineRules()
     
     def generate(self, label: str, severity: str, text: str, 
-                 session_context: Optional[List[str]] = None) -> FilteringEvent:
+                 session_context: Optional[List[str]] = None,
+                 session_id: Optional[str] = None) -> FilteringEvent:
         """
         이벤트 생성
         
@@ -44,6 +47,7 @@ class EventGenerator:
             severity: 심각도
             text: 발화 텍스트
             session_context: 세션 맥락
+            session_id: 세션 ID
         
         Returns:
             FilteringEvent
@@ -59,7 +63,8 @@ class EventGenerator:
             text=text,
             session_context=session_context,
             timestamp=datetime.now(),
-            config=event_config
+            config=event_config,
+            session_id=session_id
         )
 
 
@@ -37,7 +37,8 @@ class SpecialLabelFilter:
         self.alert_system = AlertSystem()
     
     def filter(self, label: str, text: str, 
-               session_context: Optional[List[str]] = None) -> FilteringResult:
+               session_context: Optional[List[str]] = None,
+               session_id: Optional[str] = None) -> FilteringResult:
         """
         특수 Label 필터링
         
@@ -45,6 +46,7 @@ class SpecialLabelFilter:
             label: 특수 Label
             text: 발화 텍스트
             session_context: 세션 맥락
+            session_id: 세션 ID (알림 병합 기준)
         
         Returns:
             FilteringResult (action, alert_level, event)
@@ -53,9 +55,9 @@ class SpecialLabelFilter:
         severity = self.baseline_rules.get_severity(label)
         
         # 이벤트 생성
-        event = self.event_generator.generate(label, severity, text, session_context)
+        event = self.event_generator.generate(label, severity, text, session_context, session_id)
         
-        # 알림 발송
+        # 알림 발송 (대기열에 추가만 하고 발송은 백그라운드 스레드에서 수행)
         self.alert_system.send_alert(event)
         
         return FilteringResult(
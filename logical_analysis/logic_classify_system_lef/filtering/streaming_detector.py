@@ -0,0 +1,255 @@
+"""
+실시간 특수 Label 조기 감지
+
+통화 중 STT 부분 인식 결과(같은 Turn에 대해 점점 길어지는 텍스트)를 받아
+고객이 말하는 도중에 CRITICAL/HIGH 특수 Label(PROFANITY, VIOLENCE_THREAT, SEXUAL_HARASSMENT,
+HATE_SPEECH) 이벤트를 발생
+
+- 새로 붙은 부분 + 경계에 걸친 패턴을 위한 겹침 구간만 스캔
+  - 키워드: Baseline 키워드 Aho-Corasick 오토마톤 (소문자 원문)
+  - 욕설: CompiledKorcenEngine (정규화 + 레벨 태그 오토마톤)
+- Korcen 매칭은 뒤에 오는 글자로 False Positive(예: 시발점)가 될 수 있으므로
+  hold_back 글자(공백 제외)가 더 들어올 때까지 확정하지 않음 (final이면 즉시 확정)
+- 인식 결과가 수정되어 이전 텍스트가 바뀌면 처음부터 다시 스캔 (수정으로 사라진 매칭 제거)
+- Label별 신뢰도가 임계값을 넘으면 Turn당 한 번만 이벤트 발생
+- 키워드 오토마톤은 규칙 레지스트리 스냅샷이 바뀌면 다시 컴파일 (진행 중인 Turn은 이후 구간부터 새 규칙 적용)
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from .baseline_rules import FilteringBaselineRules
+from .event_generator import EventGenerator, FilteringEvent
+from ..config.rule_source import current_snapshot
+from ..profanity_filter.baseline_rules import ProfanityBaselineRules
+from ..profanity_filter.korcen_filter import (
+    CompiledKorcenEngine,
+    KORCEN_TO_CATEGORY_MAP,
+    LEVEL_CONFIDENCE_WEIGHTS,
+    LEVEL_PATTERN_LISTS,
+    MULTI_CHAR_REPLACEMENTS,
+    FALSE_POSITIVE_PATTERNS_GENERAL,
+    FALSE_POSITIVE_PATTERNS_MINOR,
+    FALSE_POSITIVE_PATTERNS_SEXUAL,
+    FALSE_POSITIVE_PATTERNS_BELITTLE,
+    FALSE_POSITIVE_PATTERNS_RACE,
+    FALSE_POSITIVE_PATTERNS_PARENT,
+    FALSE_POSITIVE_PATTERNS_POLITICS
+)
+from ...logic_classify_system.keyword_engine.aho_corasick import TaggedKeywordAutomaton
+
+# 조기 감지 대상 Label (CRITICAL, HIGH)
+STREAMING_LABELS: List[str] = (
+    FilteringBaselineRules.SEVERITY_MAP["CRITICAL"] + FilteringBaselineRules.SEVERITY_MAP["HIGH"]
+)
+
+_MAX_FALSE_POSITIVE_LENGTH = max(
+    len(pattern)
+    for patterns in (
+        FALSE_POSITIVE_PATTERNS_GENERAL, FALSE_POSITIVE_PATTERNS_MINOR, FALSE_POSITIVE_PATTERNS_SEXUAL,
+        FALSE_POSITIVE_PATTERNS_BELITTLE, FALSE_POSITIVE_PATTERNS_RACE, FALSE_POSITIVE_PATTERNS_PARENT,
+        FALSE_POSITIVE_PATTERNS_POLITICS
+    )
+    for pattern in patterns
+)
+_MAX_PROFANITY_LENGTH = max(len(pattern) for patterns in LEVEL_PATTERN_LISTS.values() for pattern in patterns)
+
+# Korcen 겹침 구간 (공백 제외 글자 수): 패턴을 포함하는 False Positive 전체 + 다중 문자 치환
+KORCEN_OVERLAP = max(_MAX_PROFANITY_LENGTH, _MAX_FALSE_POSITIVE_LENGTH) + max(map(len, MULTI_CHAR_REPLACEMENTS))
+# 매칭 뒤에 올 수 있는 False Positive 나머지 길이
+DEFAULT_HOLD_BACK = _MAX_FALSE_POSITIVE_LENGTH - 1
+# URL 등 공백 없는 토큰이 잘리지 않도록 겹침 구간을 공백 위치까지 넓히는 최대 글자 수
+_MAX_TOKEN_EXTENSION = 64
+
+
+def _back_off(text: str, pos: int, count: int) -> int:
+    """pos 앞쪽으로 공백 제외 count글자를 포함하고, 토큰 중간이면 토큰 시작까지 넓힌 위치"""
+    idx = pos
+    while idx > 0 and count > 0:
+        idx -= 1
+        if not text[idx].isspace():
+            count -= 1
+    limit = max(0, idx - _MAX_TOKEN_EXTENSION)
+    while idx > limit and not text[idx - 1].isspace():
+        idx -= 1
+    return idx
+
+
+def _hold_limit(text: str, count: int) -> int:
+    """뒤쪽에 공백 제외 count글자를 남긴 위치"""
+    idx = len(text)
+    while idx > 0 and count > 0:
+        idx -= 1
+        if not text[idx].isspace():
+            count -= 1
+    return idx if count == 0 else 0
+
+
+class _TurnState:
+    """Turn별 스트리밍 상태"""
+
+    __slots__ = ("text", "keyword_scanned", "korcen_scanned", "keyword_hits", "korcen_levels", "fired")
+
+    def __init__(self):
+        self.text = ""
+        self.keyword_scanned = 0
+        self.korcen_scanned = 0
+        self.keyword_hits: Set[Tuple[str, int]] = set()
+        self.korcen_levels: Set[str] = set()
+        self.fired: Set[str] = set()
+
+
+class StreamingSpecialLabelDetector:
+    """STT 부분 인식 결과 기반 특수 Label 조기 감지기"""
+
+    def __init__(
+        self,
+        labels: Optional[List[str]] = None,
+        thresholds: Optional[Dict[str, float]] = None,
+        default_threshold: float = 0.5,
+        hold_back: int = DEFAULT_HOLD_BACK,
+        max_open_turns: int = 10000,
+        alert_system=None
+    ):
+        """
+        Args:
+            labels: 감지할 특수 Label (None이면 CRITICAL + HIGH Label)
+            thresholds: Label별 이벤트 발생 신뢰도 임계값
+            default_threshold: thresholds에 없는 Label의 임계값
+            hold_back: Korcen 매칭 확정 전 기다릴 뒤따르는 글자 수 (0이면 즉시 확정)
+            max_open_turns: 동시에 추적할 최대 Turn 수 (초과 시 가장 오래된 Turn 상태 제거)
+            alert_system: 이벤트를 바로 보낼 AlertSystem (None이면 반환만)
+        """
+        self.labels = list(labels or STREAMING_LABELS)
+        self.thresholds = dict(thresholds or {})
+        self.default_threshold = default_threshold
+        self.hold_back = hold_back
+        self.max_open_turns = max_open_turns
+        self.alert_system = alert_system
+        self.event_generator = EventGenerator()
+        self.engine = CompiledKorcenEngine()
+
+        self._rules = None
+        self._refresh_keyword_matcher()
+        self._turns: "OrderedDict[Tuple[str, int], _TurnState]" = OrderedDict()
+
+    def _refresh_keyword_matcher(self) -> None:
+        """규칙 스냅샷이 바뀌었으면 키워드 오토마톤 다시 컴파일"""
+        rules = current_snapshot()
+        if rules is self._rules:
+            return
+        keyword_groups = ProfanityBaselineRules.keyword_groups(rules.lef_rule_lists)
+        self.keyword_matcher = TaggedKeywordAutomaton(keyword_groups)
+        self.keyword_overlap = max(
+            (len(kw) for keywords in keyword_groups.values() for kw in keywords), default=1
+        ) - 1
+        self._rules = rules
+
+    def _scan_keywords(self, state: _TurnState, text: str) -> None:
+        """소문자 원문에서 새로 붙은 부분 + 키워드 길이만큼의 겹침 구간 스캔"""
+        start = max(0, state.keyword_scanned - self.keyword_overlap)
+        if start < len(text):
+            state.keyword_hits |= self.keyword_matcher.matched_patterns(text[start:].lower())
+        state.keyword_scanned = len(text)
+
+    def _scan_korcen(self, state: _TurnState, text: str, final: bool) -> None:
+        """
+        확정 가능한 위치까지 Korcen 스캔
+
+        잘린 구간 양 끝에서 False Positive 일부만 남아 생기는 매칭을 없애기 위해
+        - 겹침 구간부터 확정 위치까지 (오른쪽이 잘림)
+        - 겹침 구간을 한 번 더 넓힌 위치부터 끝까지 (왼쪽이 더 멀리서 잘림)
+        두 구간 모두에서 감지된 레벨만 채택
+        """
+        limit = len(text) if final else _hold_limit(text, self.hold_back)
+        scanned = state.korcen_scanned
+        if limit <= scanned:
+            return
+        start = _back_off(text, scanned, KORCEN_OVERLAP)
+        levels = set(self.engine.detect_levels(text[start:limit])) - state.korcen_levels
+        if levels and (start > 0 or limit < len(text)):
+            wider_start = _back_off(text, start, KORCEN_OVERLAP)
+            levels &= set(self.engine.detect_levels(text[wider_start:]))
+        state.korcen_levels |= levels
+        state.korcen_scanned = limit
+
+    def _label_confidences(self, state: _TurnState) -> Dict[str, float]:
+        """지금까지 감지된 키워드/레벨로 Label별 신뢰도 계산"""
+        confidences: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+        for category, _ in state.keyword_hits:
+            counts[category] = counts.get(category, 0) + 1
+        for category, count in counts.items():
+            confidences[category] = ProfanityBaselineRules.keyword_confidence(category, count)
+
+        # KorcenFilter.check_profanity와 같은 방식: 레벨 가중치 + 여러 레벨 감지 시 가산
+        bonus = 0.1 * (len(state.korcen_levels) - 1)
+        for level in state.korcen_levels:
+            category = KORCEN_TO_CATEGORY_MAP.get(level, 'PROFANITY')
+            confidence = min(LEVEL_CONFIDENCE_WEIGHTS.get(level, 0.6) + bonus, 1.0)
+            if confidence > confidences.get(category, 0.0):
+                confidences[category] = confidence
+        return confidences
+
+    def update(self, session_id: str, turn_index: int, partial_text: str, final: bool = False,
+               session_context: Optional[List[str]] = None) -> List[FilteringEvent]:
+        """
+        Turn의 부분 인식 결과 반영
+
+        Args:
+            session_id: 세션 ID
+            turn_index: Turn 인덱스
+            partial_text: 지금까지 인식된 Turn 전체 텍스트
+            final: Turn 인식 확정 여부 (True면 보류 중인 매칭도 확정하고 Turn 상태 제거)
+            session_context: 세션 맥락 (이벤트에 포함)
+
+        Returns:
+            이번 호출에서 새로 임계값을 넘은 Label의 FilteringEvent 리스트
+        """
+        key = (session_id, turn_index)
+        state = self._turns.get(key)
+        if state is None:
+            state = self._turns[key] = _TurnState()
+            while len(self._turns) > self.max_open_turns:
+                self._turns.popitem(last=False)
+        else:
+            self._turns.move_to_end(key)
+
+        # 인식 결과 수정: 감지 결과를 버리고 처음부터 다시 스캔 (이미 발생한 이벤트는 유지)
+        if not partial_text.startswith(state.text):
+            state.keyword_scanned = 0
+            state.korcen_scanned = 0
+            state.keyword_hits.clear()
+            state.korcen_levels.clear()
+        state.text = partial_text
+        if len(state.fired) == len(self.labels):
+            # 모든 Label 이벤트가 이미 발생한 Turn은 더 스캔하지 않음
+            if final:
+                del self._turns[key]
+            return []
+
+        self._refresh_keyword_matcher()
+        self._scan_keywords(state, partial_text)
+        self._scan_korcen(state, partial_text, final)
+
+        events = []
+        confidences = self._label_confidences(state)
+        for label in self.labels:
+            if label in state.fired:
+                continue
+            if confidences.get(label, 0.0) >= self.thresholds.get(label, self.default_threshold):
+                state.fired.add(label)
+                event = self.event_generator.generate(
+                    label, FilteringBaselineRules.get_severity(label), partial_text, session_context, session_id
+                )
+                if self.alert_system is not None:
+                    self.alert_system.send_alert(event)
+                events.append(event)
+
+        if final:
+            del self._turns[key]
+        return events
+
+    def discard(self, session_id: str, turn_index: int) -> None:
+        """Turn 상태 제거 (인식 취소 등)"""
+        self._turns.pop((session_id, turn_index), None)
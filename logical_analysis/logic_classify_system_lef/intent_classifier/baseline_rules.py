@@ -3,10 +3,14 @@
 
 특수 Label 감지를 위한 규칙만 포함
 classification_criteria.py의 일부 규칙만 추출하여 모듈 내부에 포함
+키워드 리스트 클래스 속성은 기본값이며, 감지 시에는 규칙 레지스트리의 현재 스냅샷 값을 사용
+(config/rule_source.py)
 """
 
 from typing import List, Tuple, Optional
 
+from ..config.rule_source import current_rule_lists
+
 
 class IntentBaselineRules:
     """발화 의도 분류용 Baseline 규칙"""
@@ -55,9 +59,10 @@ class IntentBaselineRules:
         """
         results = []
         text_lower = text.lower()
+        rule_lists = current_rule_lists()
         
         # 1. 반복성 감지
-        repetition_count = sum(1 for indicator in IntentBaselineRules.REPETITION_INDICATORS 
+        repetition_count = sum(1 for indicator in rule_lists["REPETITION_INDICATORS"] 
                                if indicator in text_lower)
         
         if session_context:
@@ -76,7 +81,7 @@ class IntentBaselineRules:
                 results.append(("REPETITION", confidence))
         
         # 2. 무리한 요구 감지
-        strong_unreasonable = [kw for kw in IntentBaselineRules.UNREASONABLE_DEMAND_STRONG 
+        strong_unreasonable = [kw for kw in rule_lists["UNREASONABLE_DEMAND_STRONG"] 
                               if kw in text_lower]
         if strong_unreasonable:
             # 강한 표현이 있으면 HIGH 심각도
@@ -84,7 +89,7 @@ class IntentBaselineRules:
             results.append(("UNREASONABLE_DEMAND", confidence))
         else:
             # 일반적인 무리한 요구 표현 (2개 이상 감지)
-            unreasonable_count = sum(1 for kw in IntentBaselineRules.UNREASONABLE_DEMAND_INDICATORS 
+            unreasonable_count = sum(1 for kw in rule_lists["UNREASONABLE_DEMAND_INDICATORS"] 
                                     if kw in text_lower)
             if unreasonable_count >= 2:
                 confidence = min(0.4 + unreasonable_count * 0.2, 1.0)
@@ -95,7 +100,7 @@ class IntentBaselineRules:
                 results.append(("UNREASONABLE_DEMAND", confidence))
         
         # 3. 부당성/무관성 감지
-        irrelevance_count = sum(1 for kw in IntentBaselineRules.IRRELEVANCE_INDICATORS 
+        irrelevance_count = sum(1 for kw in rule_lists["IRRELEVANCE_INDICATORS"] 
                                if kw in text_lower)
         if irrelevance_count > 0:
             confidence = min(0.3 + irrelevance_count * 0.25, 1.0)
@@ -33,7 +33,8 @@ class LabelRouter:
     
     def route(self, classification_result: ClassificationResult, 
               session_context: Optional[List[str]] = None,
-              agent_text: Optional[str] = None) -> RouterResult:
+              agent_text: Optional[str] = None,
+              session_id: Optional[str] = None) -> RouterResult:
         """
         Label 기반 라우팅
         
@@ -41,6 +42,7 @@ class LabelRouter:
             classification_result: 분류 결과
             session_context: 세션 맥락
             agent_text: 상담사 발화 (Normal Label 평가용)
+            session_id: 세션 ID (특수 Label 알림 병합 기준)
         
         Returns:
             RouterResult (route_type, result)
@@ -67,7 +69,8 @@ class LabelRouter:
             filtering_result = self.filter.filter(
                 label=classification_result.label,
                 text=classification_result.text,
-                session_context=session_context
+                session_context=session_context,
+                session_id=session_id
             )
             return RouterResult(
                 route_type="FILTERING",
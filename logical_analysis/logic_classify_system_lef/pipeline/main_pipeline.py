@@ -12,19 +12,23 @@ from ..profanity_filter.profanity_detector import ProfanityDetector
 from ..intent_classifier.intent_predictor import IntentPredictor
 from ..data.data_structures import PipelineResult, ClassificationResult
 from ..data.session_manager import SessionManager
+from ..data.session_store import SessionStore
 
 
 class MainPipeline:
     """메인 파이프라인"""
     
-    def __init__(self):
+    def __init__(self, session_store: Optional[SessionStore] = None):
         """
         메인 파이프라인 초기화
+
+        Args:
+            session_store: 세션 맥락 저장소 (None이면 LEF_SESSION_STORE 환경 변수로 선택)
         """
         self.text_splitter = TextSplitter()
         self.profanity_detector = ProfanityDetector(use_korcen=False)
         self.intent_predictor = IntentPredictor()
-        self.session_manager = SessionManager()
+        self.session_manager = SessionManager(session_store)
     
     def process(self, text: str, session_id: str) -> PipelineResult:
         """
@@ -3,9 +3,13 @@
 
 classification_criteria.py의 욕설 관련 규칙만 추출하여 모듈 내부에 포함
 모듈 독립성을 위해 외부 파일 의존성 제거
+키워드 리스트 클래스 속성은 기본값이며, 감지 시에는 규칙 레지스트리의 현재 스냅샷 값을 사용
+(config/rule_source.py)
 """
 
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+
+from ..config.rule_source import current_rule_lists
 
 
 class ProfanityBaselineRules:
@@ -47,6 +51,50 @@ class ProfanityBaselineRules:
         "직업_혐오": ["직업", "직종"]
     }
     
+    # 카테고리별 신뢰도 (기본값, 키워드 1개당 증가량)
+    CATEGORY_CONFIDENCE: Dict[str, Tuple[float, float]] = {
+        "PROFANITY": (0.5, 0.15),
+        "VIOLENCE_THREAT": (0.7, 0.15),
+        "SEXUAL_HARASSMENT": (0.6, 0.2),
+        "HATE_SPEECH": (0.6, 0.15),
+        "INSULT": (0.4, 0.2),
+    }
+    
+    @staticmethod
+    def keyword_confidence(category: str, count: int) -> float:
+        """
+        카테고리 키워드 count개 감지 시 신뢰도
+        
+        Args:
+            category: 감지된 카테고리
+            count: 감지된 키워드 수
+        """
+        base, step = ProfanityBaselineRules.CATEGORY_CONFIDENCE[category]
+        return min(base + count * step, 1.0)
+    
+    @staticmethod
+    def keyword_groups(rule_lists: Optional[Dict[str, Any]] = None) -> Dict[str, List[str]]:
+        """
+        카테고리별 키워드 목록 (혐오 표현 하위 분류는 하나로 합침)
+        
+        Args:
+            rule_lists: 키워드 리스트 (None이면 규칙 레지스트리의 현재 스냅샷)
+        
+        Returns:
+            {category: keywords}
+        """
+        if rule_lists is None:
+            rule_lists = current_rule_lists()
+        return {
+            "PROFANITY": list(rule_lists["PROFANITY_KEYWORDS"]),
+            "VIOLENCE_THREAT": list(rule_lists["THREAT_KEYWORDS"]),
+            "SEXUAL_HARASSMENT": list(rule_lists["SEXUAL_HARASSMENT_KEYWORDS"]),
+            "HATE_SPEECH": [
+                kw for keywords in rule_lists["HATE_SPEECH_KEYWORDS"].values() for kw in keywords
+            ],
+            "INSULT": list(rule_lists["INSULT_KEYWORDS"]),
+        }
+    
     @staticmethod
     def detect_profanity(text: str) -> Tuple[bool, Optional[str], float]:
         """
@@ -62,36 +110,37 @@ class ProfanityBaselineRules:
             - confidence: 신뢰도 (0.0-1.0)
         """
         text_lower = text.lower()
+        rule_lists = current_rule_lists()
         
         # 1. 직접적 욕설 감지 (최우선)
-        profanity_count = sum(1 for kw in ProfanityBaselineRules.PROFANITY_KEYWORDS 
+        profanity_count = sum(1 for kw in rule_lists["PROFANITY_KEYWORDS"] 
                              if kw in text_lower)
         if profanity_count > 0:
-            return True, "PROFANITY", min(0.5 + profanity_count * 0.15, 1.0)
+            return True, "PROFANITY", ProfanityBaselineRules.keyword_confidence("PROFANITY", profanity_count)
         
         # 2. 위협 표현 감지 (CRITICAL)
-        threat_count = sum(1 for kw in ProfanityBaselineRules.THREAT_KEYWORDS 
+        threat_count = sum(1 for kw in rule_lists["THREAT_KEYWORDS"] 
                           if kw in text_lower)
         if threat_count > 0:
-            return True, "VIOLENCE_THREAT", min(0.7 + threat_count * 0.15, 1.0)
+            return True, "VIOLENCE_THREAT", ProfanityBaselineRules.keyword_confidence("VIOLENCE_THREAT", threat_count)
         
         # 3. 성희롱 감지 (CRITICAL)
-        sexual_count = sum(1 for kw in ProfanityBaselineRules.SEXUAL_HARASSMENT_KEYWORDS 
+        sexual_count = sum(1 for kw in rule_lists["SEXUAL_HARASSMENT_KEYWORDS"] 
                           if kw in text_lower)
         if sexual_count > 0:
-            return True, "SEXUAL_HARASSMENT", min(0.6 + sexual_count * 0.2, 1.0)
+            return True, "SEXUAL_HARASSMENT", ProfanityBaselineRules.keyword_confidence("SEXUAL_HARASSMENT", sexual_count)
         
         # 4. 혐오 표현 감지
-        for category, keywords in ProfanityBaselineRules.HATE_SPEECH_KEYWORDS.items():
+        for category, keywords in rule_lists["HATE_SPEECH_KEYWORDS"].items():
             hate_count = sum(1 for kw in keywords if kw in text_lower)
             if hate_count > 0:
-                return True, "HATE_SPEECH", min(0.6 + hate_count * 0.15, 1.0)
+                return True, "HATE_SPEECH", ProfanityBaselineRules.keyword_confidence("HATE_SPEECH", hate_count)
         
         # 5. 모욕/조롱 감지
-        insult_count = sum(1 for kw in ProfanityBaselineRules.INSULT_KEYWORDS 
+        insult_count = sum(1 for kw in rule_lists["INSULT_KEYWORDS"] 
                          if kw in text_lower)
         if insult_count > 0:
-            return True, "INSULT", min(0.4 + insult_count * 0.2, 1.0)
+            return True, "INSULT", ProfanityBaselineRules.keyword_confidence("INSULT", insult_count)
         
         return False, None, 0.0
 
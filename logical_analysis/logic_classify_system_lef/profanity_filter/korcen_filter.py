@@ -9,6 +9,7 @@ Korcen 기반 욕설 필터 (경량화 버전)
 import re
 from typing import Tuple, Optional, Dict, List
 from .baseline_rules import ProfanityBaselineRules
+from ...logic_classify_system.keyword_engine.aho_corasick import TaggedKeywordAutomaton
 
 # ============================================================================
 # 텍스트 정규화 맵 (핵심만 추출)
@@ -336,6 +337,117 @@ LEVEL_CONFIDENCE_WEIGHTS: Dict[str, float] = {
     'special': 0.7,     # 높은 신뢰도
 }
 
+# ============================================================================
+# 컴파일된 Korcen 엔진
+# ============================================================================
+
+# 감지할 레벨 목록 (우선순위 순)
+CHECK_LEVELS = ['sexual', 'general', 'race', 'belittle', 'parent', 'minor', 'politics', 'special']
+
+WHITESPACE_REGEX = re.compile(r'\s+')
+
+# 레벨별 욕설 패턴 리스트 (P_REGEX_* 정규식의 원본)
+LEVEL_PATTERN_LISTS: Dict[str, List[str]] = {
+    'general': GENERAL_PROFANITY_PATTERNS,
+    'minor': MINOR_PROFANITY_PATTERNS,
+    'sexual': SEXUAL_PROFANITY_PATTERNS,
+    'belittle': BELITTLE_PROFANITY_PATTERNS,
+    'race': RACE_PROFANITY_PATTERNS,
+    'parent': PARENT_PROFANITY_PATTERNS,
+    'politics': POLITICS_PROFANITY_PATTERNS,
+    'special': SPECIAL_PROFANITY_PATTERNS,
+}
+
+# preprocess_text의 레벨별 치환을 한 번의 translate로 변환
+# - minor: 년/련 -> 놈
+# - belittle: 뇬/놈/넘 -> 련 -> 년 (연쇄 치환 결과는 모두 년)
+LEVEL_TRANSLATION_TABLES = {
+    'minor': str.maketrans({'년': '놈', '련': '놈'}),
+    'belittle': str.maketrans({'뇬': '년', '놈': '년', '넘': '년', '련': '년'}),
+}
+
+
+class CompiledKorcenEngine:
+    """
+    레벨별 검사를 한 번에 수행하는 Korcen 엔진
+
+    - URL 제거/소문자/문자 정규화/다중 문자 치환/공백 제거는 한 번만 수행
+    - 레벨별 치환, False Positive 제거, 최종 필터는 미리 컴파일
+    - 최종 텍스트가 같은 레벨끼리 묶어 레벨 태그 오토마톤으로 한 번만 스캔
+    결과는 check_and_report_profanity_pattern과 동일
+    """
+
+    def __init__(self, levels: Optional[List[str]] = None):
+        self.levels = list(levels or CHECK_LEVELS)
+        self.level_patterns: Dict[str, List[str]] = {
+            level: list(LEVEL_PATTERN_LISTS[level]) for level in self.levels
+        }
+        self.fp_regexes = {level: get_false_positive_regex(level) for level in self.levels}
+        self.final_filter_regexes = {
+            level: None if level == 'special' else re.compile(get_final_filter_regex_str(level))
+            for level in self.levels
+        }
+        self.matcher = TaggedKeywordAutomaton(self.level_patterns)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """모든 레벨이 공유하는 정규화 (preprocess_text의 레벨 무관 부분)"""
+        processed_text = URL_REGEX.sub('', text).lower()
+        processed_text = processed_text.translate(NORMALIZATION_TABLE)
+        processed_text = apply_multi_char_replacements(processed_text)
+        return WHITESPACE_REGEX.sub('', processed_text)
+
+    def level_text(self, normalized: str, level: str) -> str:
+        """공유 정규화 결과로부터 레벨별 최종 검사 텍스트 생성"""
+        table = LEVEL_TRANSLATION_TABLES.get(level)
+        if table is not None:
+            processed_text = normalized.translate(table)
+        elif level == 'sexual':
+            processed_text = normalized.replace('보g', '보지')
+        else:
+            processed_text = normalized
+
+        fp_regex = self.fp_regexes[level]
+        if fp_regex is not None:
+            processed_text = fp_regex.sub('', processed_text)
+
+        final_filter = self.final_filter_regexes[level]
+        if final_filter is not None:
+            processed_text = final_filter.sub('', processed_text)
+        return processed_text
+
+    def detect_levels(self, text: str) -> Dict[str, str]:
+        """
+        모든 레벨의 욕설 패턴 감지
+
+        Args:
+            text: 분석할 텍스트
+
+        Returns:
+            {level: 감지된 패턴} (감지된 레벨만, self.levels 순서)
+        """
+        normalized = self.normalize(text)
+
+        # 최종 텍스트가 같은 레벨끼리 묶기
+        groups: Dict[str, set] = {}
+        for level in self.levels:
+            groups.setdefault(self.level_text(normalized, level), set()).add(level)
+
+        first: Dict[str, Tuple[int, int]] = {}
+        for level_text, levels in groups.items():
+            if level_text:
+                first.update(self.matcher.first_matches(level_text, levels))
+
+        detected: Dict[str, str] = {}
+        for level in self.levels:
+            if level in first:
+                detected[level] = self.level_patterns[level][first[level][1]]
+            elif level == 'general' and normalized in EXACT_MATCH_PROFANITY:
+                # 정확한 매칭 (general 레벨만)
+                detected[level] = normalized
+        return detected
+
+
 # ============================================================================
 # KorcenFilter 클래스
 # ============================================================================
@@ -346,6 +458,7 @@ class KorcenFilter:
     def __init__(self):
         """Korcen 필터 초기화"""
         self.baseline_rules = ProfanityBaselineRules()
+        self.engine = CompiledKorcenEngine()
     
     def check_profanity(self, text: str) -> Tuple[bool, Optional[str], float]:
         """
@@ -365,17 +478,11 @@ class KorcenFilter:
         if is_threat and threat_category == "VIOLENCE_THREAT":
             return True, threat_category, threat_confidence
         
-        # 2. Korcen 레벨별 감지
-        detected_levels: List[Tuple[str, str]] = []  # (level, category)
-        
-        # 감지할 레벨 목록 (우선순위 순)
-        check_levels = ['sexual', 'general', 'race', 'belittle', 'parent', 'minor', 'politics', 'special']
-        
-        for level in check_levels:
-            detected_pattern = check_and_report_profanity_pattern(text, level)
-            if detected_pattern:
-                category = KORCEN_TO_CATEGORY_MAP.get(level, 'PROFANITY')
-                detected_levels.append((level, category))
+        # 2. Korcen 레벨별 감지 (정규화 1회 + 레벨 태그 오토마톤 스캔)
+        detected_levels: List[Tuple[str, str]] = [
+            (level, KORCEN_TO_CATEGORY_MAP.get(level, 'PROFANITY'))
+            for level in self.engine.detect_levels(text)
+        ]
         
         # 3. 결과 처리
         if not detected_levels:
@@ -0,0 +1,169 @@
+"""
+알림 발송 벤치마크
+
+특수 Label 알림 N개(기본 10,000, 세션 500개)를 보낼 때 분류 경로(send_alert 호출)의 지연 비교
+- sync: 기존 방식 (호출 스레드에서 바로 싱크 발송, 이력 list 무제한)
+- dispatcher: AlertDispatcher (대기열 추가만, 백그라운드 스레드에서 묶음 발송 / 병합)
+
+싱크는 콘솔 출력(/dev/null) + 알림 묶음당 DELIVERY_MS의 외부 전송 지연을 흉내냄
+
+사용법:
+    python logical_analysis/logic_classify_system_lef/test/benchmark_alert_dispatcher.py [알림 수] [세션 수]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import contextlib
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.filtering.alert_dispatcher import AlertDispatcher
+from logical_analysis.logic_classify_system_lef.filtering.alert_system import ConsoleAlertSink
+from logical_analysis.logic_classify_system_lef.filtering.baseline_rules import FilteringBaselineRules
+from logical_analysis.logic_classify_system_lef.filtering.event_generator import FilteringEvent
+
+DELIVERY_MS = 1.0
+
+
+class SlowConsoleSink(ConsoleAlertSink):
+    """콘솔 출력 + 외부 전송(상담사/관리자 알림 API) 지연, 등급별 발송 수 집계"""
+
+    def __init__(self):
+        self.sent_by_level: Counter = Counter()
+
+    def send(self, events):
+        super().send(events)
+        self.sent_by_level.update(event.alert_level for event in events)
+        time.sleep(DELIVERY_MS / 1000)
+
+
+def generate_events(num_alerts: int, num_sessions: int, seed: int = 0) -> List[FilteringEvent]:
+    """세션별 특수 Label 알림 (같은 세션에서 같은 Label이 반복되는 통화 포함)"""
+    rng = random.Random(seed)
+    labels = list(FilteringBaselineRules.EVENT_CONFIG)
+    events = []
+    for i in range(num_alerts):
+        label = rng.choice(labels)
+        config = FilteringBaselineRules.get_event_config(label)
+        events.append(FilteringEvent(
+            label=label,
+            severity=FilteringBaselineRules.get_severity(label),
+            action=config["action"],
+            alert_level=config["alert_level"],
+            text=f"특수 발화 {i}",
+            session_context=None,
+            timestamp=datetime.now(),
+            config=config,
+            session_id=f"call-{rng.randrange(num_sessions):04d}"
+        ))
+    return events
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값의 분위수"""
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def latency_summary(latencies: List[float], total_seconds: float) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    return {
+        "calls_per_sec": len(latencies) / total_seconds,
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "max_us": latencies[-1] * 1e6,
+    }
+
+
+def benchmark_sync(events: List[FilteringEvent]) -> Dict[str, Any]:
+    """기존 방식: 호출 스레드에서 이벤트마다 싱크 발송"""
+    sink = SlowConsoleSink()
+    history = []
+    latencies = []
+    start = time.perf_counter()
+    for event in events:
+        t0 = time.perf_counter()
+        history.append(event)
+        sink.send([event])
+        latencies.append(time.perf_counter() - t0)
+    row = latency_summary(latencies, time.perf_counter() - start)
+    row.update({"delivered": len(events), "history_len": len(history)})
+    return row
+
+
+def benchmark_dispatcher(events: List[FilteringEvent]) -> Dict[str, Any]:
+    """AlertDispatcher: 대기열 추가 지연과 전체 발송 완료 시간"""
+    sink = SlowConsoleSink()
+    dispatcher = AlertDispatcher([sink])
+    latencies = []
+    start = time.perf_counter()
+    for event in events:
+        t0 = time.perf_counter()
+        dispatcher.submit(event)
+        latencies.append(time.perf_counter() - t0)
+    enqueue_seconds = time.perf_counter() - start
+    dispatcher.flush()
+    drain_seconds = time.perf_counter() - start
+    dispatcher.close()
+
+    row = latency_summary(latencies, enqueue_seconds)
+    row.update({
+        "drain_seconds": drain_seconds,
+        "history_len": len(dispatcher.history),
+        "submitted_by_level": dict(Counter(event.alert_level for event in events)),
+        "sent_by_level": dict(sink.sent_by_level),
+        **dispatcher.stats,
+    })
+    return row
+
+
+def main():
+    """메인 함수"""
+    num_alerts = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    num_sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    print("=" * 80)
+    print("알림 발송 벤치마크")
+    print("=" * 80)
+    print(f"알림 {num_alerts:,}개, 세션 {num_sessions}개, 싱크 전송 지연 {DELIVERY_MS} ms/묶음")
+
+    events = generate_events(num_alerts, num_sessions)
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        results: Dict[str, Any] = {
+            "num_alerts": num_alerts,
+            "num_sessions": num_sessions,
+            "delivery_ms": DELIVERY_MS,
+            "sync": benchmark_sync(events),
+            "dispatcher": benchmark_dispatcher(events),
+        }
+
+    for name in ("sync", "dispatcher"):
+        row = results[name]
+        print(f"  {name:<10} send_alert p50 {row['p50_us']:>8.1f} us  p99 {row['p99_us']:>8.1f} us  "
+              f"max {row['max_us']:>9.1f} us  ({row['calls_per_sec']:>10,.0f} calls/s)")
+    dispatcher = results["dispatcher"]
+    print(f"  dispatcher 병합 {dispatcher['coalesced']:,}건, 버림 {dispatcher['dropped']:,}건, "
+          f"발송 {dispatcher['sent']:,}건, 전체 발송 완료 {dispatcher['drain_seconds']:.2f}s "
+          f"(sync {num_alerts / results['sync']['calls_per_sec']:.2f}s), 이력 {dispatcher['history_len']:,}개")
+    for level in ("CRITICAL", "HIGH", "MEDIUM"):
+        print(f"    {level:<8} 요청 {dispatcher['submitted_by_level'].get(level, 0):>6,}건 → "
+              f"발송 {dispatcher['sent_by_level'].get(level, 0):>6,}건")
+
+    output_dir = Path(__file__).parent / 'test_results'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / 'alert_dispatcher_benchmark.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Korcen 엔진 벤치마크
+
+레벨마다 정규화/False Positive 제거/최종 필터/패턴 검색을 반복하던 기존 방식
+(check_and_report_profanity_pattern x 8레벨)과 CompiledKorcenEngine의 처리량 비교
+
+사용법:
+    python logical_analysis/logic_classify_system_lef/test/benchmark_korcen_engine.py [코퍼스.txt]
+    (코퍼스 파일은 한 줄에 한 문장, 없으면 합성 욕설 코퍼스 사용)
+"""
+
+import sys
+import json
+import time
+import random
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.profanity_filter.korcen_filter import (
+    CHECK_LEVELS,
+    LEVEL_PATTERN_LISTS,
+    SINGLE_CHAR_NORMALIZATION_MAP,
+    FALSE_POSITIVE_PATTERNS_GENERAL,
+    FALSE_POSITIVE_PATTERNS_MINOR,
+    FALSE_POSITIVE_PATTERNS_SEXUAL,
+    CompiledKorcenEngine,
+    check_and_report_profanity_pattern
+)
+
+_FILLERS = [
+    "아니 그게 아니라", "지금 몇 번째 전화하는 건지", "상담원 바꿔", "환불 언제 해줘요",
+    "진짜 어이가 없네", "배송이 왜 이래", "요금이 이상하게 나왔어요", "네 알겠습니다",
+    "https://example.com/order 여기 보세요", "ㅋㅋㅋ", "카드 결제 취소해 주세요", "우리 애가 그랬어요",
+]
+
+# 정규화 맵 역방향 (예: 'ㅣ' -> '1', 'ㅇ' -> '0') 으로 우회 표기 생성
+_OBFUSCATION_MAP: Dict[str, List[str]] = {}
+for _src, _dst in SINGLE_CHAR_NORMALIZATION_MAP.items():
+    if _src != _dst:
+        _OBFUSCATION_MAP.setdefault(_dst, []).append(_src)
+
+
+def _obfuscate(word: str, rng: random.Random) -> str:
+    """공백 삽입, 대문자, 유사 문자 치환으로 욕설 우회 표기 생성"""
+    chars = []
+    for ch in word:
+        if ch in _OBFUSCATION_MAP and rng.random() < 0.3:
+            ch = rng.choice(_OBFUSCATION_MAP[ch])
+        elif rng.random() < 0.2:
+            ch = ch.upper()
+        chars.append(ch)
+    separator = rng.choice(["", "", " ", ".", "_"])
+    return separator.join(chars)
+
+
+def generate_profanity_corpus(count: int, seed: int = 42, profanity_ratio: float = 0.5) -> List[str]:
+    """
+    합성 욕설 코퍼스 생성
+
+    Args:
+        count: 문장 수
+        seed: 난수 시드
+        profanity_ratio: 욕설 패턴을 포함할 문장 비율
+
+    Returns:
+        문장 리스트 (일반 발화, 우회 표기 욕설, False Positive 단어 혼합)
+    """
+    rng = random.Random(seed)
+    patterns = [pattern for level in CHECK_LEVELS for pattern in LEVEL_PATTERN_LISTS[level]]
+    false_positives = FALSE_POSITIVE_PATTERNS_GENERAL + FALSE_POSITIVE_PATTERNS_MINOR + FALSE_POSITIVE_PATTERNS_SEXUAL
+
+    corpus = []
+    for _ in range(count):
+        parts = rng.sample(_FILLERS, rng.randint(1, 3))
+        if rng.random() < profanity_ratio:
+            for _ in range(rng.randint(1, 2)):
+                parts.insert(rng.randint(0, len(parts)), _obfuscate(rng.choice(patterns), rng))
+        if rng.random() < 0.3:
+            parts.insert(rng.randint(0, len(parts)), rng.choice(false_positives))
+        corpus.append(" ".join(parts))
+    return corpus
+
+
+def load_corpus(path: Optional[str], count: int) -> List[str]:
+    """코퍼스 파일 로드 (없으면 합성 코퍼스)"""
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f if line.strip()]
+        if lines:
+            return lines[:count]
+    return generate_profanity_corpus(count)
+
+
+def legacy_detect_levels(text: str) -> Dict[str, str]:
+    """기존 방식: 레벨마다 check_and_report_profanity_pattern 호출"""
+    detected = {}
+    for level in CHECK_LEVELS:
+        pattern = check_and_report_profanity_pattern(text, level)
+        if pattern:
+            detected[level] = pattern
+    return detected
+
+
+def benchmark_korcen_engine(corpus: List[str]) -> Dict[str, Any]:
+    """
+    기존 레벨별 검사 vs 컴파일된 엔진 처리량 및 결과 일치 여부 측정
+
+    Args:
+        corpus: 문장 리스트
+
+    Returns:
+        측정 결과 딕셔너리
+    """
+    start = time.perf_counter()
+    engine = CompiledKorcenEngine()
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy = [legacy_detect_levels(text) for text in corpus]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [engine.detect_levels(text) for text in corpus]
+    compiled_seconds = time.perf_counter() - start
+
+    mismatches = [text for text, a, b in zip(corpus, legacy, compiled) if a != b]
+    return {
+        "num_texts": len(corpus),
+        "detected_ratio": sum(1 for result in legacy if result) / len(corpus),
+        "compile_seconds": compile_seconds,
+        "legacy": {"seconds": legacy_seconds, "texts_per_sec": len(corpus) / legacy_seconds},
+        "compiled": {"seconds": compiled_seconds, "texts_per_sec": len(corpus) / compiled_seconds},
+        "speedup": legacy_seconds / compiled_seconds,
+        "mismatch_count": len(mismatches),
+        "mismatch_examples": mismatches[:5],
+    }
+
+
+def main():
+    """메인 함수"""
+    print("=" * 80)
+    print("Korcen 엔진 벤치마크 (레벨별 반복 검사 vs 컴파일된 엔진)")
+    print("=" * 80)
+
+    corpus = load_corpus(sys.argv[1] if len(sys.argv) > 1 else None, count=50000)
+    results = benchmark_korcen_engine(corpus)
+    print(f"문장 수: {results['num_texts']}, 욕설 감지 비율: {results['detected_ratio']:.1%}, "
+          f"엔진 컴파일: {results['compile_seconds'] * 1000:.1f}ms")
+    for name in ("legacy", "compiled"):
+        print(f"{name:<10} {results[name]['texts_per_sec']:>12,.0f} texts/s  ({results[name]['seconds']:.2f}s)")
+    print(f"속도 향상: {results['speedup']:.2f}x, 결과 불일치: {results['mismatch_count']}건")
+
+    output_dir = Path(__file__).parent / 'test_results'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / 'korcen_engine_benchmark.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
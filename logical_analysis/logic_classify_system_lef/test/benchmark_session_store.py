@@ -0,0 +1,153 @@
+"""
+세션 맥락 저장소 벤치마크
+
+동시 세션 N개(기본 10,000)에 세션당 문장 M개(기본 40)를 번갈아 추가한 뒤
+백엔드별 메모리 사용량과 get_context / append 지연(p50/p99) 비교
+- legacy: 기존 SessionManager 방식 (제한 없는 dict[str, list])
+- memory / sqlite / kv: session_store 저장소 (세션당 링 버퍼 20문장, TTL 30분)
+
+사용법:
+    python logical_analysis/logic_classify_system_lef/test/benchmark_session_store.py [세션 수] [세션당 문장 수]
+"""
+
+import gc
+import sys
+import json
+import time
+import random
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.data.session_store import (
+    SessionStore,
+    MemorySessionStore,
+    SQLiteSessionStore,
+    KeyValueSessionStore
+)
+
+_SENTENCES = [
+    "아니 그게 아니라", "지금 몇 번째 전화하는 건지 아세요", "상담원 바꿔 주세요", "환불 언제 해줘요",
+    "배송이 왜 이래요", "요금이 이상하게 나왔어요", "네 알겠습니다", "카드 결제 취소해 주세요",
+]
+LOOKUPS = 100000
+
+
+class LegacySessionStore(SessionStore):
+    """기존 SessionManager 방식 (제거 없는 dict + list)"""
+
+    def __init__(self):
+        super().__init__()
+        self.sessions: Dict[str, List[str]] = {}
+
+    def append(self, session_id: str, sentence: str) -> None:
+        self.sessions.setdefault(session_id, []).append(sentence)
+
+    def get_context(self, session_id: str, window_size: int = 5) -> List[str]:
+        return self.sessions.get(session_id, [])[-window_size:]
+
+    def session_count(self) -> int:
+        return len(self.sessions)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값의 분위수"""
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def benchmark_store(store: SessionStore, num_sessions: int, sentences_per_session: int) -> Dict[str, Any]:
+    """세션 채우기(append) 후 무작위 세션 get_context 지연 측정"""
+    session_ids = [f"call-{i:06d}" for i in range(num_sessions)]
+    rng = random.Random(0)
+
+    # 채우기 (메모리 측정, tracemalloc 오버헤드가 있으므로 지연은 아래에서 따로 측정)
+    gc.collect()
+    tracemalloc.start()
+    for seq in range(sentences_per_session):
+        base = _SENTENCES[seq % len(_SENTENCES)]
+        for session_id in session_ids:
+            store.append(session_id, f"{base} ({session_id} #{seq})")
+    gc.collect()
+    memory_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # 버퍼가 찬 상태에서 세션마다 한 문장씩 더 추가
+    append_latencies = []
+    start = time.perf_counter()
+    for session_id in session_ids:
+        t0 = time.perf_counter()
+        store.append(session_id, f"{_SENTENCES[0]} ({session_id} #{sentences_per_session})")
+        append_latencies.append(time.perf_counter() - t0)
+    append_seconds = time.perf_counter() - start
+
+    lookup_latencies = []
+    for _ in range(LOOKUPS):
+        session_id = session_ids[rng.randrange(num_sessions)]
+        t0 = time.perf_counter()
+        context = store.get_context(session_id)
+        lookup_latencies.append(time.perf_counter() - t0)
+    assert len(context) == 5
+
+    append_latencies.sort()
+    lookup_latencies.sort()
+    row = {
+        "sessions": store.session_count(),
+        "python_memory_mb": memory_bytes / 1024 / 1024,
+        "appends_per_sec": len(append_latencies) / append_seconds,
+        "append_p50_us": percentile(append_latencies, 0.50) * 1e6,
+        "append_p99_us": percentile(append_latencies, 0.99) * 1e6,
+        "lookup_p50_us": percentile(lookup_latencies, 0.50) * 1e6,
+        "lookup_p99_us": percentile(lookup_latencies, 0.99) * 1e6,
+    }
+    if isinstance(store, SQLiteSessionStore):
+        store.purge()
+        store._connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        row["file_mb"] = Path(store.path).stat().st_size / 1024 / 1024
+    return row
+
+
+def main():
+    """메인 함수"""
+    num_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    sentences_per_session = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    print("=" * 80)
+    print("세션 맥락 저장소 벤치마크")
+    print("=" * 80)
+    print(f"동시 세션 {num_sessions:,}개 × 세션당 문장 {sentences_per_session}개, 조회 {LOOKUPS:,}회 (window 5)")
+
+    results: Dict[str, Any] = {
+        "num_sessions": num_sessions,
+        "sentences_per_session": sentences_per_session,
+        "lookups": LOOKUPS,
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stores = {
+            "legacy": LegacySessionStore(),
+            "memory": MemorySessionStore(max_sessions=num_sessions),
+            "sqlite": SQLiteSessionStore(str(Path(tmp_dir) / "sessions.sqlite3"), max_sessions=num_sessions),
+            "kv": KeyValueSessionStore(max_sessions=num_sessions),
+        }
+        for name, store in stores.items():
+            results[name] = row = benchmark_store(store, num_sessions, sentences_per_session)
+            store.close()
+            file_info = f"  파일 {row['file_mb']:.1f} MB" if "file_mb" in row else ""
+            print(f"  {name:<7} 메모리 {row['python_memory_mb']:>7.1f} MB{file_info}  "
+                  f"append {row['appends_per_sec']:>9,.0f}/s (p99 {row['append_p99_us']:>7.1f} us)  "
+                  f"조회 p50 {row['lookup_p50_us']:>6.1f} us  p99 {row['lookup_p99_us']:>7.1f} us")
+
+    output_dir = Path(__file__).parent / 'test_results'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / 'session_store_benchmark.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+실시간 특수 Label 조기 감지 벤치마크
+
+합성 욕설 코퍼스 문장으로 만든 Turn(문장 3개 / 8개)을 STT 부분 인식 결과처럼 2~4글자씩 늘려 가며
+넣을 때 조각당 감지 지연 비교
+- rescan: 부분 결과가 올 때마다 전체 텍스트를 KorcenFilter.check_profanity로 다시 검사
+- streaming: StreamingSpecialLabelDetector (새로 붙은 부분 + 겹침 구간만 스캔)
+
+조기 감지: 이벤트가 발생한 시점에 Turn에 남아 있던 글자 수 (Turn 확정 후 검사 대비 앞당긴 정도)
+
+사용법:
+    python logical_analysis/logic_classify_system_lef/test/benchmark_streaming_detector.py [Turn 수] [반복 횟수]
+"""
+
+import sys
+import json
+import time
+import random
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.filtering.streaming_detector import StreamingSpecialLabelDetector
+from logical_analysis.logic_classify_system_lef.profanity_filter.korcen_filter import KorcenFilter
+from logical_analysis.logic_classify_system_lef.test.benchmark_korcen_engine import (
+    _FILLERS,
+    generate_profanity_corpus
+)
+
+
+# Turn당 문장 수 (짧은 Turn / 긴 Turn)
+TURN_SENTENCES = [3, 8]
+
+
+def make_turns(count: int, seed: int = 0, sentences_per_turn: int = 3) -> List[str]:
+    """통화 Turn 텍스트 (합성 욕설 코퍼스 문장 + 일반 발화 여러 개)"""
+    rng = random.Random(seed)
+    corpus = generate_profanity_corpus(count, seed=seed)
+    return [
+        " ".join([sentence] + rng.sample(_FILLERS, sentences_per_turn - 1))
+        for sentence in corpus
+    ]
+
+
+def make_partials(text: str, rng: random.Random) -> List[str]:
+    """2~4글자씩 늘어나는 부분 인식 결과"""
+    partials = []
+    pos = 0
+    while pos < len(text):
+        pos = min(len(text), pos + rng.randint(2, 4))
+        partials.append(text[:pos])
+    return partials
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값의 분위수"""
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def summarize(latencies: List[float]) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    return {
+        "chunks": len(latencies),
+        "chunks_per_sec": len(latencies) / sum(latencies),
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "max_us": latencies[-1] * 1e6,
+    }
+
+
+def benchmark_rescan(turns: List[Tuple[str, List[str]]]) -> Dict[str, Any]:
+    """부분 결과마다 전체 텍스트 재검사"""
+    korcen_filter = KorcenFilter()
+    latencies = []
+    for _, partials in turns:
+        for partial in partials:
+            t0 = time.perf_counter()
+            korcen_filter.check_profanity(partial)
+            latencies.append(time.perf_counter() - t0)
+    return summarize(latencies)
+
+
+def benchmark_streaming(turns: List[Tuple[str, List[str]]]) -> Dict[str, Any]:
+    """스트리밍 감지 지연과 이벤트 발생 시점"""
+    detector = StreamingSpecialLabelDetector()
+    latencies = []
+    events = 0
+    early_events = 0
+    remaining_chars = []
+    for turn_index, (text, partials) in enumerate(turns):
+        for partial in partials:
+            final = len(partial) == len(text)
+            t0 = time.perf_counter()
+            fired = detector.update("call-bench", turn_index, partial, final=final)
+            latencies.append(time.perf_counter() - t0)
+            for _ in fired:
+                events += 1
+                remaining_chars.append(len(text) - len(partial))
+                if not final:
+                    early_events += 1
+    row = summarize(latencies)
+    remaining_chars.sort()
+    row.update({
+        "events": events,
+        "early_event_ratio": early_events / max(events, 1),
+        "remaining_chars_p50": percentile(remaining_chars, 0.50) if remaining_chars else 0,
+    })
+    return row
+
+
+def main():
+    """메인 함수"""
+    num_turns = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print("=" * 80)
+    print("실시간 특수 Label 조기 감지 벤치마크")
+    print("=" * 80)
+
+    results: Dict[str, Any] = {"num_turns": num_turns, "repeat": repeat}
+    for sentences_per_turn in TURN_SENTENCES:
+        rng = random.Random(0)
+        turns = [
+            (text, make_partials(text, rng))
+            for text in make_turns(num_turns, sentences_per_turn=sentences_per_turn)
+        ]
+        avg_chars = sum(len(text) for text, _ in turns) / len(turns)
+        print(f"\nTurn {num_turns:,}개 (문장 {sentences_per_turn}개, 평균 {avg_chars:.0f}글자), "
+              f"부분 결과 {sum(len(p) for _, p in turns):,}개, {repeat}회 중 p99 최소값")
+
+        row_set: Dict[str, Any] = {"avg_chars": avg_chars}
+        for name, fn in (("rescan", benchmark_rescan), ("streaming", benchmark_streaming)):
+            runs = [fn(turns) for _ in range(repeat)]
+            row_set[name] = row = min(runs, key=lambda r: r["p99_us"])
+            print(f"  {name:<10} 조각당 p50 {row['p50_us']:>7.1f} us  p99 {row['p99_us']:>7.1f} us  "
+                  f"max {row['max_us']:>8.1f} us  ({row['chunks_per_sec']:>9,.0f} chunks/s)")
+        streaming = row_set["streaming"]
+        print(f"  이벤트 {streaming['events']:,}건 중 Turn 확정 전 발생 {streaming['early_event_ratio']:.1%}, "
+              f"발생 시점 남은 글자 수 중앙값 {streaming['remaining_chars_p50']}")
+        results[f"sentences_{sentences_per_turn}"] = row_set
+
+    output_dir = Path(__file__).parent / 'test_results'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / 'streaming_detector_benchmark.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n[저장 완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+비동기 알림 디스패처 테스트
+
+같은 세션/Label 알림 병합, 큐가 가득 찼을 때 덜 심각한 알림부터 버리기,
+이력 링 버퍼, 싱크 오류 격리, SpecialLabelFilter의 session_id 전달 검증
+"""
+
+import sys
+import threading
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.filtering.alert_dispatcher import (
+    AlertSink,
+    AlertDispatcher,
+    CallbackAlertSink
+)
+from logical_analysis.logic_classify_system_lef.filtering.alert_system import AlertSystem
+from logical_analysis.logic_classify_system_lef.filtering.event_generator import FilteringEvent
+from logical_analysis.logic_classify_system_lef.filtering.special_label_filter import SpecialLabelFilter
+
+
+class GatedSink(AlertSink):
+    """열릴 때까지 발송을 막아 두는 테스트용 싱크"""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.events = []
+
+    def send(self, events):
+        self.entered.set()
+        self.gate.wait(5)
+        self.events.extend(events)
+
+
+def make_event(label: str = "PROFANITY", alert_level: str = "HIGH", session_id=None, text: str = "") -> FilteringEvent:
+    return FilteringEvent(
+        label=label, severity=alert_level, action="WARN", alert_level=alert_level, text=text,
+        session_context=None, timestamp=datetime.now(), config={}, session_id=session_id
+    )
+
+
+def _blocked_dispatcher(**kwargs):
+    """첫 알림 발송 중에 멈춰 있는 디스패처 (이후 알림은 대기열에 쌓임)"""
+    sink = GatedSink()
+    dispatcher = AlertDispatcher([sink], **kwargs)
+    dispatcher.submit(make_event(session_id="warmup"))
+    assert sink.entered.wait(5)
+    return dispatcher, sink
+
+
+def test_coalesce_same_session_label():
+    """발송 대기 중인 같은 세션/Label 알림은 하나로 병합 (최신 발화, 반복 횟수)"""
+    dispatcher, sink = _blocked_dispatcher()
+    for i in range(3):
+        dispatcher.submit(make_event(session_id="call-1", text=f"욕설 {i}"))
+    dispatcher.submit(make_event(label="VIOLENCE_THREAT", alert_level="CRITICAL", session_id="call-1"))
+    dispatcher.submit(make_event(session_id="call-2"))
+    sink.gate.set()
+    assert dispatcher.flush(5)
+
+    events = sink.events[1:]
+    # 심각도 순 발송
+    assert [(e.session_id, e.label) for e in events] == [
+        ("call-1", "VIOLENCE_THREAT"), ("call-1", "PROFANITY"), ("call-2", "PROFANITY")
+    ]
+    assert events[1].repeat_count == 3 and events[1].text == "욕설 2"
+    assert dispatcher.stats["coalesced"] == 2
+    dispatcher.close()
+
+
+def test_bounded_queue_drops_less_severe():
+    """큐가 가득 차면 대기 중인 덜 심각한 알림을 버리고, 없으면 새 알림을 버림"""
+    dispatcher, sink = _blocked_dispatcher(max_queue=2)
+    assert dispatcher.submit(make_event(alert_level="LOW", session_id="a"))
+    assert dispatcher.submit(make_event(alert_level="HIGH", session_id="b"))
+    assert dispatcher.submit(make_event(label="VIOLENCE_THREAT", alert_level="CRITICAL", session_id="c"))
+    assert not dispatcher.submit(make_event(alert_level="HIGH", session_id="d"))
+    sink.gate.set()
+    assert dispatcher.flush(5)
+    assert [e.session_id for e in sink.events[1:]] == ["c", "b"]
+    assert dispatcher.stats["dropped"] == 2
+    dispatcher.close()
+
+
+def test_history_ring_buffer_and_sink_errors():
+    """이력은 최근 history_size개만 보관, 싱크 오류가 나도 다른 싱크와 이후 알림은 계속 발송"""
+    received = []
+
+    def failing(event):
+        raise RuntimeError("전송 실패")
+
+    dispatcher = AlertDispatcher(
+        [CallbackAlertSink(failing), CallbackAlertSink(received.append)], history_size=5
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i in range(20):
+            dispatcher.submit(make_event(text=str(i)))
+        assert dispatcher.flush(5)
+    assert len(received) == 20
+    assert [e.text for e in dispatcher.history] == ["15", "16", "17", "18", "19"]
+    assert dispatcher.stats["sink_errors"] >= 1
+    dispatcher.close()
+    try:
+        dispatcher.submit(make_event())
+        assert False, "닫힌 디스패처에 알림이 추가됨"
+    except RuntimeError:
+        pass
+
+
+def test_special_label_filter_session_id():
+    """SpecialLabelFilter가 session_id를 이벤트에 담아 비동기 발송"""
+    received = []
+    special_filter = SpecialLabelFilter()
+    special_filter.alert_system = AlertSystem(sinks=[CallbackAlertSink(received.append)])
+    result = special_filter.filter("PROFANITY", "욕설 문장", session_id="call-9")
+    assert result.alert_level == "HIGH"
+    assert special_filter.alert_system.flush(5)
+    assert received[0].session_id == "call-9"
+    assert list(special_filter.alert_system.alert_history) == received
+    special_filter.alert_system.close()
+
+
+if __name__ == "__main__":
+    test_coalesce_same_session_label()
+    test_bounded_queue_drops_less_severe()
+    test_history_ring_buffer_and_sink_errors()
+    test_special_label_filter_session_id()
+    print("[완료] 비동기 알림 디스패처 테스트 통과")
@@ -0,0 +1,64 @@
+"""
+컴파일된 Korcen 엔진 동등성 테스트
+
+CompiledKorcenEngine.detect_levels 결과가 레벨별
+check_and_report_profanity_pattern 결과와 동일한지 검증
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.profanity_filter.korcen_filter import (
+    CHECK_LEVELS,
+    LEVEL_PATTERN_LISTS,
+    CompiledKorcenEngine,
+    KorcenFilter
+)
+from logical_analysis.logic_classify_system_lef.test.benchmark_korcen_engine import (
+    generate_profanity_corpus,
+    legacy_detect_levels
+)
+
+EDGE_CASES = [
+    "", "   ", "tq", "T Q", "qt!", "https://x.com/시발 괜찮아요", "시발점에서 출발", "보g", "개 새 끼",
+    "니년이", "이 놈 저 넘", "🖕🏻", "ㅇl=스", "미친놈 미친새끼", "고양이새끼 귀엽다", "오ㅗ",
+]
+
+
+def test_detect_levels_matches_legacy():
+    """모든 레벨의 감지 결과(패턴 문자열 포함)가 기존 함수와 같은지 확인"""
+    engine = CompiledKorcenEngine()
+    corpus = EDGE_CASES + generate_profanity_corpus(3000, seed=9)
+    # 모든 패턴을 단독/공백 삽입 형태로도 검사
+    for level in CHECK_LEVELS:
+        for pattern in LEVEL_PATTERN_LISTS[level]:
+            corpus.extend([pattern, " ".join(pattern), f"아니 {pattern} 진짜"])
+    for text in corpus:
+        assert engine.detect_levels(text) == legacy_detect_levels(text), text
+
+
+class _LegacyLevels:
+    """기존 레벨별 검사를 CompiledKorcenEngine 자리에 끼우기 위한 어댑터"""
+
+    @staticmethod
+    def detect_levels(text):
+        return legacy_detect_levels(text)
+
+
+def test_check_profanity_unchanged():
+    """KorcenFilter.check_profanity 결과(카테고리, 신뢰도 포함)가 기존 방식과 같은지 확인"""
+    compiled = KorcenFilter()
+    legacy = KorcenFilter()
+    legacy.engine = _LegacyLevels()
+    for text in EDGE_CASES + generate_profanity_corpus(1000, seed=13):
+        assert compiled.check_profanity(text) == legacy.check_profanity(text), text
+
+
+if __name__ == "__main__":
+    test_detect_levels_matches_legacy()
+    test_check_profanity_unchanged()
+    print("[완료] Korcen 엔진 동등성 테스트 통과")
@@ -0,0 +1,144 @@
+"""
+세션 맥락 저장소 테스트
+
+백엔드(memory / sqlite / kv)별 링 버퍼, TTL 만료, 최대 세션 수(LRU) 제한과
+SQLite 파일을 통한 워커 간 맥락 공유 검증
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.data.session_manager import SessionManager
+from logical_analysis.logic_classify_system_lef.data.session_store import (
+    MemorySessionStore,
+    SQLiteSessionStore,
+    KeyValueSessionStore,
+    LocalKeyValueClient,
+    create_session_store
+)
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _stores(clock, tmp_dir, **kwargs):
+    """같은 설정의 백엔드별 저장소"""
+    return {
+        "memory": MemorySessionStore(clock=clock, **kwargs),
+        "sqlite": SQLiteSessionStore(str(Path(tmp_dir) / "sessions.sqlite3"), clock=clock, **kwargs),
+        "kv": KeyValueSessionStore(LocalKeyValueClient(max_keys=kwargs.get("max_sessions"), clock=clock), **kwargs),
+    }
+
+
+def test_ring_buffer():
+    """세션별로 최근 max_sentences개 문장만 순서대로 보관"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, store in _stores(FakeClock(), tmp_dir, max_sentences=3).items():
+            for i in range(5):
+                store.append("s1", f"문장{i}")
+            store.append("s2", "다른 세션")
+            assert store.get_context("s1", window_size=5) == ["문장2", "문장3", "문장4"], name
+            assert store.get_context("s1", window_size=2) == ["문장3", "문장4"], name
+            assert store.get_context("s1", window_size=0) == [], name
+            assert store.get_context("s2") == ["다른 세션"], name
+            assert store.get_context("없는 세션") == [], name
+            store.clear("s1")
+            assert store.get_context("s1") == [], name
+            store.close()
+
+
+def test_ttl_expiry():
+    """마지막 접근 후 TTL이 지나면 만료되고, 조회하면 만료 시각이 연장됨"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, store in _stores(clock, tmp_dir, ttl_seconds=10).items():
+            store.append("s1", "안녕하세요")
+            store.append("s2", "환불해 주세요")
+            clock.now += 6
+            assert store.get_context("s1") == ["안녕하세요"], name
+            clock.now += 6
+            assert store.get_context("s1") == ["안녕하세요"], name
+            assert store.get_context("s2") == [], name
+            assert store.session_count() == 1, name
+            # 만료된 세션에 다시 쓰면 이전 문장 없이 새로 시작
+            clock.now += 11
+            store.append("s1", "다시 전화했어요")
+            assert store.get_context("s1") == ["다시 전화했어요"], name
+            store.close()
+
+
+def test_max_sessions_lru():
+    """최대 세션 수를 넘으면 가장 오래 접근하지 않은 세션부터 제거"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, store in _stores(clock, tmp_dir, max_sessions=3).items():
+            for session_id in ("a", "b", "c"):
+                clock.now += 1
+                store.append(session_id, session_id)
+            clock.now += 1
+            store.get_context("a")
+            clock.now += 1
+            store.append("d", "d")
+            if isinstance(store, SQLiteSessionStore):
+                # SQLite는 주기적으로 정리
+                store.purge()
+            assert store.session_count() == 3, name
+            assert store.get_context("b") == [], name
+            assert store.get_context("a") == ["a"], name
+            assert store.get_context("d") == ["d"], name
+            store.close()
+
+
+def test_sqlite_shared_between_workers():
+    """같은 SQLite 파일을 쓰는 다른 저장소(워커)에서 맥락 조회"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = str(Path(tmp_dir) / "sessions.sqlite3")
+        worker_a = SessionManager(create_session_store("sqlite", path=path))
+        worker_b = SessionManager(create_session_store("sqlite", path=path))
+        worker_a.add_sentence("call-1", "배송이 왜 이래요")
+        worker_b.add_sentence("call-1", "주문번호 알려주세요")
+        assert worker_a.get_context("call-1") == ["배송이 왜 이래요", "주문번호 알려주세요"]
+        worker_b.clear_session("call-1")
+        assert worker_a.get_context("call-1") == []
+        worker_a.store.close()
+        worker_b.store.close()
+
+
+def test_create_session_store_env():
+    """LEF_SESSION_STORE 환경 변수로 기본 저장소 선택"""
+    previous = os.environ.get("LEF_SESSION_STORE")
+    try:
+        os.environ["LEF_SESSION_STORE"] = "kv"
+        assert isinstance(SessionManager().store, KeyValueSessionStore)
+        os.environ.pop("LEF_SESSION_STORE")
+        assert isinstance(SessionManager().store, MemorySessionStore)
+        try:
+            create_session_store("unknown")
+            assert False, "알 수 없는 저장소가 생성됨"
+        except ValueError:
+            pass
+    finally:
+        if previous is not None:
+            os.environ["LEF_SESSION_STORE"] = previous
+
+
+if __name__ == "__main__":
+    test_ring_buffer()
+    test_ttl_expiry()
+    test_max_sessions_lru()
+    test_sqlite_shared_between_workers()
+    test_create_session_store_env()
+    print("[완료] 세션 맥락 저장소 테스트 통과")
@@ -0,0 +1,102 @@
+"""
+실시간 특수 Label 조기 감지 테스트
+
+STT 부분 인식 결과를 조각 단위로 넣었을 때
+- Turn 확정 시점까지 감지한 Label이 전체 문장 일괄 감지 결과와 같은지
+- 발화 도중에 이벤트가 발생하는지, False Positive(시발점 등)는 기다렸다가 거르는지
+- 인식 결과 수정 시 사라진 매칭이 반영되지 않는지 검증
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from logical_analysis.logic_classify_system_lef.filtering.alert_dispatcher import CallbackAlertSink
+from logical_analysis.logic_classify_system_lef.filtering.alert_system import AlertSystem
+from logical_analysis.logic_classify_system_lef.filtering.streaming_detector import StreamingSpecialLabelDetector
+from logical_analysis.logic_classify_system_lef.profanity_filter.baseline_rules import ProfanityBaselineRules
+from logical_analysis.logic_classify_system_lef.profanity_filter.korcen_filter import KORCEN_TO_CATEGORY_MAP
+from logical_analysis.logic_classify_system_lef.test.benchmark_korcen_engine import generate_profanity_corpus
+
+
+def stream(detector, text, turn_index=0, min_chunk=1, max_chunk=6, rng=None):
+    """텍스트를 조각 단위 부분 인식 결과로 넣고 (발생 위치, Label) 리스트 반환"""
+    rng = rng or random.Random(0)
+    fired = []
+    pos = 0
+    while pos < len(text):
+        pos = min(len(text), pos + rng.randint(min_chunk, max_chunk))
+        for event in detector.update("call-1", turn_index, text[:pos], final=pos == len(text)):
+            fired.append((pos, event.label))
+    return fired
+
+
+def batch_labels(detector, text):
+    """전체 문장 기준 키워드 + Korcen 레벨 감지 Label"""
+    labels = {
+        category for category, keywords in ProfanityBaselineRules.keyword_groups().items()
+        if any(keyword in text.lower() for keyword in keywords)
+    }
+    labels |= {KORCEN_TO_CATEGORY_MAP[level] for level in detector.engine.detect_levels(text)}
+    return labels & set(detector.labels)
+
+
+def test_streaming_matches_batch():
+    """임의 조각 크기로 넣어도 Turn 확정 시점의 감지 Label은 일괄 감지와 동일"""
+    detector = StreamingSpecialLabelDetector(default_threshold=0.01)
+    rng = random.Random(7)
+    for turn_index, text in enumerate(generate_profanity_corpus(1500, seed=11)):
+        fired = {label for _, label in stream(detector, text, turn_index, rng=rng)}
+        assert fired == batch_labels(detector, text), text
+    assert not detector._turns
+
+
+def test_fires_before_turn_ends():
+    """욕설/위협은 발화가 끝나기 전에 이벤트 발생"""
+    text = "야 이 개새끼야 너 죽여버린다 진짜 두고 봐"
+    fired = dict((label, pos) for pos, label in stream(StreamingSpecialLabelDetector(), text, max_chunk=2))
+    assert fired["PROFANITY"] <= text.index("야 너") + 1
+    assert fired["VIOLENCE_THREAT"] < len(text)
+
+
+def test_false_positive_waits_for_context():
+    """뒤따르는 글자로 False Positive가 되는 매칭은 확정하지 않음"""
+    detector = StreamingSpecialLabelDetector()
+    assert stream(detector, "시발점에서 출발했어요", max_chunk=1) == []
+    assert stream(detector, "시발 진짜 짜증나네", turn_index=1, max_chunk=1)[0][1] == "PROFANITY"
+
+
+def test_revision_rescans():
+    """부분 인식 결과가 수정되면 사라진 매칭은 반영하지 않음"""
+    detector = StreamingSpecialLabelDetector()
+    assert detector.update("call-1", 0, "환불 시발") == []
+    assert detector.update("call-1", 0, "환불 신청할게요", final=True) == []
+
+    events = detector.update("call-1", 1, "그냥 고소", final=False)
+    assert [event.label for event in events] == ["VIOLENCE_THREAT"]
+    # 이미 발생한 이벤트는 Turn당 한 번
+    assert detector.update("call-1", 1, "그냥 고소할 거예요", final=True) == []
+
+
+def test_sends_to_alert_system():
+    """alert_system이 있으면 세션 ID가 담긴 이벤트를 바로 전달"""
+    received = []
+    alert_system = AlertSystem(sinks=[CallbackAlertSink(received.append)])
+    detector = StreamingSpecialLabelDetector(alert_system=alert_system)
+    events = detector.update("call-7", 3, "죽여버린다", final=True)
+    assert alert_system.flush(5)
+    assert received == events and received[0].session_id == "call-7"
+    alert_system.close()
+
+
+if __name__ == "__main__":
+    test_streaming_matches_batch()
+    test_fires_before_turn_ends()
+    test_false_positive_waits_for_context()
+    test_revision_rescans()
+    test_sends_to_alert_system()
+    print("[완료] 실시간 특수 Label 조기 감지 테스트 통과")
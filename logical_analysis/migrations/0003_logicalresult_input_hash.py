@@ -0,0 +1,131 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_process', '0005_speakersegment_emotion_input_hash'),
+        ('logical_analysis', '0002_logicalresult_delete_classificationresult'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='logicalresult',
+            options={'ordering': ['segment__start_time']},
+        ),
+        migrations.RemoveField(
+            model_name='logicalresult',
+            name='session_id',
+        ),
+        migrations.RemoveField(
+            model_name='logicalresult',
+            name='text',
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='context_appropriateness',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='empathy_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='input_hash',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='insistence_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='intent_label',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='is_overlap',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='manual_compliance_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='pause_duration',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='profanity_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='speech_speed',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='threat_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='action',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='alert_level',
+            field=models.CharField(blank=True, max_length=20, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='confidence',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='label',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='label_type',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='probabilities',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='segment',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='logical_analysis', to='audio_process.speakersegment'),
+        ),
+        migrations.AlterField(
+            model_name='logicalresult',
+            name='timestamp',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterModelTable(
+            name='logicalresult',
+            table='logical_results',
+        ),
+    ]
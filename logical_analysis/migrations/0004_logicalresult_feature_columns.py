@@ -0,0 +1,82 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audio_process', '0005_speakersegment_emotion_input_hash'),
+        ('logical_analysis', '0003_logicalresult_input_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logicalresult',
+            name='agent_response_quality_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='communication_clarity_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='customer_problem_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='feature_scores',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='hate_speech_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='information_accuracy_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='problem_solving_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='repetition_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='sexual_harassment_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='special_label_confidence',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='turn_index',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='logicalresult',
+            name='turn_risk_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='logicalresult',
+            index=models.Index(fields=['turn_risk_score', 'created_at'], name='logical_res_turn_ri_3546a5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logicalresult',
+            index=models.Index(fields=['created_at'], name='logical_res_created_feea8f_idx'),
+        ),
+    ]
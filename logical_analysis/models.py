@@ -13,15 +13,35 @@ class LogicalResult(models.Model):
     pause_duration = models.FloatField(null=True, blank=True)
     is_overlap = models.BooleanField(default=False)
 
+    # Turn 위치 (세션 내 Turn 인덱스, 손님/상담원 세그먼트 공통)
+    turn_index = models.IntegerField(null=True, blank=True)
+
+    # 손님 발화 특징점 (CustomerFeatureScores)
     profanity_score = models.FloatField(null=True, blank=True)
     threat_score = models.FloatField(null=True, blank=True)
-    insistence_score = models.FloatField(null=True, blank=True)
+    insistence_score = models.FloatField(null=True, blank=True)  # unreasonable_demand_score
+    sexual_harassment_score = models.FloatField(null=True, blank=True)
+    hate_speech_score = models.FloatField(null=True, blank=True)
+    repetition_score = models.FloatField(null=True, blank=True)  # repetition_keyword_score
+    special_label_confidence = models.FloatField(null=True, blank=True)
     intent_label = models.CharField(max_length=100, null=True, blank=True)
 
+    # 상담원 발화 특징점 (AgentFeatureScores)
     manual_compliance_score = models.FloatField(null=True, blank=True)
     empathy_score = models.FloatField(null=True, blank=True)
+    information_accuracy_score = models.FloatField(null=True, blank=True)
+    communication_clarity_score = models.FloatField(null=True, blank=True)
+    problem_solving_score = models.FloatField(null=True, blank=True)
     context_appropriateness = models.FloatField(null=True, blank=True)
 
+    # Turn 종합 점수 (TurnScores, Turn의 손님 세그먼트 행에만 저장 → Turn당 1행으로 집계)
+    customer_problem_score = models.FloatField(null=True, blank=True)
+    agent_response_quality_score = models.FloatField(null=True, blank=True)
+    turn_risk_score = models.FloatField(null=True, blank=True)
+
+    # 세그먼트의 전체 특징점 점수 (요인별 점수 등 컬럼이 없는 값 포함)
+    feature_scores = models.JSONField(null=True, blank=True)
+
     # ClassificationResult에서 사용되던 필드(호환용)
     label = models.CharField(max_length=100, null=True, blank=True)
     label_type = models.CharField(max_length=50, null=True, blank=True)
@@ -32,6 +52,14 @@ class LogicalResult(models.Model):
     timestamp = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # 분석 입력 해시 (발화 텍스트, 화자 역할, Turn 맥락, 규칙/모델 버전) - 변경된 세그먼트만 재분석
+    input_hash = models.CharField(max_length=64, null=True, blank=True)
+
     class Meta:
         db_table = 'logical_results'
-        ordering = ['segment__start_time']
\ No newline at end of file
+        ordering = ['segment__start_time']
+        indexes = [
+            # 기간 내 위험 Turn 상위 N개 조회 (GET /top-risk)
+            models.Index(fields=['turn_risk_score', 'created_at']),
+            models.Index(fields=['created_at']),
+        ]
@@ -16,6 +16,9 @@ class ClassificationResultOut(Schema):
     alert_level: str
     timestamp: Optional[datetime] = None
     created_at: datetime
+    turn_index: Optional[int] = None
+    turn_risk_score: Optional[float] = None
+    feature_scores: Optional[Dict[str, float]] = None
 
 class SessionSummary(Schema):
     total_sentences: int
@@ -27,4 +30,18 @@ class AnalysisSessionOut(Schema):
     session_id: str
     created_at: datetime
     summary: SessionSummary
-    results: List[ClassificationResultOut]
\ No newline at end of file
+    results: List[ClassificationResultOut]
+
+class RiskTurnOut(Schema):
+    session_id: str
+    segment_id: int
+    turn_index: Optional[int] = None
+    start_time: float
+    text: str
+    label: Optional[str] = None
+    alert_level: Optional[str] = None
+    turn_risk_score: float
+    customer_problem_score: Optional[float] = None
+    agent_response_quality_score: Optional[float] = None
+    recorded_at: datetime
+    created_at: datetime
@@ -0,0 +1,258 @@
+# logical_analysis/session_analysis.py
+"""
+세션 단위 논리 분석
+
+정렬된 SpeakerSegment로 STT 세션 입력({"session_id", "segments": [...]})을 한 번 구성하여
+MainPipeline.process로 세션 전체를 Turn 단위 분석하고(손님 발화 모델 추론은 세션 단위 배치),
+Turn 결과를 세그먼트별 LogicalResult 행으로 변환
+(특징점/Turn 종합 점수는 컬럼과 feature_scores JSON으로 저장하여 대시보드 집계를 DB에서 수행)
+
+세그먼트별 입력 해시(텍스트, 화자 역할, Turn 맥락, 규칙/모델 버전)를 결과와 함께 저장하고,
+재분석 시 해시가 바뀐 세그먼트가 속한 Turn만 다시 분석
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from django.utils import timezone
+
+from .models import LogicalResult
+
+# SpeakerSegment.speaker_label 화자 구분 (그 외 값은 is_counselor로 판단)
+COUNSELOR_SPEAKER_LABELS = {"counselor", "agent"}
+CLIENT_SPEAKER_LABELS = {"client", "customer"}
+
+# Special Label별 (권장 조치, 경고 수준) - 종합 필터링 규칙(FilteringBaselineRules.EVENT_CONFIG)과 동일
+LABEL_ALERTS = {
+    "VIOLENCE_THREAT": ("TERMINATE_CALL", "CRITICAL"),
+    "SEXUAL_HARASSMENT": ("TERMINATE_CALL", "CRITICAL"),
+    "PROFANITY": ("WARN", "HIGH"),
+    "HATE_SPEECH": ("WARN", "HIGH"),
+    "UNREASONABLE_DEMAND": ("SUPPORT_AGENT", "MEDIUM"),
+    "REPETITION": ("SUPPORT_AGENT", "MEDIUM"),
+}
+DEFAULT_ALERT = ("MONITOR", "LOW")
+
+# 상담원 세그먼트 행의 label_type (손님 발화 분류 결과와 구분)
+AGENT_LABEL_TYPE = "AGENT"
+
+# 결과 행 구성 버전 (저장 컬럼이 바뀌면 올려서 기존 결과를 한 번 재분석)
+RESULT_SCHEMA_VERSION = 2
+
+# 특징점 점수 키 → LogicalResult 컬럼 (그 외 키는 feature_scores JSON에만 저장)
+CUSTOMER_SCORE_COLUMNS = {
+    "profanity_score": "profanity_score",
+    "threat_score": "threat_score",
+    "unreasonable_demand_score": "insistence_score",
+    "sexual_harassment_score": "sexual_harassment_score",
+    "hate_speech_score": "hate_speech_score",
+    "repetition_keyword_score": "repetition_score",
+    "special_label_confidence": "special_label_confidence",
+}
+AGENT_SCORE_COLUMNS = {
+    "manual_compliance_score": "manual_compliance_score",
+    "empathy_score": "empathy_score",
+    "information_accuracy_score": "information_accuracy_score",
+    "communication_clarity_score": "communication_clarity_score",
+    "problem_solving_score": "problem_solving_score",
+}
+TURN_SCORE_COLUMNS = ("customer_problem_score", "agent_response_quality_score", "turn_risk_score")
+
+
+def score_columns(scores, columns: Dict[str, str]) -> Dict[str, Optional[float]]:
+    """특징점 점수(FeatureScores/dict) → {컬럼: 값}"""
+    return {column: scores.get(key) for key, column in columns.items()}
+
+
+def segment_speaker(segment) -> str:
+    """SpeakerSegment 화자(client/counselor)를 파이프라인 화자(customer/agent)로 변환"""
+    speaker_label = (segment.speaker_label or "").lower()
+    if speaker_label in COUNSELOR_SPEAKER_LABELS:
+        return "agent"
+    if speaker_label in CLIENT_SPEAKER_LABELS:
+        return "customer"
+    return "agent" if segment.is_counselor else "customer"
+
+
+def input_hash(*parts: Any) -> str:
+    """분석 입력 해시 (순서 있는 값들의 JSON 직렬화 → BLAKE2b 128bit hex)"""
+    payload = json.dumps(parts, ensure_ascii=False, default=str, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def segment_input_hashes(turns: Sequence, version: str) -> Dict[int, str]:
+    """
+    STT segments 인덱스별 분석 입력 해시
+
+    Turn 맥락 의존성:
+    - 손님 세그먼트: 욕설/의도/특징점은 자신의 텍스트만으로 분석하지만, 같은 행에 저장하는
+      Turn 종합 점수(상담원 대응 품질, Turn 위험도)가 같은 Turn의 상담원 발화와
+      세션 시작/끝 여부에 의존하므로 함께 사용
+    - 상담원 세그먼트: 같은 Turn의 손님 발화(대응 Label), 합쳐진 상담원 발화,
+      세션 시작/끝 여부(인사/마무리 검사)에 의존
+    화자 변경으로 Turn 경계가 바뀌면 이웃 세그먼트의 해시도 함께 바뀜
+
+    Args:
+        turns: TurnSplitter.split_into_turns 결과
+        version: MainPipeline.analysis_version (규칙/모델 버전)
+
+    Returns:
+        {segment 인덱스: 해시} (Turn에 포함되지 않는 세그먼트는 없음)
+    """
+    version = f"{version}/r{RESULT_SCHEMA_VERSION}"
+    hashes: Dict[int, str] = {}
+    last = len(turns) - 1
+    for position, turn in enumerate(turns):
+        if not turn.segment_indices:
+            continue
+        customer_index, *agent_indices = turn.segment_indices
+        context = (turn.customer_text, turn.agent_text, position == 0, position == last)
+        hashes[customer_index] = input_hash(version, "customer", *context)
+        agent_hash = input_hash(version, "agent", *context)
+        for agent_index in agent_indices:
+            hashes[agent_index] = agent_hash
+    return hashes
+
+
+@dataclass
+class ReanalysisPlan:
+    """세션 재분석 계획"""
+    input_hashes: Dict[int, str]  # segment 인덱스 → 새 입력 해시
+    stale_segment_ids: List[int] = field(default_factory=list)  # 결과가 없거나 해시가 바뀐 세그먼트
+    orphan_result_ids: List[int] = field(default_factory=list)  # Turn에서 빠진 세그먼트의 기존 결과
+    turn_indices: Set[int] = field(default_factory=set)  # 다시 분석할 Turn
+
+    @property
+    def up_to_date(self) -> bool:
+        return not self.stale_segment_ids and not self.orphan_result_ids
+
+
+def plan_reanalysis(segments: Sequence, turns: Sequence, version: str) -> ReanalysisPlan:
+    """
+    저장된 결과의 입력 해시와 비교하여 다시 분석할 세그먼트/Turn 결정
+
+    Args:
+        segments: 시간순 SpeakerSegment 리스트 (logical_analysis select_related 권장)
+        turns: segments로 만든 STT 입력의 Turn 리스트
+        version: MainPipeline.analysis_version
+    """
+    plan = ReanalysisPlan(input_hashes=segment_input_hashes(turns, version))
+    stale_indices = set()
+    for idx, segment in enumerate(segments):
+        existing = getattr(segment, 'logical_analysis', None)
+        new_hash = plan.input_hashes.get(idx)
+        if new_hash is None:
+            if existing is not None:
+                plan.orphan_result_ids.append(existing.id)
+        elif existing is None or existing.input_hash != new_hash:
+            plan.stale_segment_ids.append(segment.id)
+            stale_indices.add(idx)
+    plan.turn_indices = {
+        turn.turn_index for turn in turns
+        if stale_indices.intersection(turn.segment_indices)
+    }
+    return plan
+
+
+def build_session_stt_data(session_id: str, segments: Sequence) -> Dict[str, Any]:
+    """
+    시간순 SpeakerSegment 리스트를 MainPipeline.process 입력으로 변환
+
+    segments의 순서가 그대로 STT segments 인덱스가 되므로 Turn 결과의 segment_indices로
+    원래 SpeakerSegment를 찾을 수 있음
+    """
+    return {
+        "session_id": session_id,
+        "segments": [
+            {
+                "speaker": segment_speaker(segment),
+                "text": segment.text or "",
+                "start": segment.start_time,
+                "end": segment.end_time
+            }
+            for segment in segments
+        ]
+    }
+
+
+def build_logical_results(
+    segments: Sequence,
+    pipeline_result,
+    pending_segment_ids: Optional[Iterable[int]] = None,
+    input_hashes: Optional[Dict[int, str]] = None
+) -> List[LogicalResult]:
+    """
+    세션 분석 결과를 세그먼트별 LogicalResult로 변환 (저장하지 않음)
+
+    Args:
+        segments: build_session_stt_data에 전달한 SpeakerSegment 리스트 (같은 순서)
+        pipeline_result: MainPipeline.process 결과 (PipelineResult)
+        pending_segment_ids: 결과를 만들 세그먼트 ID (None이면 Turn에 포함된 전체)
+        input_hashes: segment 인덱스별 입력 해시 (segment_input_hashes 결과, 결과 행에 저장)
+
+    Returns:
+        LogicalResult 리스트 (손님 발화 이전 상담원 발화/빈 발화 세그먼트는 Turn이 없어 제외)
+    """
+    pending = set(pending_segment_ids) if pending_segment_ids is not None else None
+    input_hashes = input_hashes or {}
+    timestamp = timezone.now()
+    rows = []
+
+    for turn_result in pipeline_result.turn_results:
+        if not turn_result.segment_indices:
+            continue
+        customer_index, *agent_indices = turn_result.segment_indices
+
+        customer_result = turn_result.customer_result
+        classification = customer_result.classification_result
+        feature_scores = customer_result.feature_scores
+        action, alert_level = (
+            LABEL_ALERTS.get(classification.label, DEFAULT_ALERT)
+            if classification.label_type == "SPECIAL" else DEFAULT_ALERT
+        )
+        turn_scores = {column: turn_result.turn_scores.get(column) for column in TURN_SCORE_COLUMNS}
+        rows.append(LogicalResult(
+            segment=segments[customer_index],
+            turn_index=turn_result.turn_index,
+            **score_columns(feature_scores, CUSTOMER_SCORE_COLUMNS),
+            **turn_scores,
+            feature_scores=feature_scores.to_dict(),
+            intent_label=classification.label,
+            label=classification.label,
+            label_type=classification.label_type,
+            confidence=classification.confidence,
+            probabilities=classification.probabilities or {},
+            action=action,
+            alert_level=alert_level,
+            timestamp=timestamp,
+            input_hash=input_hashes.get(customer_index)
+        ))
+
+        agent_result = turn_result.agent_result
+        if agent_result is None:
+            continue
+        # Turn의 상담원 발화들은 하나로 합쳐 분석되므로 같은 결과를 공유
+        agent_scores = score_columns(agent_result.feature_scores, AGENT_SCORE_COLUMNS)
+        agent_scores["manual_compliance_score"] = agent_result.manual_compliance_score
+        agent_feature_scores = agent_result.feature_scores.to_dict()
+        for agent_index in agent_indices:
+            rows.append(LogicalResult(
+                segment=segments[agent_index],
+                turn_index=turn_result.turn_index,
+                **agent_scores,
+                feature_scores=agent_feature_scores,
+                label=agent_result.corresponding_customer_label,
+                label_type=AGENT_LABEL_TYPE,
+                confidence=agent_result.manual_compliance_score,
+                probabilities={},
+                action=DEFAULT_ALERT[0],
+                alert_level=DEFAULT_ALERT[1],
+                timestamp=timestamp,
+                input_hash=input_hashes.get(agent_index)
+            ))
+
+    if pending is not None:
+        rows = [row for row in rows if row.segment_id in pending]
+    return rows
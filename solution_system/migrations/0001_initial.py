@@ -0,0 +1,51 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('audio_process', '0004_speakersegment_branch_emotion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResponseManual',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('situation_title', models.CharField(max_length=255)),
+                ('target_emotion', models.CharField(max_length=100)),
+                ('target_logic_flaw', models.CharField(max_length=100)),
+                ('script', models.TextField()),
+                ('action_guide', models.TextField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RuleSet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(default='default', max_length=100)),
+                ('version', models.PositiveIntegerField()),
+                ('rules', models.JSONField(default=dict)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['name', '-version'],
+                'unique_together': {('name', 'version')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SolutionResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('matched_manual', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='solution_results', to='solution_system.responsemanual')),
+                ('segment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='solution_result', to='audio_process.speakersegment')),
+            ],
+        ),
+    ]
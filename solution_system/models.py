@@ -29,4 +29,20 @@ class SolutionResult(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"Solution for Segment ID: {self.segment.id}"
\ No newline at end of file
+        return f"Solution for Segment ID: {self.segment.id}"
+
+
+class RuleSet(models.Model):
+    """논리 분석 규칙 세트 (규칙 키워드/매뉴얼 키워드 JSON, 규칙 레지스트리가 불러옴)"""
+    name = models.CharField(max_length=100, default="default")
+    version = models.PositiveIntegerField()
+    rules = models.JSONField(default=dict)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("name", "version")
+        ordering = ["name", "-version"]
+
+    def __str__(self):
+        return f"RuleSet {self.name} v{self.version}"